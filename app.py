@@ -1,6 +1,10 @@
 import streamlit as st
 from project_manager import project_manager
 from settings import Settings
+from service.render_job_queue import render_job_queue
+from service.dirty_scene_watcher import dirty_scene_watcher
+from service.output_targets import OUTPUT_TARGET_PRESETS
+from service.storage_gc import storage_gc
 from ui import page1, page2, page3
 from ui.popup.project_create_popup import create_dialog
 from ui.popup.project_load_popup import load_dialog
@@ -20,6 +24,13 @@ if 'current_page' not in st.session_state:
 if 'debug_mode' not in st.session_state:
     st.session_state.debug_mode = Settings.is_debug_mode()
 
+# 백그라운드 렌더링 워커 시작 (이미 실행 중이면 부족한 수만큼만 추가)
+render_job_queue.start_workers(Settings.get("render_workers", 1))
+
+# 백그라운드 저장소 정리 (설정 "storage_gc"가 켜져 있을 때만, 이미 실행 중이면 무시)
+if Settings.get("storage_gc", False):
+    storage_gc.start(Settings.get("storage_gc_interval", 3600))
+
 # 사이드바
 st.sidebar.header("🎬 Streamlit 앱")
 
@@ -28,6 +39,9 @@ current_project = project_manager.get_current_project()
 if current_project:
     st.sidebar.subheader(f"{current_project['folder_name']}")
 
+# 현재 프로젝트 파일 감시 (바뀐 씬을 편집이 멈췄을 때 백그라운드에서 다시 렌더링)
+dirty_scene_watcher.watch(project_manager.get_project_path())
+
     
 col1, col2 = st.sidebar.columns(2)
 
@@ -46,6 +60,48 @@ if debug_enabled != st.session_state.debug_mode:
     st.session_state.debug_mode = debug_enabled
     Settings.set_debug_mode(debug_enabled)
 
+# 디버그 모드에서만 렌더링 샘플링 프로파일러 토글 표시 (결과는 프로젝트 logs 폴더에 .folded로 저장)
+if debug_enabled:
+    profiling_enabled = st.sidebar.toggle("🔬 Render Profiling", key="render_profiling_toggle",
+                                          value=bool(Settings.get("render_profiling", False)))
+    if profiling_enabled != bool(Settings.get("render_profiling", False)):
+        Settings.set("render_profiling", profiling_enabled)
+
+# TTS 미리 합성 토글 (텍스트 입력이 멈추면 백그라운드에서 TTS를 미리 생성)
+prefetch_enabled = st.sidebar.toggle("⚡ TTS Prefetch", key="tts_prefetch_toggle",
+                                     value=bool(Settings.get("tts_prefetch", False)),
+                                     help="텍스트 입력 후 TTS를 미리 생성해 auto 버튼을 바로 완료합니다. (프로젝트별 하루 글자 수 예산 적용)")
+if prefetch_enabled != bool(Settings.get("tts_prefetch", False)):
+    Settings.set("tts_prefetch", prefetch_enabled)
+
+# 자동 렌더링 토글 (편집이 멈추면 바뀐 씬만 낮은 우선순위로 다시 렌더링)
+auto_render_enabled = st.sidebar.toggle("🔁 Auto Render", key="auto_render_toggle",
+                                        value=bool(Settings.get("auto_render", False)),
+                                        help="편집이 멈추면 바뀐 씬을 백그라운드에서 미리 렌더링합니다.")
+if auto_render_enabled != bool(Settings.get("auto_render", False)):
+    Settings.set("auto_render", auto_render_enabled)
+
+# 빠른 컴포지터 토글 (단색 배경 위 정지 이미지/텍스트 씬을 NumPy로 합성)
+numpy_compositor_enabled = st.sidebar.toggle("🧮 NumPy Compositor", key="numpy_compositor_toggle",
+                                             value=Settings.get("compositor") == "numpy",
+                                             help="씬 합성을 MoviePy 대신 NumPy 컴포지터로 수행합니다. (결과는 반올림 오차 수준에서 같음)")
+if numpy_compositor_enabled != (Settings.get("compositor") == "numpy"):
+    Settings.set("compositor", "numpy" if numpy_compositor_enabled else "moviepy")
+
+# 시간 분할 병렬 인코딩 토글 (긴 씬을 청크로 나눠 워커 프로세스에서 동시에 인코딩)
+chunked_encoding_enabled = st.sidebar.toggle("✂️ Chunked Encoding", key="chunked_encoding_toggle",
+                                             value=bool(Settings.get("chunked_encoding", False)),
+                                             help="긴 씬을 몇 초 단위로 나눠 CPU 코어마다 인코딩한 뒤 재인코딩 없이 이어붙입니다.")
+if chunked_encoding_enabled != bool(Settings.get("chunked_encoding", False)):
+    Settings.set("chunked_encoding", chunked_encoding_enabled)
+
+# 함께 만들 출력 대상 (한 번의 합성으로 배포처별 비디오를 동시에 인코딩)
+output_targets = st.sidebar.multiselect("📐 Output Targets", list(OUTPUT_TARGET_PRESETS), key="output_targets_select",
+                                        default=[name for name in Settings.get("output_targets", []) if name in OUTPUT_TARGET_PRESETS],
+                                        help="🎬 전체 렌더링 때 기본 비디오와 함께 만들 출력 형식입니다.")
+if output_targets != Settings.get("output_targets", []):
+    Settings.set("output_targets", output_targets)
+
 # 구분선
 st.sidebar.divider()
 
@@ -53,7 +109,7 @@ st.sidebar.divider()
 if st.sidebar.button("페이지 1", width="stretch", key="page1_btn"):
     st.session_state.current_page = 'page1'
 
-if st.sidebar.button("페이지 2", width="stretch", key="page2_btn"):
+if st.sidebar.button("📊 성능 대시보드", width="stretch", key="page2_btn"):
     st.session_state.current_page = 'page2'
 
 if st.sidebar.button("페이지 3", width="stretch", key="page3_btn"):
@@ -0,0 +1,4 @@
+"""
+렌더링 성능 벤치마크
+저장소 루트에서 python -m benchmarks.render_benchmark 로 실행합니다.
+"""
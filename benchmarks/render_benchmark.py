@@ -0,0 +1,581 @@
+"""
+렌더링 벤치마크
+등록된 모든 씬 타입을 포함하는 합성 프로젝트(사인파 WAV, PIL 이미지, 번들 폰트)를 만들어
+씬별 렌더링과 전체 렌더링을 측정합니다. 네트워크(ElevenLabs)는 사용하지 않습니다.
+
+측정 항목:
+- 씬별/전체 렌더링 벽시계 시간, 초당 렌더링 프레임 수(render_fps)
+- 최대 메모리 사용량(peak RSS, 케이스마다 새 프로세스에서 측정 - 본 프로세스와 ffmpeg 등 자식 프로세스 중 큰 값)
+- 출력 파일 크기, 오디오 PCM 캐시 적중률, 트레이스 단계(phase)별 시간
+- 렌더링 모듈 import 시간
+
+사용 예 (저장소 루트에서):
+    python -m benchmarks.render_benchmark
+    python -m benchmarks.render_benchmark --save-baseline
+    python -m benchmarks.render_benchmark --compare --threshold 0.15
+    python -m benchmarks.render_benchmark --types balance_christmas_main dimango_type --seconds 2
+    python -m benchmarks.render_benchmark --compositor numpy
+
+--compare는 기준선보다 threshold 이상 느려진 케이스가 있으면 종료 코드 1을 반환합니다.
+--compositor는 씬마다 MoviePy 컴포지터와 프레임 차이/합성 fps를 비교하고, 평균 픽셀 차이가
+--tolerance를 넘으면 종료 코드 1을 반환합니다.
+"""
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+AUDIO_FPS = 44100
+
+# 씬 타입별로 채울 필드 (오디오 필드는 WAV, 이미지 필드는 PNG를 생성)
+SCENE_FIELDS = {
+    "type1": {"text": "벤치마크 Type 1"},
+    "type2": {"text": "벤치마크 Type 2"},
+    "type3": {"text": "벤치마크 Type 3"},
+    "balance_christmas_main": {
+        "title": "산타에게 받고 싶은 선물은?", "title_audio": "audio",
+        "choice_a": "최신 스마트폰", "a_audio": "audio", "a_image": "image",
+        "choice_b": "1년치 치킨", "b_audio": "audio", "b_image": "image",
+    },
+    "balance_christmas_enter": {
+        "title": "크리스마스 밸런스 게임", "title_audio": "audio", "center_image": "image",
+    },
+    "balance_christmas_exit": {
+        "title": "다음에 또 만나요", "title_audio": "audio",
+        "choice_a": "좋아요", "a_audio": "audio", "a_image": "image",
+        "choice_b": "구독", "b_audio": "audio", "b_image": "image",
+    },
+    "dimango_type": {
+        "title": "오늘의 [c:red]디망고[/c] 퀴즈", "title_audio": "audio", "center_image": "image",
+    },
+    "dimango_end_type": {
+        "title": "[c:#FF6600]디망고[/c]에서 만나요", "sub_title": "지금 다운로드",
+        "title_audio": "audio", "center_image": "image",
+    },
+}
+
+
+def write_sine_wav(path: Path, seconds: float, frequency: float):
+    """
+    스테레오 16bit 사인파 WAV 생성
+
+    Args:
+        path (Path): 저장할 파일 경로
+        seconds (float): 길이(초)
+        frequency (float): 주파수(Hz)
+    """
+    t = np.arange(int(seconds * AUDIO_FPS)) / AUDIO_FPS
+    tone = 0.3 * np.sin(2 * math.pi * frequency * t)
+    samples = (np.column_stack([tone, tone]) * 32767).astype('<i2')
+    with wave.open(str(path), 'wb') as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(AUDIO_FPS)
+        wav_file.writeframes(samples.tobytes())
+
+
+def write_test_image(path: Path, seed: int, size=(600, 600)):
+    """
+    그라데이션 + 도형이 그려진 테스트 PNG 생성
+
+    Args:
+        path (Path): 저장할 파일 경로
+        seed (int): 색상 결정용 시드
+        size (tuple): 이미지 크기
+    """
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 256, size=3)
+    gradient = np.linspace(0, 1, size[1])[:, None, None]
+    pixels = (base * (0.4 + 0.6 * gradient)).astype(np.uint8)
+    image = Image.fromarray(np.broadcast_to(pixels, (size[1], size[0], 3)).copy(), 'RGB')
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((size[0] // 4, size[1] // 4, size[0] * 3 // 4, size[1] * 3 // 4),
+                 fill=tuple(int(c) for c in 255 - base))
+    image.save(path, 'PNG')
+
+
+def build_synthetic_project(root: Path, scene_types: List[str], seconds: float) -> Path:
+    """
+    씬 타입마다 씬 하나씩을 포함하는 합성 프로젝트 생성
+
+    Args:
+        root (Path): 프로젝트를 만들 폴더
+        scene_types (List[str]): 포함할 씬 타입 목록
+        seconds (float): 오디오 필드 하나당 길이(초)
+
+    Returns:
+        Path: 생성된 프로젝트 경로
+    """
+    project_path = root / f"benchmark_{uuid.uuid4().hex[:6]}"
+    for subfolder in ("audio", "image", "output", "logs"):
+        (project_path / subfolder).mkdir(parents=True, exist_ok=True)
+
+    scenes = []
+    for idx, scene_type in enumerate(scene_types):
+        scene_id = f"bench_{idx:02d}_{scene_type}"
+        scene = {"id": scene_id, "type": scene_type}
+        for field, value in SCENE_FIELDS.get(scene_type, {}).items():
+            if value == "audio":
+                relative = f"audio/{scene_id}_{field}.wav"
+                write_sine_wav(project_path / relative, seconds, 220.0 + 110.0 * (len(scenes) + len(scene)))
+                scene[field] = relative
+            elif value == "image":
+                relative = f"image/{scene_id}_{field}.png"
+                write_test_image(project_path / relative, seed=idx * 10 + len(scene))
+                scene[field] = relative
+            else:
+                scene[field] = value
+        scenes.append(scene)
+
+    with open(project_path / "video.json", 'w', encoding='utf-8') as f:
+        json.dump({"scenes": scenes}, f, ensure_ascii=False, indent=2)
+
+    return project_path
+
+
+def clear_audio_cache(project_path: Path):
+    """프로젝트의 오디오 PCM 캐시(.npy) 삭제 (콜드 렌더링 측정용)"""
+    for cache_file in (project_path / "audio").glob("*.npy"):
+        cache_file.unlink()
+
+
+def get_peak_rss_mb(children: bool = False) -> Optional[float]:
+    """
+    현재 프로세스(또는 종료된 자식 프로세스 중 가장 큰 것)의 최대 메모리 사용량(MB) 반환
+
+    Args:
+        children (bool): True면 자식 프로세스(ffmpeg 인코더 등) 기준 (Windows에서는 측정하지 않음)
+
+    Returns:
+        float: peak RSS (MB) 또는 None (측정할 수 없을 때)
+    """
+    try:
+        import resource
+        who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+        peak = resource.getrusage(who).ru_maxrss
+        # Linux는 KB, macOS는 byte 단위
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        if children:
+            return None
+
+    try:
+        # Windows: PROCESS_MEMORY_COUNTERS.PeakWorkingSetSize
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize / (1024 * 1024)
+    except Exception:
+        pass
+    return None
+
+
+def run_case(case: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    벤치마크 케이스 하나 실행 (새 프로세스에서 호출됨)
+
+    Args:
+        case (dict): {"name", "kind": "scene" | "full", "project_path", "scene_ids", "frames", "use_cache"}
+
+    Returns:
+        dict: 측정 결과
+    """
+    os.chdir(REPO_ROOT)
+    from project_manager import project_manager
+    from service.audio_cache_service import audio_cache_service
+    from service.render_tracer import render_tracer
+    from service.scene_manager import SceneManager
+    from service.video_generator import video_generator
+
+    project_path = Path(case["project_path"])
+    scenes = SceneManager(project_path / "video.json").get_video_data().get("scenes", [])
+    if case.get("scene_ids"):
+        scenes = [scene for scene in scenes if scene.get("id") in case["scene_ids"]]
+
+    result = {"name": case["name"], "kind": case["kind"], "fps": project_manager.get_fps()}
+    warnings = []
+    started = time.perf_counter()
+
+    if case["kind"] == "scene":
+        with render_tracer.trace(project_path / "logs", render_id=f"bench_{case['name']}"):
+            renders = video_generator.render_scenes(scenes, warning_callback=warnings.append,
+                                                    project_path=project_path, use_cache=False)
+        output_paths = [render.video_path for render in renders]
+        frames = sum(int(render.duration * render.fps) for render in renders)
+        ok = len(renders) == len(scenes)
+    else:
+        final_path = video_generator.generate_final_video(
+            scenes, output_filename="benchmark_final.mp4", warning_callback=warnings.append,
+            error_callback=warnings.append, project_path=project_path,
+            use_cache=case.get("use_cache", False)
+        )
+        output_paths = [final_path] if final_path else []
+        frames = case.get("frames", 0)
+        ok = final_path is not None
+
+    wall = time.perf_counter() - started
+    trace = render_tracer.last_trace
+    # 인코딩은 ffmpeg 자식 프로세스에서 하므로 둘 중 큰 값을 케이스의 peak RSS로 사용
+    self_rss, children_rss = get_peak_rss_mb(), get_peak_rss_mb(children=True)
+    measured_rss = [rss for rss in (self_rss, children_rss) if rss is not None]
+    result.update({
+        "ok": ok,
+        "wall": round(wall, 4),
+        "frames": frames,
+        "render_fps": round(frames / wall, 3) if wall > 0 and frames else 0.0,
+        "output_bytes": sum(Path(path).stat().st_size for path in output_paths if Path(path).exists()),
+        "peak_rss_mb": max(measured_rss) if measured_rss else None,
+        "peak_rss_self_mb": self_rss,
+        "peak_rss_children_mb": children_rss,
+        "audio_cache": audio_cache_service.get_stats(),
+        "phases": {phase: round(item["wall"], 4) for phase, item in trace.summarize().items()} if trace else {},
+        "warnings": warnings
+    })
+    return result
+
+
+def compare_compositors(case: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    씬별로 MoviePy 컴포지터와 비교 대상 컴포지터의 프레임 차이와 합성 속도 측정 (새 프로세스에서 호출됨)
+
+    Args:
+        case (dict): {"name", "project_path", "compositor", "max_frames"}
+
+    Returns:
+        dict: {"name", "ok", "scenes": {씬 타입: {"max_diff", "mean_diff", "reference_fps", "fps", "speedup"}}}
+    """
+    os.chdir(REPO_ROOT)
+    from service.compositors import get_compositor
+    from service.scene_manager import SceneManager
+    from service.scene_renderers import get_renderer_class
+
+    project_path = Path(case["project_path"])
+    scenes = SceneManager(project_path / "video.json").get_video_data().get("scenes", [])
+    reference, candidate = get_compositor("moviepy"), get_compositor(case["compositor"])
+    result = {"name": case["name"], "ok": candidate is not None, "scenes": {}}
+    if candidate is None:
+        return result
+
+    for scene in scenes:
+        renderer_class = get_renderer_class(scene.get("type", "type1"))
+        timeline = renderer_class(scene, project_path=project_path).get_timeline() if renderer_class else None
+        if timeline is None:
+            continue
+        frames = min(timeline.frame_count, case.get("max_frames", 120))
+        times = [idx / timeline.fps for idx in range(frames)]
+        measured = {}
+        try:
+            for label, compositor in (("reference", reference), ("candidate", candidate)):
+                frame_function = compositor.make_frame_function(timeline, project_path / "temp")
+                started = time.perf_counter()
+                measured[label] = [np.array(frame_function(t), dtype=np.uint8) for t in times]
+                measured[f"{label}_fps"] = frames / (time.perf_counter() - started)
+        except Exception as e:
+            print(f"⚠️ 컴포지터 비교 실패 ({scene['type']}): {e}")
+            result["ok"] = False
+            continue
+        diffs = [np.abs(a.astype(np.int16) - b.astype(np.int16))
+                 for a, b in zip(measured["reference"], measured["candidate"])]
+        result["scenes"][scene["type"]] = {
+            "frames": frames,
+            "max_diff": int(max(diff.max() for diff in diffs)),
+            "mean_diff": round(float(np.mean([diff.mean() for diff in diffs])), 4),
+            "reference_fps": round(measured["reference_fps"], 2),
+            "fps": round(measured["candidate_fps"], 2),
+            "speedup": round(measured["candidate_fps"] / measured["reference_fps"], 2)
+        }
+    return result
+
+
+def run_isolated(case: Dict[str, Any]) -> Dict[str, Any]:
+    """케이스를 새 프로세스(spawn)에서 실행하여 peak RSS와 캐시 통계를 케이스별로 분리"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(compare_compositors if case.get("kind") == "compositor" else run_case, case).result()
+
+
+def measure_import_time(module: str = "service.video_generator") -> Optional[float]:
+    """
+    새 인터프리터에서 모듈 import 시간(초) 측정
+
+    Args:
+        module (str): 측정할 모듈명
+
+    Returns:
+        float: import 시간(초) 또는 None (실패 시)
+    """
+    code = (f"import time; started = time.perf_counter(); import {module}; "
+            f"print(time.perf_counter() - started)")
+    try:
+        output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True,
+                                text=True, timeout=120, check=True).stdout.strip().splitlines()
+        return round(float(output[-1]), 4)
+    except Exception as e:
+        print(f"⚠️ import 시간 측정 실패 ({module}): {e}")
+        return None
+
+
+def run_benchmark(scene_types: List[str], seconds: float, workdir: Optional[Path] = None,
+                  keep: bool = False, compositor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    전체 벤치마크 실행
+
+    Args:
+        scene_types (List[str]): 측정할 씬 타입 목록
+        seconds (float): 오디오 필드 하나당 길이(초)
+        workdir (Path, optional): 합성 프로젝트를 만들 폴더 (없으면 임시 폴더)
+        keep (bool): 측정 후 합성 프로젝트를 남길지 여부
+        compositor (str, optional): MoviePy 컴포지터와 비교할 컴포지터 이름 (예: "numpy")
+
+    Returns:
+        dict: 벤치마크 결과 ({"meta": ..., "cases": {이름: 결과}})
+    """
+    root = Path(workdir) if workdir else Path(tempfile.mkdtemp(prefix="supermovie_bench_"))
+    root.mkdir(parents=True, exist_ok=True)
+    project_path = build_synthetic_project(root, scene_types, seconds)
+    print(f"합성 프로젝트: {project_path}")
+
+    from service.scene_manager import SceneManager
+    scenes = SceneManager(project_path / "video.json").get_video_data().get("scenes", [])
+
+    cases = {}
+    comparison = None
+    try:
+        # 씬별 렌더링 (콜드: 오디오 캐시 없음)
+        clear_audio_cache(project_path)
+        for scene in scenes:
+            name = f"scene:{scene['type']}"
+            print(f"▶ {name}")
+            cases[name] = run_isolated({"name": name, "kind": "scene", "project_path": str(project_path),
+                                        "scene_ids": [scene["id"]]})
+
+        frames = sum(case["frames"] for case in cases.values())
+
+        # 전체 렌더링 (웜: 씬별 렌더링에서 만든 캐시 사용)
+        print("▶ full:warm")
+        cases["full:warm"] = run_isolated({"name": "full:warm", "kind": "full",
+                                           "project_path": str(project_path), "frames": frames})
+
+        # 전체 렌더링 (씬 렌더링 캐시 사용: 바뀐 씬이 없으므로 합치기만 수행)
+        print("▶ full:cached")
+        cases["full:cached"] = run_isolated({"name": "full:cached", "kind": "full",
+                                             "project_path": str(project_path), "frames": frames,
+                                             "use_cache": True})
+
+        # 전체 렌더링 (콜드)
+        clear_audio_cache(project_path)
+        print("▶ full:cold")
+        cases["full:cold"] = run_isolated({"name": "full:cold", "kind": "full",
+                                           "project_path": str(project_path), "frames": frames})
+
+        # 컴포지터 비교 (프레임 차이와 합성 속도)
+        if compositor:
+            print(f"▶ compositor:{compositor}")
+            comparison = run_isolated({"name": f"compositor:{compositor}", "kind": "compositor",
+                                       "project_path": str(project_path), "compositor": compositor})
+    finally:
+        if not keep and not workdir:
+            shutil.rmtree(root, ignore_errors=True)
+
+    return {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "seconds": seconds,
+            "scene_types": scene_types,
+            "fps": next(iter(cases.values()))["fps"] if cases else None,
+            "import_seconds": measure_import_time()
+        },
+        "cases": cases,
+        "compositor": comparison
+    }
+
+
+def compare_with_baseline(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    기준선과 비교하여 회귀(느려진 케이스) 목록 반환
+
+    Args:
+        results (dict): 현재 결과
+        baseline (dict): 기준선 결과
+        threshold (float): 허용 비율 (0.15 = 15% 까지 허용)
+
+    Returns:
+        List[str]: 회귀 설명 문자열 리스트
+    """
+    if results["meta"].get("fps") != baseline["meta"].get("fps"):
+        print(f"⚠️ fps가 기준선과 다릅니다 (현재 {results['meta'].get('fps')}, "
+              f"기준선 {baseline['meta'].get('fps')}) - 디버그 모드 설정을 확인하세요.")
+
+    regressions = []
+    for name, case in results["cases"].items():
+        base = baseline["cases"].get(name)
+        if not base or not base.get("ok") or not case.get("ok"):
+            continue
+        if base["wall"] > 0 and case["wall"] > base["wall"] * (1 + threshold):
+            regressions.append(f"{name}: wall {base['wall']:.3f}s → {case['wall']:.3f}s "
+                               f"(+{(case['wall'] / base['wall'] - 1) * 100:.1f}%)")
+        base_rss, rss = base.get("peak_rss_mb"), case.get("peak_rss_mb")
+        if "peak_rss_children_mb" not in base:
+            # 자식 프로세스를 측정하지 않던 이전 기준선은 peak RSS를 비교하지 않음
+            base_rss = None
+        if base_rss and rss and rss > base_rss * (1 + threshold):
+            regressions.append(f"{name}: peak RSS {base_rss:.1f}MB → {rss:.1f}MB "
+                               f"(+{(rss / base_rss - 1) * 100:.1f}%)")
+    return regressions
+
+
+def print_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    """결과 표 출력 (기준선이 있으면 wall 시간 변화율 포함)"""
+    meta = results["meta"]
+    print(f"\nfps={meta['fps']}  import={meta['import_seconds']}s  python={meta['python']}")
+    print(f"{'case':32s} {'ok':>3s} {'wall(s)':>9s} {'frames':>7s} {'fps':>8s} "
+          f"{'out(KB)':>9s} {'rss(MB)':>8s} {'cache':>6s} {'Δwall':>8s}")
+    for name, case in results["cases"].items():
+        delta = ""
+        base = (baseline or {}).get("cases", {}).get(name)
+        if base and base.get("wall"):
+            delta = f"{(case['wall'] / base['wall'] - 1) * 100:+.1f}%"
+        rss = case.get("peak_rss_mb")
+        print(f"{name:32s} {'✓' if case['ok'] else '✗':>3s} {case['wall']:9.3f} {case['frames']:7d} "
+              f"{case['render_fps']:8.2f} {case['output_bytes'] / 1024:9.1f} "
+              f"{rss if rss is not None else float('nan'):8.1f} "
+              f"{case['audio_cache']['hit_rate'] * 100:5.0f}% {delta:>8s}")
+
+
+def print_compositor_report(comparison: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    컴포지터 비교 결과 표 출력
+
+    Args:
+        comparison (dict): compare_compositors() 결과
+        tolerance (float): 허용할 평균 픽셀 차이
+
+    Returns:
+        List[str]: 허용 오차를 넘은 씬 설명 리스트
+    """
+    print(f"\n[{comparison['name']}] MoviePy 대비")
+    print(f"{'scene':32s} {'frames':>7s} {'max':>5s} {'mean':>7s} {'ref fps':>9s} {'fps':>9s} {'speedup':>8s}")
+    mismatches = []
+    for scene_type, item in comparison["scenes"].items():
+        print(f"{scene_type:32s} {item['frames']:7d} {item['max_diff']:5d} {item['mean_diff']:7.3f} "
+              f"{item['reference_fps']:9.2f} {item['fps']:9.2f} {item['speedup']:7.2f}x")
+        if item["mean_diff"] > tolerance:
+            mismatches.append(f"{scene_type}: 평균 픽셀 차이 {item['mean_diff']:.3f} > {tolerance}")
+    return mismatches
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """CLI 인자 파서 생성"""
+    parser = argparse.ArgumentParser(description="합성 프로젝트로 렌더링 성능을 측정합니다.")
+    parser.add_argument("--types", nargs="+", metavar="TYPE",
+                        help="측정할 씬 타입 (기본값: 등록된 모든 타입)")
+    parser.add_argument("--seconds", type=float, default=1.0, help="오디오 필드 하나당 길이(초, 기본값: 1.0)")
+    parser.add_argument("--workdir", help="합성 프로젝트를 만들 폴더 (지정하면 삭제하지 않음)")
+    parser.add_argument("--keep", action="store_true", help="측정 후 임시 합성 프로젝트를 삭제하지 않음")
+    parser.add_argument("--baseline", default="default", help="기준선 이름 (benchmarks/baselines/<이름>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준선으로 저장")
+    parser.add_argument("--compare", action="store_true", help="기준선과 비교하여 회귀가 있으면 실패")
+    parser.add_argument("--threshold", type=float, default=0.15, help="회귀로 판단할 비율 (기본값: 0.15)")
+    parser.add_argument("--output", help="결과 JSON을 저장할 경로")
+    parser.add_argument("--compositor", help="MoviePy 컴포지터와 프레임/속도를 비교할 컴포지터 (예: numpy)")
+    parser.add_argument("--tolerance", type=float, default=1.0,
+                        help="컴포지터 비교에서 허용할 평균 픽셀 차이 (기본값: 1.0)")
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    CLI 진입점
+
+    Returns:
+        int: 종료 코드 (0: 성공, 1: 회귀 또는 렌더링 실패)
+    """
+    args = build_parser().parse_args(argv)
+    os.chdir(REPO_ROOT)
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    from service.scene_renderers import renderer_classes
+    scene_types = args.types or list(renderer_classes)
+    unknown = [scene_type for scene_type in scene_types if scene_type not in renderer_classes]
+    if unknown:
+        print(f"❌ 알 수 없는 씬 타입: {', '.join(unknown)}")
+        return 1
+
+    results = run_benchmark(scene_types, args.seconds, args.workdir, args.keep, args.compositor)
+
+    baseline_path = BASELINE_DIR / f"{args.baseline}.json"
+    baseline = None
+    if baseline_path.exists():
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print_report(results, baseline)
+    mismatches = print_compositor_report(results["compositor"], args.tolerance) if results.get("compositor") else []
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n기준선 저장: {baseline_path}")
+
+    exit_code = 0
+    if args.compare:
+        if not baseline:
+            print(f"\n⚠️ 기준선이 없습니다: {baseline_path} (--save-baseline으로 먼저 저장하세요)")
+        else:
+            regressions = compare_with_baseline(results, baseline, args.threshold)
+            if regressions:
+                print(f"\n❌ 성능 회귀 ({args.threshold * 100:.0f}% 초과):")
+                for regression in regressions:
+                    print(f"   {regression}")
+                exit_code = 1
+            else:
+                print("\n✅ 기준선 대비 회귀 없음")
+
+    if mismatches:
+        print("\n❌ 컴포지터 결과 불일치:")
+        for mismatch in mismatches:
+            print(f"   {mismatch}")
+        exit_code = 1
+
+    # type1~3처럼 아직 영상을 만들지 않는 타입은 실패로 표시만 하고 종료 코드에는 반영하지 않음
+    if not results["cases"].get("full:warm", {}).get("ok"):
+        exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
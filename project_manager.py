@@ -1,7 +1,8 @@
 import os
 import datetime
 from pathlib import Path
-import streamlit as st
+from service.blob_store import blob_store
+from service.project_catalog import ProjectCatalog, project_catalog
 from service.video_manager import video_manager
 from settings import Settings
 
@@ -62,6 +63,9 @@ class ProjectManager:
     def __init__(self, base_dir="projects"):
         self.base_dir = Path(base_dir)
         self.current_project = None  # 현재 선택된 프로젝트 정보 저장
+        # 프로젝트 목록/통계 인덱스 (기본 폴더는 전역 카탈로그 공유)
+        self.catalog = project_catalog if self.base_dir == project_catalog.base_dir else ProjectCatalog(
+            self.base_dir, db_path=f"{self.base_dir.name}_catalog.db")
         self.ensure_projects_directory()
         self._load_last_project()
 
@@ -128,6 +132,7 @@ class ProjectManager:
             subfolders = ['data', 'output', 'config', 'logs']
             for subfolder in subfolders:
                 (project_path / subfolder).mkdir(exist_ok=True)
+            self.catalog.refresh_project(project_path)
             
             # Project 객체 생성
             project = Project(
@@ -159,37 +164,39 @@ class ProjectManager:
             }
     
     def get_projects_list(self):
-        """생성된 프로젝트 목록 반환 (Project 객체 리스트)"""
+        """생성된 프로젝트 목록 반환 (Project 객체 리스트, 최신순) - 프로젝트 카탈로그 사용"""
         if not self.base_dir.exists():
             return []
         
-        projects = []
-        for item in self.base_dir.iterdir():
-            if item.is_dir():
-                # 폴더 이름에서 날짜시간과 프로젝트 이름 분리
-                folder_name = item.name
-                if "_" in folder_name:
-                    timestamp, name = folder_name.split("_", 1)
-                    # Project 객체 생성
-                    project = Project(
-                        project_name=name,
-                        folder_name=folder_name,
-                        path=item,
-                        timestamp=timestamp
-                    )
-                    projects.append(project)
-                else:
-                    # 타임스탬프가 없는 경우
-                    project = Project(
-                        project_name=folder_name,
-                        folder_name=folder_name,
-                        path=item,
-                        timestamp=""
-                    )
-                    projects.append(project)
+        entries, _ = self.catalog.query(limit=None, refresh_stats=False)
+        return [self.entry_to_project(entry) for entry in entries]
+    
+    def search_projects(self, search=None, date_from=None, date_to=None, page=0, page_size=20):
+        """
+        프로젝트 검색 (이름/생성일 범위, 페이지 단위) - 통계(씬 수, 크기, 마지막 렌더링) 포함
         
-        # 타임스탬프 기준으로 정렬 (최신순)
-        return sorted(projects, key=lambda x: x.timestamp, reverse=True)
+        Args:
+            search (str, optional): 프로젝트 이름 검색어
+            date_from (date, optional): 생성일 시작 (포함)
+            date_to (date, optional): 생성일 끝 (포함)
+            page (int): 페이지 번호 (0부터)
+            page_size (int): 페이지당 프로젝트 수
+            
+        Returns:
+            tuple: (CatalogEntry 리스트, 조건에 맞는 전체 프로젝트 수)
+        """
+        return self.catalog.query(search=search, date_from=date_from, date_to=date_to,
+                                  offset=page * page_size, limit=page_size)
+    
+    @staticmethod
+    def entry_to_project(entry):
+        """카탈로그 항목(CatalogEntry)을 Project 객체로 변환"""
+        return Project(
+            project_name=entry.project_name,
+            folder_name=entry.folder_name,
+            path=entry.path,
+            timestamp=entry.timestamp
+        )
     
     def get_current_project(self):
         """현재 선택된 프로젝트 정보 반환"""
@@ -238,9 +245,9 @@ class ProjectManager:
             # 파일 경로
             file_path = target_folder / filename
             
-            # 파일 저장
-            with open(file_path, 'wb') as f:
-                f.write(uploaded_file.getbuffer())
+            # 파일 저장 (내용 주소 저장소에 한 번만 보관하고 하드링크)
+            if not blob_store.save_bytes(uploaded_file.getbuffer(), file_path):
+                return None
             
             # 상대 경로 반환
             relative_path = f"{subfolder}/{filename}"
@@ -289,9 +296,9 @@ class ProjectManager:
             # 파일 경로
             file_path = target_folder / filename
 
-            # 파일 저장
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
+            # 파일 저장 (내용 주소 저장소에 한 번만 보관하고 하드링크)
+            if not blob_store.save_bytes(uploaded_file.getbuffer(), file_path):
+                return None
 
             # 상대 경로 반환
             relative_path = f"{subfolder}/{filename}"
@@ -316,17 +323,18 @@ class ProjectManager:
 
         return project_path / relative_path
 
-    def get_output_path(self, scene_id: str) -> tuple:
+    def get_output_path(self, scene_id: str, project_path=None) -> tuple:
         """
         scene_id를 받아서 output 폴더 경로와 파일 경로를 반환
         
         Args:
             scene_id (str): 씬 ID
+            project_path (str or Path, optional): 프로젝트 경로 (없으면 현재 프로젝트 사용)
             
         Returns:
             tuple: (output_folder_path, output_file_path, relative_path) 또는 (None, None, None)
         """
-        project_path = self.get_project_path()
+        project_path = Path(project_path) if project_path else self.get_project_path()
         if not project_path:
             print("프로젝트가 로드되지 않았습니다.")
             return None, None, None
@@ -356,6 +364,9 @@ class ProjectManager:
             if project_path.exists():
                 import shutil
                 shutil.rmtree(project_path)
+                self.catalog.remove(folder_name)
+                # 다른 프로젝트가 참조하지 않는 에셋만 저장소에서 삭제
+                blob_store.release_tree(project_path)
                 return {
                     "success": True,
                     "message": f"프로젝트 '{folder_name}'가 삭제되었습니다."
@@ -0,0 +1,107 @@
+"""
+헤드리스 렌더링 CLI
+Streamlit/UI 모듈을 import 하지 않고 프로젝트 폴더(또는 선택한 씬)를 렌더링합니다.
+배치 서버에서 빠르게 시작하고 적은 메모리로 실행하기 위한 진입점입니다.
+
+사용 예:
+    python render_cli.py "projects/20251221_075752_내 남친 몇개"
+    python render_cli.py "projects/..." --scene <scene_id> --scene <scene_id>
+    python render_cli.py "projects/..." --list
+"""
+import argparse
+import sys
+from pathlib import Path
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """CLI 인자 파서 생성"""
+    parser = argparse.ArgumentParser(description="프로젝트를 헤드리스로 렌더링합니다.")
+    parser.add_argument("project", help="프로젝트 폴더 경로 (video.json 포함)")
+    parser.add_argument("--scene", action="append", dest="scene_ids", metavar="SCENE_ID",
+                        help="렌더링할 씬 ID (여러 번 지정 가능, 지정하면 최종 비디오는 만들지 않음)")
+    parser.add_argument("--output", default="final_output.mp4", help="최종 비디오 파일명 (기본값: final_output.mp4)")
+    parser.add_argument("--target", action="append", dest="output_targets", metavar="TARGET",
+                        help="함께 만들 출력 대상 프리셋 (여러 번 지정 가능, 예: shorts, reels, tiktok, feed_4x5)")
+    parser.add_argument("--list", action="store_true", help="씬 목록만 출력")
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    CLI 진입점
+
+    Args:
+        argv (list, optional): 명령행 인자 (None이면 sys.argv 사용)
+
+    Returns:
+        int: 종료 코드 (0: 성공, 1: 실패)
+    """
+    args = build_parser().parse_args(argv)
+
+    project_path = Path(args.project)
+    video_json_path = project_path / "video.json"
+    if not video_json_path.exists():
+        print(f"❌ video.json을 찾을 수 없습니다: {video_json_path}")
+        return 1
+
+    from service.scene_manager import SceneManager
+    scenes = SceneManager(video_json_path).get_video_data().get("scenes", [])
+
+    if args.list:
+        for idx, scene in enumerate(scenes, 1):
+            print(f"{idx:3d}  {scene.get('id')}  {scene.get('type', 'type1')}")
+        return 0
+
+    if args.scene_ids:
+        scene_ids = set(args.scene_ids)
+        missing = scene_ids - {scene.get("id") for scene in scenes}
+        for scene_id in sorted(missing):
+            print(f"⚠️ 씬을 찾을 수 없습니다: {scene_id}")
+        scenes = [scene for scene in scenes if scene.get("id") in scene_ids]
+
+    if not scenes:
+        print("❌ 생성할 씬이 없습니다.")
+        return 1
+
+    # 렌더링 쪽 모듈만 로드 (ui.* / streamlit 없음)
+    from service.video_generator import video_generator
+
+    def on_progress(progress: float):
+        print(f"   진행률: {progress * 100:.0f}%")
+
+    def on_message(message: str):
+        print(message)
+
+    if args.scene_ids:
+        video_paths = video_generator.generate_all_scene_videos(
+            scenes=scenes,
+            progress_callback=on_progress,
+            status_callback=on_message,
+            warning_callback=on_message,
+            project_path=project_path
+        )
+        for path in video_paths:
+            print(f"✅ {path}")
+        return 0 if len(video_paths) == len(scenes) else 1
+
+    outputs = video_generator.generate_final_outputs(
+        scenes=scenes,
+        output_filename=args.output,
+        progress_callback=on_progress,
+        status_callback=on_message,
+        warning_callback=on_message,
+        error_callback=on_message,
+        success_callback=on_message,
+        project_path=project_path,
+        output_targets=args.output_targets
+    )
+    if not outputs:
+        return 1
+    for name, path in outputs.items():
+        print(f"✅ [{name}] {path}")
+    # 요청한 출력 대상이 모두 만들어졌을 때만 성공
+    return 0 if len(outputs) == 1 + len(set(args.output_targets or [])) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
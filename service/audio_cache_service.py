@@ -0,0 +1,182 @@
+"""
+오디오 PCM 캐시 서비스
+오디오 파일을 한 번만 디코딩하여 리샘플링된 PCM을 원본 파일 옆에 .npy로 저장하고,
+이후 렌더링에서는 디코딩 없이 메모리 매핑(mmap)으로 읽어옵니다.
+
+- 캐시 파일명: {원본 파일명}.{fps}hz.{원본 식별자}.npy (예: audio/abc_title_audio.mp3.44100hz.1a2b-5f00-17c3....npy)
+- 원본 식별자는 원본 파일의 (inode, 크기, 수정 시각 ns)입니다. 블롭 저장소가 원본을 예전 수정 시각의
+  하드링크로 바꿔도 식별자가 달라지므로 이전 PCM을 쓰지 않고 다시 디코딩합니다. (이전 캐시 파일은 새로 저장할 때 삭제)
+- mmap으로 읽기 때문에 여러 워커 프로세스가 OS 페이지 캐시를 공유합니다.
+"""
+import os
+import subprocess
+import threading
+from glob import escape as glob_escape
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from utils.ffmpeg_utils import get_ffmpeg_binary
+from service.telemetry import telemetry
+
+
+class AudioCacheService:
+    """디코딩된 오디오 PCM을 .npy로 캐싱하는 서비스 클래스"""
+
+    # MoviePy AudioFileClip 기본값과 동일한 샘플레이트/채널 수
+    DEFAULT_FPS = 44100
+    NCHANNELS = 2
+
+    def __init__(self):
+        """AudioCacheService 초기화 (캐시 적중 통계 포함)"""
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_source_signature(audio_path: Path) -> Optional[str]:
+        """원본 파일 식별자 (inode, 크기, 수정 시각 ns) - 파일이 없으면 None"""
+        try:
+            stat = Path(audio_path).stat()
+        except OSError:
+            return None
+        return f"{stat.st_ino:x}-{stat.st_size:x}-{stat.st_mtime_ns:x}"
+
+    @classmethod
+    def get_cache_path(cls, audio_path: Path, fps: int = DEFAULT_FPS) -> Optional[Path]:
+        """
+        원본 오디오 파일(현재 내용)에 대응하는 캐시 파일 경로 반환
+
+        Args:
+            audio_path (Path): 원본 오디오 파일 경로
+            fps (int): 샘플레이트
+
+        Returns:
+            Path: 캐시(.npy) 파일 경로 또는 None (원본이 없을 때)
+        """
+        audio_path = Path(audio_path)
+        signature = cls.get_source_signature(audio_path)
+        if signature is None:
+            return None
+        return audio_path.with_name(f"{audio_path.name}.{fps}hz.{signature}.npy")
+
+    def load(self, audio_path, fps: int = DEFAULT_FPS) -> Optional[np.ndarray]:
+        """
+        오디오 파일의 PCM 배열을 반환 (캐시가 있으면 mmap으로 읽기, 없으면 디코딩 후 캐싱)
+
+        Args:
+            audio_path (str or Path): 원본 오디오 파일 경로
+            fps (int): 샘플레이트 (기본값: 44100)
+
+        Returns:
+            np.ndarray: (샘플 수, 2) 형태의 float32 배열 또는 None (실패 시)
+        """
+        audio_path = Path(audio_path)
+        cache_path = self.get_cache_path(audio_path, fps)
+        if cache_path is None:
+            return None
+
+        if cache_path.exists():
+            try:
+                array = np.load(cache_path, mmap_mode='r')
+                self.hits += 1
+                telemetry.count_cache("audio", hit=True)
+                return array
+            except Exception as e:
+                print(f"[AUDIO_CACHE] 캐시 읽기 오류 (재디코딩): {e}")
+
+        self.misses += 1
+        telemetry.count_cache("audio", hit=False)
+        array = self._decode(audio_path, fps)
+        if array is None:
+            return None
+
+        # 디코딩 중에 원본이 바뀌었으면 이전 식별자로 저장하지 않음
+        if self.get_cache_path(audio_path, fps) != cache_path or not self._write_cache(cache_path, array):
+            return array
+        self._remove_stale(cache_path, audio_path, fps)
+
+        try:
+            return np.load(cache_path, mmap_mode='r')
+        except Exception:
+            return array
+
+    def get_duration(self, audio_path, fps: int = DEFAULT_FPS) -> Optional[float]:
+        """
+        오디오 길이(초) 반환 (캐시된 PCM 길이 기준)
+
+        Args:
+            audio_path (str or Path): 원본 오디오 파일 경로
+            fps (int): 샘플레이트
+
+        Returns:
+            float: 길이(초) 또는 None (실패 시)
+        """
+        array = self.load(audio_path, fps)
+        if array is None:
+            return None
+        return len(array) / fps
+
+    def get_stats(self) -> dict:
+        """캐시 적중 통계 반환"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0
+        }
+
+    @staticmethod
+    def _remove_stale(cache_path: Path, audio_path: Path, fps: int):
+        """같은 원본/샘플레이트의 이전 식별자 캐시 파일 삭제"""
+        for stale_path in audio_path.parent.glob(f"{glob_escape(audio_path.name)}.{fps}hz.*.npy"):
+            if stale_path != cache_path:
+                try:
+                    stale_path.unlink()
+                except OSError:
+                    pass
+
+    @classmethod
+    def _decode(cls, audio_path: Path, fps: int) -> Optional[np.ndarray]:
+        """
+        ffmpeg로 오디오를 디코딩하여 (샘플 수, 2) float32 배열로 변환
+        (MoviePy의 to_soundarray는 길이가 샘플 경계에 딱 맞는 파일에서 끝 시각 접근 오류가 나므로 직접 디코딩)
+        """
+        try:
+            command = [
+                get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error",
+                "-i", str(audio_path),
+                # 모노 오디오는 스테레오로 맞춤 (AudioArrayClip은 2채널 기준)
+                "-f", "f32le", "-acodec", "pcm_f32le", "-ac", str(cls.NCHANNELS), "-ar", str(fps),
+                "-"
+            ]
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            if result.returncode != 0:
+                print(f"[AUDIO_CACHE] 오디오 디코딩 오류: {audio_path} - {result.stderr.decode(errors='ignore').strip()}")
+                return None
+            array = np.frombuffer(result.stdout, dtype=np.float32)
+            return array[:len(array) - len(array) % cls.NCHANNELS].reshape(-1, cls.NCHANNELS).copy()
+        except Exception as e:
+            print(f"[AUDIO_CACHE] 오디오 디코딩 오류: {audio_path} - {e}")
+            return None
+
+    @staticmethod
+    def _write_cache(cache_path: Path, array: np.ndarray) -> bool:
+        """임시 파일에 쓴 뒤 교체하여 캐시를 원자적으로 저장"""
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.save(f, array)
+            os.replace(tmp_path, cache_path)
+            return True
+        except Exception as e:
+            print(f"[AUDIO_CACHE] 캐시 저장 오류: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return False
+
+
+# 싱글톤 인스턴스 생성 (편의를 위해)
+audio_cache_service = AudioCacheService()
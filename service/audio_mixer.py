@@ -0,0 +1,166 @@
+"""
+오디오 믹싱 서비스
+씬들의 오디오 배치 정보(파일, 시작 시간)를 받아 NumPy로 한 번에 믹싱하고
+WAV로 저장합니다. 최종 영상의 사운드트랙을 한 번만 인코딩하기 위해 사용됩니다.
+"""
+import io
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from service.audio_cache_service import audio_cache_service
+
+
+@dataclass
+class AudioPlacement:
+    """
+    오디오 배치 구조체
+    오디오 파일 경로, 타임라인상 시작 시간, (선택) 잘라낼 종료 시간을 포함
+    """
+    path: str
+    start: float = 0.0
+    end: Optional[float] = None  # None이면 오디오 끝까지 (씬 길이에서 잘릴 때 사용)
+
+    def shifted(self, offset: float, end: Optional[float] = None) -> 'AudioPlacement':
+        """
+        시작/종료 시간을 offset만큼 이동한 새 배치 반환
+
+        Args:
+            offset (float): 이동할 시간(초)
+            end (float, optional): 새 종료 시간 (이미 offset이 반영된 절대 시간)
+
+        Returns:
+            AudioPlacement: 이동된 배치
+        """
+        own_end = self.end + offset if self.end is not None else None
+        if end is not None:
+            own_end = min(own_end, end) if own_end is not None else end
+        return AudioPlacement(path=self.path, start=self.start + offset, end=own_end)
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (JSON 저장용)"""
+        return {"path": str(self.path), "start": self.start, "end": self.end}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'AudioPlacement':
+        """딕셔너리에서 AudioPlacement 생성"""
+        return cls(path=data["path"], start=data.get("start", 0.0), end=data.get("end"))
+
+
+class AudioMixer:
+    """오디오 배치들을 하나의 PCM 버퍼로 믹싱하는 클래스"""
+
+    def __init__(self, fps: int = audio_cache_service.DEFAULT_FPS):
+        """
+        AudioMixer 초기화
+
+        Args:
+            fps (int): 샘플레이트 (기본값: 44100)
+        """
+        self.fps = fps
+
+    def mix(self, placements: List[AudioPlacement], duration: float) -> np.ndarray:
+        """
+        오디오 배치들을 duration 길이의 스테레오 버퍼에 믹싱
+
+        Args:
+            placements (List[AudioPlacement]): 오디오 배치 리스트
+            duration (float): 전체 길이(초)
+
+        Returns:
+            np.ndarray: (샘플 수, 2) 형태의 float32 배열 (-1.0 ~ 1.0)
+        """
+        total_samples = int(round(duration * self.fps))
+        buffer = np.zeros((total_samples, audio_cache_service.NCHANNELS), dtype=np.float32)
+
+        for placement in placements:
+            pcm = audio_cache_service.load(placement.path, self.fps)
+            if pcm is None:
+                print(f"[AUDIO_MIX] 오디오를 불러올 수 없습니다: {placement.path}")
+                continue
+
+            start_sample = int(round(placement.start * self.fps))
+            end_sample = start_sample + len(pcm)
+            if placement.end is not None:
+                end_sample = min(end_sample, int(round(placement.end * self.fps)))
+            end_sample = min(end_sample, total_samples)
+
+            # 버퍼 범위를 벗어난 부분은 잘라냄 (음수 시작 포함)
+            src_offset = max(0, -start_sample)
+            dst_start = max(0, start_sample)
+            if end_sample <= dst_start:
+                continue
+
+            length = end_sample - dst_start
+            buffer[dst_start:end_sample] += pcm[src_offset:src_offset + length]
+
+        np.clip(buffer, -1.0, 1.0, out=buffer)
+        return buffer
+
+    def write_wav(self, pcm: np.ndarray, output_path: Path) -> Optional[Path]:
+        """
+        PCM 버퍼를 16bit WAV 파일로 저장
+
+        Args:
+            pcm (np.ndarray): (샘플 수, 채널 수) float 배열
+            output_path (Path): 저장할 파일 경로
+
+        Returns:
+            Path: 저장된 파일 경로 또는 None (실패 시)
+        """
+        try:
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_wav(str(output_path), pcm)
+            return output_path
+        except Exception as e:
+            print(f"[AUDIO_MIX] WAV 저장 오류: {e}")
+            return None
+
+    def encode_wav(self, pcm: np.ndarray) -> Optional[bytes]:
+        """
+        PCM 버퍼를 16bit WAV 바이트로 인코딩 (파일 없이 메모리에서, 미리듣기용)
+
+        Args:
+            pcm (np.ndarray): (샘플 수, 채널 수) float 배열
+
+        Returns:
+            bytes: WAV 바이트 또는 None (실패 시)
+        """
+        try:
+            buffer = io.BytesIO()
+            self._write_wav(buffer, pcm)
+            return buffer.getvalue()
+        except Exception as e:
+            print(f"[AUDIO_MIX] WAV 인코딩 오류: {e}")
+            return None
+
+    def _write_wav(self, target, pcm: np.ndarray):
+        """PCM 버퍼를 16bit WAV로 기록 (target: 파일 경로 또는 파일 객체)"""
+        samples = (np.clip(pcm, -1.0, 1.0) * 32767.0).astype('<i2')
+        with wave.open(target, 'wb') as wav_file:
+            wav_file.setnchannels(samples.shape[1])
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(self.fps)
+            wav_file.writeframes(samples.tobytes())
+
+    def mix_to_wav(self, placements: List[AudioPlacement], duration: float, output_path: Path) -> Optional[Path]:
+        """
+        오디오 배치들을 믹싱하여 WAV 파일로 저장 (편의 메서드)
+
+        Args:
+            placements (List[AudioPlacement]): 오디오 배치 리스트
+            duration (float): 전체 길이(초)
+            output_path (Path): 저장할 파일 경로
+
+        Returns:
+            Path: 저장된 파일 경로 또는 None (실패 시)
+        """
+        return self.write_wav(self.mix(placements, duration), output_path)
+
+
+# 싱글톤 인스턴스 생성 (편의를 위해)
+audio_mixer = AudioMixer()
@@ -0,0 +1,204 @@
+"""
+오디오 미리듣기 서비스
+비디오를 렌더링하지 않고 씬의 오디오 배치(gen_audio_clip의 시작 시간)만 모아 NumPy로 믹싱한 뒤
+짧은 WAV/Opus로 반환합니다. 제목/A/B 오디오의 순서와 간격을 바로 들어 볼 때 사용합니다.
+
+- 씬 렌더러의 타임라인(get_timeline)에서 오디오 레이어만 사용합니다. (영상 합성, 인코딩 없음)
+- 오디오는 디코딩된 PCM 캐시(.npy, mmap)에서 읽어서 AudioMixer로 믹싱합니다. (최종 사운드트랙과 같은 믹싱)
+- 결과는 오디오 지문(파일 경로/크기/수정 시각, 시작/종료 시간, 씬 길이, 형식)별로 LRU 캐시에 MAX_ITEMS개까지 보관합니다.
+  녹음을 다시 하거나 배치가 바뀌면 지문이 달라지므로 새로 믹싱합니다.
+- Opus는 ffmpeg(libopus)로 인코딩하며, 실패하면 WAV로 반환합니다.
+"""
+import hashlib
+import json
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from project_manager import project_manager
+from service.audio_mixer import AudioPlacement, audio_mixer
+from service.render_tracer import render_tracer
+from service.telemetry import telemetry
+from utils.ffmpeg_utils import get_ffmpeg_binary
+
+# 형식 → MIME 타입
+AUDIO_FORMATS = {"wav": "audio/wav", "opus": "audio/ogg"}
+
+
+@dataclass
+class AudioPreview:
+    """
+    오디오 미리듣기 결과 구조체
+    인코딩된 오디오 바이트, MIME 타입, 씬 길이, 오디오 배치 요약을 포함
+    """
+    data: bytes
+    mime_type: str
+    duration: float
+    placements: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class AudioPreviewService:
+    """비디오 렌더링 없이 씬의 오디오만 믹싱하는 미리듣기 서비스 클래스"""
+
+    MAX_ITEMS = 32          # 캐시할 미리듣기 수
+    OPUS_BITRATE = "64k"    # Opus 미리듣기 비트레이트
+
+    def __init__(self, max_items: int = MAX_ITEMS):
+        """
+        AudioPreviewService 초기화
+
+        Args:
+            max_items (int): 캐시할 미리듣기 수
+        """
+        self.max_items = max_items
+        self._previews: "OrderedDict[str, AudioPreview]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_audio_key(placements: List[AudioPlacement], duration: float, audio_format: str) -> str:
+        """
+        오디오 지문 계산 (파일 크기/수정 시각을 포함하므로 같은 경로에 다시 녹음해도 달라짐)
+
+        Args:
+            placements (List[AudioPlacement]): 오디오 배치 리스트
+            duration (float): 씬 길이(초)
+            audio_format (str): 형식 ("wav" 또는 "opus")
+
+        Returns:
+            str: 지문 (sha1 hex)
+        """
+        items = []
+        for placement in placements:
+            try:
+                stat = Path(placement.path).stat()
+                file_info = [stat.st_size, stat.st_mtime_ns]
+            except OSError:
+                file_info = None
+            items.append([str(placement.path), placement.start, placement.end, file_info])
+        payload = json.dumps({"placements": items, "duration": duration, "fps": audio_mixer.fps,
+                              "format": audio_format}, sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_placements(scene: Dict[str, Any], project_path: Path):
+        """
+        씬 타임라인에서 오디오 배치와 씬 길이 계산 (영상 레이어는 합성하지 않음)
+
+        Returns:
+            tuple: (AudioPlacement 리스트, 씬 길이) 또는 (None, None) (타임라인을 만들 수 없을 때)
+        """
+        from service.scene_renderers import get_renderer_class
+
+        SceneClass = get_renderer_class(scene.get("type", "type1"))
+        if SceneClass is None:
+            return None, None
+        timeline = SceneClass(scene, project_path=project_path).get_timeline()
+        if timeline is None:
+            return None, None
+        placements = [AudioPlacement(path=layer.source["path"], start=layer.start) for layer in timeline.audio_layers]
+        placements.sort(key=lambda placement: placement.start)
+        return placements, timeline.duration
+
+    @staticmethod
+    def summarize(placements: List[AudioPlacement], duration: float) -> List[Dict[str, Any]]:
+        """
+        오디오 배치 요약 (순서, 파일 이름, 시작/끝, 앞 오디오와의 간격) - 음수 간격은 겹침
+
+        Args:
+            placements (List[AudioPlacement]): 시작 시간 순 오디오 배치 리스트
+            duration (float): 씬 길이(초)
+
+        Returns:
+            list: {"name", "start", "end", "gap"} 딕셔너리 리스트
+        """
+        from service.audio_cache_service import audio_cache_service
+
+        rows = []
+        previous_end = 0.0
+        for placement in placements:
+            pcm = audio_cache_service.load(placement.path, audio_mixer.fps)
+            length = pcm.shape[0] / audio_mixer.fps if pcm is not None else 0.0
+            end = min(placement.start + length, placement.end if placement.end is not None else duration, duration)
+            rows.append({"name": Path(placement.path).name, "start": round(placement.start, 3),
+                         "end": round(end, 3), "gap": round(placement.start - previous_end, 3)})
+            previous_end = max(previous_end, end)
+        return rows
+
+    def _encode_opus(self, wav_data: bytes) -> Optional[bytes]:
+        """WAV 바이트를 ffmpeg로 Opus(ogg)로 인코딩"""
+        try:
+            command = [
+                get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error",
+                "-f", "wav", "-i", "-",
+                "-c:a", "libopus", "-b:a", self.OPUS_BITRATE, "-f", "ogg", "-"
+            ]
+            result = subprocess.run(command, input=wav_data, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            if result.returncode != 0:
+                print(f"[AUDIO_PREVIEW] Opus 인코딩 오류: {result.stderr.decode(errors='ignore').strip()}")
+                return None
+            return result.stdout
+        except Exception as e:
+            print(f"[AUDIO_PREVIEW] Opus 인코딩 오류: {e}")
+            return None
+
+    def get_preview(self, scene: Dict[str, Any], project_path=None, audio_format: str = "wav") -> Optional[AudioPreview]:
+        """
+        씬 오디오 미리듣기 (오디오 지문별 캐시 사용)
+
+        Args:
+            scene (dict): 씬 정보 딕셔너리
+            project_path (str or Path, optional): 프로젝트 경로 (없으면 현재 로드된 프로젝트)
+            audio_format (str): 형식 ("wav" 또는 "opus")
+
+        Returns:
+            AudioPreview: 미리듣기 결과 또는 None (오디오가 없거나 실패 시)
+        """
+        if audio_format not in AUDIO_FORMATS:
+            print(f"[AUDIO_PREVIEW] 지원하지 않는 형식: {audio_format}")
+            return None
+        project_path = Path(project_path) if project_path else project_manager.get_project_path()
+        try:
+            placements, duration = self.get_placements(scene, project_path)
+            if not placements or not duration:
+                return None
+
+            key = self.get_audio_key(placements, duration, audio_format)
+            with self._lock:
+                preview = self._previews.get(key)
+                if preview is not None:
+                    self._previews.move_to_end(key)
+            telemetry.count_cache("audio_preview", hit=preview is not None)
+            if preview is not None:
+                return preview
+
+            with render_tracer.span("audio_preview", phase="preview", scene_id=scene.get("id")):
+                data = audio_mixer.encode_wav(audio_mixer.mix(placements, duration))
+                if data is None:
+                    return None
+                mime_type = AUDIO_FORMATS["wav"]
+                if audio_format == "opus":
+                    opus_data = self._encode_opus(data)
+                    if opus_data:
+                        data, mime_type = opus_data, AUDIO_FORMATS["opus"]
+                preview = AudioPreview(data, mime_type, duration, self.summarize(placements, duration))
+
+            with self._lock:
+                self._previews[key] = preview
+                while len(self._previews) > self.max_items:
+                    self._previews.popitem(last=False)
+            return preview
+        except Exception as e:
+            print(f"[AUDIO_PREVIEW] 오디오 미리듣기 생성 오류: {e}")
+            return None
+
+    def clear(self):
+        """미리듣기 캐시 비우기"""
+        with self._lock:
+            self._previews.clear()
+
+
+# 싱글톤 인스턴스 생성 (편의를 위해)
+audio_preview_service = AudioPreviewService()
@@ -0,0 +1,389 @@
+"""
+내용 주소 기반(content-addressed) 에셋 저장소
+프로젝트에 저장하는 이미지/오디오를 SHA-256 해시로 한 번만 보관하고, 프로젝트의 image/, audio/ 파일은
+저장소 파일의 하드링크로 만듭니다. 같은 배경 이미지나 같은 TTS 문장이 여러 프로젝트에 있어도 디스크에는 한 벌만 남습니다.
+
+- 같은 내용이 이미 있으면 해시 계산만 하고 쓰기/복사는 하지 않습니다.
+- 참조(프로젝트 파일 경로 → 해시)는 blob_store/blobs.db에 기록하고, 참조가 0이 된 파일만 지웁니다.
+  프로젝트를 삭제하면 그 프로젝트의 참조만 빠지므로 다른 프로젝트가 쓰는 데이터는 남습니다.
+- 하드링크를 만들 수 없는 파일 시스템(다른 드라이브 등)에서는 복사로 대신합니다.
+- 하드링크된 파일은 내용을 공유하므로 프로젝트 파일을 덮어쓸 때는 반드시 save_bytes/save_file을 사용합니다
+  (새 파일로 교체하므로 다른 프로젝트에 영향 없음).
+
+기존 프로젝트 정리: python -m service.blob_store dedupe projects
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from utils.sqlite_utils import SQLiteStore
+
+# 해시 계산 시 한 번에 읽는 크기
+CHUNK_SIZE = 1024 * 1024
+
+# 기존 프로젝트 정리(dedupe) 대상 하위 폴더
+ASSET_SUBFOLDERS = ("image", "audio")
+
+
+class BlobStore(SQLiteStore):
+    """SHA-256 해시로 에셋을 보관하고 하드링크 + 참조 카운트로 프로젝트 간 공유하는 저장소"""
+
+    DB_LABEL = "에셋 저장소 DB"
+
+    def __init__(self, root="blob_store"):
+        """
+        BlobStore 초기화
+
+        Args:
+            root (str or Path): 저장소 폴더 (objects/ 하위에 해시 파일, blobs.db에 참조 정보)
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.db_path = self.root / "blobs.db"
+        # 저장(추가 → 링크)과 참조 해제/삭제가 겹치지 않도록 보호 (save_*가 link_into를 감싸므로 재진입 가능)
+        self._lock = threading.RLock()
+        self._init_db()
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        """해시/참조 테이블 생성"""
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS refs (
+                path TEXT PRIMARY KEY,
+                digest TEXT NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_refs_digest ON refs (digest)")
+
+    @staticmethod
+    def _ref_key(path) -> str:
+        """참조 키 (절대 경로, / 구분자)"""
+        return Path(os.path.abspath(path)).as_posix()
+
+    def blob_path(self, digest: str) -> Path:
+        """해시에 해당하는 저장소 파일 경로 (objects/ab/abcdef...)"""
+        return self.objects_dir / digest[:2] / digest
+
+    @staticmethod
+    def hash_file(path) -> str:
+        """파일 SHA-256 해시"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _register(self, digest: str, size: int):
+        with self._db() as conn:
+            conn.execute("INSERT OR IGNORE INTO blobs (digest, size, created_at) VALUES (?, ?, ?)",
+                         (digest, size, time.time()))
+
+    def put_bytes(self, data) -> str:
+        """
+        바이트 데이터를 저장소에 추가 (같은 내용이 있으면 쓰지 않음)
+
+        Args:
+            data (bytes or memoryview): 파일 내용
+
+        Returns:
+            str: SHA-256 해시
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self.blob_path(digest)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, blob_path)
+        self._register(digest, len(data))
+        return digest
+
+    def put_file(self, source, link_source: bool = False, digest: Optional[str] = None) -> str:
+        """
+        파일을 저장소에 추가 (같은 내용이 있으면 해시 계산만 함)
+
+        Args:
+            source (str or Path): 원본 파일 경로
+            link_source (bool): True면 원본을 복사하지 않고 하드링크로 저장소에 넣음
+                                (TTS 캐시처럼 내용이 바뀌지 않는 파일에서만 사용)
+            digest (str, optional): 미리 계산한 해시
+
+        Returns:
+            str: SHA-256 해시
+        """
+        source = Path(source)
+        digest = digest or self.hash_file(source)
+        blob_path = self.blob_path(digest)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+            if not (link_source and self._try_link(source, tmp_path)):
+                shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, blob_path)
+        self._register(digest, source.stat().st_size)
+        return digest
+
+    @staticmethod
+    def _try_link(source: Path, target: Path) -> bool:
+        """하드링크 생성 (지원하지 않거나 다른 드라이브면 False)"""
+        try:
+            os.link(source, target)
+            return True
+        except OSError:
+            return False
+
+    def link_into(self, digest: str, target_path) -> bool:
+        """
+        저장소 파일을 프로젝트 경로에 하드링크로 배치하고 참조 기록 (기존 파일은 교체, 이전 참조는 해제)
+
+        Args:
+            digest (str): SHA-256 해시
+            target_path (str or Path): 프로젝트 안의 파일 경로
+
+        Returns:
+            bool: 성공 여부
+        """
+        target_path = Path(target_path)
+        blob_path = self.blob_path(digest)
+        try:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            # 임시 이름으로 링크(또는 복사)한 뒤 교체 - 기존 파일이 하드링크여도 저장소 내용은 그대로 유지
+            tmp_path = target_path.with_name(f".{target_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            if not self._try_link(blob_path, tmp_path):
+                shutil.copyfile(blob_path, tmp_path)
+            os.replace(tmp_path, target_path)
+
+            key = self._ref_key(target_path)
+            with self._lock:
+                with self._db() as conn:
+                    row = conn.execute("SELECT digest FROM refs WHERE path = ?", (key,)).fetchone()
+                    conn.execute("INSERT OR REPLACE INTO refs (path, digest) VALUES (?, ?)", (key, digest))
+                if row and row["digest"] != digest:
+                    self._collect([row["digest"]])
+            return True
+        except Exception as e:
+            print(f"[BLOB_STORE] 에셋 배치 오류: {e}")
+            return False
+
+    def save_bytes(self, data, target_path) -> bool:
+        """
+        바이트 데이터를 프로젝트 파일로 저장 (저장소에 한 번만 보관하고 하드링크)
+
+        Args:
+            data (bytes or memoryview): 파일 내용 (UploadedFile.getbuffer() 등)
+            target_path (str or Path): 프로젝트 안의 파일 경로
+
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            with self._lock:
+                return self.link_into(self.put_bytes(data), target_path)
+        except Exception as e:
+            print(f"[BLOB_STORE] 에셋 저장 오류: {e}")
+            return False
+
+    def save_file(self, source, target_path, link_source: bool = False) -> bool:
+        """
+        파일을 프로젝트 파일로 저장 (저장소에 한 번만 보관하고 하드링크)
+
+        Args:
+            source (str or Path): 원본 파일 경로
+            target_path (str or Path): 프로젝트 안의 파일 경로
+            link_source (bool): 원본을 복사하지 않고 하드링크로 저장소에 넣을지 여부 (put_file 참고)
+
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            with self._lock:
+                return self.link_into(self.put_file(source, link_source=link_source), target_path)
+        except Exception as e:
+            print(f"[BLOB_STORE] 에셋 저장 오류: {e}")
+            return False
+
+    def release_tree(self, folder) -> int:
+        """
+        폴더(프로젝트) 안의 모든 참조 해제 후 더 이상 참조되지 않는 저장소 파일 삭제
+        폴더를 지운 뒤(또는 지우기 전에) 호출합니다.
+
+        Args:
+            folder (str or Path): 프로젝트 폴더
+
+        Returns:
+            int: 삭제된 저장소 파일 수
+        """
+        prefix = self._ref_key(folder).rstrip("/") + "/"
+        try:
+            with self._lock:
+                with self._db() as conn:
+                    rows = conn.execute("SELECT DISTINCT digest FROM refs WHERE substr(path, 1, ?) = ?",
+                                        (len(prefix), prefix)).fetchall()
+                    conn.execute("DELETE FROM refs WHERE substr(path, 1, ?) = ?", (len(prefix), prefix))
+                return self._collect([row["digest"] for row in rows])
+        except Exception as e:
+            print(f"[BLOB_STORE] 참조 해제 오류: {e}")
+            return 0
+
+    def _collect(self, digests: Iterable[str]) -> int:
+        """참조가 0이고 다른 하드링크도 없는 저장소 파일 삭제 (호출 측에서 _lock 보유)"""
+        removed = 0
+        with self._db() as conn:
+            for digest in set(digests):
+                if conn.execute("SELECT 1 FROM refs WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+                    continue
+                blob_path = self.blob_path(digest)
+                try:
+                    # 기록되지 않은 하드링크(외부에서 만든 링크 등)가 남아 있으면 보존
+                    if blob_path.exists() and blob_path.stat().st_nlink > 1:
+                        continue
+                    blob_path.unlink(missing_ok=True)
+                except OSError as e:
+                    print(f"[BLOB_STORE] 저장소 파일 삭제 오류: {e}")
+                    continue
+                conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+                removed += 1
+        return removed
+
+    def collect(self, digests: Iterable[str]) -> int:
+        """
+        지정한 해시 중 참조가 0이고 다른 하드링크도 없는 저장소 파일 삭제
+        (외부에서 하드링크를 지운 뒤 저장소 파일만 남았을 때 호출)
+
+        Args:
+            digests (Iterable[str]): SHA-256 해시 목록
+
+        Returns:
+            int: 삭제된 저장소 파일 수
+        """
+        with self._lock:
+            return self._collect(digests)
+
+    def get_inode_digests(self) -> Dict[Tuple[int, int], str]:
+        """저장소 파일의 (장치, inode) → 해시 (하드링크된 외부 파일이 어느 저장소 파일인지 찾을 때 사용)"""
+        inode_digests = {}
+        if not self.objects_dir.exists():
+            return inode_digests
+        for blob_path in self.objects_dir.glob("*/*"):
+            if blob_path.name.endswith(".tmp"):
+                continue
+            try:
+                stat = blob_path.stat()
+            except OSError:
+                continue
+            inode_digests[(stat.st_dev, stat.st_ino)] = blob_path.name
+        return inode_digests
+
+    def collect_unreferenced(self) -> int:
+        """
+        참조가 없는 저장소 파일 전체 정리 (저장 도중 중단된 경우 등)
+
+        Returns:
+            int: 삭제된 저장소 파일 수
+        """
+        with self._lock:
+            with self._db() as conn:
+                rows = conn.execute(
+                    "SELECT digest FROM blobs WHERE digest NOT IN (SELECT DISTINCT digest FROM refs)"
+                ).fetchall()
+            return self._collect([row["digest"] for row in rows])
+
+    def get_refcount(self, digest: str) -> int:
+        """해시의 참조 수"""
+        with self._db() as conn:
+            return conn.execute("SELECT COUNT(*) FROM refs WHERE digest = ?", (digest,)).fetchone()[0]
+
+    def dedupe_tree(self, folder, subfolders=ASSET_SUBFOLDERS) -> Dict[str, int]:
+        """
+        기존 프로젝트 파일을 저장소 하드링크로 교체 (이미 저장소 파일이면 참조만 기록)
+
+        Args:
+            folder (str or Path): 프로젝트 폴더 또는 projects/ 폴더
+            subfolders (tuple): 정리할 하위 폴더 이름 (이 이름의 폴더 안 파일만 처리)
+
+        Returns:
+            dict: {"files", "linked", "bytes_saved"}
+        """
+        stats = {"files": 0, "linked": 0, "bytes_saved": 0}
+        for path in sorted(Path(folder).rglob("*")):
+            if not path.is_file() or path.parent.name not in subfolders or path.name.startswith("."):
+                continue
+            stats["files"] += 1
+            size = path.stat().st_size
+            digest = self.hash_file(path)
+            blob_path = self.blob_path(digest)
+            if blob_path.exists() and os.path.samefile(blob_path, path):
+                # 이미 하드링크 - 참조만 기록
+                self.link_into(digest, path)
+                continue
+            existed = blob_path.exists()
+            self.put_file(path, link_source=True, digest=digest)
+            if self.link_into(digest, path):
+                stats["linked"] += 1
+                if existed:
+                    stats["bytes_saved"] += size
+        return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        저장소 통계 반환
+
+        Returns:
+            dict: {"blobs", "stored_bytes", "refs", "referenced_bytes", "saved_bytes"}
+        """
+        with self._db() as conn:
+            blobs, stored = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+            refs, referenced = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(blobs.size), 0) FROM refs JOIN blobs ON refs.digest = blobs.digest"
+            ).fetchone()
+        return {
+            "blobs": blobs,
+            "stored_bytes": stored,
+            "refs": refs,
+            "referenced_bytes": referenced,
+            "saved_bytes": max(referenced - stored, 0)
+        }
+
+
+# 싱글톤 인스턴스 생성 (편의를 위해)
+blob_store = BlobStore()
+
+
+def main(argv=None) -> int:
+    """저장소 관리 CLI (dedupe: 기존 프로젝트 정리, stats: 통계, gc: 참조 없는 파일 삭제)"""
+    parser = argparse.ArgumentParser(description="에셋 저장소를 관리합니다.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    dedupe_parser = subparsers.add_parser("dedupe", help="기존 프로젝트의 image/audio 파일을 저장소 하드링크로 교체")
+    dedupe_parser.add_argument("folder", help="프로젝트 폴더 또는 projects 폴더")
+    subparsers.add_parser("stats", help="저장소 통계 출력")
+    subparsers.add_parser("gc", help="참조가 없는 저장소 파일 삭제")
+    args = parser.parse_args(argv)
+
+    if args.command == "dedupe":
+        stats = blob_store.dedupe_tree(args.folder)
+        print(f"파일 {stats['files']}개 중 {stats['linked']}개 링크, {stats['bytes_saved'] / 1024 / 1024:.1f} MB 절약")
+    elif args.command == "gc":
+        print(f"저장소 파일 {blob_store.collect_unreferenced()}개 삭제")
+    stats = blob_store.get_stats()
+    print(f"저장소: 파일 {stats['blobs']}개 ({stats['stored_bytes'] / 1024 / 1024:.1f} MB), "
+          f"참조 {stats['refs']}개, 중복 제거로 {stats['saved_bytes'] / 1024 / 1024:.1f} MB 절약")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
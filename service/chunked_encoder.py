@@ -0,0 +1,296 @@
+"""
+시간 분할 병렬 인코딩
+긴 씬 하나가 전체 렌더링 시간을 차지할 때 씬 타임라인을 고정 길이 청크로 나눠
+청크마다 별도 워커 프로세스에서 합성/인코딩한 뒤 스트림 복사(-c copy)로 무손실 이어붙입니다.
+
+- 청크 경계는 정수 초(fps의 배수 프레임)이며 각 청크는 독립 인코더로 시작하므로 항상 키프레임에서 시작합니다.
+  (이어붙일 때 재인코딩이 필요 없음)
+- 모든 청크는 같은 인코딩 설정을 사용하고, 워커마다 ffmpeg 스레드를 (CPU 수 / 워커 수)로 나눠 과부하를 막습니다.
+- 씬 오디오는 메인 프로세스에서 WAV로 한 번만 믹싱하여 이어붙이는 단계에서 mux 합니다.
+- 출력 대상(OutputTarget)이 있으면 청크마다 대상별 인코더로 함께 인코딩하고 대상별로 이어붙입니다.
+- 워커는 MoviePy 기반 컴포지터(build_video_clip 제공)로 프레임을 합성합니다.
+
+설정:
+- "chunked_encoding": 사용 여부 (기본값: 사용 안 함)
+- "chunk_seconds": 청크 길이(초, 기본값 5)
+- "chunk_workers": 워커 프로세스 수 (기본값: CPU 수)
+"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from settings import Settings
+from service.render_tracer import render_tracer, file_size
+from service.timeline import Timeline
+from utils.ffmpeg_utils import run_ffmpeg, write_concat_list
+
+DEFAULT_CHUNK_SECONDS = 5.0
+
+
+def _render_chunk(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    워커 프로세스에서 청크 하나를 합성/인코딩 (오디오 없음)
+
+    Args:
+        payload (dict): {"index", "timeline", "compositor", "start_frame", "end_frame", "threads",
+                         "outputs": [(OutputTarget 딕셔너리 또는 None, 출력 경로)]}
+
+    Returns:
+        dict: {"index", "success", "frames", "wall", "composite", "composite_cpu", "write_seconds"}
+    """
+    from service.compositors import get_compositor
+    from service.ffmpeg_frame_sink import FFmpegFrameSink, FrameFanout
+    from service.output_targets import OutputTarget
+
+    started = time.perf_counter()
+    result = {"index": payload["index"], "success": False, "frames": 0,
+              "wall": 0.0, "composite": 0.0, "composite_cpu": 0.0, "write_seconds": 0.0}
+    timeline = Timeline.from_dict(payload["timeline"])
+    compositor = get_compositor(payload["compositor"])
+    if compositor is None:
+        print(f"[CHUNKED] 알 수 없는 컴포지터: {payload['compositor']}")
+        return result
+
+    # 중간 파일(텍스트 이미지)은 청크마다 따로 만들어 다른 워커와 같은 파일에 동시에 쓰지 않도록 함
+    with tempfile.TemporaryDirectory(prefix="supermovie_chunk_") as work_dir:
+        final_clip, resources = compositor.build_video_clip(timeline, work_dir, with_audio=False)
+        if final_clip is None:
+            return result
+
+        sinks = []
+        for target_data, path in payload["outputs"]:
+            target = OutputTarget.from_dict(target_data) if target_data else None
+            sinks.append(FFmpegFrameSink(path, timeline.screen_size, timeline.fps, threads=payload["threads"],
+                                         video_filter=target.get_video_filter() if target else None,
+                                         video_args=target.get_video_args() if target else None))
+        frame_function = final_clip.frame_function
+        try:
+            with FrameFanout(sinks) as fanout:
+                for idx in range(payload["start_frame"], payload["end_frame"]):
+                    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+                    frame = frame_function(idx / timeline.fps)
+                    result["composite"] += time.perf_counter() - wall_start
+                    result["composite_cpu"] += time.thread_time() - cpu_start
+                    fanout.write(frame)
+                result["success"] = all(fanout.close())
+        finally:
+            final_clip.close()
+            for clip in resources:
+                clip.close()
+
+    stats = sinks[0].get_stats()
+    result.update(frames=stats["frames"], write_seconds=stats["write_seconds"], wall=time.perf_counter() - started)
+    return result
+
+
+class ChunkedEncoder:
+    """씬 타임라인을 청크로 나눠 워커 프로세스에서 병렬 인코딩하고 스트림 복사로 이어붙이는 클래스"""
+
+    def __init__(self):
+        """ChunkedEncoder 초기화 (워커 프로세스 풀은 처음 사용할 때 생성)"""
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_workers = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """시간 분할 병렬 인코딩 사용 여부 (설정 "chunked_encoding")"""
+        return bool(Settings.get("chunked_encoding", False))
+
+    @staticmethod
+    def get_worker_count() -> int:
+        """워커 프로세스 수 (설정 "chunk_workers", 기본값: CPU 수)"""
+        return max(1, int(Settings.get("chunk_workers", 0) or os.cpu_count() or 1))
+
+    @staticmethod
+    def get_chunk_frames(fps: int) -> int:
+        """청크 하나의 프레임 수 (정수 초로 맞춰 청크 경계가 항상 같은 간격의 키프레임이 되도록 함)"""
+        seconds = float(Settings.get("chunk_seconds", DEFAULT_CHUNK_SECONDS) or DEFAULT_CHUNK_SECONDS)
+        return max(1, round(seconds)) * fps
+
+    def split(self, timeline: Timeline) -> List[Tuple[int, int]]:
+        """
+        타임라인의 프레임 구간을 청크로 나눔 (마지막 청크가 청크 길이의 절반보다 짧으면 앞 청크에 합침)
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+
+        Returns:
+            list: [(시작 프레임, 끝 프레임)] - 끝 프레임은 포함하지 않음
+        """
+        total, size = timeline.frame_count, self.get_chunk_frames(timeline.fps)
+        chunks = [(start, min(start + size, total)) for start in range(0, total, size)]
+        if len(chunks) > 1 and chunks[-1][1] - chunks[-1][0] < size // 2:
+            last_start, last_end = chunks.pop()
+            chunks[-1] = (chunks[-1][0], last_end)
+        return chunks
+
+    def should_chunk(self, timeline: Timeline, compositor) -> bool:
+        """
+        이 씬을 청크로 나눠 인코딩할지 여부
+        (설정이 켜져 있고, 워커가 2개 이상이고, 청크가 2개 이상 나오고, MoviePy 기반 컴포지터일 때)
+        """
+        if not self.is_enabled() or self.get_worker_count() < 2:
+            return False
+        if not hasattr(compositor, "build_video_clip") or not hasattr(compositor, "mix_scene_audio"):
+            return False
+        return len(self.split(timeline)) > 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """워커 프로세스 풀 (워커 수 설정이 바뀌면 다시 생성)"""
+        workers = self.get_worker_count()
+        with self._lock:
+            if self._executor is None or self._executor_workers != workers:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                # Streamlit/워커 스레드에서 fork하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+                self._executor_workers = workers
+            return self._executor
+
+    def shutdown(self):
+        """워커 프로세스 풀 종료"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def render(self, timeline: Timeline, output_path, compositor, logger="bar", targets=None) -> bool:
+        """
+        타임라인을 청크로 나눠 병렬 인코딩한 뒤 이어붙여 씬 비디오 생성
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            output_path (str or Path): 출력 비디오 경로
+            compositor: 프레임을 합성할 컴포지터 (MoviePy 기반)
+            logger: MoviePy/proglog 로거 (청크가 끝날 때마다 frame_index 진행)
+            targets (list, optional): 함께 인코딩할 [(OutputTarget, 출력 경로)] (오디오 없음)
+
+        Returns:
+            bool: 성공 여부
+        """
+        import proglog
+
+        output_path = Path(output_path)
+        chunks = self.split(timeline)
+        workers = self.get_worker_count()
+        threads = max(1, (os.cpu_count() or 1) // min(workers, len(chunks)))
+        chunk_dir = output_path.with_name(f"{output_path.stem}_chunks")
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+
+        # 출력별(기본 출력 + 대상) 청크 파일 경로
+        outputs = [(None, output_path)] + [(target, Path(path)) for target, path in targets or []]
+        chunk_paths = [[chunk_dir / f"{idx}_{chunk_idx:03d}.mp4" for chunk_idx in range(len(chunks))]
+                       for idx in range(len(outputs))]
+        payloads = [{
+            "index": chunk_idx,
+            "timeline": timeline.to_dict(),
+            "compositor": compositor.name,
+            "start_frame": start,
+            "end_frame": end,
+            "threads": threads,
+            "outputs": [(target.to_dict() if target else None, str(chunk_paths[idx][chunk_idx]))
+                        for idx, (target, _) in enumerate(outputs)]
+        } for chunk_idx, (start, end) in enumerate(chunks)]
+
+        bar_logger = proglog.default_bar_logger(logger)
+        bar_logger(frame_index__total=timeline.frame_count)
+        audio_path = None
+        executor = None
+        futures = []
+        try:
+            executor = self._get_executor()
+            started = time.perf_counter()
+            for payload in payloads:
+                futures.append(executor.submit(_render_chunk, payload))
+
+            # 기다리는 동안 씬 오디오 믹싱 (메인 프로세스)
+            audio_path = compositor.mix_scene_audio(timeline, output_path)
+
+            done_frames = 0
+            results = []
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results.append(result)
+                    if not result["success"]:
+                        print(f"[CHUNKED] 청크 {result['index']} 인코딩 실패")
+                        return False
+                    done_frames += result["frames"]
+                    bar_logger(frame_index__index=done_frames - 1)
+            encode_wall = time.perf_counter() - started
+
+            # 청크 통계는 워커 프로세스에서 측정했으므로 메인 스레드에서 span으로 추가
+            for result in sorted(results, key=lambda item: item["index"]):
+                render_tracer.add_span("encode_chunk", result["wall"], phase="encode", cpu=result["composite_cpu"],
+                                       chunk=result["index"], frames=result["frames"],
+                                       composite=round(result["composite"], 4),
+                                       encode_wait=round(result["write_seconds"], 4))
+            render_tracer.add_span("chunked_encode", encode_wall, phase="encode", chunks=len(chunks),
+                                   workers=min(workers, len(chunks)), frames=timeline.frame_count,
+                                   compositor=compositor.name)
+
+            # 출력별로 청크를 스트림 복사로 이어붙임 (기본 출력에는 씬 오디오 mux)
+            with render_tracer.span("concat_chunks", phase="concat", chunks=len(chunks), outputs=len(outputs)):
+                for idx, (_, path) in enumerate(outputs):
+                    if not self.concat(chunk_paths[idx], path, chunk_dir / f"{idx}_concat.txt",
+                                       audio_path=audio_path if idx == 0 else None):
+                        return False
+                render_tracer.record_bytes(sum(file_size(path) for _, path in outputs))
+            return True
+
+        except Exception as e:
+            print(f"[CHUNKED] 병렬 인코딩 오류: {e}")
+            if isinstance(e, BrokenProcessPool):
+                # 워커 프로세스가 죽은 풀은 다시 쓸 수 없으므로 다음 씬에서 새로 생성
+                with self._lock:
+                    if self._executor is executor:
+                        self._executor = None
+            return False
+        finally:
+            # 실패/예외로 빠져나올 때는 남은 청크를 취소하고, 이미 실행 중인 청크가 끝난 뒤에 청크 폴더 삭제
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+            if audio_path:
+                audio_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def concat(chunk_paths: List[Path], output_path: Path, list_path: Path, audio_path=None) -> bool:
+        """
+        청크 비디오를 재인코딩 없이 이어붙임 (오디오가 있으면 함께 mux)
+
+        Args:
+            chunk_paths (list): 순서대로 이어붙일 청크 경로
+            output_path (Path): 출력 경로
+            list_path (Path): concat 목록 파일 경로
+            audio_path (Path, optional): mux할 WAV 경로
+
+        Returns:
+            bool: 성공 여부
+        """
+        if write_concat_list([str(path) for path in chunk_paths], list_path) is None:
+            return False
+        args = ["-f", "concat", "-safe", "0", "-i", str(list_path)]
+        if audio_path:
+            args += ["-i", str(audio_path), "-map", "0:v:0", "-map", "1:a:0", "-c:a", "aac", "-b:a", "192k", "-shortest"]
+        else:
+            args += ["-an"]
+        args += ["-c:v", "copy", str(output_path)]
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return run_ffmpeg(args, error_prefix="CHUNKED")
+
+
+# 싱글톤 인스턴스 생성 (편의를 위해)
+chunked_encoder = ChunkedEncoder()
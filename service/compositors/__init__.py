@@ -0,0 +1,79 @@
+"""
+컴포지터 백엔드 모듈
+씬 타임라인(service.timeline.Timeline)을 프레임으로 합성하여 씬 비디오 파일로 인코딩하는 백엔드를 포함합니다.
+
+백엔드 클래스는 처음 사용될 때 import 됩니다 (지연 로딩).
+외부 패키지는 "supermovie.compositors" entry point 그룹으로 새 백엔드를 등록할 수 있습니다.
+
+사용할 백엔드는 환경 변수 SUPERMOVIE_COMPOSITOR → 설정 "compositor" → 기본값("moviepy") 순서로 정합니다.
+"""
+import os
+import threading
+from typing import Optional
+
+from utils.lazy_registry import LazyClassRegistry
+
+__all__ = ['get_compositor', 'get_compositor_name', 'register_compositor', 'compositor_classes', 'DEFAULT_COMPOSITOR']
+
+DEFAULT_COMPOSITOR = "moviepy"
+
+# 백엔드 이름별 클래스 - 접근 시 import
+compositor_classes = LazyClassRegistry(entry_point_group="supermovie.compositors")
+compositor_classes.register("moviepy", "service.compositors.moviepy_compositor:MoviePyCompositor", "MoviePy")
+compositor_classes.register("numpy", "service.compositors.numpy_compositor:NumpyCompositor", "NumPy (fast)")
+
+# 백엔드 인스턴스 캐시
+_compositor_instances = {}
+_compositor_lock = threading.Lock()
+
+
+def register_compositor(name: str, target, display_name: str = None):
+    """
+    컴포지터 백엔드 등록 (플러그인/코드에서 직접 등록할 때 사용)
+
+    Args:
+        name (str): 백엔드 이름
+        target (str or type): "패키지.모듈:클래스" 문자열, 클래스 또는 백엔드 인스턴스
+        display_name (str, optional): 표시 이름
+    """
+    with _compositor_lock:
+        if isinstance(target, (str, type)):
+            _compositor_instances.pop(name, None)
+            compositor_classes.register(name, target, display_name)
+        else:
+            compositor_classes.register(name, type(target), display_name)
+            _compositor_instances[name] = target
+
+
+def get_compositor_name() -> str:
+    """
+    사용할 컴포지터 이름 (환경 변수 SUPERMOVIE_COMPOSITOR → 설정 "compositor" → 기본값)
+
+    Returns:
+        str: 컴포지터 이름
+    """
+    name = os.environ.get("SUPERMOVIE_COMPOSITOR")
+    if not name:
+        from settings import Settings
+        name = Settings.get("compositor")
+    return name or DEFAULT_COMPOSITOR
+
+
+def get_compositor(name: Optional[str] = None):
+    """
+    이름에 맞는 컴포지터 인스턴스 반환 (한 번 만든 인스턴스는 재사용)
+
+    Args:
+        name (str, optional): 백엔드 이름 ("moviepy", "numpy" 등, 없으면 get_compositor_name())
+
+    Returns:
+        BaseCompositor: 백엔드 인스턴스 또는 None (없거나 로드 실패 시)
+    """
+    name = name or get_compositor_name()
+    with _compositor_lock:
+        if name not in _compositor_instances:
+            compositor_class = compositor_classes.get_class(name)
+            if compositor_class is None:
+                return None
+            _compositor_instances[name] = compositor_class()
+        return _compositor_instances[name]
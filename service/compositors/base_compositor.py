@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, List, Optional
+
+from service.render_tracer import render_tracer, file_size
+from service.telemetry import telemetry
+from service.text_image_service import text_image_service
+from service.timeline import Layer, Timeline
+
+
+@dataclass
+class PreparedTimeline:
+    """
+    인코딩 전에 미리 준비한 씬 합성 자원 구조체
+    컴포지터별 클립(또는 프레임 함수), 닫을 자원, 미리 믹싱한 씬 오디오, 준비 방식, 준비에 걸린 시간을 포함
+    """
+    timeline: Timeline
+    clip: Any = None
+    resources: List[Any] = field(default_factory=list)
+    audio_path: Optional[Path] = None
+    mode: Optional[str] = None
+    wall: float = 0.0
+    closed: bool = False
+
+    def close(self):
+        """준비한 자원 해제 (여러 번 호출해도 안전)"""
+        if self.closed:
+            return
+        self.closed = True
+        for resource in [self.clip] + list(self.resources):
+            if resource is not None and hasattr(resource, "close"):
+                resource.close()
+        if self.audio_path:
+            Path(self.audio_path).unlink(missing_ok=True)
+
+
+class BaseCompositor(ABC):
+    """
+    컴포지터 백엔드의 기본 클래스 - 모든 컴포지터가 상속받아야 함
+    씬 렌더러가 만든 타임라인을 받아 프레임을 합성하고 비디오 파일로 인코딩합니다.
+    """
+
+    # 레지스트리 키와 동일한 백엔드 이름
+    name = "base"
+
+    @abstractmethod
+    def render(self, timeline: Timeline, output_path, work_dir=None, logger="bar", targets=None,
+               prepared: Optional[PreparedTimeline] = None) -> bool:
+        """
+        타임라인을 비디오 파일로 렌더링
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            output_path (str or Path): 출력 비디오 경로
+            work_dir (str or Path, optional): 중간 파일(텍스트 이미지 등) 저장 폴더 (없으면 시스템 임시 폴더)
+            logger: MoviePy/proglog 로거 ("bar", None 또는 ProgressBarLogger)
+            targets (list, optional): 같은 프레임으로 함께 인코딩할 [(OutputTarget, 출력 경로)] (오디오 없음)
+            prepared (PreparedTimeline, optional): prepare()로 미리 준비한 자원 (렌더링 후 해제됨)
+
+        Returns:
+            bool: 성공 여부
+        """
+        pass
+
+    def prepare(self, timeline: Timeline, output_path, work_dir=None, targets=None) -> Optional[PreparedTimeline]:
+        """
+        인코딩 전에 할 수 있는 준비(이미지 로드/리사이즈, 텍스트 렌더링, 오디오 믹싱)를 미리 수행
+        다른 씬이 인코딩되는 동안 별도 스레드에서 호출할 수 있습니다. (기본 구현: 준비할 것이 없음)
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            output_path (str or Path): 출력 비디오 경로 (중간 오디오 파일 위치)
+            work_dir (str or Path, optional): 중간 파일 저장 폴더
+            targets (list, optional): 함께 인코딩할 [(OutputTarget, 출력 경로)]
+
+        Returns:
+            PreparedTimeline: 준비된 자원 또는 None (미리 준비하지 않음/실패 시)
+        """
+        return None
+
+    @staticmethod
+    def get_rich_text_filename(layer: Layer, scene_id: Optional[str] = None) -> str:
+        """
+        rich_text 레이어 이미지 파일명 (scene_id와 텍스트/폰트/크기/위치 해시 사용)
+        내용이 같으면 이름이 같으므로 이미 그린 이미지를 재사용하고, 저장소 정리에서 참조 확인에도 사용합니다.
+        """
+        key = json.dumps({"source": layer.source, "size": list(layer.size or ())}, sort_keys=True, ensure_ascii=False)
+        text_hash = hashlib.md5(key.encode()).hexdigest()[:8]
+        return f"{scene_id}_text_{text_hash}.png"
+
+    @staticmethod
+    def rasterize_rich_text(layer: Layer, scene_id: Optional[str] = None, work_dir=None) -> Optional[Path]:
+        """
+        rich_text 레이어를 TextImageService로 그려 PNG로 저장 (work_dir에 같은 내용의 이미지가 있으면 재사용)
+
+        Args:
+            layer (Layer): rich_text 레이어
+            scene_id (str, optional): 파일명에 사용할 씬 ID
+            work_dir (str or Path, optional): 저장 폴더 (없으면 시스템 임시 폴더)
+
+        Returns:
+            Path: 저장된 PNG 경로 또는 None (실패 시)
+        """
+        source = layer.source
+        try:
+            cached_path = Path(work_dir) / BaseCompositor.get_rich_text_filename(layer, scene_id) if work_dir else None
+            if cached_path is not None and cached_path.exists():
+                telemetry.count_cache("text", hit=True)
+                # 저장소 정리(LRU)에서 최근 사용한 파일로 보이도록 시각 갱신
+                os.utime(cached_path)
+                return cached_path
+            telemetry.count_cache("text", hit=False)
+
+            # screen_size는 캔버스 크기, position은 텍스트를 그릴 중점 위치
+            text_image = text_image_service.create_text_image(
+                text=source["text"],
+                font_path=source["font"],
+                font_size=source["font_size"],
+                color=source["color"],
+                screen_size=tuple(layer.size),
+                text_width=source["text_width"],
+                position=tuple(source["text_position"]),
+                text_align=source["text_align"]
+            )
+            if not text_image:
+                return None
+
+            if cached_path is not None:
+                # 프로젝트 폴더의 temp 폴더에 저장 (상태 확인용, 다음 렌더링에서 재사용)
+                cached_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cached_path
+                # 동시에 같은 이미지를 그리는 다른 스레드/프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 이름으로 저장 후 교체
+                partial_path = cached_path.with_name(f"{cached_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                text_image.save(partial_path, 'PNG')
+                os.replace(partial_path, cached_path)
+            else:
+                # 프로젝트가 없으면 시스템 임시 디렉토리 사용
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
+                    tmp_path = Path(tmp_file.name)
+                text_image.save(tmp_path, 'PNG')
+
+            render_tracer.record_bytes(file_size(tmp_path))
+            print(f"[TEXT_IMAGE] 텍스트 이미지 저장: {tmp_path}")
+            return tmp_path
+
+        except Exception as e:
+            print(f"rich text 이미지 생성 중 오류 발생: {e}")
+            return None
@@ -0,0 +1,306 @@
+import time
+from pathlib import Path
+from typing import Optional
+
+from service.audio_cache_service import audio_cache_service
+from service.audio_mixer import AudioPlacement, audio_mixer
+from service.compositors.base_compositor import BaseCompositor, PreparedTimeline
+from service.ffmpeg_frame_sink import FFmpegFrameSink, FrameFanout
+from service.render_tracer import render_tracer, file_size
+from service.timeline import Layer, LayerKind, Timeline
+
+# MoviePy는 import 비용이 크므로 실제로 클립을 만들 때 각 메서드에서 import 합니다.
+
+
+class MoviePyCompositor(BaseCompositor):
+    """타임라인 레이어를 MoviePy 클립으로 바꿔 CompositeVideoClip으로 합성/인코딩하는 백엔드"""
+
+    name = "moviepy"
+
+    # 마지막 프레임 싱크 인코딩 통계 (FFmpegFrameSink.get_stats())
+    last_sink_stats = None
+
+    def render(self, timeline: Timeline, output_path, work_dir=None, logger="bar", targets=None,
+               prepared: PreparedTimeline = None) -> bool:
+        """
+        타임라인을 비디오 파일로 렌더링
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            output_path (str or Path): 출력 비디오 경로
+            work_dir (str or Path, optional): 중간 파일 저장 폴더
+            logger: MoviePy/proglog 로거
+            targets (list, optional): 함께 인코딩할 [(OutputTarget, 출력 경로)] - 있으면 항상 프레임 싱크 사용
+            prepared (PreparedTimeline, optional): prepare()로 미리 만든 클립 (렌더링 후 해제됨)
+
+        Returns:
+            bool: 성공 여부
+        """
+        if targets or self.use_frame_sink():
+            return self.render_to_sink(timeline, output_path, work_dir, logger, targets=targets, prepared=prepared)
+
+        prepared = self._use_prepared(prepared, "clip") or PreparedTimeline(timeline, *self.build_video_clip(timeline, work_dir))
+        final_clip = prepared.clip
+        if final_clip is None:
+            return False
+
+        # 프레임 합성 시간을 인코딩 시간과 분리해서 기록
+        composite_time = [0.0, 0.0]
+        frame_function = final_clip.frame_function
+
+        def timed_frame_function(t):
+            wall_start, cpu_start = time.perf_counter(), time.thread_time()
+            frame = frame_function(t)
+            composite_time[0] += time.perf_counter() - wall_start
+            composite_time[1] += time.thread_time() - cpu_start
+            return frame
+
+        final_clip.frame_function = timed_frame_function
+
+        try:
+            # 비디오 저장
+            final_clip.write_videofile(str(output_path), fps=timeline.fps, logger=logger)
+            render_tracer.add_span("composite_frames", composite_time[0], phase="composite",
+                                   cpu=composite_time[1], frames=timeline.frame_count, compositor=self.name)
+            render_tracer.record_bytes(file_size(output_path))
+        finally:
+            # 리소스 정리
+            prepared.close()
+        return True
+
+    @staticmethod
+    def use_frame_sink() -> bool:
+        """ffmpeg 프레임 싱크 사용 여부 (설정 "frame_sink", 기본값: 사용)"""
+        from settings import Settings
+        return bool(Settings.get("frame_sink", True))
+
+    def prepare(self, timeline: Timeline, output_path, work_dir=None, targets=None) -> Optional[PreparedTimeline]:
+        """
+        클립 구성(이미지 로드/리사이즈, 텍스트 렌더링)과 씬 오디오 믹싱을 인코딩 전에 미리 수행
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            output_path (str or Path): 출력 비디오 경로
+            work_dir (str or Path, optional): 중간 파일 저장 폴더
+            targets (list, optional): 함께 인코딩할 [(OutputTarget, 출력 경로)]
+
+        Returns:
+            PreparedTimeline: 준비된 클립 또는 None (실패 시)
+        """
+        started = time.perf_counter()
+        use_sink = bool(targets) or self.use_frame_sink()
+        final_clip, resources = self.build_video_clip(timeline, work_dir, with_audio=not use_sink)
+        if final_clip is None:
+            return None
+        audio_path = self.mix_scene_audio(timeline, output_path) if use_sink else None
+        return PreparedTimeline(timeline=timeline, clip=final_clip, resources=resources, audio_path=audio_path,
+                                mode="sink" if use_sink else "clip", wall=time.perf_counter() - started)
+
+    @staticmethod
+    def _use_prepared(prepared: Optional[PreparedTimeline], mode: str) -> Optional[PreparedTimeline]:
+        """준비 방식이 렌더링 방식과 같을 때만 준비된 자원 사용 (다르면 해제 - 준비 후 설정이 바뀐 경우)"""
+        if prepared is None or prepared.mode == mode:
+            return prepared
+        prepared.close()
+        return None
+
+    @staticmethod
+    def mix_scene_audio(timeline: Timeline, output_path) -> Optional[Path]:
+        """
+        씬 오디오 레이어를 출력 비디오 옆의 WAV로 믹싱 (프레임 싱크에서 mux)
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            output_path (str or Path): 출력 비디오 경로
+
+        Returns:
+            Path: WAV 경로 또는 None (오디오가 없거나 실패 시)
+        """
+        if not timeline.audio_layers:
+            return None
+        output_path = Path(output_path)
+        audio_path = output_path.with_name(f"{output_path.stem}_audio.wav")
+        placements = [AudioPlacement(path=layer.source["path"], start=layer.start) for layer in timeline.audio_layers]
+        with render_tracer.span("mix_scene_audio", phase="audio_mix", placements=len(placements)):
+            if not audio_mixer.mix_to_wav(placements, timeline.duration, audio_path):
+                return None
+        return audio_path
+
+    def render_to_sink(self, timeline: Timeline, output_path, work_dir=None, logger="bar", targets=None,
+                       prepared: PreparedTimeline = None) -> bool:
+        """
+        프레임을 ffmpeg 프레임 싱크로 직접 보내 인코딩 (오디오는 WAV로 믹싱하여 같은 프로세스에서 mux)
+        출력 대상이 있으면 프레임을 한 번만 합성하여 대상별 인코더에 동시에 보냅니다 (FrameFanout).
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            output_path (str or Path): 출력 비디오 경로
+            work_dir (str or Path, optional): 중간 파일 저장 폴더
+            logger: MoviePy/proglog 로거
+            targets (list, optional): 함께 인코딩할 [(OutputTarget, 출력 경로)] (오디오는 최종 합치기에서 mux)
+            prepared (PreparedTimeline, optional): prepare()로 미리 만든 클립과 씬 오디오
+
+        Returns:
+            bool: 성공 여부
+        """
+        import proglog
+
+        output_path = Path(output_path)
+        prepared = self._use_prepared(prepared, "sink")
+        if prepared is None:
+            prepared = PreparedTimeline(timeline, *self.build_video_clip(timeline, work_dir, with_audio=False))
+            if prepared.clip is not None:
+                prepared.audio_path = self.mix_scene_audio(timeline, output_path)
+        final_clip, audio_path = prepared.clip, prepared.audio_path
+        if final_clip is None:
+            return False
+
+        sink = FFmpegFrameSink(output_path, timeline.screen_size, timeline.fps, audio_path=audio_path)
+        target_sinks = [
+            FFmpegFrameSink(path, timeline.screen_size, timeline.fps,
+                            video_filter=target.get_video_filter(), video_args=target.get_video_args())
+            for target, path in targets or []
+        ]
+        frame_function = final_clip.frame_function
+        composite_wall = composite_cpu = 0.0
+        try:
+            with FrameFanout([sink] + target_sinks) as fanout:
+                for idx in proglog.default_bar_logger(logger).iter_bar(frame_index=range(timeline.frame_count)):
+                    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+                    frame = frame_function(idx / timeline.fps)
+                    composite_wall += time.perf_counter() - wall_start
+                    composite_cpu += time.thread_time() - cpu_start
+                    fanout.write(frame)
+                success = all(fanout.close())
+        finally:
+            prepared.close()
+
+        stats = sink.get_stats()
+        render_tracer.add_span("composite_frames", composite_wall, phase="composite", cpu=composite_cpu,
+                               frames=stats["frames"], compositor=self.name)
+        # 파이프 쓰기에서 막힌 시간 = 인코더가 합성을 기다리게 만든 시간 (backpressure)
+        render_tracer.add_span("encode_wait", stats["write_seconds"], phase="encode_wait",
+                               max_write=round(stats["max_write_seconds"], 4),
+                               wait_ratio=round(stats["write_wait_ratio"], 3),
+                               copied_frames=stats["copied_frames"], targets=len(target_sinks))
+        render_tracer.record_bytes(file_size(output_path) + sum(file_size(item.output_path) for item in target_sinks))
+        self.last_sink_stats = stats
+        return success
+
+    def make_frame_function(self, timeline: Timeline, work_dir=None):
+        """
+        인코딩 없이 t초의 프레임(H x W x 3 uint8)을 계산하는 함수 반환 (미리보기/비교용)
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            work_dir (str or Path, optional): 중간 파일 저장 폴더
+
+        Returns:
+            Callable[[float], np.ndarray]: 프레임 함수 또는 None (실패 시)
+        """
+        final_clip, _ = self.build_video_clip(timeline, work_dir, with_audio=False)
+        return final_clip.frame_function if final_clip is not None else None
+
+    def build_video_clip(self, timeline: Timeline, work_dir=None, with_audio: bool = True):
+        """
+        타임라인 전체를 하나의 MoviePy 비디오 클립으로 구성
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            work_dir (str or Path, optional): 중간 파일 저장 폴더
+            with_audio (bool): 오디오 레이어 포함 여부
+
+        Returns:
+            tuple: (클립 또는 None, 렌더링 후 닫을 클립 리스트)
+        """
+        from moviepy import CompositeVideoClip
+
+        clips = []
+        for layer in timeline.visual_layers:
+            clip = self.build_visual_clip(layer, timeline, work_dir)
+            if clip is not None:
+                clips.append(clip)
+        if not clips:
+            print("[COMPOSITOR] 합성할 영상 레이어가 없습니다.")
+            return None, []
+
+        final_clip = CompositeVideoClip(clips)
+        final_clip = self.attach_audio(final_clip, timeline) if with_audio else final_clip
+        return final_clip.with_duration(timeline.duration), clips
+
+    def attach_audio(self, clip, timeline: Timeline):
+        """타임라인의 오디오 레이어를 합쳐 클립에 붙임"""
+        from moviepy import CompositeAudioClip
+
+        audio_clips = [audio for audio in (self.build_audio_clip(layer) for layer in timeline.audio_layers) if audio]
+        return clip.with_audio(CompositeAudioClip(audio_clips)) if audio_clips else clip
+
+    def build_visual_clip(self, layer: Layer, timeline: Timeline, work_dir=None):
+        """
+        영상 레이어를 MoviePy 클립으로 변환
+
+        Args:
+            layer (Layer): 영상 레이어
+            timeline (Timeline): 레이어가 속한 타임라인
+            work_dir (str or Path, optional): 중간 파일 저장 폴더
+
+        Returns:
+            Clip: MoviePy 클립 또는 None (실패 시)
+        """
+        with render_tracer.span(f"{layer.kind}_clip", phase=f"{layer.kind}_clip", scene_id=timeline.scene_id):
+            if layer.kind == LayerKind.COLOR:
+                from moviepy import ColorClip
+                return ColorClip(size=tuple(layer.size), color=tuple(layer.source["color"]),
+                                 duration=layer.duration).with_start(layer.start).with_position(layer.position)
+
+            if layer.kind == LayerKind.IMAGE:
+                from moviepy import ImageClip
+                clip = ImageClip(layer.source["path"]).with_start(layer.start).with_position(layer.position).with_end(layer.end)
+                width, height = layer.size or (None, None)
+                if width or height:
+                    clip = clip.resized(width=width, height=height) if width and height else (
+                        clip.resized(width=width) if width else clip.resized(height=height))
+                return clip
+
+            if layer.kind == LayerKind.TEXT:
+                from moviepy import TextClip
+                source = layer.source
+                clip = TextClip(
+                    font=source["font"],
+                    text=source["text"],
+                    font_size=source["font_size"],
+                    color=source["color"],
+                    method=source["method"],
+                    margin=tuple(source["margin"]),
+                    size=tuple(layer.size),
+                    text_align="center"
+                )
+                return clip.with_start(layer.start).with_end(layer.end).with_position(layer.position)
+
+            if layer.kind == LayerKind.RICH_TEXT:
+                image_path = self.rasterize_rich_text(layer, timeline.scene_id, work_dir)
+                if not image_path:
+                    return None
+                # position은 이미 텍스트 그릴 때 적용했으므로 center로 배치
+                from moviepy import ImageClip
+                return ImageClip(str(image_path)).with_start(layer.start).with_position(layer.position).with_end(layer.end)
+
+        print(f"[COMPOSITOR] 알 수 없는 레이어 종류: {layer.kind}")
+        return None
+
+    @staticmethod
+    def build_audio_clip(layer: Layer):
+        """
+        오디오 레이어를 MoviePy 클립으로 변환 (디코딩된 PCM 캐시 사용)
+
+        Args:
+            layer (Layer): 오디오 레이어
+
+        Returns:
+            AudioArrayClip: 오디오 클립 또는 None (실패 시)
+        """
+        pcm = audio_cache_service.load(Path(layer.source["path"]))
+        if pcm is None:
+            return None
+        from moviepy import AudioArrayClip
+        return AudioArrayClip(pcm, fps=audio_cache_service.DEFAULT_FPS).with_start(layer.start)
@@ -0,0 +1,251 @@
+"""
+NumPy 컴포지터
+고정 레이아웃 씬(단색 배경 위에 축 정렬된 정지 이미지/텍스트)을 위한 빠른 컴포지터입니다.
+
+- 레이어마다 한 번만 스프라이트를 만듭니다: MoviePy 클립으로 이미지를 불러오고 리사이즈/텍스트 렌더링을 한 뒤
+  알파가 0인 가장자리를 잘라내고, 미리 곱한(premultiplied) uint16 색상과 (255 - 알파)를 보관합니다.
+- 레이어 시작/끝 시각으로 구간 색인(interval index)을 만들어 시각별로 보이는 레이어를 찾습니다.
+- 구간 안에서는 보이는 레이어가 같고 모두 정지 이미지이므로 구간마다 한 번만 합성하고 프레임을 재사용합니다.
+- 합성은 미리 할당한 프레임 버퍼와 uint16 작업 버퍼 위에서 정수 연산으로 수행합니다:
+  out = (src * a + dst * (255 - a) + 127) // 255
+
+결과는 MoviePy(CompositeVideoClip)와 반올림 오차 수준에서 같습니다.
+(benchmarks.render_benchmark의 compositor 비교 참고)
+"""
+import bisect
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from service.compositors.moviepy_compositor import MoviePyCompositor
+from service.render_tracer import render_tracer
+from service.timeline import Layer, Timeline
+
+# 구간 프레임 캐시 최대 개수 (미리보기처럼 임의 시각을 요청할 때를 위한 여유분)
+MAX_CACHED_SEGMENTS = 4
+
+
+@dataclass
+class Sprite:
+    """
+    합성용 스프라이트
+    캔버스 좌표(x, y)와 미리 곱한 색상(premultiplied, uint16), 역알파(255 - a, uint16)를 포함
+    불투명(opaque)한 스프라이트는 rgb만 사용하여 그대로 복사
+    """
+    x: int
+    y: int
+    rgb: np.ndarray
+    premultiplied: Optional[np.ndarray] = None
+    inverse_alpha: Optional[np.ndarray] = None
+
+    @property
+    def opaque(self) -> bool:
+        return self.inverse_alpha is None
+
+
+def resolve_position(position, size: Tuple[int, int], canvas_size: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    MoviePy와 같은 규칙으로 위치를 캔버스 좌표로 변환 ("left"/"center"/"right", "top"/"center"/"bottom", 픽셀)
+
+    Args:
+        position: 레이어 위치 ("center" 또는 (x, y))
+        size (tuple): 스프라이트 크기 (w, h)
+        canvas_size (tuple): 캔버스 크기 (W, H)
+
+    Returns:
+        tuple: 왼쪽 위 좌표 (x, y)
+    """
+    if isinstance(position, str):
+        position = (position, position)
+    (w, h), (canvas_w, canvas_h) = size, canvas_size
+    x, y = position
+    if isinstance(x, str):
+        x = {"left": 0, "center": (canvas_w - w) / 2, "right": canvas_w - w}[x]
+    if isinstance(y, str):
+        y = {"top": 0, "center": (canvas_h - h) / 2, "bottom": canvas_h - h}[y]
+    return int(x), int(y)
+
+
+def make_sprite(rgb: np.ndarray, mask: Optional[np.ndarray], position, canvas_size: Tuple[int, int]) -> Optional[Sprite]:
+    """
+    클립 프레임/마스크로 스프라이트 생성 (캔버스 밖과 완전히 투명한 가장자리는 잘라냄)
+
+    Args:
+        rgb (np.ndarray): H x W x 3 uint8 프레임
+        mask (np.ndarray, optional): H x W 마스크 (0.0 ~ 1.0, 없으면 불투명)
+        position: 레이어 위치
+        canvas_size (tuple): 캔버스 크기 (W, H)
+
+    Returns:
+        Sprite: 스프라이트 또는 None (보이는 부분이 없을 때)
+    """
+    h, w = rgb.shape[:2]
+    x, y = resolve_position(position, (w, h), canvas_size)
+    alpha = None
+    if mask is not None:
+        # MoviePy와 같이 마스크를 uint8로 내림 변환
+        alpha = (np.asarray(mask) * 255).astype(np.uint8)
+
+    # 캔버스 안에 들어오는 영역
+    left, top = max(0, -x), max(0, -y)
+    right, bottom = min(w, canvas_size[0] - x), min(h, canvas_size[1] - y)
+    if alpha is not None:
+        # 완전히 투명한 가장자리 제외 (rich text는 화면 크기 캔버스라 대부분이 투명)
+        visible = alpha[top:bottom, left:right] > 0
+        rows, cols = np.flatnonzero(visible.any(axis=1)), np.flatnonzero(visible.any(axis=0))
+        if rows.size == 0:
+            return None
+        left, right = left + cols[0], left + cols[-1] + 1
+        top, bottom = top + rows[0], top + rows[-1] + 1
+    if right <= left or bottom <= top:
+        return None
+
+    rgb = np.ascontiguousarray(rgb[top:bottom, left:right, :3], dtype=np.uint8)
+    sprite = Sprite(x=x + left, y=y + top, rgb=rgb)
+    if alpha is not None:
+        alpha = alpha[top:bottom, left:right]
+        if not (alpha == 255).all():
+            alpha16 = alpha.astype(np.uint16)[:, :, None]
+            sprite.premultiplied = rgb.astype(np.uint16) * alpha16 + 127
+            sprite.inverse_alpha = 255 - alpha16
+    return sprite
+
+
+class LayerIntervalIndex:
+    """레이어 시작/끝 시각으로 나눈 구간별 보이는 레이어 색인"""
+
+    def __init__(self, layers: List[Layer], duration: float):
+        """
+        LayerIntervalIndex 초기화
+
+        Args:
+            layers (list): 영상 레이어 (z 순서)
+            duration (float): 씬 길이
+        """
+        bounds = {0.0, float(duration)}
+        for layer in layers:
+            bounds.update(min(max(float(value), 0.0), float(duration)) for value in (layer.start, layer.end))
+        self.bounds = sorted(bounds)
+        self.segments = []
+        for start, end in zip(self.bounds, self.bounds[1:]):
+            middle = (start + end) / 2
+            self.segments.append(tuple(idx for idx, layer in enumerate(layers) if layer.is_active(middle)))
+
+    def segment_at(self, t: float) -> int:
+        """t초가 속한 구간 번호"""
+        return min(max(bisect.bisect_right(self.bounds, t) - 1, 0), len(self.segments) - 1)
+
+
+class NumpyFrameRenderer:
+    """타임라인의 스프라이트를 구간별로 합성하는 프레임 함수"""
+
+    def __init__(self, sprites: List[Optional[Sprite]], index: LayerIntervalIndex, canvas_size: Tuple[int, int]):
+        """
+        NumpyFrameRenderer 초기화
+
+        Args:
+            sprites (list): 레이어 순서의 스프라이트 (보이는 부분이 없으면 None)
+            index (LayerIntervalIndex): 구간 색인
+            canvas_size (tuple): 캔버스 크기 (W, H)
+        """
+        self.sprites = sprites
+        self.index = index
+        width, height = canvas_size
+        # CompositeVideoClip과 같이 검은 배경에서 시작
+        self._frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self._scratch = np.empty((height, width, 3), dtype=np.uint16)
+        self._cache: Dict[int, np.ndarray] = {}
+        self.composited_segments = 0
+
+    def __call__(self, t: float) -> np.ndarray:
+        segment = self.index.segment_at(t)
+        frame = self._cache.get(segment)
+        if frame is None:
+            frame = self._composite(self.index.segments[segment])
+            if len(self._cache) >= MAX_CACHED_SEGMENTS:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[segment] = frame
+        return frame
+
+    def _composite(self, active: Tuple[int, ...]) -> np.ndarray:
+        """보이는 레이어를 아래에서 위로 합성한 새 프레임 반환"""
+        frame = self._frame
+        frame.fill(0)
+        for idx in active:
+            sprite = self.sprites[idx]
+            if sprite is None:
+                continue
+            h, w = sprite.rgb.shape[:2]
+            region = frame[sprite.y:sprite.y + h, sprite.x:sprite.x + w]
+            if sprite.opaque:
+                region[...] = sprite.rgb
+                continue
+            scratch = self._scratch[:h, :w]
+            np.multiply(region, sprite.inverse_alpha, out=scratch)
+            np.add(scratch, sprite.premultiplied, out=scratch)
+            np.floor_divide(scratch, 255, out=scratch)
+            region[...] = scratch
+        self.composited_segments += 1
+        return frame.copy()
+
+
+class NumpyCompositor(MoviePyCompositor):
+    """
+    스프라이트를 미리 만들어 NumPy 정수 연산으로 합성하는 컴포지터
+    이미지 로드/리사이즈/텍스트 렌더링과 인코딩은 MoviePy 백엔드와 같은 코드를 사용합니다.
+    """
+
+    name = "numpy"
+
+    def build_video_clip(self, timeline: Timeline, work_dir=None, with_audio: bool = True):
+        """
+        타임라인 전체를 NumPy 프레임 함수를 쓰는 비디오 클립으로 구성
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            work_dir (str or Path, optional): 중간 파일 저장 폴더
+            with_audio (bool): 오디오 레이어 포함 여부
+
+        Returns:
+            tuple: (클립 또는 None, 렌더링 후 닫을 클립 리스트)
+        """
+        from moviepy import VideoClip
+
+        frame_function = self.build_frame_renderer(timeline, work_dir)
+        if frame_function is None:
+            return None, []
+        clip = VideoClip(frame_function=frame_function, duration=timeline.duration)
+        clip = self.attach_audio(clip, timeline) if with_audio else clip
+        return clip, []
+
+    def build_frame_renderer(self, timeline: Timeline, work_dir=None) -> Optional[NumpyFrameRenderer]:
+        """
+        레이어별 스프라이트와 구간 색인을 만들어 프레임 함수 생성
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            work_dir (str or Path, optional): 중간 파일 저장 폴더
+
+        Returns:
+            NumpyFrameRenderer: 프레임 함수 또는 None (영상 레이어가 없을 때)
+        """
+        layers = timeline.visual_layers
+        canvas_size = tuple(timeline.screen_size)
+        sprites = []
+        loaded = 0
+        for layer in layers:
+            clip = self.build_visual_clip(layer, timeline, work_dir)
+            if clip is None:
+                sprites.append(None)
+                continue
+            loaded += 1
+            with render_tracer.span("bake_sprite", phase="sprite", scene_id=timeline.scene_id, kind=layer.kind):
+                rgb = clip.get_frame(layer.start)
+                mask = clip.mask.get_frame(layer.start) if clip.mask is not None else None
+                sprites.append(make_sprite(rgb, mask, layer.position, canvas_size))
+            clip.close()
+        if not loaded:
+            print("[COMPOSITOR] 합성할 영상 레이어가 없습니다.")
+            return None
+        return NumpyFrameRenderer(sprites, LayerIntervalIndex(layers, timeline.duration), canvas_size)
@@ -0,0 +1,189 @@
+"""
+더러운(dirty) 씬 감시 서비스
+현재 프로젝트의 video.json과 에셋 폴더(audio/, image/)를 watchdog으로 감시하다가,
+편집이 멈추면(idle) 입력이 바뀐 씬만 낮은 우선순위 렌더링 작업으로 큐에 넣습니다.
+그러면 🎬(최종 비디오) 작업은 대부분 렌더링 매니페스트의 결과를 재사용해 합치기만 하게 됩니다.
+
+- 설정 "auto_render"가 켜져 있을 때만 작업을 넣습니다 (기본값: 꺼짐).
+- 편집이 멈춘 뒤 기다리는 시간은 설정 "auto_render_idle"(초, 기본값 5)입니다.
+- 같은 프로젝트에 대기/실행 중인 작업이 있으면 끝날 때까지 기다렸다가 다시 확인합니다.
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from settings import Settings
+
+# 감시 대상 (프로젝트 폴더 기준)
+WATCHED_FILES = {"video.json"}
+WATCHED_DIRS = {"audio", "image"}
+# 렌더링/캐시가 만드는 파일은 무시
+IGNORED_SUFFIXES = (".npy", ".tmp")
+
+
+class DirtySceneWatcher:
+    """프로젝트 파일 변경을 감시하여 바뀐 씬을 백그라운드에서 다시 렌더링하는 클래스"""
+
+    AUTO_RENDER_PRIORITY = -1  # 사용자가 누른 렌더링(0, 1)보다 항상 나중에 처리
+    DEFAULT_IDLE_SECONDS = 5.0
+    POLL_INTERVAL = 1.0
+
+    def __init__(self):
+        """DirtySceneWatcher 초기화"""
+        self.project_path: Optional[Path] = None
+        self._resolved_path: Optional[Path] = None
+        self._observer = None
+        self._changed_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.last_submitted_job_id: Optional[str] = None
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """자동 렌더링 사용 여부 (설정 "auto_render")"""
+        return bool(Settings.get("auto_render", False))
+
+    def watch(self, project_path) -> bool:
+        """
+        프로젝트 감시 시작 (다른 프로젝트를 감시 중이면 교체, 같은 프로젝트면 아무것도 하지 않음)
+
+        Args:
+            project_path (str or Path): 프로젝트 경로 (None이면 감시 중지)
+
+        Returns:
+            bool: 감시 중인지 여부
+        """
+        # 작업 큐와 같은 경로 문자열을 쓰도록 받은 경로를 그대로 보관 (필터링에는 절대 경로 사용)
+        project_path = Path(project_path) if project_path else None
+        with self._lock:
+            if project_path == self.project_path and self._observer is not None:
+                return True
+            self._stop_observer()
+            self.project_path = project_path
+            if project_path is None or not project_path.exists():
+                return False
+            self._resolved_path = project_path.resolve()
+
+            try:
+                from watchdog.events import FileSystemEventHandler
+                from watchdog.observers import Observer
+            except ImportError as e:
+                print(f"[AUTO_RENDER] watchdog을 불러올 수 없습니다: {e}")
+                return False
+
+            watcher = self
+
+            class _Handler(FileSystemEventHandler):
+                def on_any_event(self, event):
+                    if not event.is_directory:
+                        watcher._on_change(getattr(event, "dest_path", None) or event.src_path)
+
+            observer = Observer()
+            observer.schedule(_Handler(), str(project_path), recursive=True)
+            observer.daemon = True
+            observer.start()
+            self._observer = observer
+
+            # 프로젝트를 연 시점에 이미 바뀐 씬이 있을 수 있으므로 한 번 확인하도록 표시
+            self._changed_at = time.monotonic()
+            self._ensure_thread()
+            return True
+
+    def stop(self):
+        """감시 중지"""
+        with self._lock:
+            self._stop_observer()
+            self.project_path = None
+
+    def _stop_observer(self):
+        """observer 정리 (_lock 안에서 호출)"""
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=1.0)
+            except Exception as e:
+                print(f"[AUTO_RENDER] 감시 중지 오류: {e}")
+            self._observer = None
+        self._changed_at = None
+
+    def _is_relevant(self, path: str) -> bool:
+        """렌더링 입력 파일(video.json, audio/, image/)의 변경인지 확인"""
+        if not self._resolved_path or not path or path.endswith(IGNORED_SUFFIXES):
+            return False
+        try:
+            relative = Path(path).resolve().relative_to(self._resolved_path)
+        except ValueError:
+            return False
+        return relative.as_posix() in WATCHED_FILES or (relative.parts and relative.parts[0] in WATCHED_DIRS)
+
+    def _on_change(self, path: str):
+        """watchdog 이벤트 처리 (watchdog 스레드에서 호출)"""
+        if self._is_relevant(path):
+            # 마지막 변경 시각만 갱신 (디바운스) - 실제 확인은 감시 스레드에서
+            self._changed_at = time.monotonic()
+
+    def _ensure_thread(self):
+        """감시 스레드가 없으면 시작 (_lock 안에서 호출)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._loop, name="dirty-scene-watcher", daemon=True)
+            self._thread.start()
+
+    def _loop(self):
+        while True:
+            time.sleep(self.POLL_INTERVAL)
+            try:
+                self._check()
+            except Exception as e:
+                print(f"[AUTO_RENDER] 확인 중 오류: {e}")
+
+    def _check(self):
+        """편집이 멈췄으면 더러운 씬을 낮은 우선순위 작업으로 제출"""
+        changed_at, project_path = self._changed_at, self.project_path
+        if changed_at is None or project_path is None or not self.is_enabled():
+            return
+
+        idle_seconds = float(Settings.get("auto_render_idle", self.DEFAULT_IDLE_SECONDS))
+        if time.monotonic() - changed_at < idle_seconds:
+            return
+
+        from service.render_job_queue import RenderJobStatus, render_job_queue
+        if render_job_queue.list_jobs(project_path=project_path, statuses=RenderJobStatus.ACTIVE, limit=1):
+            # 진행 중인 작업이 끝난 뒤 다시 확인 (그 작업이 이미 더러운 씬을 처리했을 수 있음)
+            return
+
+        dirty_scene_ids = self.get_dirty_scene_ids(project_path)
+        # 확인하는 동안 새 변경이 없었을 때만 표시를 지움
+        if self._changed_at == changed_at:
+            self._changed_at = None
+        if not dirty_scene_ids:
+            return
+
+        self.last_submitted_job_id = render_job_queue.submit(
+            project_path, scene_ids=dirty_scene_ids, priority=self.AUTO_RENDER_PRIORITY
+        )
+        print(f"[AUTO_RENDER] 변경된 씬 {len(dirty_scene_ids)}개 백그라운드 렌더링 예약")
+
+    @staticmethod
+    def get_dirty_scene_ids(project_path) -> list:
+        """
+        프로젝트에서 다시 렌더링이 필요한 씬 ID 목록 반환
+
+        Args:
+            project_path (str or Path): 프로젝트 경로
+
+        Returns:
+            list: 더러운 씬 ID 리스트
+        """
+        from service.render_manifest import RenderManifest
+        from service.scene_manager import SceneManager
+
+        video_json_path = Path(project_path) / "video.json"
+        if not video_json_path.exists():
+            return []
+        scenes = SceneManager(video_json_path).get_video_data().get("scenes", [])
+        return RenderManifest(project_path).get_dirty_scene_ids(scenes)
+
+
+# 싱글톤 인스턴스 생성 (편의를 위해)
+dirty_scene_watcher = DirtySceneWatcher()
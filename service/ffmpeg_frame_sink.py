@@ -0,0 +1,291 @@
+"""
+ffmpeg 프레임 싱크
+출력 파일 하나당 ffmpeg 프로세스 하나를 띄워 두고, 합성된 프레임(H x W x 3 uint8)을 rawvideo로
+stdin 파이프에 그대로 씁니다. (MoviePy write_videofile처럼 프레임마다 변환/복사하지 않음)
+
+- C 연속(contiguous) uint8 프레임은 memoryview로 복사 없이 씁니다.
+  형식이 다른 프레임만 미리 할당한 버퍼 하나에 변환하여 재사용합니다.
+- 오디오는 WAV 파일을 두 번째 입력으로 받아 같은 프로세스에서 mux 합니다 (임시 오디오 인코딩 단계 없음).
+- 파이프 쓰기에서 막힌 시간(인코더 backpressure)을 기록하여 합성과 인코딩 중 어느 쪽이 병목인지 알려줍니다.
+  write_wait_ratio가 1에 가까우면 인코더가, 0에 가까우면 합성이 병목입니다.
+- FrameFanout은 한 번 합성한 프레임을 여러 싱크(출력 대상별 인코더)에 동시에 씁니다.
+"""
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.ffmpeg_utils import get_ffmpeg_binary
+
+
+class FFmpegFrameSink:
+    """rawvideo 파이프로 프레임을 받아 인코딩하는 ffmpeg 프로세스 래퍼"""
+
+    # MoviePy write_videofile 기본값과 같은 인코딩 설정
+    DEFAULT_CODEC = "libx264"
+    DEFAULT_PRESET = "medium"
+    DEFAULT_PIX_FMT = "yuv420p"
+
+    def __init__(
+        self,
+        output_path,
+        size: Tuple[int, int],
+        fps: int,
+        audio_path=None,
+        codec: str = DEFAULT_CODEC,
+        preset: str = DEFAULT_PRESET,
+        pix_fmt: str = DEFAULT_PIX_FMT,
+        audio_codec: str = "aac",
+        audio_bitrate: str = "192k",
+        threads: Optional[int] = None,
+        video_filter: Optional[str] = None,
+        video_args: Optional[List[str]] = None
+    ):
+        """
+        FFmpegFrameSink 초기화 (프로세스는 open()에서 시작)
+
+        Args:
+            output_path (str or Path): 출력 비디오 경로
+            size (tuple): 프레임 크기 (width, height)
+            fps (int): 초당 프레임 수
+            audio_path (str or Path, optional): 함께 mux할 WAV 경로
+            codec (str): 비디오 코덱
+            preset (str): 인코더 preset
+            pix_fmt (str): 출력 픽셀 형식
+            audio_codec (str): 오디오 코덱
+            audio_bitrate (str): 오디오 비트레이트
+            threads (int, optional): 인코더 스레드 수 (없으면 ffmpeg 기본값)
+            video_filter (str, optional): 인코딩 전 적용할 ffmpeg 필터 (크롭/스케일)
+            video_args (list, optional): 비디오 인코더 인자 (있으면 codec/preset/pix_fmt 대신 사용)
+        """
+        self.output_path = Path(output_path)
+        self.width, self.height = int(size[0]), int(size[1])
+        self.fps = fps
+        self.audio_path = Path(audio_path) if audio_path else None
+        self.codec = codec
+        self.preset = preset
+        self.pix_fmt = pix_fmt
+        self.audio_codec = audio_codec
+        self.audio_bitrate = audio_bitrate
+        self.threads = threads
+        self.video_filter = video_filter
+        self.video_args = video_args
+
+        self.process: Optional[subprocess.Popen] = None
+        self._buffer: Optional[np.ndarray] = None
+        self._stderr = bytearray()
+        self._stderr_thread: Optional[threading.Thread] = None
+
+        self.frames = 0
+        self.bytes_written = 0
+        self.copied_frames = 0
+        self.write_seconds = 0.0
+        self.max_write_seconds = 0.0
+        self._opened_at: Optional[float] = None
+        self._closed_at: Optional[float] = None
+
+    def build_command(self) -> list:
+        """ffmpeg 명령줄 생성"""
+        command = [
+            get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "rawvideo", "-vcodec", "rawvideo",
+            "-s", f"{self.width}x{self.height}", "-pix_fmt", "rgb24", "-r", str(self.fps),
+            "-i", "-"
+        ]
+        if self.audio_path:
+            command += ["-i", str(self.audio_path), "-map", "0:v:0", "-map", "1:a:0",
+                        "-c:a", self.audio_codec, "-b:a", self.audio_bitrate, "-shortest"]
+        else:
+            command += ["-an"]
+        if self.video_filter:
+            command += ["-vf", self.video_filter]
+        command += self.video_args or ["-vcodec", self.codec, "-preset", self.preset, "-pix_fmt", self.pix_fmt]
+        if self.threads:
+            command += ["-threads", str(self.threads)]
+        command += [str(self.output_path)]
+        return command
+
+    def open(self) -> 'FFmpegFrameSink':
+        """ffmpeg 프로세스 시작"""
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.process = subprocess.Popen(self.build_command(), stdin=subprocess.PIPE,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        # stderr 파이프가 가득 차서 ffmpeg가 멈추지 않도록 별도 스레드에서 비움
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+        self._opened_at = time.perf_counter()
+        return self
+
+    def _drain_stderr(self):
+        for line in self.process.stderr:
+            self._stderr.extend(line)
+
+    def write(self, frame: np.ndarray):
+        """
+        프레임 한 장 쓰기
+
+        Args:
+            frame (np.ndarray): H x W x 3 프레임 (C 연속 uint8이면 복사 없이 씀)
+        """
+        if frame.dtype != np.uint8 or not frame.flags.c_contiguous or frame.shape != (self.height, self.width, 3):
+            # 형식이 다른 프레임만 재사용 버퍼에 변환 (RGBA면 알파 제외)
+            if self._buffer is None:
+                self._buffer = np.empty((self.height, self.width, 3), dtype=np.uint8)
+            np.copyto(self._buffer, frame[:, :, :3], casting="unsafe")
+            frame = self._buffer
+            self.copied_frames += 1
+
+        started = time.perf_counter()
+        try:
+            self.process.stdin.write(memoryview(frame).cast("B"))
+        except (BrokenPipeError, OSError) as e:
+            raise IOError(f"ffmpeg 인코더가 종료되었습니다: {self.get_error() or e}") from e
+        elapsed = time.perf_counter() - started
+
+        self.write_seconds += elapsed
+        self.max_write_seconds = max(self.max_write_seconds, elapsed)
+        self.frames += 1
+        self.bytes_written += frame.nbytes
+
+    def close(self) -> bool:
+        """
+        입력을 닫고 인코딩이 끝날 때까지 대기
+
+        Returns:
+            bool: 성공 여부 (ffmpeg 종료 코드 0)
+        """
+        if self.process is None:
+            return False
+        if self._closed_at is not None:
+            return self.process.returncode == 0
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        returncode = self.process.wait()
+        if self._stderr_thread:
+            self._stderr_thread.join(timeout=1.0)
+        self._closed_at = time.perf_counter()
+        if returncode != 0:
+            print(f"[FRAME_SINK] ffmpeg 오류 (코드: {returncode})")
+            print(f"   {self.get_error()}")
+        return returncode == 0
+
+    def abort(self):
+        """인코딩 중단 (예외 발생 시)"""
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+
+    def get_error(self) -> str:
+        """ffmpeg stderr 내용"""
+        return self._stderr.decode(errors="ignore").strip()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        인코딩 통계 반환
+
+        Returns:
+            dict: {"frames", "bytes_written", "copied_frames", "wall", "write_seconds",
+                   "max_write_seconds", "write_wait_ratio", "encoder_fps"}
+        """
+        wall = ((self._closed_at or time.perf_counter()) - self._opened_at) if self._opened_at else 0.0
+        return {
+            "frames": self.frames,
+            "bytes_written": self.bytes_written,
+            "copied_frames": self.copied_frames,
+            "wall": wall,
+            "write_seconds": self.write_seconds,
+            "max_write_seconds": self.max_write_seconds,
+            "write_wait_ratio": self.write_seconds / wall if wall else 0.0,
+            "encoder_fps": self.frames / wall if wall else 0.0
+        }
+
+    def __enter__(self) -> 'FFmpegFrameSink':
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+        return False
+
+
+class FrameFanout:
+    """
+    프레임 한 장을 여러 FFmpegFrameSink에 동시에 쓰는 팬아웃
+    인코더마다 쓰기 스레드를 두므로 가장 느린 인코더의 속도로 진행합니다 (프레임 단위로 동기화).
+    """
+
+    def __init__(self, sinks: List[FFmpegFrameSink]):
+        """
+        FrameFanout 초기화
+
+        Args:
+            sinks (list): 프레임을 받을 싱크 리스트 (첫 번째가 기본 출력)
+        """
+        self.sinks = sinks
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def open(self) -> 'FrameFanout':
+        """모든 싱크의 ffmpeg 프로세스 시작"""
+        try:
+            for sink in self.sinks:
+                sink.open()
+        except Exception:
+            self.abort()
+            raise
+        if len(self.sinks) > 1:
+            self._executor = ThreadPoolExecutor(max_workers=len(self.sinks), thread_name_prefix="frame-fanout")
+        return self
+
+    def write(self, frame: np.ndarray):
+        """
+        프레임 한 장을 모든 싱크에 쓰기 (모든 쓰기가 끝날 때까지 대기 - 프레임 버퍼 재사용 안전)
+
+        Args:
+            frame (np.ndarray): H x W x 3 프레임
+        """
+        if self._executor is None:
+            for sink in self.sinks:
+                sink.write(frame)
+            return
+        for future in [self._executor.submit(sink.write, frame) for sink in self.sinks]:
+            future.result()
+
+    def close(self) -> List[bool]:
+        """
+        모든 싱크의 입력을 닫고 인코딩이 끝날 때까지 대기 (싱크마다 병렬)
+
+        Returns:
+            list: 싱크별 성공 여부
+        """
+        if self._executor is None:
+            return [sink.close() for sink in self.sinks]
+        results = list(self._executor.map(lambda sink: sink.close(), self.sinks))
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        return results
+
+    def abort(self):
+        """모든 인코딩 중단 (예외 발생 시)"""
+        for sink in self.sinks:
+            sink.abort()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> 'FrameFanout':
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+        return False
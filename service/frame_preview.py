@@ -0,0 +1,210 @@
+"""
+단일 프레임 미리보기 서비스
+씬을 인코딩하지 않고 요청한 시각(t초)의 프레임 하나만 합성해서 이미지로 반환합니다.
+
+- 씬 렌더러의 타임라인(get_timeline)을 컴포지터로 클립 구조로 만든 뒤 그 시각의 프레임만 계산합니다.
+  스프라이트를 한 번 구워 두고 프레임마다 합성만 하는 numpy 컴포지터를 우선 사용합니다. (없으면 설정한 컴포지터)
+- 씬 클립은 렌더링 입력의 지문(렌더링 매니페스트와 같은 계산)별로 최근 MAX_SCENES개를 열어 두고,
+  씬 내용이 바뀌면 지문이 달라지므로 새로 만듭니다.
+- 합성한 프레임은 (지문, 프레임 번호, 미리보기 너비)별로 인코딩한 이미지를 LRU 캐시에 MAX_FRAMES개까지 보관합니다.
+- t는 프레임 번호로 맞춰서(렌더링 결과의 같은 프레임) 근처 시각 요청도 캐시를 사용합니다.
+"""
+import io
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from project_manager import project_manager
+from service.render_tracer import render_tracer
+from service.telemetry import telemetry
+from service.timeline import Timeline
+
+
+@dataclass
+class PreviewScene:
+    """
+    미리보기용으로 열어 둔 씬 구조체
+    타임라인, 합성 클립, 닫을 자원을 포함
+    """
+    timeline: Timeline
+    clip: Any = None
+    resources: List[Any] = field(default_factory=list)
+
+    def get_frame_index(self, t: float) -> int:
+        """t초에 해당하는 프레임 번호 (0 ~ 마지막 프레임)"""
+        last = max(self.timeline.frame_count - 1, 0)
+        return min(max(int(round(t * self.timeline.fps)), 0), last)
+
+    def close(self):
+        """클립과 자원 닫기"""
+        for resource in [self.clip] + self.resources:
+            try:
+                if resource is not None:
+                    resource.close()
+            except Exception:
+                pass
+
+
+class FramePreviewService:
+    """인코딩 없이 씬의 단일 프레임을 합성하는 미리보기 서비스 클래스"""
+
+    MAX_SCENES = 4          # 열어 둘 씬 클립 수
+    MAX_FRAMES = 256        # 캐시할 미리보기 이미지 수
+    DEFAULT_WIDTH = 540     # 기본 미리보기 너비 (원본의 절반)
+    PREFERRED_COMPOSITOR = "numpy"  # 미리보기에 우선 사용할 컴포지터
+
+    def __init__(self, max_scenes: int = MAX_SCENES, max_frames: int = MAX_FRAMES):
+        """
+        FramePreviewService 초기화
+
+        Args:
+            max_scenes (int): 열어 둘 씬 클립 수
+            max_frames (int): 캐시할 미리보기 이미지 수
+        """
+        self.max_scenes = max_scenes
+        self.max_frames = max_frames
+        self._scenes: "OrderedDict[str, PreviewScene]" = OrderedDict()
+        self._frames: "OrderedDict[tuple, bytes]" = OrderedDict()
+        # MoviePy 클립은 스레드 안전하지 않으므로 합성은 한 번에 하나씩
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def get_scene_key(scene: Dict[str, Any], project_path: Path) -> str:
+        """씬 미리보기 캐시 키 (렌더링 입력의 지문)"""
+        from service.render_manifest import compute_fingerprint
+        return compute_fingerprint(scene, project_path)
+
+    def _open_scene(self, key: str, scene: Dict[str, Any], project_path: Path) -> Optional[PreviewScene]:
+        """씬 클립을 열거나 열어 둔 클립 반환 (lock 안에서 호출)"""
+        preview = self._scenes.get(key)
+        if preview is not None:
+            self._scenes.move_to_end(key)
+            return preview
+
+        from service.compositors import get_compositor
+        from service.scene_renderers import get_renderer_class
+
+        SceneClass = get_renderer_class(scene.get("type", "type1"))
+        compositor = get_compositor(self.PREFERRED_COMPOSITOR) or get_compositor()
+        if SceneClass is None or compositor is None:
+            return None
+        timeline = SceneClass(scene, project_path=project_path).get_timeline()
+        if timeline is None:
+            return None
+        with render_tracer.span("preview_open_scene", phase="preview", scene_id=timeline.scene_id):
+            # 텍스트 이미지는 렌더링과 같은 temp 폴더에 그려서 서로 재사용
+            clip, resources = compositor.build_video_clip(timeline, work_dir=project_path / "temp", with_audio=False)
+        if clip is None:
+            return None
+
+        preview = PreviewScene(timeline, clip, list(resources))
+        self._scenes[key] = preview
+        while len(self._scenes) > self.max_scenes:
+            _, evicted = self._scenes.popitem(last=False)
+            evicted.close()
+        return preview
+
+    def get_duration(self, scene: Dict[str, Any], project_path=None) -> Optional[float]:
+        """
+        씬 길이(초) - 미리보기 스크러버 범위용 (씬 클립도 함께 열어 둠)
+
+        Args:
+            scene (dict): 씬 정보 딕셔너리
+            project_path (str or Path, optional): 프로젝트 경로 (없으면 현재 로드된 프로젝트)
+
+        Returns:
+            float: 씬 길이 또는 None (타임라인을 만들 수 없을 때)
+        """
+        project_path = Path(project_path) if project_path else project_manager.get_project_path()
+        with self._lock:
+            preview = self._open_scene(self.get_scene_key(scene, project_path), scene, project_path)
+            return preview.timeline.duration if preview else None
+
+    def get_frame(self, scene: Dict[str, Any], t: float, project_path=None) -> Optional[np.ndarray]:
+        """
+        t초의 프레임 합성 (H x W x 3 uint8, 캐시하지 않음)
+
+        Args:
+            scene (dict): 씬 정보 딕셔너리
+            t (float): 시각(초)
+            project_path (str or Path, optional): 프로젝트 경로 (없으면 현재 로드된 프로젝트)
+
+        Returns:
+            np.ndarray: 프레임 또는 None (실패 시)
+        """
+        project_path = Path(project_path) if project_path else project_manager.get_project_path()
+        try:
+            with self._lock:
+                preview = self._open_scene(self.get_scene_key(scene, project_path), scene, project_path)
+                if preview is None:
+                    return None
+                frame_index = preview.get_frame_index(t)
+                return np.asarray(preview.clip.get_frame(frame_index / preview.timeline.fps))
+        except Exception as e:
+            print(f"[PREVIEW] 프레임 합성 오류: {e}")
+            return None
+
+    def get_frame_image(self, scene: Dict[str, Any], t: float, project_path=None, width: Optional[int] = DEFAULT_WIDTH,
+                        image_format: str = "JPEG") -> Optional[bytes]:
+        """
+        t초의 프레임을 이미지(JPEG/PNG 바이트)로 반환 (LRU 캐시 사용)
+
+        Args:
+            scene (dict): 씬 정보 딕셔너리
+            t (float): 시각(초)
+            project_path (str or Path, optional): 프로젝트 경로 (없으면 현재 로드된 프로젝트)
+            width (int, optional): 미리보기 너비 (None이면 원본 크기)
+            image_format (str): 이미지 형식 ("JPEG" 또는 "PNG")
+
+        Returns:
+            bytes: 이미지 바이트 또는 None (실패 시)
+        """
+        from PIL import Image
+
+        project_path = Path(project_path) if project_path else project_manager.get_project_path()
+        try:
+            with self._lock:
+                key = self.get_scene_key(scene, project_path)
+                preview = self._open_scene(key, scene, project_path)
+                if preview is None:
+                    return None
+                frame_index = preview.get_frame_index(t)
+                cache_key = (key, frame_index, width, image_format)
+                data = self._frames.get(cache_key)
+                telemetry.count_cache("frame", hit=data is not None)
+                if data is not None:
+                    self._frames.move_to_end(cache_key)
+                    return data
+
+                with render_tracer.span("preview_frame", phase="preview", scene_id=preview.timeline.scene_id):
+                    frame = np.asarray(preview.clip.get_frame(frame_index / preview.timeline.fps))
+                    image = Image.fromarray(frame.astype(np.uint8))
+                    if width and image.width > width:
+                        image = image.resize((width, round(image.height * width / image.width)), Image.BILINEAR)
+                    buffer = io.BytesIO()
+                    image.save(buffer, format=image_format, quality=85)
+                    data = buffer.getvalue()
+
+                self._frames[cache_key] = data
+                while len(self._frames) > self.max_frames:
+                    self._frames.popitem(last=False)
+                return data
+        except Exception as e:
+            print(f"[PREVIEW] 미리보기 이미지 생성 오류: {e}")
+            return None
+
+    def clear(self):
+        """열어 둔 씬 클립과 프레임 캐시 비우기"""
+        with self._lock:
+            for preview in self._scenes.values():
+                preview.close()
+            self._scenes.clear()
+            self._frames.clear()
+
+
+# 싱글톤 인스턴스 생성 (편의를 위해)
+frame_preview_service = FramePreviewService()
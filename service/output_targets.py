@@ -0,0 +1,167 @@
+"""
+출력 대상(배포 형식) 정의
+Shorts/Reels/TikTok처럼 해상도(크롭/스케일), 인코더 설정(CRF, 최대 비트레이트), 컨테이너가 다른 결과물을
+한 번의 합성으로 같이 만들기 위한 설정입니다.
+
+씬 프레임은 한 번만 합성되고, 대상마다 별도의 ffmpeg 인코더로 동시에 보내집니다 (FrameFanout).
+대상별 씬 비디오는 output/targets/<대상 이름>/ 에 저장되고, 최종 비디오는 <파일명>_<대상 이름>.<컨테이너>로 합쳐집니다.
+
+설정 "output_targets"에 프리셋 이름 목록을 저장하면 🎬 전체 렌더링에서 기본으로 사용합니다.
+"""
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class OutputTarget:
+    """
+    출력 대상 구조체
+    이름, 출력 해상도, (선택) 크롭 크기/위치, 인코더 설정, 컨테이너를 포함
+
+    - crop: 합성된 프레임에서 잘라낼 (너비, 높이) - 스케일 전에 적용, crop_offset이 없으면 가운데 기준
+    - crf + max_bitrate: 품질 기준 인코딩에 최대 비트레이트 상한 (VBV, bufsize 기본값은 max_bitrate의 2배)
+    """
+    name: str
+    width: int = 1080
+    height: int = 1920
+    crop: Optional[Tuple[int, int]] = None
+    crop_offset: Optional[Tuple[int, int]] = None
+    codec: str = "libx264"
+    preset: str = "medium"
+    crf: Optional[int] = 23
+    max_bitrate: Optional[str] = None
+    bufsize: Optional[str] = None
+    profile: Optional[str] = "high"
+    pix_fmt: str = "yuv420p"
+    container: str = "mp4"
+    audio_codec: str = "aac"
+    audio_bitrate: str = "192k"
+
+    def get_video_filter(self) -> Optional[str]:
+        """크롭/스케일 ffmpeg 필터 문자열 (필요 없으면 None)"""
+        filters = []
+        if self.crop:
+            crop = f"crop={self.crop[0]}:{self.crop[1]}"
+            if self.crop_offset:
+                crop += f":{self.crop_offset[0]}:{self.crop_offset[1]}"
+            filters.append(crop)
+        filters.append(f"scale={self.width}:{self.height}:flags=lanczos")
+        return ",".join(filters)
+
+    def get_video_args(self) -> List[str]:
+        """비디오 인코더 ffmpeg 인자"""
+        args = ["-vcodec", self.codec, "-preset", self.preset, "-pix_fmt", self.pix_fmt]
+        if self.crf is not None:
+            args += ["-crf", str(self.crf)]
+        if self.max_bitrate:
+            args += ["-maxrate", self.max_bitrate, "-bufsize", self.bufsize or _double_bitrate(self.max_bitrate)]
+        if self.profile and self.codec == "libx264":
+            args += ["-profile:v", self.profile]
+        return args
+
+    def get_mux_args(self) -> List[str]:
+        """최종 합치기에서 사용할 오디오/컨테이너 ffmpeg 인자"""
+        args = ["-c:a", self.audio_codec, "-b:a", self.audio_bitrate]
+        if self.container in ("mp4", "mov"):
+            args += ["-movflags", "+faststart"]
+        return args
+
+    def get_scene_relative_path(self, scene_id: str) -> str:
+        """
+        대상별 씬 비디오의 프로젝트 기준 상대 경로 (output/targets/<대상 이름>/<씬 ID>_output.<컨테이너>)
+
+        Args:
+            scene_id (str): 씬 ID
+
+        Returns:
+            str: 상대 경로
+        """
+        return f"output/targets/{self.name}/{scene_id}_output.{self.container}"
+
+    def get_output_filename(self, output_filename: str) -> str:
+        """
+        최종 비디오 파일명 (예: final_output.mp4 → final_output_shorts.mp4)
+
+        Args:
+            output_filename (str): 기본 최종 비디오 파일명
+
+        Returns:
+            str: 대상별 파일명
+        """
+        stem = output_filename.rsplit(".", 1)[0]
+        return f"{stem}_{self.name}.{self.container}"
+
+    def signature(self) -> str:
+        """대상 설정 해시 (설정이 바뀌면 대상별 씬 비디오를 다시 인코딩)"""
+        encoded = json.dumps(self.to_dict(), sort_keys=True)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        for key in ("crop", "crop_offset"):
+            if data[key] is not None:
+                data[key] = list(data[key])
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'OutputTarget':
+        data = dict(data)
+        for key in ("crop", "crop_offset"):
+            if data.get(key) is not None:
+                data[key] = tuple(data[key])
+        return cls(**data)
+
+
+def _double_bitrate(bitrate: str) -> str:
+    """"8M" → "16M" (VBV 버퍼 기본값)"""
+    number, unit = (bitrate[:-1], bitrate[-1]) if bitrate[-1].isalpha() else (bitrate, "")
+    return f"{float(number) * 2:g}{unit}"
+
+
+# 배포처별 프리셋 (화면 크기 1080x1920 기준)
+OUTPUT_TARGET_PRESETS = {
+    "shorts": OutputTarget(name="shorts", crf=20, max_bitrate="12M"),
+    "reels": OutputTarget(name="reels", crf=21, max_bitrate="8M"),
+    "tiktok": OutputTarget(name="tiktok", crf=22, max_bitrate="6M"),
+    "feed_4x5": OutputTarget(name="feed_4x5", width=1080, height=1350, crop=(1080, 1350), crf=21, max_bitrate="8M"),
+}
+
+
+def get_output_target(target) -> Optional[OutputTarget]:
+    """
+    프리셋 이름/딕셔너리/OutputTarget을 OutputTarget으로 변환
+
+    Args:
+        target (str, dict or OutputTarget): 대상 지정
+
+    Returns:
+        OutputTarget: 출력 대상 또는 None (알 수 없는 프리셋)
+    """
+    if isinstance(target, OutputTarget):
+        return target
+    if isinstance(target, dict):
+        return OutputTarget.from_dict(target)
+    preset = OUTPUT_TARGET_PRESETS.get(target)
+    if preset is None:
+        print(f"[OUTPUT_TARGET] 알 수 없는 출력 대상: {target}")
+    return preset
+
+
+def resolve_output_targets(targets) -> List[OutputTarget]:
+    """
+    출력 대상 목록 변환 (알 수 없는 항목과 중복 이름은 제외)
+
+    Args:
+        targets (list, optional): 프리셋 이름/딕셔너리/OutputTarget 리스트
+
+    Returns:
+        List[OutputTarget]: 출력 대상 리스트
+    """
+    resolved = []
+    for target in targets or []:
+        target = get_output_target(target)
+        if target and target.name not in (item.name for item in resolved):
+            resolved.append(target)
+    return resolved
@@ -0,0 +1,388 @@
+"""
+프로젝트 카탈로그 인덱스
+projects/ 폴더의 프로젝트 목록과 프로젝트별 통계(씬 수, 폴더 크기, 마지막 렌더링)를 SQLite에 저장하여
+프로젝트가 수천 개여도 로드 다이얼로그가 폴더 전체를 매번 훑지 않도록 합니다.
+
+- 프로젝트 목록: projects/ 폴더의 수정 시각이 바뀌었을 때만 폴더 이름을 다시 읽어 행을 추가/삭제합니다.
+- 프로젝트 통계: 조회한 페이지의 프로젝트만 서명(폴더/video.json/output/렌더링 매니페스트 수정 시각)을 확인하고,
+  바뀐 프로젝트만 다시 계산합니다.
+- 생성/삭제/video.json 저장 시에는 ProjectManager/SceneManager가 카탈로그를 바로 갱신합니다.
+"""
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from utils.sqlite_utils import SQLiteStore
+
+# 렌더링 매니페스트 파일 (service.render_manifest.MANIFEST_FILENAME과 같음 - 렌더링 모듈을 import하지 않기 위해 복사)
+MANIFEST_FILENAME = "render_manifest.json"
+
+
+@dataclass
+class CatalogEntry:
+    """
+    카탈로그 항목 구조체
+    프로젝트 이름/폴더/경로/타임스탬프와 미리 계산한 통계를 포함
+    """
+    folder_name: str
+    project_name: str
+    path: str
+    timestamp: str = ""
+    scene_count: int = 0
+    size_bytes: int = 0
+    rendered_scenes: int = 0
+    last_render_at: Optional[float] = None
+    indexed_at: Optional[float] = None
+
+    @property
+    def created_at(self) -> Optional[datetime.datetime]:
+        """폴더 이름의 타임스탬프(YYYYMMDD_HHMMSS)를 datetime으로 변환 (없으면 None)"""
+        try:
+            return datetime.datetime.strptime(self.timestamp, "%Y%m%d_%H%M%S")
+        except ValueError:
+            return None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'CatalogEntry':
+        """DB 행에서 CatalogEntry 생성"""
+        return cls(
+            folder_name=row["folder_name"],
+            project_name=row["project_name"],
+            path=row["path"],
+            timestamp=row["timestamp"],
+            scene_count=row["scene_count"],
+            size_bytes=row["size_bytes"],
+            rendered_scenes=row["rendered_scenes"],
+            last_render_at=row["last_render_at"],
+            indexed_at=row["indexed_at"]
+        )
+
+
+def split_folder_name(folder_name: str) -> Tuple[str, str]:
+    """
+    폴더 이름을 (타임스탬프, 프로젝트 이름)으로 분리 (ProjectManager 폴더 규칙: 날짜시간_이름)
+
+    Args:
+        folder_name (str): 프로젝트 폴더 이름
+
+    Returns:
+        tuple: (타임스탬프, 프로젝트 이름) - 타임스탬프가 없으면 ("", 폴더 이름)
+    """
+    parts = folder_name.split("_")
+    # YYYYMMDD_HHMMSS_이름
+    if len(parts) >= 3 and parts[0].isdigit() and parts[1].isdigit():
+        return f"{parts[0]}_{parts[1]}", "_".join(parts[2:])
+    if "_" in folder_name:
+        timestamp, name = folder_name.split("_", 1)
+        return timestamp, name
+    return "", folder_name
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _directory_size(path: Path) -> int:
+    """폴더 전체 파일 크기 합계 (심볼릭 링크는 따라가지 않음)"""
+    total = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+def get_project_signature(project_path: Path) -> str:
+    """
+    프로젝트 통계 서명 (폴더, video.json, output 폴더, 렌더링 매니페스트의 수정 시각)
+
+    Args:
+        project_path (Path): 프로젝트 경로
+
+    Returns:
+        str: 서명 문자열
+    """
+    paths = (project_path, project_path / "video.json", project_path / "output", project_path / "output" / MANIFEST_FILENAME)
+    return ":".join(str(_mtime_ns(path)) for path in paths)
+
+
+def compute_project_stats(project_path: Path) -> dict:
+    """
+    프로젝트 통계 계산
+
+    Args:
+        project_path (Path): 프로젝트 경로
+
+    Returns:
+        dict: {"scene_count", "size_bytes", "rendered_scenes", "last_render_at"}
+    """
+    scene_count = 0
+    try:
+        with open(project_path / "video.json", 'r', encoding='utf-8') as f:
+            scene_count = len(json.load(f).get("scenes", []))
+    except (OSError, ValueError):
+        pass
+
+    rendered_scenes = 0
+    last_render_at = None
+    try:
+        with open(project_path / "output" / MANIFEST_FILENAME, 'r', encoding='utf-8') as f:
+            entries = json.load(f).get("scenes", {})
+        rendered_scenes = len(entries)
+        last_render_at = max((entry.get("rendered_at", 0) for entry in entries.values()), default=None)
+    except (OSError, ValueError):
+        pass
+
+    return {
+        "scene_count": scene_count,
+        "size_bytes": _directory_size(project_path),
+        "rendered_scenes": rendered_scenes,
+        "last_render_at": last_render_at
+    }
+
+
+class ProjectCatalog(SQLiteStore):
+    """SQLite 기반 프로젝트 카탈로그 (목록 + 프로젝트별 통계)"""
+
+    DB_LABEL = "프로젝트 카탈로그 DB"
+
+    def __init__(self, base_dir="projects", db_path: str = "project_catalog.db"):
+        """
+        ProjectCatalog 초기화
+
+        Args:
+            base_dir (str or Path): 프로젝트 폴더 (ProjectManager.base_dir)
+            db_path (str): 카탈로그 DB 파일 경로 (projects/ 밖에 두어 폴더 수정 시각에 영향을 주지 않음)
+        """
+        self.base_dir = Path(base_dir)
+        self.db_path = Path(db_path)
+        self._sync_lock = threading.Lock()
+        self._init_db()
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        """카탈로그 테이블 생성"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS projects (
+                folder_name TEXT PRIMARY KEY,
+                project_name TEXT NOT NULL,
+                path TEXT NOT NULL,
+                timestamp TEXT NOT NULL DEFAULT '',
+                scene_count INTEGER NOT NULL DEFAULT 0,
+                size_bytes INTEGER NOT NULL DEFAULT 0,
+                rendered_scenes INTEGER NOT NULL DEFAULT 0,
+                last_render_at REAL,
+                signature TEXT,
+                indexed_at REAL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_timestamp ON projects (timestamp)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_name ON projects (project_name COLLATE NOCASE)")
+        conn.execute("CREATE TABLE IF NOT EXISTS catalog_meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def _get_meta(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM catalog_meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def sync(self, force: bool = False) -> bool:
+        """
+        projects/ 폴더와 카탈로그 목록 동기화 (폴더 수정 시각이 바뀌었을 때만 폴더 이름을 다시 읽음)
+        새 프로젝트는 통계 없이 추가되고, 통계는 조회할 때 계산됩니다.
+
+        Args:
+            force (bool): 수정 시각과 관계없이 다시 읽기
+
+        Returns:
+            bool: 목록을 다시 읽었는지 여부
+        """
+        base_mtime = _mtime_ns(self.base_dir)
+        if base_mtime is None:
+            return False
+        with self._sync_lock:
+            try:
+                with self._db() as conn:
+                    if not force and self._get_meta(conn, "base_mtime") == str(base_mtime):
+                        return False
+                    folders = {item.name: item for item in self.base_dir.iterdir() if item.is_dir()}
+                    indexed = {row["folder_name"] for row in conn.execute("SELECT folder_name FROM projects")}
+                    removed = indexed - folders.keys()
+                    conn.executemany("DELETE FROM projects WHERE folder_name = ?", [(name,) for name in removed])
+                    conn.executemany(
+                        "INSERT INTO projects (folder_name, project_name, path, timestamp) VALUES (?, ?, ?, ?)",
+                        [(name, split_folder_name(name)[1], str(folders[name]), split_folder_name(name)[0])
+                         for name in folders.keys() - indexed]
+                    )
+                    conn.execute("INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('base_mtime', ?)",
+                                 (str(base_mtime),))
+                return True
+            except Exception as e:
+                print(f"프로젝트 카탈로그 동기화 오류: {e}")
+                return False
+
+    def refresh_project(self, project_path) -> Optional[CatalogEntry]:
+        """
+        프로젝트 하나의 통계를 다시 계산하여 저장 (카탈로그에 없으면 추가)
+
+        Args:
+            project_path (str or Path): 프로젝트 경로
+
+        Returns:
+            CatalogEntry: 갱신된 항목 또는 None (폴더가 없거나 실패 시)
+        """
+        project_path = Path(project_path)
+        if not project_path.is_dir():
+            self.remove(project_path.name)
+            return None
+        try:
+            signature = get_project_signature(project_path)
+            stats = compute_project_stats(project_path)
+            timestamp, project_name = split_folder_name(project_path.name)
+            with self._db() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO projects (folder_name, project_name, path, timestamp, scene_count, "
+                    "size_bytes, rendered_scenes, last_render_at, signature, indexed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (project_path.name, project_name, str(project_path), timestamp, stats["scene_count"],
+                     stats["size_bytes"], stats["rendered_scenes"], stats["last_render_at"], signature, time.time())
+                )
+                row = conn.execute("SELECT * FROM projects WHERE folder_name = ?", (project_path.name,)).fetchone()
+            return CatalogEntry.from_row(row) if row else None
+        except Exception as e:
+            print(f"프로젝트 카탈로그 갱신 오류: {e}")
+            return None
+
+    def invalidate(self, project_path):
+        """
+        프로젝트 통계를 다음 조회 때 다시 계산하도록 표시 (video.json 저장처럼 잦은 변경에서 사용)
+        카탈로그에 없는 경로(projects/ 밖의 임시 프로젝트 등)는 무시합니다.
+
+        Args:
+            project_path (str or Path): 프로젝트 경로
+        """
+        project_path = Path(project_path)
+        try:
+            with self._db() as conn:
+                conn.execute("UPDATE projects SET signature = NULL WHERE folder_name = ? AND path = ?",
+                             (project_path.name, str(project_path)))
+        except Exception as e:
+            print(f"프로젝트 카탈로그 갱신 오류: {e}")
+
+    def remove(self, folder_name: str):
+        """
+        프로젝트 항목 삭제
+
+        Args:
+            folder_name (str): 프로젝트 폴더 이름
+        """
+        try:
+            with self._db() as conn:
+                conn.execute("DELETE FROM projects WHERE folder_name = ?", (folder_name,))
+        except Exception as e:
+            print(f"프로젝트 카탈로그 삭제 오류: {e}")
+
+    def query(
+        self,
+        search: Optional[str] = None,
+        date_from: Optional[datetime.date] = None,
+        date_to: Optional[datetime.date] = None,
+        offset: int = 0,
+        limit: Optional[int] = 20,
+        refresh_stats: bool = True
+    ) -> Tuple[List[CatalogEntry], int]:
+        """
+        프로젝트 검색 (최신순, 페이지 단위) - 결과 페이지의 통계는 서명이 바뀐 프로젝트만 다시 계산
+
+        Args:
+            search (str, optional): 프로젝트 이름 검색어 (부분 일치, 영문 대소문자 무시)
+            date_from (date, optional): 생성일 시작 (포함)
+            date_to (date, optional): 생성일 끝 (포함)
+            offset (int): 건너뛸 항목 수
+            limit (int, optional): 최대 항목 수 (None이면 전체)
+            refresh_stats (bool): False면 저장된 통계를 그대로 반환 (전체 목록처럼 통계가 필요 없을 때)
+
+        Returns:
+            tuple: (CatalogEntry 리스트, 조건에 맞는 전체 항목 수)
+        """
+        self.sync()
+
+        conditions, params = [], []
+        if search:
+            escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            conditions.append("project_name LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        # 타임스탬프(YYYYMMDD_HHMMSS)는 고정 길이라 문자열 비교로 날짜 범위 검색
+        if date_from:
+            conditions.append("timestamp >= ?")
+            params.append(date_from.strftime("%Y%m%d"))
+        if date_to:
+            conditions.append("timestamp < ?")
+            params.append((date_to + datetime.timedelta(days=1)).strftime("%Y%m%d"))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        try:
+            with self._db() as conn:
+                total = conn.execute(f"SELECT COUNT(*) FROM projects {where}", params).fetchone()[0]
+                rows = conn.execute(
+                    f"SELECT * FROM projects {where} ORDER BY timestamp DESC, folder_name DESC LIMIT ? OFFSET ?",
+                    params + [limit if limit is not None else -1, offset]
+                ).fetchall()
+        except Exception as e:
+            print(f"프로젝트 카탈로그 조회 오류: {e}")
+            return [], 0
+
+        entries = []
+        for row in rows:
+            entry = CatalogEntry.from_row(row)
+            if refresh_stats and row["signature"] != get_project_signature(Path(row["path"])):
+                entry = self.refresh_project(row["path"])
+                if entry is None:
+                    # 동기화 이후 삭제된 프로젝트
+                    continue
+            entries.append(entry)
+        return entries, total
+
+    def get_disk_usage(self, limit: int = 20) -> Tuple[List[CatalogEntry], int, int]:
+        """
+        디스크 사용량이 큰 프로젝트 조회 (저장된 통계 사용 - 폴더를 다시 읽지 않음)
+
+        Args:
+            limit (int): 최대 항목 수
+
+        Returns:
+            tuple: (크기순 CatalogEntry 리스트, 전체 프로젝트 수, 전체 크기(바이트))
+        """
+        self.sync()
+        try:
+            with self._db() as conn:
+                total, total_bytes = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM projects"
+                ).fetchone()
+                rows = conn.execute(
+                    "SELECT * FROM projects ORDER BY size_bytes DESC, folder_name LIMIT ?", (limit,)
+                ).fetchall()
+        except Exception as e:
+            print(f"프로젝트 카탈로그 조회 오류: {e}")
+            return [], 0, 0
+        return [CatalogEntry.from_row(row) for row in rows], total, total_bytes
+
+
+# 싱글톤 인스턴스 생성 (편의를 위해)
+project_catalog = ProjectCatalog()
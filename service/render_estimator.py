@@ -0,0 +1,408 @@
+"""
+렌더링 비용 추정 서비스
+렌더링을 시작하기 전에 씬/프로젝트별 예상 렌더링 시간과 출력 파일 크기를 계산합니다.
+
+- 씬 특징: 타임라인(프레임 계산 없이 만들 수 있음)의 길이(오디오 길이 기준), 프레임 수, 영상 레이어 수,
+  프레임당 합성 픽셀 면적(화면 대비 비율)
+- 작업량 = 프레임 수 × (1 + 합성 픽셀 비율) - 인코딩 비용은 프레임 수, 합성 비용은 픽셀 면적에 비례한다고 봄
+- 비용 프로필: 컴포지터(청크 인코딩 여부 포함) + 인코더 설정(마스터 + 출력 대상별 코덱/preset/해상도)
+- 씬이 렌더링될 때마다 씬 타입/프로필별 실제 시간과 파일 크기를 render_stats.db에 기록하고,
+  최근 기록의 중앙값(작업량당 시간, 초당 바이트)으로 추정합니다.
+  같은 씬 타입 기록이 없으면 같은 프로필의 전체 기록, 그것도 없으면 기본값(인코더 preset 보정)을 사용합니다.
+- 입력이 바뀌지 않은 씬(렌더링 매니페스트의 지문 일치)은 렌더링 시간 0으로 계산합니다.
+- 최종 비디오 합치기(사운드트랙 믹싱 + mux) 시간은 최근 렌더링 트레이스의 단계별 시간(텔레메트리) 중앙값으로 추정합니다.
+"""
+import sqlite3
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from service.render_progress import format_duration
+from service.render_tracer import file_size
+from service.timeline import Timeline
+from utils.sqlite_utils import SQLiteStore
+
+# 마스터 비디오 인코더 (MoviePy write_videofile / FFmpegFrameSink 기본값)
+MASTER_ENCODER = "libx264/medium"
+# 추정에 사용할 최근 기록 수
+HISTORY_SAMPLES = 20
+# 최종 비디오 합치기 단계에 해당하는 렌더링 트레이스 단계 (씬 오디오 믹싱 audio_mix는 씬 렌더링에 포함)
+ASSEMBLE_PHASES = ("soundtrack_mix", "mux")
+# 기록이 없을 때의 기본값 (1080x1920, libx264 medium 기준)
+DEFAULT_SECONDS_PER_UNIT = 0.05
+DEFAULT_BYTES_PER_SECOND = 250_000
+# 출력 대상 인코더의 상대 비용 (합성은 한 번이므로 대상 하나가 마스터 전체 비용만큼 들지는 않음)
+TARGET_COST_SHARE = 0.5
+# libx264 preset별 상대 인코딩 시간 (medium = 1.0)
+PRESET_FACTORS = {
+    "ultrafast": 0.35, "superfast": 0.45, "veryfast": 0.55, "faster": 0.7, "fast": 0.85,
+    "medium": 1.0, "slow": 1.5, "slower": 2.4, "veryslow": 4.0
+}
+
+
+@dataclass
+class SceneFeatures:
+    """
+    비용 추정용 씬 특징 구조체
+    씬 타입, 길이, 프레임 수, 영상 레이어 수, 프레임당 합성 픽셀 비율(화면 면적 = 1.0)을 포함
+    """
+    scene_type: str
+    duration: float
+    frames: int
+    layers: int
+    pixel_ratio: float
+
+    @property
+    def work_units(self) -> float:
+        """작업량 (프레임 수 × (1 + 합성 픽셀 비율))"""
+        return self.frames * (1.0 + self.pixel_ratio)
+
+    @classmethod
+    def from_timeline(cls, timeline: Timeline) -> 'SceneFeatures':
+        """타임라인에서 특징 계산"""
+        width, height = timeline.screen_size
+        screen_area = float(width * height) or 1.0
+        pixel_time = 0.0
+        visual_layers = timeline.visual_layers
+        for layer in visual_layers:
+            # 크기를 모르는 축(비율 유지 리사이즈 등)은 화면 크기로 간주
+            size = layer.size or (None, None)
+            layer_width = min(size[0] or width, width)
+            layer_height = min(size[1] or height, height)
+            visible = max(0.0, min(layer.end, timeline.duration) - max(layer.start, 0.0))
+            pixel_time += layer_width * layer_height * visible
+        pixel_ratio = pixel_time / (screen_area * timeline.duration) if timeline.duration else 0.0
+        return cls(
+            scene_type=timeline.scene_type,
+            duration=timeline.duration,
+            frames=timeline.frame_count,
+            layers=len(visual_layers),
+            pixel_ratio=round(pixel_ratio, 4)
+        )
+
+
+@dataclass
+class SceneEstimate:
+    """
+    씬 하나의 비용 추정 결과 구조체
+    예상 렌더링 시간(초), 출력 크기(바이트, 마스터 + 출력 대상), 근거("history", "profile", "default")를 포함
+    """
+    scene_id: Optional[str]
+    scene_type: str
+    seconds: float
+    bytes: int
+    duration: float = 0.0
+    frames: int = 0
+    layers: int = 0
+    cached: bool = False
+    source: str = "default"
+    samples: int = 0
+
+    def format_message(self) -> str:
+        """표시용 문자열 (예: "약 12초 · 4.2 MB")"""
+        if self.cached:
+            return f"변경 없음 · {self.bytes / 1024 / 1024:.1f} MB"
+        return f"약 {format_duration(self.seconds)} · {self.bytes / 1024 / 1024:.1f} MB"
+
+
+@dataclass
+class ProjectEstimate:
+    """
+    프로젝트 비용 추정 결과 구조체
+    씬별 추정 결과와 전체 렌더링 시간(다시 렌더링할 씬 합계), 최종 출력 크기(모든 씬 합계)를 포함
+    """
+    scenes: List[SceneEstimate] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(scene.seconds for scene in self.scenes)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(scene.bytes for scene in self.scenes)
+
+    @property
+    def dirty_count(self) -> int:
+        return sum(1 for scene in self.scenes if not scene.cached)
+
+    def get_scene(self, scene_id: str) -> Optional[SceneEstimate]:
+        return next((scene for scene in self.scenes if scene.scene_id == scene_id), None)
+
+    def format_message(self) -> str:
+        """표시용 문자열 (예: "예상 약 1분 12초 · 38.5 MB (다시 렌더링할 씬 3/5개)")"""
+        return (f"예상 약 {format_duration(self.total_seconds)} · {self.total_bytes / 1024 / 1024:.1f} MB "
+                f"(다시 렌더링할 씬 {self.dirty_count}/{len(self.scenes)}개)")
+
+
+def get_encoder_profile(targets: Optional[list] = None) -> str:
+    """
+    인코더 설정 프로필 문자열 (마스터 + 출력 대상별 코덱/preset/해상도)
+
+    Args:
+        targets (list, optional): OutputTarget 리스트
+
+    Returns:
+        str: 프로필 문자열 (예: "libx264/medium+libx264/slow@1080x1350")
+    """
+    parts = [MASTER_ENCODER]
+    parts += sorted(f"{target.codec}/{target.preset}@{target.width}x{target.height}" for target in targets or [])
+    return "+".join(parts)
+
+
+def get_compositor_profile(timeline: Optional[Timeline] = None) -> str:
+    """
+    컴포지터 프로필 문자열 (청크 병렬 인코딩으로 렌더링될 씬은 "+chunked" 추가)
+
+    Args:
+        timeline (Timeline, optional): 씬 타임라인
+
+    Returns:
+        str: 프로필 문자열 (예: "numpy+chunked")
+    """
+    from service.chunked_encoder import chunked_encoder
+    from service.compositors import get_compositor, get_compositor_name
+
+    name = get_compositor_name()
+    if timeline is not None and chunked_encoder.should_chunk(timeline, get_compositor(name)):
+        name += "+chunked"
+    return name
+
+
+def get_default_rates(targets: Optional[list], screen_size: Tuple[int, int]) -> Tuple[float, float]:
+    """
+    기록이 없을 때의 (작업량당 시간, 초당 바이트) - 출력 대상의 preset/해상도로 보정
+
+    Args:
+        targets (list, optional): OutputTarget 리스트
+        screen_size (tuple): 화면 크기 (width, height)
+
+    Returns:
+        tuple: (작업량당 시간(초), 초당 바이트)
+    """
+    screen_area = float(screen_size[0] * screen_size[1]) or 1.0
+    encode_factor = 1.0
+    bytes_factor = 1.0
+    for target in targets or []:
+        area_ratio = target.width * target.height / screen_area
+        encode_factor += PRESET_FACTORS.get(target.preset, 1.0) * area_ratio * TARGET_COST_SHARE
+        bytes_factor += area_ratio
+    return DEFAULT_SECONDS_PER_UNIT * encode_factor, DEFAULT_BYTES_PER_SECOND * bytes_factor
+
+
+class RenderEstimator(SQLiteStore):
+    """씬 렌더링 기록(SQLite)을 바탕으로 렌더링 시간과 출력 크기를 추정하는 클래스"""
+
+    DB_LABEL = "[ESTIMATE] 렌더링 기록 DB"
+
+    def __init__(self, db_path: str = "render_stats.db"):
+        """
+        RenderEstimator 초기화
+
+        Args:
+            db_path (str): 렌더링 기록 DB 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self._init_db()
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        """렌더링 기록 테이블 생성"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS scene_render_stats (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                scene_type TEXT NOT NULL,
+                compositor TEXT NOT NULL,
+                encoder TEXT NOT NULL,
+                duration REAL NOT NULL,
+                frames INTEGER NOT NULL,
+                layers INTEGER NOT NULL,
+                pixel_ratio REAL NOT NULL,
+                wall REAL NOT NULL,
+                bytes INTEGER NOT NULL,
+                recorded_at REAL NOT NULL
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_scene_render_stats_profile "
+            "ON scene_render_stats (compositor, encoder, scene_type, recorded_at)"
+        )
+
+    def record(self, timeline: Timeline, wall: float, bytes_written: int, targets: Optional[list] = None):
+        """
+        씬 렌더링 결과 기록
+
+        Args:
+            timeline (Timeline): 렌더링한 씬 타임라인
+            wall (float): 렌더링에 걸린 시간(초)
+            bytes_written (int): 출력 파일 크기 합계 (마스터 + 출력 대상)
+            targets (list, optional): 함께 인코딩한 OutputTarget 리스트
+        """
+        features = SceneFeatures.from_timeline(timeline)
+        if not features.frames or wall <= 0:
+            return
+        try:
+            with self._db() as conn:
+                conn.execute(
+                    "INSERT INTO scene_render_stats (scene_type, compositor, encoder, duration, frames, layers, "
+                    "pixel_ratio, wall, bytes, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (features.scene_type, get_compositor_profile(timeline), get_encoder_profile(targets),
+                     features.duration, features.frames, features.layers, features.pixel_ratio,
+                     wall, bytes_written, time.time())
+                )
+        except Exception as e:
+            print(f"[ESTIMATE] 렌더링 기록 저장 오류: {e}")
+
+    def get_rates(self, scene_type: str, compositor: str, encoder: str) -> Optional[Tuple[float, float, int, str]]:
+        """
+        최근 기록의 중앙값으로 (작업량당 시간, 초당 바이트, 기록 수, 근거) 계산
+        같은 씬 타입 기록이 없으면 같은 프로필의 모든 씬 타입 기록을 사용
+
+        Args:
+            scene_type (str): 씬 타입
+            compositor (str): 컴포지터 프로필
+            encoder (str): 인코더 프로필
+
+        Returns:
+            tuple: (작업량당 시간, 초당 바이트, 기록 수, "history" 또는 "profile") 또는 None (기록 없음)
+        """
+        queries = [
+            ("history", "WHERE compositor = ? AND encoder = ? AND scene_type = ?", (compositor, encoder, scene_type)),
+            ("profile", "WHERE compositor = ? AND encoder = ?", (compositor, encoder)),
+        ]
+        try:
+            with self._db() as conn:
+                for source, where, params in queries:
+                    rows = conn.execute(
+                        f"SELECT frames, pixel_ratio, duration, wall, bytes FROM scene_render_stats {where} "
+                        "ORDER BY recorded_at DESC LIMIT ?",
+                        (*params, HISTORY_SAMPLES)
+                    ).fetchall()
+                    if rows:
+                        seconds_per_unit = statistics.median(
+                            row["wall"] / (row["frames"] * (1.0 + row["pixel_ratio"])) for row in rows)
+                        bytes_per_second = statistics.median(row["bytes"] / row["duration"] for row in rows)
+                        return seconds_per_unit, bytes_per_second, len(rows), source
+        except Exception as e:
+            print(f"[ESTIMATE] 렌더링 기록 조회 오류: {e}")
+        return None
+
+    def estimate_timeline(self, timeline: Timeline, targets: Optional[list] = None,
+                          rates_cache: Optional[Dict[tuple, Any]] = None) -> SceneEstimate:
+        """
+        씬 타임라인의 렌더링 시간과 출력 크기 추정
+
+        Args:
+            timeline (Timeline): 씬 타임라인
+            targets (list, optional): 함께 인코딩할 OutputTarget 리스트
+            rates_cache (dict, optional): 프로필별 조회 결과 캐시 (여러 씬을 추정할 때 DB 조회를 줄임)
+
+        Returns:
+            SceneEstimate: 추정 결과
+        """
+        features = SceneFeatures.from_timeline(timeline)
+        key = (features.scene_type, get_compositor_profile(timeline), get_encoder_profile(targets))
+        if rates_cache is not None and key in rates_cache:
+            rates = rates_cache[key]
+        else:
+            rates = self.get_rates(*key)
+            if rates_cache is not None:
+                rates_cache[key] = rates
+        if rates:
+            seconds_per_unit, bytes_per_second, samples, source = rates
+        else:
+            seconds_per_unit, bytes_per_second = get_default_rates(targets, timeline.screen_size)
+            samples, source = 0, "default"
+        return SceneEstimate(
+            scene_id=timeline.scene_id,
+            scene_type=features.scene_type,
+            seconds=features.work_units * seconds_per_unit,
+            bytes=int(features.duration * bytes_per_second),
+            duration=features.duration,
+            frames=features.frames,
+            layers=features.layers,
+            source=source,
+            samples=samples
+        )
+
+    def estimate_project(self, project_path, scene_ids: Optional[List[str]] = None,
+                         output_targets: Optional[list] = None, use_cache: bool = True) -> ProjectEstimate:
+        """
+        프로젝트(또는 일부 씬)의 렌더링 시간과 출력 크기 추정 (렌더링하지 않고 타임라인만 만듦)
+
+        Args:
+            project_path (str or Path): 프로젝트 경로
+            scene_ids (List[str], optional): 추정할 씬 ID 목록 (None이면 전체 씬)
+            output_targets (list, optional): 출력 대상 (프리셋 이름/딕셔너리/OutputTarget 리스트)
+            use_cache (bool): False면 변경 없는 씬도 다시 렌더링하는 것으로 계산
+
+        Returns:
+            ProjectEstimate: 추정 결과 (video.json이 없으면 빈 결과)
+        """
+        from service.output_targets import resolve_output_targets
+        from service.render_manifest import RenderManifest
+        from service.scene_manager import SceneManager
+        from service.scene_renderers import get_renderer_class
+
+        project_path = Path(project_path)
+        estimate = ProjectEstimate()
+        video_json_path = project_path / "video.json"
+        if not video_json_path.exists():
+            return estimate
+
+        targets = resolve_output_targets(output_targets)
+        manifest = RenderManifest(project_path)
+        rates_cache: Dict[tuple, Any] = {}
+        for scene in SceneManager(video_json_path).get_video_data().get("scenes", []):
+            if scene_ids is not None and scene.get("id") not in scene_ids:
+                continue
+            SceneClass = get_renderer_class(scene.get("type", "type1"))
+            if not SceneClass:
+                continue
+            entry = manifest.get_clean_entry(scene, output_targets=targets) if use_cache else None
+            if entry:
+                paths = [entry["video_path"]] + [entry["targets"][target.name]["path"] for target in targets]
+                estimate.scenes.append(SceneEstimate(
+                    scene_id=scene.get("id"),
+                    scene_type=scene.get("type", "type1"),
+                    seconds=0.0,
+                    bytes=sum(file_size(project_path / path) for path in paths),
+                    duration=entry.get("duration", 0.0),
+                    frames=int(entry.get("duration", 0.0) * entry.get("fps", 0)),
+                    cached=True,
+                    source="manifest"
+                ))
+                continue
+            try:
+                timeline = SceneClass(scene, project_path=project_path).get_timeline()
+            except Exception as e:
+                print(f"[ESTIMATE] 타임라인 생성 오류 ({scene.get('id')}): {e}")
+                timeline = None
+            if timeline is not None:
+                estimate.scenes.append(self.estimate_timeline(timeline, targets, rates_cache=rates_cache))
+        return estimate
+
+    @staticmethod
+    def estimate_assemble_seconds() -> float:
+        """
+        최종 비디오 합치기(사운드트랙 믹싱 + mux) 예상 시간 - 최근 렌더링들의 합치기 시간 중앙값
+
+        Returns:
+            float: 예상 시간(초) (기록이 없으면 0)
+        """
+        from service.telemetry import telemetry
+
+        by_render: Dict[str, float] = {}
+        muxed = set()
+        for sample in telemetry.get_samples("phase_seconds", limit=HISTORY_SAMPLES * 20):
+            if sample.get("phase") in ASSEMBLE_PHASES and sample.get("render_id"):
+                by_render[sample["render_id"]] = by_render.get(sample["render_id"], 0.0) + sample["value"]
+                if sample["phase"] == "mux":
+                    muxed.add(sample["render_id"])
+        # 최종 비디오까지 합친 렌더링만 사용 (씬만 렌더링한 기록은 제외)
+        recent = [seconds for render_id, seconds in by_render.items() if render_id in muxed][-HISTORY_SAMPLES:]
+        return statistics.median(recent) if recent else 0.0
+
+
+# 전역 렌더링 비용 추정 인스턴스
+render_estimator = RenderEstimator()
@@ -0,0 +1,980 @@
+"""
+렌더 팜
+여러 프로젝트를 한꺼번에 렌더링할 때 코디네이터 하나와 여러 머신의 워커 프로세스로 작업을 나눠 처리합니다.
+
+- 코디네이터: 프로젝트 전체(최종 비디오) 또는 일부 씬을 작업으로 등록하고 HTTP(JSON)로 워커에게 나눠 줍니다.
+  작업 상태는 공유 저장소의 farm.db(SQLite)에 기록하며 DB에는 코디네이터만 접근합니다.
+- 번들: 작업마다 video.json의 씬 정보와 씬이 참조하는 프로젝트 파일(audio/, image/ ...)을 zip으로 묶어
+  공유 저장소에 둡니다. (공용 에셋 assets/와 렌더러 코드는 워커의 저장소 체크아웃을 사용)
+- 스케줄링: 우선순위 → 예상 렌더링 시간이 짧은 작업 먼저(shortest-job-first) → 먼저 들어온 작업 순서
+  예상 렌더링 시간은 렌더링 비용 추정(service.render_estimator)으로 계산합니다.
+- 재시도: 실패했거나 하트비트가 끊긴(임대 만료) 작업은 max_attempts번까지 다시 대기열에 넣습니다.
+- 결과: 워커가 공유 저장소 results/<작업 ID>/에 복사하고 저장소 기준 상대 경로를 코디네이터에 보고합니다.
+
+공유 저장소 구조:
+    <storage>/farm.db
+    <storage>/bundles/<작업 ID>.zip
+    <storage>/results/<작업 ID>/...
+
+한 머신에서 실행 (코디네이터 + 워커 프로세스 N개, 모든 작업이 끝나면 종료):
+    python -m service.render_farm local --workers 3 "projects/a" "projects/b"
+여러 머신에서 실행 (공유 저장소를 모든 머신에 같은 내용으로 마운트):
+    python -m service.render_farm coordinator --storage /mnt/farm --port 8765
+    python -m service.render_farm worker --storage /mnt/farm --coordinator http://host:8765 --workers 2
+    python -m service.render_farm submit --coordinator http://host:8765 "projects/a" [--scene ID] [--target shorts]
+    python -m service.render_farm status --coordinator http://host:8765
+"""
+import argparse
+import json
+import os
+import shutil
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+import zipfile
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from service.render_estimator import render_estimator
+from service.render_job_queue import RenderCancelled, RenderJobStatus
+from service.render_progress import format_duration
+from utils.sqlite_utils import SQLiteStore
+
+DEFAULT_PORT = 8765
+# 하트비트가 이 시간 동안 없으면 워커가 죽은 것으로 보고 작업을 다시 대기열에 넣음
+DEFAULT_LEASE_SECONDS = 120.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+@dataclass
+class FarmJob:
+    """
+    렌더 팜 작업 구조체
+    원본 프로젝트, 대상 씬 ID 목록(None이면 전체 + 최종 비디오), 번들/결과 경로(저장소 기준), 예상 길이,
+    시도 횟수, 담당 워커와 임대 만료 시각, 상태/진행률을 포함
+    """
+    job_id: str
+    project_path: str
+    bundle_path: str
+    scene_ids: Optional[List[str]] = None
+    priority: int = 0
+    output_filename: str = "final_output.mp4"
+    output_targets: List[Any] = field(default_factory=list)
+    estimated_seconds: float = 0.0
+    attempts: int = 0
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    status: str = RenderJobStatus.QUEUED
+    progress: float = 0.0
+    message: str = ""
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+    result_paths: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def is_final_render(self) -> bool:
+        """프로젝트 전체(최종 비디오) 렌더링 작업인지 여부"""
+        return self.scene_ids is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FarmJob':
+        return cls(**data)
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'FarmJob':
+        """DB 행에서 FarmJob 생성"""
+        data = dict(row)
+        for key in ("scene_ids", "output_targets", "result_paths"):
+            data[key] = json.loads(data[key]) if data[key] else None
+        data["output_targets"] = data["output_targets"] or []
+        data["result_paths"] = data["result_paths"] or []
+        data["cancel_requested"] = bool(data["cancel_requested"])
+        return cls(**data)
+
+
+def get_scene_files(scene: Dict[str, Any], project_path: Path) -> List[str]:
+    """
+    씬 필드가 가리키는 프로젝트 안의 파일 (렌더링 매니페스트 지문과 같은 규칙)
+
+    Args:
+        scene (dict): 씬 정보 딕셔너리
+        project_path (Path): 프로젝트 경로
+
+    Returns:
+        list: 프로젝트 기준 상대 경로 리스트
+    """
+    files = []
+    for value in scene.values():
+        if isinstance(value, str) and "/" in value and len(value) < 300 and (project_path / value).is_file():
+            files.append(value)
+    return files
+
+
+def create_bundle(project_path, scenes: List[Dict[str, Any]], bundle_path: Path) -> int:
+    """
+    작업 번들 생성 (video.json + 씬이 참조하는 프로젝트 파일)
+
+    Args:
+        project_path (str or Path): 원본 프로젝트 경로
+        scenes (list): 번들에 넣을 씬 리스트
+        bundle_path (Path): 만들 zip 경로
+
+    Returns:
+        int: 번들에 넣은 파일 수 (video.json 포함)
+    """
+    from service.scene_manager import SceneManager
+
+    project_path = Path(project_path)
+    video_data = dict(SceneManager(project_path / "video.json").get_video_data())
+    video_data["scenes"] = scenes
+    files = sorted({path for scene in scenes for path in get_scene_files(scene, project_path)})
+
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = bundle_path.with_name(f"{bundle_path.name}.{os.getpid()}.tmp")
+    # 오디오/이미지는 이미 압축된 형식이므로 압축하지 않고 담음
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_STORED) as bundle:
+        bundle.writestr("video.json", json.dumps(video_data, ensure_ascii=False, indent=2))
+        for relative_path in files:
+            bundle.write(project_path / relative_path, relative_path)
+    os.replace(tmp_path, bundle_path)
+    return len(files) + 1
+
+
+def extract_bundle(bundle_path: Path, project_path: Path) -> Path:
+    """
+    작업 번들을 프로젝트 폴더로 풀기 (기존 폴더는 지우고 새로 만듦)
+
+    Args:
+        bundle_path (Path): 번들 zip 경로
+        project_path (Path): 풀 프로젝트 폴더
+
+    Returns:
+        Path: 프로젝트 폴더
+    """
+    shutil.rmtree(project_path, ignore_errors=True)
+    project_path.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(bundle_path) as bundle:
+        for name in bundle.namelist():
+            # 프로젝트 폴더 밖으로 나가는 경로는 무시
+            target = (project_path / name).resolve()
+            if project_path.resolve() not in target.parents:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with bundle.open(name) as source, open(target, "wb") as output:
+                shutil.copyfileobj(source, output)
+    for subfolder in ("audio", "image", "output"):
+        (project_path / subfolder).mkdir(exist_ok=True)
+    return project_path
+
+
+class FarmCoordinator(SQLiteStore):
+    """렌더 팜 작업 대기열 (SQLite) - 작업 등록, 워커에게 작업 배정, 임대/재시도 관리"""
+
+    DB_LABEL = "[FARM] 작업 DB"
+    WAL = False   # 공유 저장소(네트워크 폴더)에서는 WAL을 쓰지 않음
+
+    def __init__(self, storage_root, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        FarmCoordinator 초기화
+
+        Args:
+            storage_root (str or Path): 공유 저장소 경로
+            lease_seconds (float): 작업 임대 시간(초) - 이 시간 동안 하트비트가 없으면 다시 배정
+            max_attempts (int): 작업당 최대 시도 횟수
+        """
+        self.storage_root = Path(storage_root)
+        self.db_path = self.storage_root / "farm.db"
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._init_db()
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        """작업 테이블 생성"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS farm_jobs (
+                job_id TEXT PRIMARY KEY,
+                project_path TEXT NOT NULL,
+                bundle_path TEXT NOT NULL,
+                scene_ids TEXT,
+                priority INTEGER NOT NULL DEFAULT 0,
+                output_filename TEXT NOT NULL,
+                output_targets TEXT,
+                estimated_seconds REAL NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                progress REAL NOT NULL DEFAULT 0,
+                message TEXT,
+                worker_id TEXT,
+                lease_expires_at REAL,
+                result_paths TEXT,
+                error TEXT,
+                cancel_requested INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_farm_jobs_schedule "
+            "ON farm_jobs (status, priority, estimated_seconds, created_at)"
+        )
+
+    def submit(
+        self,
+        project_path,
+        scene_ids: Optional[List[str]] = None,
+        priority: int = 0,
+        output_filename: str = "final_output.mp4",
+        output_targets: Optional[list] = None,
+        max_attempts: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        프로젝트(또는 일부 씬) 렌더링 작업 등록 - 번들을 만들어 공유 저장소에 둠
+
+        Args:
+            project_path (str or Path): 원본 프로젝트 경로
+            scene_ids (List[str], optional): 렌더링할 씬 ID 목록 (None이면 전체 씬 + 최종 비디오)
+            priority (int): 우선순위 (클수록 먼저 처리)
+            output_filename (str): 최종 비디오 파일명 (전체 렌더링일 때만 사용)
+            output_targets (list, optional): 함께 만들 출력 대상 (프리셋 이름 또는 OutputTarget.to_dict() 리스트)
+            max_attempts (int, optional): 최대 시도 횟수 (없으면 코디네이터 기본값)
+
+        Returns:
+            str: 작업 ID 또는 None (실패 시)
+        """
+        from service.scene_manager import SceneManager
+
+        project_path = Path(project_path)
+        video_json_path = project_path / "video.json"
+        if not video_json_path.exists():
+            print(f"[FARM] video.json을 찾을 수 없습니다: {video_json_path}")
+            return None
+        scenes = SceneManager(video_json_path).get_video_data().get("scenes", [])
+        if scene_ids is not None:
+            scenes = [scene for scene in scenes if scene.get("id") in scene_ids]
+        if not scenes:
+            print(f"[FARM] 렌더링할 씬이 없습니다: {project_path}")
+            return None
+
+        job_id = uuid.uuid4().hex
+        bundle_path = Path("bundles") / f"{job_id}.zip"
+        try:
+            file_count = create_bundle(project_path, scenes, self.storage_root / bundle_path)
+            # 번들에는 output/과 렌더링 매니페스트가 없어 워커는 항상 모든 씬을 새로 렌더링하므로 캐시 없이 추정
+            estimated = render_estimator.estimate_project(project_path, scene_ids, output_targets,
+                                                          use_cache=False).total_seconds
+            with self._db() as conn:
+                conn.execute(
+                    "INSERT INTO farm_jobs (job_id, project_path, bundle_path, scene_ids, priority, output_filename, "
+                    "output_targets, estimated_seconds, max_attempts, status, message, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        job_id,
+                        str(project_path),
+                        bundle_path.as_posix(),
+                        json.dumps(scene_ids) if scene_ids is not None else None,
+                        priority,
+                        output_filename,
+                        json.dumps(output_targets) if output_targets else None,
+                        estimated,
+                        max_attempts or self.max_attempts,
+                        RenderJobStatus.QUEUED,
+                        f"대기 중... (파일 {file_count}개, 예상 {format_duration(estimated)})",
+                        time.time()
+                    )
+                )
+            return job_id
+        except Exception as e:
+            print(f"[FARM] 작업 등록 오류: {e}")
+            return None
+
+    def _expire_leases(self, conn: sqlite3.Connection):
+        """임대가 만료된 실행 중 작업을 다시 대기열에 넣거나 (시도 횟수 초과 시) 실패 처리 (취소 요청된 작업은 취소 처리)"""
+        now = time.time()
+        conn.execute(
+            "UPDATE farm_jobs SET status = ?, message = ?, finished_at = ?, worker_id = NULL, lease_expires_at = NULL "
+            "WHERE status = ? AND lease_expires_at < ? AND cancel_requested = 1",
+            (RenderJobStatus.CANCELLED, "취소됨", now, RenderJobStatus.RUNNING, now)
+        )
+        conn.execute(
+            "UPDATE farm_jobs SET status = ?, message = ?, error = ?, finished_at = ?, worker_id = NULL "
+            "WHERE status = ? AND lease_expires_at < ? AND attempts >= max_attempts",
+            (RenderJobStatus.FAILED, "렌더링에 실패했습니다. (재시도 횟수 초과)", "워커 응답 없음", now,
+             RenderJobStatus.RUNNING, now)
+        )
+        conn.execute(
+            "UPDATE farm_jobs SET status = ?, message = ?, error = ?, worker_id = NULL, lease_expires_at = NULL "
+            "WHERE status = ? AND lease_expires_at < ?",
+            (RenderJobStatus.QUEUED, "재시도 대기 중... (워커 응답 없음)", "워커 응답 없음",
+             RenderJobStatus.RUNNING, now)
+        )
+
+    def claim(self, worker_id: str) -> Optional[FarmJob]:
+        """
+        대기 중인 작업 하나를 워커에게 배정 (우선순위 → 예상 길이가 짧은 작업 → 등록 순)
+
+        Args:
+            worker_id (str): 워커 ID
+
+        Returns:
+            FarmJob: 배정된 작업 또는 None (대기 중인 작업이 없을 때)
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            self._expire_leases(conn)
+            row = conn.execute(
+                "SELECT * FROM farm_jobs WHERE status = ? "
+                "ORDER BY priority DESC, estimated_seconds ASC, created_at ASC LIMIT 1",
+                (RenderJobStatus.QUEUED,)
+            ).fetchone()
+            if not row:
+                conn.execute("COMMIT")
+                return None
+            now = time.time()
+            conn.execute(
+                "UPDATE farm_jobs SET status = ?, worker_id = ?, attempts = attempts + 1, started_at = ?, "
+                "lease_expires_at = ?, progress = 0, message = ? WHERE job_id = ?",
+                (RenderJobStatus.RUNNING, worker_id, now, now + self.lease_seconds,
+                 f"{worker_id}에서 렌더링 시작...", row["job_id"])
+            )
+            updated = conn.execute("SELECT * FROM farm_jobs WHERE job_id = ?", (row["job_id"],)).fetchone()
+            conn.execute("COMMIT")
+            return FarmJob.from_row(updated)
+        except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
+            print(f"[FARM] 작업 배정 오류: {e}")
+            return None
+        finally:
+            conn.close()
+
+    def heartbeat(self, job_id: str, worker_id: str, progress: Optional[float] = None,
+                  message: Optional[str] = None) -> Dict[str, bool]:
+        """
+        작업 임대 연장과 진행률 갱신
+
+        Args:
+            job_id (str): 작업 ID
+            worker_id (str): 워커 ID
+            progress (float, optional): 진행률 (0.0 ~ 1.0)
+            message (str, optional): 상태 메시지
+
+        Returns:
+            dict: {"ok": 아직 이 워커의 작업인지, "cancel": 취소가 요청되었는지}
+        """
+        try:
+            with self._db() as conn:
+                cursor = conn.execute(
+                    "UPDATE farm_jobs SET lease_expires_at = ?, progress = COALESCE(?, progress), "
+                    "message = COALESCE(?, message) WHERE job_id = ? AND worker_id = ? AND status = ?",
+                    (time.time() + self.lease_seconds, progress, message, job_id, worker_id, RenderJobStatus.RUNNING)
+                )
+                row = conn.execute("SELECT cancel_requested FROM farm_jobs WHERE job_id = ?", (job_id,)).fetchone()
+            return {"ok": cursor.rowcount > 0, "cancel": bool(row and row["cancel_requested"])}
+        except Exception as e:
+            print(f"[FARM] 하트비트 기록 오류: {e}")
+            return {"ok": True, "cancel": False}
+
+    def complete(self, job_id: str, worker_id: str, result_paths: List[str], message: str = "완료!",
+                 error: Optional[str] = None) -> bool:
+        """
+        작업 완료 기록
+
+        Args:
+            job_id (str): 작업 ID
+            worker_id (str): 워커 ID
+            result_paths (list): 공유 저장소 기준 결과 파일 경로
+            message (str): 상태 메시지
+            error (str, optional): 경고/부분 실패 내용
+
+        Returns:
+            bool: 기록 성공 여부 (다른 워커에게 다시 배정된 작업이면 False)
+        """
+        try:
+            with self._db() as conn:
+                cursor = conn.execute(
+                    "UPDATE farm_jobs SET status = ?, progress = 1.0, message = ?, result_paths = ?, error = ?, "
+                    "finished_at = ?, lease_expires_at = NULL WHERE job_id = ? AND worker_id = ? AND status = ?",
+                    (RenderJobStatus.DONE, message, json.dumps(result_paths), error, time.time(),
+                     job_id, worker_id, RenderJobStatus.RUNNING)
+                )
+            return cursor.rowcount > 0
+        except Exception as e:
+            print(f"[FARM] 작업 완료 기록 오류: {e}")
+            return False
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry: bool = True) -> Optional[str]:
+        """
+        작업 실패 기록 (시도 횟수가 남아 있으면 다시 대기열에 넣음)
+
+        Args:
+            job_id (str): 작업 ID
+            worker_id (str): 워커 ID
+            error (str): 오류 내용
+            retry (bool): 재시도 여부 (취소된 작업은 False)
+
+        Returns:
+            str: 기록 후 작업 상태 또는 None (실패 시)
+        """
+        try:
+            with self._db() as conn:
+                row = conn.execute(
+                    "SELECT attempts, max_attempts, cancel_requested FROM farm_jobs "
+                    "WHERE job_id = ? AND worker_id = ? AND status = ?",
+                    (job_id, worker_id, RenderJobStatus.RUNNING)
+                ).fetchone()
+                if not row:
+                    return None
+                if row["cancel_requested"]:
+                    status, message = RenderJobStatus.CANCELLED, "취소됨"
+                elif retry and row["attempts"] < row["max_attempts"]:
+                    status, message = RenderJobStatus.QUEUED, f"재시도 대기 중... ({row['attempts']}/{row['max_attempts']})"
+                else:
+                    status, message = RenderJobStatus.FAILED, "렌더링에 실패했습니다."
+                conn.execute(
+                    "UPDATE farm_jobs SET status = ?, message = ?, error = ?, worker_id = NULL, lease_expires_at = NULL, "
+                    "finished_at = CASE WHEN ? = ? THEN NULL ELSE ? END WHERE job_id = ?",
+                    (status, message, error, status, RenderJobStatus.QUEUED, time.time(), job_id)
+                )
+            return status
+        except Exception as e:
+            print(f"[FARM] 작업 실패 기록 오류: {e}")
+            return None
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        작업 취소 (대기 중이면 즉시 취소, 실행 중이면 다음 하트비트에서 워커가 중단)
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            bool: 취소(요청) 성공 여부
+        """
+        try:
+            with self._db() as conn:
+                cursor = conn.execute(
+                    "UPDATE farm_jobs SET status = ?, message = ?, finished_at = ? WHERE job_id = ? AND status = ?",
+                    (RenderJobStatus.CANCELLED, "취소됨", time.time(), job_id, RenderJobStatus.QUEUED)
+                )
+                if cursor.rowcount:
+                    return True
+                cursor = conn.execute(
+                    "UPDATE farm_jobs SET cancel_requested = 1, message = ? WHERE job_id = ? AND status = ?",
+                    ("취소 요청됨...", job_id, RenderJobStatus.RUNNING)
+                )
+                return cursor.rowcount > 0
+        except Exception as e:
+            print(f"[FARM] 작업 취소 오류: {e}")
+            return False
+
+    def list_jobs(self, statuses: Optional[tuple] = None, limit: int = 100) -> List[FarmJob]:
+        """
+        작업 목록 조회 (최신순)
+
+        Args:
+            statuses (tuple, optional): 조회할 상태 목록
+            limit (int): 최대 개수
+
+        Returns:
+            List[FarmJob]: 작업 리스트
+        """
+        query = "SELECT * FROM farm_jobs"
+        params: List[Any] = []
+        if statuses:
+            query += f" WHERE status IN ({', '.join('?' for _ in statuses)})"
+            params.extend(statuses)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        try:
+            with self._db() as conn:
+                self._expire_leases(conn)
+                rows = conn.execute(query, params).fetchall()
+            return [FarmJob.from_row(row) for row in rows]
+        except Exception as e:
+            print(f"[FARM] 작업 목록 조회 오류: {e}")
+            return []
+
+
+class FarmServer:
+    """코디네이터를 HTTP(JSON)로 노출하는 서버 (워커/제출 클라이언트가 사용)"""
+
+    def __init__(self, coordinator: FarmCoordinator, host: str = "0.0.0.0", port: int = DEFAULT_PORT):
+        """
+        FarmServer 초기화
+
+        Args:
+            coordinator (FarmCoordinator): 작업 대기열
+            host (str): 바인드 주소
+            port (int): 포트 (0이면 빈 포트 자동 선택)
+        """
+        self.coordinator = coordinator
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """서버 주소 (0.0.0.0에 바인드했으면 로컬 주소로 표시)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{'127.0.0.1' if host == '0.0.0.0' else host}:{port}"
+
+    def _make_handler(self):
+        coordinator = self.coordinator
+
+        routes = {
+            "/submit": lambda body: {"job_id": coordinator.submit(
+                body["project_path"], scene_ids=body.get("scene_ids"), priority=body.get("priority", 0),
+                output_filename=body.get("output_filename", "final_output.mp4"),
+                output_targets=body.get("output_targets"), max_attempts=body.get("max_attempts"))},
+            "/claim": lambda body: {"job": (lambda job: job.to_dict() if job else None)(
+                coordinator.claim(body["worker_id"]))},
+            "/heartbeat": lambda body: coordinator.heartbeat(
+                body["job_id"], body["worker_id"], body.get("progress"), body.get("message")),
+            "/complete": lambda body: {"ok": coordinator.complete(
+                body["job_id"], body["worker_id"], body.get("result_paths", []),
+                body.get("message", "완료!"), body.get("error"))},
+            "/fail": lambda body: {"status": coordinator.fail(
+                body["job_id"], body["worker_id"], body.get("error", ""), body.get("retry", True))},
+            "/cancel": lambda body: {"ok": coordinator.cancel(body["job_id"])},
+            "/jobs": lambda body: {"jobs": [job.to_dict() for job in coordinator.list_jobs(
+                tuple(body["statuses"]) if body.get("statuses") else None, body.get("limit", 100))]},
+        }
+
+        class _Handler(BaseHTTPRequestHandler):
+            def _reply(self, status: int, payload: dict):
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                route = routes.get(self.path)
+                if route is None:
+                    self._reply(404, {"error": f"알 수 없는 경로: {self.path}"})
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                    self._reply(200, route(body))
+                except Exception as e:
+                    self._reply(400, {"error": str(e)})
+
+            def do_GET(self):
+                if self.path == "/jobs":
+                    self._reply(200, routes["/jobs"]({}))
+                else:
+                    self._reply(404, {"error": f"알 수 없는 경로: {self.path}"})
+
+            def log_message(self, format, *args):
+                # 워커 폴링마다 접근 로그가 쌓이지 않도록 출력하지 않음
+                pass
+
+        return _Handler
+
+    def start(self) -> 'FarmServer':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="render-farm-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (Ctrl+C로 종료)"""
+        self.httpd.serve_forever()
+
+    def shutdown(self):
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FarmClient:
+    """코디네이터 HTTP API 클라이언트"""
+
+    def __init__(self, url: str, timeout: float = 30.0):
+        """
+        FarmClient 초기화
+
+        Args:
+            url (str): 코디네이터 주소 (예: http://host:8765)
+            timeout (float): 요청 타임아웃(초)
+        """
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _post(self, path: str, payload: Optional[dict] = None) -> dict:
+        import requests
+        response = requests.post(f"{self.url}{path}", json=payload or {}, timeout=self.timeout)
+        data = response.json()
+        if response.status_code != 200:
+            raise RuntimeError(data.get("error") or f"HTTP {response.status_code}")
+        return data
+
+    def submit(self, project_path, **options) -> Optional[str]:
+        """작업 등록 (옵션은 FarmCoordinator.submit과 같음) - 프로젝트 경로는 코디네이터 기준"""
+        return self._post("/submit", {"project_path": str(project_path), **options}).get("job_id")
+
+    def claim(self, worker_id: str) -> Optional[FarmJob]:
+        """작업 하나 배정받기"""
+        data = self._post("/claim", {"worker_id": worker_id}).get("job")
+        return FarmJob.from_dict(data) if data else None
+
+    def heartbeat(self, job_id: str, worker_id: str, progress: Optional[float] = None,
+                  message: Optional[str] = None) -> Dict[str, bool]:
+        """임대 연장/진행률 보고"""
+        return self._post("/heartbeat", {"job_id": job_id, "worker_id": worker_id,
+                                         "progress": progress, "message": message})
+
+    def complete(self, job_id: str, worker_id: str, result_paths: List[str], message: str = "완료!",
+                 error: Optional[str] = None) -> bool:
+        """작업 완료 보고"""
+        return bool(self._post("/complete", {"job_id": job_id, "worker_id": worker_id, "result_paths": result_paths,
+                                             "message": message, "error": error}).get("ok"))
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry: bool = True) -> Optional[str]:
+        """작업 실패 보고"""
+        return self._post("/fail", {"job_id": job_id, "worker_id": worker_id, "error": error, "retry": retry}).get("status")
+
+    def cancel(self, job_id: str) -> bool:
+        """작업 취소"""
+        return bool(self._post("/cancel", {"job_id": job_id}).get("ok"))
+
+    def list_jobs(self, statuses: Optional[tuple] = None, limit: int = 100) -> List[FarmJob]:
+        """작업 목록 조회"""
+        data = self._post("/jobs", {"statuses": list(statuses) if statuses else None, "limit": limit})
+        return [FarmJob.from_dict(item) for item in data.get("jobs", [])]
+
+
+class FarmWorker:
+    """코디네이터에서 작업을 받아 번들을 풀고 렌더링한 뒤 결과를 공유 저장소에 올리는 워커"""
+
+    def __init__(self, client: FarmClient, storage_root, worker_id: Optional[str] = None, work_dir=None,
+                 poll_interval: float = 2.0, heartbeat_interval: float = DEFAULT_LEASE_SECONDS / 4):
+        """
+        FarmWorker 초기화
+
+        Args:
+            client (FarmClient): 코디네이터 클라이언트
+            storage_root (str or Path): 공유 저장소 경로 (이 머신의 마운트 위치)
+            worker_id (str, optional): 워커 ID (없으면 "호스트명-pid")
+            work_dir (str or Path, optional): 번들을 풀고 렌더링할 로컬 폴더 (없으면 farm_work/<워커 ID>)
+            poll_interval (float): 대기 중인 작업이 없을 때 다시 확인하는 간격(초)
+            heartbeat_interval (float): 하트비트 간격(초) - 코디네이터 임대 시간보다 충분히 짧아야 함
+        """
+        self.client = client
+        self.storage_root = Path(storage_root)
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.work_dir = Path(work_dir) if work_dir else Path("farm_work") / self.worker_id
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+
+    def run(self, stop_event: Optional[threading.Event] = None, max_jobs: Optional[int] = None) -> int:
+        """
+        작업을 계속 받아 처리 (stop_event가 설정되거나 max_jobs개를 처리하면 종료)
+
+        Args:
+            stop_event (threading.Event, optional): 종료 신호
+            max_jobs (int, optional): 처리할 최대 작업 수
+
+        Returns:
+            int: 처리한 작업 수
+        """
+        stop_event = stop_event or threading.Event()
+        processed = 0
+        print(f"[FARM] 워커 시작: {self.worker_id}")
+        while not stop_event.is_set() and (max_jobs is None or processed < max_jobs):
+            try:
+                job = self.client.claim(self.worker_id)
+            except Exception as e:
+                print(f"[FARM] 코디네이터 연결 오류: {e}")
+                job = None
+            if job is None:
+                stop_event.wait(self.poll_interval)
+                continue
+            self.run_job(job)
+            processed += 1
+        return processed
+
+    def run_job(self, job: FarmJob) -> bool:
+        """
+        작업 하나 처리 (하트비트 스레드가 임대를 연장하고 진행률/취소 요청을 주고받음)
+
+        Args:
+            job (FarmJob): 배정된 작업
+
+        Returns:
+            bool: 성공 여부
+        """
+        state = {"progress": 0.0, "message": None, "cancel": False}
+        done = threading.Event()
+
+        def heartbeat_loop():
+            while not done.wait(self.heartbeat_interval):
+                try:
+                    reply = self.client.heartbeat(job.job_id, self.worker_id, state["progress"], state["message"])
+                    state["cancel"] = reply.get("cancel") or not reply.get("ok", True)
+                except Exception as e:
+                    print(f"[FARM] 하트비트 오류: {e}")
+
+        def on_progress(progress: float):
+            state["progress"] = progress
+            if state["cancel"]:
+                raise RenderCancelled(job.job_id)
+
+        def on_status(message: str):
+            state["message"] = message
+
+        heartbeat = threading.Thread(target=heartbeat_loop, name=f"farm-heartbeat-{job.job_id[:8]}", daemon=True)
+        heartbeat.start()
+        started = time.perf_counter()
+        try:
+            result_paths, warnings = self._render(job, on_progress, on_status)
+            done.set()
+            if not result_paths:
+                self.client.fail(job.job_id, self.worker_id, "\n".join(warnings) or "결과 파일이 없습니다.")
+                return False
+            self.client.complete(job.job_id, self.worker_id, result_paths,
+                                 message=f"완료! ({time.perf_counter() - started:.1f}초, {self.worker_id})",
+                                 error="\n".join(warnings) or None)
+            return True
+        except RenderCancelled:
+            done.set()
+            try:
+                self.client.fail(job.job_id, self.worker_id, "취소됨", retry=False)
+            except Exception as report_error:
+                print(f"[FARM] 취소 보고 오류 (임대 만료 시 취소 처리됨): {report_error}")
+            return False
+        except Exception as e:
+            done.set()
+            print(f"[FARM] 작업 실행 오류: {e}")
+            try:
+                self.client.fail(job.job_id, self.worker_id, str(e))
+            except Exception as report_error:
+                print(f"[FARM] 실패 보고 오류 (임대 만료 후 다시 배정됨): {report_error}")
+            return False
+        finally:
+            done.set()
+            shutil.rmtree(self.work_dir / job.job_id, ignore_errors=True)
+
+    def _render(self, job: FarmJob, on_progress, on_status) -> tuple:
+        """번들을 풀어 렌더링하고 결과를 공유 저장소에 복사 - (결과 경로 리스트, 경고 리스트) 반환"""
+        from service.scene_manager import SceneManager
+        from service.video_generator import video_generator
+
+        project_path = extract_bundle(self.storage_root / job.bundle_path, self.work_dir / job.job_id / "project")
+        scenes = SceneManager(project_path / "video.json").get_video_data().get("scenes", [])
+        warnings = []
+
+        if job.is_final_render:
+            outputs = video_generator.generate_final_outputs(
+                scenes=scenes,
+                output_filename=job.output_filename,
+                progress_callback=on_progress,
+                status_callback=on_status,
+                warning_callback=warnings.append,
+                error_callback=warnings.append,
+                project_path=project_path,
+                output_targets=job.output_targets
+            ) or {}
+            files = list(outputs.values())
+        else:
+            files = video_generator.generate_all_scene_videos(
+                scenes=scenes,
+                progress_callback=on_progress,
+                status_callback=on_status,
+                warning_callback=warnings.append,
+                project_path=project_path
+            )
+        return [self.publish(job, Path(path)) for path in files], warnings
+
+    def publish(self, job: FarmJob, path: Path) -> str:
+        """
+        결과 파일을 공유 저장소 results/<작업 ID>/에 복사 (임시 이름으로 쓴 뒤 바꿔 반쯤 쓴 파일이 보이지 않게 함)
+
+        Args:
+            job (FarmJob): 작업
+            path (Path): 로컬 결과 파일
+
+        Returns:
+            str: 공유 저장소 기준 상대 경로
+        """
+        relative_path = Path("results") / job.job_id / path.name
+        target = self.storage_root / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f"{target.name}.{self.worker_id}.tmp")
+        shutil.copyfile(path, tmp_path)
+        os.replace(tmp_path, target)
+        return relative_path.as_posix()
+
+
+def run_worker_process(coordinator_url: str, storage_root: str, worker_id: Optional[str] = None):
+    """워커 프로세스 진입점 (multiprocessing/CLI에서 사용)"""
+    worker = FarmWorker(FarmClient(coordinator_url), storage_root, worker_id=worker_id)
+    try:
+        worker.run()
+    except KeyboardInterrupt:
+        pass
+
+
+def _start_worker_processes(coordinator_url: str, storage_root, count: int) -> list:
+    """워커 프로세스 count개 시작 (렌더링 모듈이 fork 상태를 공유하지 않도록 spawn 사용)"""
+    from multiprocessing import get_context
+
+    context = get_context("spawn")
+    hostname = socket.gethostname()
+    processes = []
+    for idx in range(count):
+        process = context.Process(target=run_worker_process, args=(coordinator_url, str(storage_root),
+                                                                   f"{hostname}-w{idx + 1}"),
+                                  name=f"render-farm-worker-{idx + 1}", daemon=True)
+        process.start()
+        processes.append(process)
+    return processes
+
+
+def _print_jobs(jobs: List[FarmJob]):
+    """작업 목록 출력"""
+    for job in jobs:
+        scope = "전체" if job.is_final_render else f"씬 {len(job.scene_ids)}개"
+        print(f"{job.job_id[:8]}  {job.status:<9}  {job.progress * 100:5.1f}%  예상 {format_duration(job.estimated_seconds):>7}  "
+              f"시도 {job.attempts}/{job.max_attempts}  {scope}  {Path(job.project_path).name}  {job.message}")
+        for path in job.result_paths:
+            print(f"          → {path}")
+        if job.status == RenderJobStatus.FAILED and job.error:
+            print(f"          ⚠️ {job.error}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """CLI 인자 파서 생성"""
+    parser = argparse.ArgumentParser(description="여러 프로젝트를 코디네이터와 워커 프로세스로 나눠 렌더링합니다.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_submit_options(command):
+        command.add_argument("--scene", action="append", dest="scene_ids", metavar="SCENE_ID",
+                             help="렌더링할 씬 ID (지정하면 최종 비디오는 만들지 않음)")
+        command.add_argument("--output", default="final_output.mp4", help="최종 비디오 파일명")
+        command.add_argument("--target", action="append", dest="output_targets", metavar="TARGET",
+                             help="함께 만들 출력 대상 프리셋 (여러 번 지정 가능)")
+        command.add_argument("--priority", type=int, default=0, help="우선순위 (클수록 먼저)")
+
+    coordinator = commands.add_parser("coordinator", help="코디네이터 실행")
+    coordinator.add_argument("--storage", required=True, help="공유 저장소 경로")
+    coordinator.add_argument("--host", default="0.0.0.0")
+    coordinator.add_argument("--port", type=int, default=DEFAULT_PORT)
+    coordinator.add_argument("--lease", type=float, default=DEFAULT_LEASE_SECONDS, help="작업 임대 시간(초)")
+    coordinator.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS, help="작업당 최대 시도 횟수")
+
+    worker = commands.add_parser("worker", help="워커 프로세스 실행")
+    worker.add_argument("--storage", required=True, help="공유 저장소 경로 (이 머신의 마운트 위치)")
+    worker.add_argument("--coordinator", required=True, help="코디네이터 주소 (예: http://host:8765)")
+    worker.add_argument("--workers", type=int, default=1, help="이 머신에서 실행할 워커 프로세스 수")
+
+    submit = commands.add_parser("submit", help="작업 등록 (프로젝트 경로는 코디네이터 머신 기준)")
+    submit.add_argument("projects", nargs="+", help="프로젝트 폴더 경로")
+    submit.add_argument("--coordinator", required=True, help="코디네이터 주소")
+    add_submit_options(submit)
+
+    status = commands.add_parser("status", help="작업 목록 출력")
+    status.add_argument("--coordinator", required=True, help="코디네이터 주소")
+
+    local = commands.add_parser("local", help="한 머신에서 코디네이터 + 워커 N개로 렌더링 (모든 작업이 끝나면 종료)")
+    local.add_argument("projects", nargs="+", help="프로젝트 폴더 경로")
+    local.add_argument("--storage", default="farm_storage", help="저장소 경로 (기본값: farm_storage)")
+    local.add_argument("--workers", type=int, default=2, help="워커 프로세스 수")
+    add_submit_options(local)
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    CLI 진입점
+
+    Returns:
+        int: 종료 코드 (0: 성공, 1: 실패)
+    """
+    args = build_parser().parse_args(argv)
+
+    if args.command == "coordinator":
+        server = FarmServer(FarmCoordinator(args.storage, args.lease, args.max_attempts), args.host, args.port)
+        print(f"[FARM] 코디네이터 실행 중: {server.url} (저장소: {args.storage})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.shutdown()
+        return 0
+
+    if args.command == "worker":
+        if args.workers <= 1:
+            run_worker_process(args.coordinator, args.storage)
+            return 0
+        processes = _start_worker_processes(args.coordinator, args.storage, args.workers)
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.terminate()
+        return 0
+
+    if args.command == "status":
+        _print_jobs(FarmClient(args.coordinator).list_jobs())
+        return 0
+
+    options = {"scene_ids": args.scene_ids, "output_filename": args.output,
+               "output_targets": args.output_targets, "priority": args.priority}
+
+    if args.command == "submit":
+        client = FarmClient(args.coordinator)
+        job_ids = [client.submit(str(Path(project).resolve()), **options) for project in args.projects]
+        for project, job_id in zip(args.projects, job_ids):
+            print(f"{'✅' if job_id else '❌'} {project} → {job_id or '등록 실패'}")
+        return 0 if all(job_ids) else 1
+
+    # local: 코디네이터는 이 프로세스의 스레드, 워커는 별도 프로세스
+    coordinator = FarmCoordinator(args.storage)
+    job_ids = [coordinator.submit(project, **options) for project in args.projects]
+    job_ids = [job_id for job_id in job_ids if job_id]
+    if not job_ids:
+        print("❌ 등록된 작업이 없습니다.")
+        return 1
+    server = FarmServer(coordinator, host="127.0.0.1", port=0).start()
+    processes = _start_worker_processes(server.url, args.storage, args.workers)
+    started = time.perf_counter()
+    try:
+        while True:
+            jobs = [job for job in coordinator.list_jobs() if job.job_id in job_ids]
+            if all(job.status in RenderJobStatus.FINISHED for job in jobs):
+                break
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        print("중단합니다.")
+    finally:
+        for process in processes:
+            process.terminate()
+        server.shutdown()
+
+    jobs = [job for job in coordinator.list_jobs() if job.job_id in job_ids]
+    _print_jobs(jobs)
+    print(f"⏱️ {time.perf_counter() - started:.1f}초 (워커 {args.workers}개)")
+    return 0 if all(job.status == RenderJobStatus.DONE for job in jobs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,515 @@
+"""
+렌더링 작업 큐
+Streamlit 스크립트 스레드와 분리된 백그라운드 워커가 렌더링 작업을 처리합니다.
+
+- 작업 상태/진행률은 SQLite 파일에 저장되므로 재실행(rerun)이나 탭 종료와 무관하게 유지됩니다.
+- 작업은 프로젝트 전체(최종 비디오) 또는 일부 씬만 대상으로 할 수 있습니다.
+- 우선순위가 높은 작업부터, 같은 우선순위는 예상 렌더링 시간이 짧은 작업부터(같으면 먼저 들어온 작업부터) 처리합니다.
+- 취소 요청은 씬 사이(진행률 콜백 시점)에서 반영됩니다.
+- 실행 중인 작업은 가져간 프로세스(worker_id)가 임대(LEASE_SECONDS)를 하트비트로 연장합니다.
+  여러 앱 인스턴스가 같은 DB를 써도 임대가 만료된 작업(프로세스 종료 등)만 다시 대기 상태로 되돌립니다.
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, List, Optional
+
+from service.render_estimator import render_estimator
+from service.render_progress import format_duration
+from utils.sqlite_utils import SQLiteStore
+
+
+class RenderJobStatus:
+    """렌더링 작업 상태 상수"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    ACTIVE = (QUEUED, RUNNING)
+    FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class RenderCancelled(Exception):
+    """렌더링 작업이 취소되었을 때 발생하는 예외"""
+    pass
+
+
+@dataclass
+class RenderJob:
+    """
+    렌더링 작업 구조체
+    프로젝트 경로, 대상 씬 ID 목록(None이면 전체 + 최종 비디오), 우선순위, 출력 대상, 예상 렌더링 시간,
+    상태/진행률, 결과를 포함
+    """
+    job_id: str
+    project_path: str
+    scene_ids: Optional[List[str]] = None
+    priority: int = 0
+    output_filename: str = "final_output.mp4"
+    output_targets: List[Any] = field(default_factory=list)
+    estimated_seconds: float = 0.0
+    status: str = RenderJobStatus.QUEUED
+    progress: float = 0.0
+    message: str = ""
+    output_paths: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def is_active(self) -> bool:
+        """대기 중이거나 실행 중인지 여부"""
+        return self.status in RenderJobStatus.ACTIVE
+
+    @property
+    def is_final_render(self) -> bool:
+        """프로젝트 전체(최종 비디오) 렌더링 작업인지 여부"""
+        return self.scene_ids is None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'RenderJob':
+        """DB 행에서 RenderJob 생성"""
+        return cls(
+            job_id=row["job_id"],
+            project_path=row["project_path"],
+            scene_ids=json.loads(row["scene_ids"]) if row["scene_ids"] else None,
+            priority=row["priority"],
+            output_filename=row["output_filename"],
+            output_targets=json.loads(row["output_targets"]) if row["output_targets"] else [],
+            estimated_seconds=row["estimated_seconds"] or 0.0,
+            status=row["status"],
+            progress=row["progress"],
+            message=row["message"] or "",
+            output_paths=json.loads(row["output_paths"]) if row["output_paths"] else [],
+            error=row["error"],
+            cancel_requested=bool(row["cancel_requested"]),
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"]
+        )
+
+
+class RenderJobQueue(SQLiteStore):
+    """SQLite 기반 영속 렌더링 작업 큐 + 백그라운드 워커 관리 클래스"""
+
+    DB_LABEL = "렌더링 작업 DB"
+    LEASE_SECONDS = 60.0                        # 실행 중 작업 임대 시간(초) - 이 시간 동안 하트비트가 없으면 다시 대기
+    HEARTBEAT_INTERVAL = LEASE_SECONDS / 4      # 임대 연장 간격(초)
+
+    def __init__(self, db_path: str = "render_jobs.db"):
+        """
+        RenderJobQueue 초기화
+
+        Args:
+            db_path (str): 작업 DB 파일 경로
+        """
+        self.db_path = Path(db_path)
+        # 이 프로세스의 워커 ID (같은 DB를 쓰는 다른 앱 인스턴스와 구분)
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._workers: List[threading.Thread] = []
+        self._workers_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._init_db()
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        """작업 테이블 생성"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS render_jobs (
+                job_id TEXT PRIMARY KEY,
+                project_path TEXT NOT NULL,
+                scene_ids TEXT,
+                priority INTEGER NOT NULL DEFAULT 0,
+                output_filename TEXT NOT NULL,
+                output_targets TEXT,
+                estimated_seconds REAL NOT NULL DEFAULT 0,
+                status TEXT NOT NULL,
+                progress REAL NOT NULL DEFAULT 0,
+                message TEXT,
+                output_paths TEXT,
+                error TEXT,
+                cancel_requested INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL,
+                worker_id TEXT,
+                lease_expires_at REAL
+            )
+        """)
+        # 이전 버전 DB에 없는 컬럼 추가
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(render_jobs)")}
+        if "output_targets" not in columns:
+            conn.execute("ALTER TABLE render_jobs ADD COLUMN output_targets TEXT")
+        if "estimated_seconds" not in columns:
+            conn.execute("ALTER TABLE render_jobs ADD COLUMN estimated_seconds REAL NOT NULL DEFAULT 0")
+        if "worker_id" not in columns:
+            conn.execute("ALTER TABLE render_jobs ADD COLUMN worker_id TEXT")
+        if "lease_expires_at" not in columns:
+            conn.execute("ALTER TABLE render_jobs ADD COLUMN lease_expires_at REAL")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_render_jobs_status "
+            "ON render_jobs (status, priority, created_at)"
+        )
+
+    def submit(
+        self,
+        project_path,
+        scene_ids: Optional[List[str]] = None,
+        priority: int = 0,
+        output_filename: str = "final_output.mp4",
+        output_targets: Optional[list] = None
+    ) -> Optional[str]:
+        """
+        렌더링 작업 등록
+
+        Args:
+            project_path (str or Path): 프로젝트 경로
+            scene_ids (List[str], optional): 렌더링할 씬 ID 목록 (None이면 전체 씬 + 최종 비디오)
+            priority (int): 우선순위 (클수록 먼저 처리)
+            output_filename (str): 최종 비디오 파일명 (전체 렌더링일 때만 사용)
+            output_targets (list, optional): 함께 만들 출력 대상 (프리셋 이름 또는 OutputTarget.to_dict() 리스트)
+
+        Returns:
+            str: 작업 ID 또는 None (실패 시)
+        """
+        job_id = uuid.uuid4().hex
+        try:
+            with self._db() as conn:
+                conn.execute(
+                    "INSERT INTO render_jobs (job_id, project_path, scene_ids, priority, output_filename, "
+                    "output_targets, estimated_seconds, status, progress, message, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?)",
+                    (
+                        job_id,
+                        str(project_path),
+                        json.dumps(scene_ids) if scene_ids is not None else None,
+                        priority,
+                        output_filename,
+                        json.dumps(output_targets) if output_targets else None,
+                        0.0,
+                        RenderJobStatus.QUEUED,
+                        "대기 중...",
+                        time.time()
+                    )
+                )
+            self._wakeup.set()
+        except Exception as e:
+            print(f"렌더링 작업 등록 오류: {e}")
+            return None
+
+        # 예상 시간 계산(타임라인 생성, 첫 오디오 디코딩 포함)은 호출한 스레드(UI)를 막지 않도록 별도 스레드에서 수행
+        threading.Thread(target=self._estimate_job, args=(job_id, project_path, scene_ids, output_targets),
+                         name=f"render-estimate-{job_id[:8]}", daemon=True).start()
+        return job_id
+
+    def _estimate_job(self, job_id: str, project_path, scene_ids: Optional[List[str]], output_targets: Optional[list]):
+        """
+        대기 중인 작업의 예상 렌더링 시간 기록 (같은 우선순위에서는 예상 시간이 짧은 작업부터 처리)
+        실패하면 예상 시간 0으로 둡니다.
+        """
+        try:
+            estimated = render_estimator.estimate_project(project_path, scene_ids, output_targets).total_seconds
+            with self._db() as conn:
+                conn.execute(
+                    "UPDATE render_jobs SET estimated_seconds = ?, message = ? WHERE job_id = ? AND status = ?",
+                    (estimated, f"대기 중... (예상 {format_duration(estimated)})", job_id, RenderJobStatus.QUEUED)
+                )
+        except Exception as e:
+            print(f"렌더링 예상 시간 계산 오류: {e}")
+
+    def get_job(self, job_id: str) -> Optional[RenderJob]:
+        """
+        작업 조회
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            RenderJob: 작업 정보 또는 None
+        """
+        try:
+            with self._db() as conn:
+                row = conn.execute("SELECT * FROM render_jobs WHERE job_id = ?", (job_id,)).fetchone()
+            return RenderJob.from_row(row) if row else None
+        except Exception as e:
+            print(f"렌더링 작업 조회 오류: {e}")
+            return None
+
+    def list_jobs(self, project_path=None, statuses: Optional[tuple] = None, limit: int = 20) -> List[RenderJob]:
+        """
+        작업 목록 조회 (최신순)
+
+        Args:
+            project_path (str or Path, optional): 특정 프로젝트의 작업만 조회
+            statuses (tuple, optional): 조회할 상태 목록
+            limit (int): 최대 개수
+
+        Returns:
+            List[RenderJob]: 작업 리스트
+        """
+        query = "SELECT * FROM render_jobs WHERE 1=1"
+        params = []
+        if project_path is not None:
+            query += " AND project_path = ?"
+            params.append(str(project_path))
+        if statuses:
+            query += f" AND status IN ({', '.join('?' for _ in statuses)})"
+            params.extend(statuses)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+
+        try:
+            with self._db() as conn:
+                rows = conn.execute(query, params).fetchall()
+            return [RenderJob.from_row(row) for row in rows]
+        except Exception as e:
+            print(f"렌더링 작업 목록 조회 오류: {e}")
+            return []
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        작업 취소 (대기 중이면 즉시 취소, 실행 중이면 취소 요청 표시)
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            bool: 취소(요청) 성공 여부
+        """
+        try:
+            with self._db() as conn:
+                cursor = conn.execute(
+                    "UPDATE render_jobs SET status = ?, message = ?, finished_at = ? "
+                    "WHERE job_id = ? AND status = ?",
+                    (RenderJobStatus.CANCELLED, "취소됨", time.time(), job_id, RenderJobStatus.QUEUED)
+                )
+                if cursor.rowcount:
+                    return True
+                cursor = conn.execute(
+                    "UPDATE render_jobs SET cancel_requested = 1, message = ? WHERE job_id = ? AND status = ?",
+                    ("취소 요청됨...", job_id, RenderJobStatus.RUNNING)
+                )
+                return cursor.rowcount > 0
+        except Exception as e:
+            print(f"렌더링 작업 취소 오류: {e}")
+            return False
+
+    def update_progress(self, job_id: str, progress: Optional[float] = None, message: Optional[str] = None):
+        """
+        작업 진행률/메시지 갱신
+        (취소가 요청되었거나 임대가 만료되어 다른 워커가 가져간 작업이면 RenderCancelled 발생)
+
+        Args:
+            job_id (str): 작업 ID
+            progress (float, optional): 진행률 (0.0 ~ 1.0)
+            message (str, optional): 상태 메시지
+        """
+        with self._db() as conn:
+            if progress is not None:
+                conn.execute("UPDATE render_jobs SET progress = ? WHERE job_id = ? AND worker_id = ?",
+                             (progress, job_id, self.worker_id))
+            if message is not None:
+                conn.execute("UPDATE render_jobs SET message = ? WHERE job_id = ? AND worker_id = ?",
+                             (message, job_id, self.worker_id))
+            row = conn.execute("SELECT cancel_requested, worker_id FROM render_jobs WHERE job_id = ?",
+                               (job_id,)).fetchone()
+
+        if row and (row["cancel_requested"] or row["worker_id"] != self.worker_id):
+            raise RenderCancelled(job_id)
+
+    def _claim_next(self) -> Optional[RenderJob]:
+        """대기 중인 작업 하나를 실행 상태로 가져옴 (우선순위 → 예상 렌더링 시간이 짧은 작업 → 등록 순)"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            self._expire_leases(conn)
+            row = conn.execute(
+                "SELECT * FROM render_jobs WHERE status = ? "
+                "ORDER BY priority DESC, estimated_seconds ASC, created_at ASC LIMIT 1",
+                (RenderJobStatus.QUEUED,)
+            ).fetchone()
+            if not row:
+                conn.execute("COMMIT")
+                return None
+            now = time.time()
+            conn.execute(
+                "UPDATE render_jobs SET status = ?, started_at = ?, message = ?, worker_id = ?, lease_expires_at = ? "
+                "WHERE job_id = ?",
+                (RenderJobStatus.RUNNING, now, "렌더링 시작...", self.worker_id, now + self.LEASE_SECONDS,
+                 row["job_id"])
+            )
+            conn.execute("COMMIT")
+            job = RenderJob.from_row(row)
+            job.status = RenderJobStatus.RUNNING
+            return job
+        except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
+            print(f"렌더링 작업 가져오기 오류: {e}")
+            return None
+        finally:
+            conn.close()
+
+    def _finish(self, job_id: str, status: str, message: str, output_paths: Optional[List[str]] = None,
+                error: Optional[str] = None):
+        """작업 종료 상태 기록 (임대가 만료되어 다른 워커가 가져간 작업이면 기록하지 않음)"""
+        try:
+            with self._db() as conn:
+                conn.execute(
+                    "UPDATE render_jobs SET status = ?, message = ?, output_paths = ?, error = ?, "
+                    "finished_at = ?, progress = CASE WHEN ? = ? THEN 1.0 ELSE progress END, lease_expires_at = NULL "
+                    "WHERE job_id = ? AND worker_id = ?",
+                    (
+                        status, message, json.dumps(output_paths or []), error, time.time(),
+                        status, RenderJobStatus.DONE, job_id, self.worker_id
+                    )
+                )
+        except Exception as e:
+            print(f"렌더링 작업 상태 기록 오류: {e}")
+
+    @staticmethod
+    def _expire_leases(conn: sqlite3.Connection):
+        """임대가 만료된(하트비트가 끊긴) 실행 중 작업을 다시 대기 상태로 되돌림 (임대 정보가 없는 이전 버전 작업 포함)"""
+        conn.execute(
+            "UPDATE render_jobs SET status = ?, message = ?, started_at = NULL, worker_id = NULL, lease_expires_at = NULL "
+            "WHERE status = ? AND (lease_expires_at IS NULL OR lease_expires_at < ?)",
+            (RenderJobStatus.QUEUED, "재시작 대기 중...", RenderJobStatus.RUNNING, time.time())
+        )
+
+    def _heartbeat_loop(self):
+        """이 프로세스가 실행 중인 작업의 임대를 주기적으로 연장"""
+        while True:
+            try:
+                with self._db() as conn:
+                    conn.execute(
+                        "UPDATE render_jobs SET lease_expires_at = ? WHERE worker_id = ? AND status = ?",
+                        (time.time() + self.LEASE_SECONDS, self.worker_id, RenderJobStatus.RUNNING)
+                    )
+            except Exception as e:
+                print(f"렌더링 작업 임대 연장 오류: {e}")
+            time.sleep(self.HEARTBEAT_INTERVAL)
+
+    def start_workers(self, num_workers: int = 1):
+        """
+        백그라운드 워커 스레드 시작 (이미 실행 중이면 부족한 수만큼만 추가)
+
+        Args:
+            num_workers (int): 워커 수
+        """
+        with self._workers_lock:
+            self._workers = [worker for worker in self._workers if worker.is_alive()]
+            if self._heartbeat_thread is None or not self._heartbeat_thread.is_alive():
+                self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="render-heartbeat",
+                                                          daemon=True)
+                self._heartbeat_thread.start()
+
+            while len(self._workers) < num_workers:
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"render-worker-{len(self._workers) + 1}",
+                    daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def _worker_loop(self):
+        """워커 메인 루프 - 작업을 가져와 처리"""
+        while True:
+            job = self._claim_next()
+            if job is None:
+                self._wakeup.wait(timeout=2.0)
+                self._wakeup.clear()
+                continue
+            self._run_job(job)
+
+    def _run_job(self, job: RenderJob):
+        """
+        작업 하나를 실행
+
+        Args:
+            job (RenderJob): 실행할 작업
+        """
+        # 무거운 렌더링 모듈은 워커에서 처음 필요할 때 로드
+        from service.scene_manager import SceneManager
+        from service.video_generator import video_generator
+
+        project_path = Path(job.project_path)
+        warnings = []
+
+        def on_progress(progress: float):
+            self.update_progress(job.job_id, progress=progress)
+
+        def on_status(status: str):
+            self.update_progress(job.job_id, message=status)
+
+        def on_warning(message: str):
+            warnings.append(message)
+
+        try:
+            video_json_path = project_path / "video.json"
+            if not video_json_path.exists():
+                self._finish(job.job_id, RenderJobStatus.FAILED, "video.json을 찾을 수 없습니다.",
+                             error=str(video_json_path))
+                return
+
+            scenes = SceneManager(video_json_path).get_video_data().get("scenes", [])
+            if job.scene_ids is not None:
+                scenes = [scene for scene in scenes if scene.get("id") in job.scene_ids]
+
+            if not scenes:
+                self._finish(job.job_id, RenderJobStatus.FAILED, "생성할 씬이 없습니다.")
+                return
+
+            if job.is_final_render:
+                errors = []
+                outputs = video_generator.generate_final_outputs(
+                    scenes=scenes,
+                    output_filename=job.output_filename,
+                    progress_callback=on_progress,
+                    status_callback=on_status,
+                    warning_callback=on_warning,
+                    error_callback=errors.append,
+                    project_path=project_path,
+                    output_targets=job.output_targets
+                )
+                if outputs:
+                    # 출력 대상 일부가 실패한 경우의 오류도 경고로 남김
+                    self._finish(job.job_id, RenderJobStatus.DONE, "완료!", output_paths=list(outputs.values()),
+                                 error="\n".join(errors + warnings) or None)
+                else:
+                    self._finish(job.job_id, RenderJobStatus.FAILED, "비디오 생성에 실패했습니다.",
+                                 error="\n".join(errors + warnings) or None)
+            else:
+                video_paths = video_generator.generate_all_scene_videos(
+                    scenes=scenes,
+                    progress_callback=on_progress,
+                    status_callback=on_status,
+                    warning_callback=on_warning,
+                    project_path=project_path
+                )
+                if video_paths:
+                    self._finish(job.job_id, RenderJobStatus.DONE, "완료!", output_paths=video_paths,
+                                 error="\n".join(warnings) or None)
+                else:
+                    self._finish(job.job_id, RenderJobStatus.FAILED, "비디오 생성에 실패했습니다.",
+                                 error="\n".join(warnings) or None)
+
+        except RenderCancelled:
+            self._finish(job.job_id, RenderJobStatus.CANCELLED, "취소됨")
+        except Exception as e:
+            print(f"렌더링 작업 실행 오류: {e}")
+            self._finish(job.job_id, RenderJobStatus.FAILED, "렌더링 중 오류가 발생했습니다.", error=str(e))
+
+
+# 전역 렌더링 작업 큐 인스턴스
+render_job_queue = RenderJobQueue()
@@ -0,0 +1,252 @@
+"""
+씬 렌더링 매니페스트
+씬마다 렌더링 입력(씬 필드, 참조 파일, 렌더러 코드, fps/화면 크기, 공용 에셋)의 지문(fingerprint)과
+렌더링 결과(비디오 경로, 길이, 오디오 배치)를 프로젝트의 output/render_manifest.json에 기록합니다.
+
+지문이 같고 비디오 파일이 남아 있는 씬은 "깨끗한(clean)" 씬으로 보고 다시 렌더링하지 않습니다.
+출력 대상(OutputTarget)을 요청한 렌더링은 대상별 씬 비디오도 같은 설정(서명)으로 남아 있어야 깨끗한 씬입니다.
+"""
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from project_manager import project_manager
+from service.compositors import get_compositor_name
+from service.scene_renderers import renderer_classes
+
+MANIFEST_FILENAME = "render_manifest.json"
+
+# 씬 렌더러가 직접 참조하는 공용 에셋 폴더 (저장소 기준 상대 경로)
+SHARED_ASSET_DIR = Path("assets")
+
+# 렌더러 클래스 밖에서 씬 출력에 영향을 주는 모듈 (타임라인 표현, 컴포지터 백엔드)
+RENDER_PIPELINE_MODULES = ("service.timeline", "service.compositors.base_compositor",
+                           "service.compositors.moviepy_compositor", "service.compositors.numpy_compositor")
+
+# 매니페스트 파일을 여러 워커 스레드가 동시에 갱신하지 않도록 보호
+_manifest_lock = threading.Lock()
+
+
+def _file_signature(path: Path) -> Optional[List[int]]:
+    """파일의 [크기, 수정 시각(ns)] 반환 (없으면 None)"""
+    try:
+        stat = path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+    except OSError:
+        return None
+
+
+def get_shared_assets_signature() -> str:
+    """
+    공용 에셋 폴더(assets/) 전체 파일의 크기/수정 시각 해시 반환
+
+    Returns:
+        str: 해시 문자열 (에셋 폴더가 없으면 빈 문자열)
+    """
+    if not SHARED_ASSET_DIR.exists():
+        return ""
+    digest = hashlib.sha256()
+    for path in sorted(SHARED_ASSET_DIR.rglob("*")):
+        if path.is_file():
+            digest.update(f"{path.as_posix()}:{_file_signature(path)}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_renderer_signature(scene_type: str) -> List[Any]:
+    """
+    렌더러 코드(렌더러 모듈 + 기본 렌더러 모듈 + 타임라인/컴포지터 모듈)의 수정 시각 반환 - 코드가 바뀌면 다시 렌더링
+
+    Args:
+        scene_type (str): 씬 타입
+
+    Returns:
+        list: [렌더러 "모듈:클래스", 모듈 파일 서명들]
+    """
+    renderer_class = renderer_classes.get_class(scene_type)
+    if renderer_class is None:
+        return [scene_type]
+    signature = [f"{renderer_class.__module__}:{renderer_class.__name__}"]
+    module_names = [klass.__module__ for klass in renderer_class.__mro__] + list(RENDER_PIPELINE_MODULES)
+    for module_name in module_names:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            module_file = getattr(module, "__file__", None)
+        else:
+            # 아직 로드되지 않은 파이프라인 모듈도 확인 (프로세스마다 지문이 같도록)
+            spec = importlib.util.find_spec(module_name)
+            module_file = spec.origin if spec else None
+        if module_file and module_name.startswith("service."):
+            signature.append([module_name, _file_signature(Path(module_file))])
+    return signature
+
+
+def compute_fingerprint(scene: Dict[str, Any], project_path: Path, shared_assets: Optional[str] = None) -> str:
+    """
+    씬 렌더링 입력의 지문 계산
+
+    Args:
+        scene (dict): 씬 정보 딕셔너리
+        project_path (Path): 프로젝트 경로 (씬 필드의 상대 경로 파일 확인용)
+        shared_assets (str, optional): get_shared_assets_signature() 결과 (여러 씬 계산 시 재사용)
+
+    Returns:
+        str: SHA-256 지문
+    """
+    files = {}
+    for key, value in scene.items():
+        # 프로젝트 안의 파일을 가리키는 필드는 파일 내용 변경(크기/수정 시각)도 반영
+        if isinstance(value, str) and "/" in value and len(value) < 300:
+            signature = _file_signature(Path(project_path) / value)
+            if signature is not None:
+                files[key] = signature
+
+    payload = {
+        "scene": scene,
+        "files": files,
+        "renderer": get_renderer_signature(scene.get("type", "type1")),
+        "fps": project_manager.get_fps(),
+        "screen_size": list(project_manager.get_screen_size()),
+        "compositor": get_compositor_name(),
+        "shared_assets": shared_assets if shared_assets is not None else get_shared_assets_signature()
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class RenderManifest:
+    """프로젝트 하나의 씬 렌더링 매니페스트"""
+
+    def __init__(self, project_path):
+        """
+        RenderManifest 초기화
+
+        Args:
+            project_path (str or Path): 프로젝트 경로
+        """
+        self.project_path = Path(project_path)
+        self.path = self.project_path / "output" / MANIFEST_FILENAME
+        self._shared_assets = None
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("scenes", {})
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries: Dict[str, Any]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{MANIFEST_FILENAME}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"scenes": entries}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def fingerprint(self, scene: Dict[str, Any]) -> str:
+        """씬 지문 계산 (공용 에셋 해시는 인스턴스에서 한 번만 계산)"""
+        if self._shared_assets is None:
+            self._shared_assets = get_shared_assets_signature()
+        return compute_fingerprint(scene, self.project_path, self._shared_assets)
+
+    def get_entries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        전체 매니페스트 항목 반환 (지문 확인 없음 - 이전 렌더링 길이 참고용)
+
+        Returns:
+            dict: 씬 ID → 매니페스트 항목
+        """
+        return self._load()
+
+    def get_clean_entry(self, scene: Dict[str, Any], fingerprint: Optional[str] = None,
+                        output_targets: Optional[list] = None) -> Optional[Dict[str, Any]]:
+        """
+        씬이 깨끗하면(지문 일치 + 비디오 존재 + 요청한 출력 대상 비디오 존재) 매니페스트 항목 반환
+
+        Args:
+            scene (dict): 씬 정보 딕셔너리
+            fingerprint (str, optional): 미리 계산한 지문
+            output_targets (list, optional): 함께 있어야 하는 출력 대상 (OutputTarget 리스트)
+
+        Returns:
+            dict: {"fingerprint", "video_path", "duration", "fps", "audio_placements", "targets", "rendered_at"} 또는 None
+        """
+        entry = self._load().get(scene.get("id"))
+        if not entry:
+            return None
+        if entry.get("fingerprint") != (fingerprint or self.fingerprint(scene)):
+            return None
+        if not (self.project_path / entry.get("video_path", "")).exists():
+            return None
+        targets = entry.get("targets", {})
+        for target in output_targets or []:
+            recorded = targets.get(target.name)
+            if (not recorded or recorded.get("signature") != target.signature()
+                    or not (self.project_path / recorded.get("path", "")).exists()):
+                return None
+        return entry
+
+    def get_dirty_scene_ids(self, scenes: List[Dict[str, Any]]) -> List[str]:
+        """
+        다시 렌더링이 필요한 씬 ID 목록 반환 (렌더러가 없는 씬 타입은 제외)
+
+        Args:
+            scenes (list): 씬 정보 리스트
+
+        Returns:
+            list: 더러운(dirty) 씬 ID 리스트 (씬 순서 유지)
+        """
+        entries = self._load()
+        dirty = []
+        for scene in scenes:
+            if scene.get("type", "type1") not in renderer_classes:
+                continue
+            entry = entries.get(scene.get("id"))
+            if (not entry or entry.get("fingerprint") != self.fingerprint(scene)
+                    or not (self.project_path / entry.get("video_path", "")).exists()):
+                dirty.append(scene.get("id"))
+        return dirty
+
+    def record(self, scene_id: str, fingerprint: str, video_path: str, duration: float, fps: int,
+               audio_placements: List[Dict[str, Any]], targets: Optional[Dict[str, Dict[str, str]]] = None):
+        """
+        씬 렌더링 결과 기록
+
+        Args:
+            scene_id (str): 씬 ID
+            fingerprint (str): 렌더링 시작 시점의 지문
+            video_path (str): 비디오 경로 (프로젝트 기준 상대 경로)
+            duration (float): 씬 길이(초)
+            fps (int): fps
+            audio_placements (list): AudioPlacement.to_dict() 리스트
+            targets (dict, optional): 대상 이름 → {"path": 상대 경로, "signature": OutputTarget.signature()}
+        """
+        with _manifest_lock:
+            try:
+                entries = self._load()
+                entries[scene_id] = {
+                    "fingerprint": fingerprint,
+                    "video_path": video_path,
+                    "duration": duration,
+                    "fps": fps,
+                    "audio_placements": audio_placements,
+                    "targets": targets or {},
+                    "rendered_at": time.time()
+                }
+                self._save(entries)
+            except Exception as e:
+                print(f"[MANIFEST] 매니페스트 저장 오류: {e}")
+
+    def forget(self, scene_id: str):
+        """씬 항목 삭제 (렌더링 실패 등으로 결과를 믿을 수 없을 때)"""
+        with _manifest_lock:
+            entries = self._load()
+            if entries.pop(scene_id, None) is not None:
+                try:
+                    self._save(entries)
+                except Exception as e:
+                    print(f"[MANIFEST] 매니페스트 저장 오류: {e}")
@@ -0,0 +1,304 @@
+"""
+렌더링 진행률 추적
+MoviePy(proglog)의 프레임 단위 인코딩 진행률을 받아 프로젝트 전체 진행률, 현재 단계(phase),
+초당 프레임 수(fps), 평활화된 남은 시간(ETA)을 계산하여 VideoGenerator의 콜백으로 전달합니다.
+
+- 진행률은 씬별 예상 프레임 수를 가중치로 계산합니다.
+  아직 렌더링하지 않은 씬은 렌더링 매니페스트의 이전 길이, 없으면 지금까지의 평균 프레임 수로 추정합니다.
+- 최종 비디오를 만들 때는 씬 렌더링 뒤의 합치기(사운드트랙 믹싱 + mux) 단계도 같은 트래커로 보고합니다.
+  합치기 예상 시간(이전 렌더링 기록)만큼 진행률 끝부분을 남겨 두고 남은 시간에 더합니다.
+- UI/DB가 과부하되지 않도록 콜백은 min_interval(초)마다 한 번만 호출합니다 (단계가 바뀔 때는 즉시).
+"""
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+
+class RenderPhase:
+    """렌더링 단계 상수"""
+    PREPARE = "prepare"   # 클립 구성 (텍스트/이미지/오디오 준비)
+    AUDIO = "audio"       # 씬 오디오 쓰기
+    ENCODE = "encode"     # 프레임 합성 + 인코딩
+    CACHED = "cached"     # 이전 렌더링 결과 재사용
+    ASSEMBLE = "assemble" # 사운드트랙 믹싱 + 합치기
+
+    LABELS = {
+        PREPARE: "준비",
+        AUDIO: "오디오",
+        ENCODE: "인코딩",
+        CACHED: "캐시",
+        ASSEMBLE: "합치기",
+    }
+
+
+@dataclass
+class RenderProgress:
+    """
+    렌더링 진행 상태 구조체
+    단계, 현재 씬 위치, 씬 내 프레임 진행, 전체 진행률, fps, ETA를 포함
+    """
+    phase: str
+    scene_index: int
+    scene_count: int
+    scene_id: Optional[str] = None
+    frame: int = 0
+    total_frames: int = 0
+    fraction: float = 0.0
+    fps: float = 0.0
+    eta_seconds: Optional[float] = None
+    step: Optional[str] = None  # 합치기 단계의 세부 작업 (예: "사운드트랙 믹싱")
+
+    def format_message(self) -> str:
+        """상태 메시지 문자열 (예: "씬 2/5 인코딩 · 120/480 프레임 · 35.2 fps · 남은 시간 1분 12초")"""
+        parts = [f"씬 {self.scene_index + 1}/{self.scene_count} {RenderPhase.LABELS.get(self.phase, self.phase)}"]
+        if self.phase == RenderPhase.ASSEMBLE:
+            parts = [f"최종 비디오 합치는 중 ({self.step})" if self.step else "최종 비디오 합치는 중"]
+        if self.total_frames:
+            parts.append(f"{self.frame}/{self.total_frames} 프레임")
+        if self.fps:
+            parts.append(f"{self.fps:.1f} fps")
+        if self.eta_seconds is not None:
+            parts.append(f"남은 시간 {format_duration(self.eta_seconds)}")
+        return " · ".join(parts)
+
+
+def format_duration(seconds: float) -> str:
+    """초를 "1분 12초" 형식으로 변환"""
+    seconds = max(0, int(round(seconds)))
+    minutes, seconds = divmod(seconds, 60)
+    if minutes >= 60:
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}시간 {minutes}분"
+    return f"{minutes}분 {seconds}초" if minutes else f"{seconds}초"
+
+
+class RenderProgressTracker:
+    """프로젝트 단위 렌더링 진행률/ETA 계산 및 콜백 호출 클래스"""
+
+    DEFAULT_SCENE_FRAMES = 120  # 추정할 근거가 없을 때의 씬 프레임 수
+    FPS_SMOOTHING = 0.2         # fps 지수 이동 평균 계수
+
+    def __init__(
+        self,
+        scene_count: int,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+        assemble_seconds: float = 0.0,
+        min_interval: float = 0.5
+    ):
+        """
+        RenderProgressTracker 초기화
+
+        Args:
+            scene_count (int): 전체 씬 수
+            progress_callback (Callable, optional): 전체 진행률 콜백 (0.0 ~ 1.0)
+            status_callback (Callable, optional): 상태 메시지 콜백
+            assemble_seconds (float): 씬 렌더링 뒤 합치기 단계의 예상 시간(초) (0이면 진행률/남은 시간에 반영하지 않음)
+            min_interval (float): 콜백 최소 간격(초)
+        """
+        self.scene_count = scene_count
+        self.progress_callback = progress_callback
+        self.status_callback = status_callback
+        self.assemble_seconds = max(0.0, assemble_seconds or 0.0)
+        self.min_interval = min_interval
+
+        self.estimates: Dict[int, int] = {}   # 씬 인덱스 → 예상 프레임 수
+        self.completed: Dict[int, int] = {}   # 씬 인덱스 → 실제 처리한 프레임 수 (캐시는 0)
+        self.scene_index = 0
+        self.scene_id = None
+        self.phase = RenderPhase.PREPARE
+        self.frame = 0
+        self.total_frames = 0
+
+        self._smoothed_fps = 0.0
+        self._last_frame_time: Optional[float] = None
+        self._last_frame = 0
+        self._last_emit = 0.0
+        self._max_fraction = 0.0
+        # 합치기 단계 (시작 시각, 시작 시 진행률, 세부 작업)
+        self._assemble_started: Optional[float] = None
+        self._assemble_from = 0.0
+        self.assemble_step: Optional[str] = None
+        # 콜백이 던진 예외 (예: 작업 취소) - 씬 렌더러가 예외를 삼켜도 렌더링 루프에서 다시 던질 수 있도록 보관
+        self.aborted: Optional[BaseException] = None
+
+    def set_estimate(self, scene_index: int, frames: Optional[int]):
+        """씬의 예상 프레임 수 설정 (매니페스트의 이전 길이 등)"""
+        if frames:
+            self.estimates[scene_index] = int(frames)
+
+    def _estimate(self, scene_index: int) -> int:
+        if scene_index in self.completed:
+            return self.completed[scene_index]
+        if scene_index == self.scene_index and self.total_frames:
+            return self.total_frames
+        if scene_index in self.estimates:
+            return self.estimates[scene_index]
+        rendered = [frames for frames in self.completed.values() if frames]
+        return int(sum(rendered) / len(rendered)) if rendered else self.DEFAULT_SCENE_FRAMES
+
+    def start_scene(self, scene_index: int, scene_id: Optional[str] = None):
+        """씬 시작 (클립 구성 단계)"""
+        self.scene_index = scene_index
+        self.scene_id = scene_id
+        self.frame = 0
+        self.total_frames = 0
+        self._last_frame_time = None
+        self._last_frame = 0
+        self.set_phase(RenderPhase.PREPARE)
+
+    def finish_scene(self, scene_index: int, frames: int = 0, cached: bool = False):
+        """
+        씬 완료
+
+        Args:
+            scene_index (int): 씬 인덱스
+            frames (int): 실제 렌더링한 프레임 수
+            cached (bool): 이전 결과를 재사용했는지 여부 (남은 작업량에서 제외)
+        """
+        self.completed[scene_index] = 0 if cached else frames
+        if cached:
+            self.scene_index = scene_index
+            self.phase = RenderPhase.CACHED
+        self.emit(force=True)
+
+    def set_phase(self, phase: str):
+        """단계 변경 (즉시 콜백)"""
+        self.phase = phase
+        self.emit(force=True)
+
+    def start_assemble(self):
+        """씬 렌더링이 끝나고 합치기 단계 시작 (즉시 콜백)"""
+        self._assemble_from = self.get_progress().fraction
+        self._assemble_started = time.monotonic()
+        self.assemble_step = None
+        self.set_phase(RenderPhase.ASSEMBLE)
+
+    def set_assemble_step(self, step: str):
+        """합치기 단계의 세부 작업 변경 (예: "사운드트랙 믹싱", 즉시 콜백)"""
+        if self.phase != RenderPhase.ASSEMBLE:
+            self.start_assemble()
+        self.assemble_step = step
+        self.emit(force=True)
+
+    def on_frame(self, frame: int, total_frames: int):
+        """프레임 인코딩 진행 (proglog 콜백에서 호출)"""
+        if self.phase != RenderPhase.ENCODE:
+            self.phase = RenderPhase.ENCODE
+        self.total_frames = total_frames or self.total_frames
+        # MoviePy는 마지막에 전체 프레임 수보다 하나 큰 인덱스를 보고할 수 있음
+        self.frame = min(frame, self.total_frames) if self.total_frames else frame
+
+        now = time.monotonic()
+        if self._last_frame_time is None:
+            self._last_frame_time, self._last_frame = now, frame
+        elif now - self._last_frame_time >= 0.25 and frame > self._last_frame:
+            instant_fps = (frame - self._last_frame) / (now - self._last_frame_time)
+            if self._smoothed_fps:
+                self._smoothed_fps += self.FPS_SMOOTHING * (instant_fps - self._smoothed_fps)
+            else:
+                self._smoothed_fps = instant_fps
+            self._last_frame_time, self._last_frame = now, frame
+        self.emit()
+
+    def get_progress(self) -> RenderProgress:
+        """현재 진행 상태 계산"""
+        if self.phase == RenderPhase.ASSEMBLE:
+            return self._get_assemble_progress()
+
+        total = sum(self._estimate(idx) for idx in range(self.scene_count))
+        done = sum(frames for frames in self.completed.values())
+        if self.scene_index not in self.completed:
+            done += min(self.frame, self._estimate(self.scene_index))
+        remaining_frames = max(0, total - done)
+
+        if total:
+            fraction = done / total
+        else:
+            fraction = len(self.completed) / self.scene_count if self.scene_count else 1.0
+
+        eta = remaining_frames / self._smoothed_fps if self._smoothed_fps else None
+        if self.assemble_seconds:
+            # 합치기 예상 시간만큼 진행률 끝부분을 남겨 두고 남은 시간에 더함 (인코딩할 프레임이 없으면 합치기가 전부)
+            if not total:
+                fraction, eta = 0.0, self.assemble_seconds
+            elif self._smoothed_fps:
+                fraction *= 1.0 - self.assemble_seconds / (self.assemble_seconds + total / self._smoothed_fps)
+                eta += self.assemble_seconds
+        # 추정치가 바뀌어도 진행률이 뒤로 가지 않도록 함
+        self._max_fraction = max(self._max_fraction, min(1.0, fraction))
+        return RenderProgress(
+            phase=self.phase,
+            scene_index=self.scene_index,
+            scene_count=self.scene_count,
+            scene_id=self.scene_id,
+            frame=self.frame,
+            total_frames=self.total_frames,
+            fraction=self._max_fraction,
+            fps=self._smoothed_fps,
+            eta_seconds=eta
+        )
+
+    def _get_assemble_progress(self) -> RenderProgress:
+        """합치기 단계의 진행 상태 (예상 시간 대비 경과 시간)"""
+        elapsed = time.monotonic() - (self._assemble_started or time.monotonic())
+        fraction, eta = self._assemble_from, None
+        if self.assemble_seconds:
+            fraction += (1.0 - self._assemble_from) * min(1.0, elapsed / self.assemble_seconds)
+            eta = max(0.0, self.assemble_seconds - elapsed)
+        self._max_fraction = max(self._max_fraction, min(1.0, fraction))
+        return RenderProgress(
+            phase=self.phase,
+            scene_index=self.scene_index,
+            scene_count=self.scene_count,
+            fraction=self._max_fraction,
+            eta_seconds=eta,
+            step=self.assemble_step
+        )
+
+    def emit(self, force: bool = False):
+        """콜백 호출 (force가 아니면 min_interval마다 한 번)"""
+        now = time.monotonic()
+        if not force and now - self._last_emit < self.min_interval:
+            return
+        self._last_emit = now
+
+        progress = self.get_progress()
+        try:
+            if self.progress_callback:
+                self.progress_callback(progress.fraction)
+            if self.status_callback:
+                self.status_callback(progress.format_message())
+        except Exception as e:
+            self.aborted = e
+            raise
+
+    def raise_if_aborted(self):
+        """콜백에서 예외가 발생했었다면 다시 발생시킴"""
+        if self.aborted is not None:
+            raise self.aborted
+
+    def create_logger(self):
+        """
+        MoviePy write_videofile(logger=...)에 넘길 proglog 로거 생성
+
+        Returns:
+            proglog.ProgressBarLogger: 프레임 진행을 이 트래커로 전달하는 로거
+        """
+        from proglog import ProgressBarLogger
+
+        tracker = self
+
+        class _FrameProgressLogger(ProgressBarLogger):
+            """MoviePy의 frame_index(영상)/chunk(오디오) 진행 막대를 트래커로 전달"""
+
+            def bars_callback(self, bar, attr, value, old_value=None):
+                if attr != "index":
+                    return
+                total = self.bars[bar].get("total") or 0
+                if bar == "frame_index":
+                    tracker.on_frame(value + 1, total)
+                elif bar == "chunk" and tracker.phase != RenderPhase.AUDIO:
+                    tracker.set_phase(RenderPhase.AUDIO)
+
+        return _FrameProgressLogger()
@@ -0,0 +1,378 @@
+"""
+렌더링 트레이싱 서비스
+렌더링 단계별(span) 실행 시간을 기록하여 렌더링마다 JSON 트레이스로 저장합니다.
+
+- span마다 씬 ID, 단계(phase), 벽시계 시간, CPU 시간(스레드 기준), 기록한 바이트 수를 남깁니다.
+- 트레이스는 프로젝트의 logs 폴더에 render_trace_{id}.json 으로 저장되며,
+  Chrome 트레이스 형식(render_trace_{id}.chrome.json, chrome://tracing / Perfetto)으로도 내보냅니다.
+- 디버그 모드에서 render_profiling 설정을 켜면 샘플링 프로파일러 결과(.folded)도 함께 저장합니다.
+- 트레이스가 시작되지 않은 스레드에서의 span 호출은 아무것도 기록하지 않습니다.
+"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from settings import Settings
+from service.telemetry import telemetry
+
+
+class RenderTrace:
+    """렌더링 1회의 span 기록을 담는 클래스"""
+
+    def __init__(self, render_id: str, output_dir: Optional[Path] = None, meta: Optional[dict] = None):
+        """
+        RenderTrace 초기화
+
+        Args:
+            render_id (str): 렌더링 ID
+            output_dir (Path, optional): 트레이스를 저장할 폴더
+            meta (dict, optional): 추가 정보 (프로젝트 경로 등)
+        """
+        self.render_id = render_id
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.meta = meta or {}
+        self.started_at = time.time()
+        self.origin = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def add_span(self, span: Dict[str, Any]):
+        """완료된 span 추가 (스레드 안전)"""
+        with self._lock:
+            self.spans.append(span)
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (JSON 저장용)"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span["start"])
+        return {
+            "render_id": self.render_id,
+            "started_at": self.started_at,
+            "meta": self.meta,
+            "spans": spans
+        }
+
+    def to_chrome_trace(self) -> dict:
+        """
+        Chrome 트레이스 이벤트 형식으로 변환 (chrome://tracing, Perfetto에서 열 수 있음)
+
+        Returns:
+            dict: {"traceEvents": [...]} 형식의 딕셔너리
+        """
+        events = []
+        for span in self.to_dict()["spans"]:
+            args = dict(span.get("attrs", {}))
+            args.update({
+                "scene_id": span.get("scene_id"),
+                "cpu_ms": round(span["cpu"] * 1000, 3),
+                "bytes_written": span.get("bytes_written", 0)
+            })
+            events.append({
+                "name": span["name"],
+                "cat": span.get("phase") or "render",
+                "ph": "X",
+                "ts": round(span["start"] * 1_000_000, 1),
+                "dur": round(span["wall"] * 1_000_000, 1),
+                "pid": span.get("pid", 0),
+                "tid": span.get("tid", 0),
+                "args": args
+            })
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"render_id": self.render_id, **{k: str(v) for k, v in self.meta.items()}}
+        }
+
+    def summarize(self) -> Dict[str, Dict[str, float]]:
+        """
+        단계(phase)별 합계 반환
+
+        Returns:
+            dict: {phase: {"wall": 합계, "cpu": 합계, "count": 개수, "bytes_written": 합계}}
+        """
+        summary: Dict[str, Dict[str, float]] = {}
+        for span in self.to_dict()["spans"]:
+            phase = span.get("phase") or span["name"]
+            item = summary.setdefault(phase, {"wall": 0.0, "cpu": 0.0, "count": 0, "bytes_written": 0})
+            item["wall"] += span["wall"]
+            item["cpu"] += span["cpu"]
+            item["count"] += 1
+            item["bytes_written"] += span.get("bytes_written", 0)
+        return summary
+
+    def save(self) -> Optional[Path]:
+        """
+        트레이스를 JSON과 Chrome 트레이스 형식으로 저장
+
+        Returns:
+            Path: 저장된 JSON 파일 경로 또는 None (저장 위치가 없거나 실패 시)
+        """
+        if not self.output_dir:
+            return None
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            trace_path = self.output_dir / f"render_trace_{self.render_id}.json"
+            with open(trace_path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            with open(self.output_dir / f"render_trace_{self.render_id}.chrome.json", 'w', encoding='utf-8') as f:
+                json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+            return trace_path
+        except Exception as e:
+            print(f"[TRACE] 트레이스 저장 오류: {e}")
+            return None
+
+
+class SamplingProfiler:
+    """
+    일정 간격으로 대상 스레드의 스택을 샘플링하는 프로파일러
+    결과는 flamegraph/speedscope에서 열 수 있는 collapsed stack(.folded) 형식으로 저장합니다.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        """
+        SamplingProfiler 초기화
+
+        Args:
+            thread_id (int): 샘플링할 스레드 ID
+            interval (float): 샘플링 간격(초)
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """샘플링 시작"""
+        self._thread = threading.Thread(target=self._run, name="render-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """샘플링 중지"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+
+    def save(self, output_path: Path) -> Optional[Path]:
+        """
+        collapsed stack 형식으로 저장
+
+        Args:
+            output_path (Path): 저장할 파일 경로
+
+        Returns:
+            Path: 저장된 파일 경로 또는 None (실패 시)
+        """
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            lines = [f"{stack} {count}" for stack, count in self.samples.most_common()]
+            output_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+            return output_path
+        except Exception as e:
+            print(f"[TRACE] 프로파일 저장 오류: {e}")
+            return None
+
+
+class RenderTracer:
+    """스레드별 현재 트레이스와 span 스택을 관리하는 클래스"""
+
+    def __init__(self):
+        """RenderTracer 초기화"""
+        self._local = threading.local()
+        self.last_trace: Optional[RenderTrace] = None
+
+    def current(self) -> Optional[RenderTrace]:
+        """현재 스레드에서 진행 중인 트레이스 반환"""
+        return getattr(self._local, "trace", None)
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @staticmethod
+    def is_profiling_enabled() -> bool:
+        """샘플링 프로파일러 사용 여부 (디버그 모드 + render_profiling 설정)"""
+        return Settings.is_debug_mode() and bool(Settings.get("render_profiling", False))
+
+    @contextmanager
+    def trace(self, output_dir=None, render_id: Optional[str] = None, **meta):
+        """
+        렌더링 트레이스 범위 (이미 진행 중인 트레이스가 있으면 그대로 사용)
+
+        Args:
+            output_dir (str or Path, optional): 트레이스를 저장할 폴더 (보통 프로젝트의 logs 폴더)
+            render_id (str, optional): 렌더링 ID (없으면 자동 생성)
+            **meta: 트레이스에 함께 저장할 정보
+
+        Yields:
+            RenderTrace: 현재 트레이스
+        """
+        existing = self.current()
+        if existing is not None:
+            yield existing
+            return
+
+        render_id = render_id or f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        trace = RenderTrace(render_id, output_dir, meta)
+        self._local.trace = trace
+
+        profiler = None
+        if self.is_profiling_enabled():
+            profiler = SamplingProfiler(threading.get_ident())
+            profiler.start()
+
+        try:
+            with self.span("render", phase="render"):
+                yield trace
+        finally:
+            self._local.trace = None
+            self.last_trace = trace
+            trace_path = trace.save()
+            # 성능 대시보드용 단계별/씬별 시간과 인코딩 fps 기록
+            try:
+                telemetry.record_trace(trace)
+            except Exception as e:
+                print(f"[TRACE] 텔레메트리 기록 오류: {e}")
+            if profiler:
+                profiler.stop()
+                if trace.output_dir:
+                    profiler.save(trace.output_dir / f"render_profile_{trace.render_id}.folded")
+            if trace_path:
+                print(f"[TRACE] 렌더링 트레이스 저장: {trace_path}")
+
+    @contextmanager
+    def span(self, name: str, phase: Optional[str] = None, scene_id: Optional[str] = None, **attrs):
+        """
+        실행 구간(span) 기록
+
+        Args:
+            name (str): span 이름 (예: "gen_image_clip")
+            phase (str, optional): 단계 (예: "encode", "text_rasterize")
+            scene_id (str, optional): 씬 ID (없으면 상위 span의 씬 ID 사용)
+            **attrs: 추가 속성
+
+        Yields:
+            dict: span 정보 (yield 받은 쪽에서 "bytes_written" 등을 채울 수 있음)
+        """
+        trace = self.current()
+        if trace is None:
+            # 트레이스가 없으면 기록하지 않음 (호출 측 코드는 그대로 동작)
+            yield {"attrs": {}}
+            return
+
+        stack = self._stack()
+        if scene_id is None and stack:
+            scene_id = stack[-1].get("scene_id")
+
+        span = {
+            "name": name,
+            "phase": phase,
+            "scene_id": scene_id,
+            "depth": len(stack),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "bytes_written": 0,
+            "attrs": dict(attrs)
+        }
+        stack.append(span)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield span
+        except Exception as e:
+            span["attrs"]["error"] = str(e)
+            raise
+        finally:
+            span["wall"] = time.perf_counter() - wall_start
+            span["cpu"] = time.thread_time() - cpu_start
+            span["start"] = wall_start - trace.origin
+            stack.pop()
+            trace.add_span(span)
+
+    def record_bytes(self, nbytes: int):
+        """현재 span에 기록한 바이트 수 추가 (트레이스가 없으면 무시)"""
+        stack = self._stack() if self.current() is not None else None
+        if stack:
+            stack[-1]["bytes_written"] += int(nbytes)
+
+    def traced(self, name: Optional[str] = None, phase: Optional[str] = None):
+        """
+        메서드 전체를 span으로 기록하는 데코레이터
+        첫 번째 인자(self)에 scene_id 속성이 있으면 span의 씬 ID로 사용합니다.
+
+        Args:
+            name (str, optional): span 이름 (없으면 함수 이름)
+            phase (str, optional): 단계
+        """
+        def decorator(func):
+            span_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                scene_id = getattr(args[0], "scene_id", None) if args else None
+                with self.span(span_name, phase=phase, scene_id=scene_id):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def add_span(self, name: str, wall: float, phase: Optional[str] = None, cpu: float = 0.0, **attrs):
+        """
+        직접 측정한 구간을 span으로 추가 (예: 프레임 합성 누적 시간)
+
+        Args:
+            name (str): span 이름
+            wall (float): 벽시계 시간(초)
+            phase (str, optional): 단계
+            cpu (float): CPU 시간(초)
+            **attrs: 추가 속성
+        """
+        trace = self.current()
+        if trace is None:
+            return
+        stack = self._stack()
+        trace.add_span({
+            "name": name,
+            "phase": phase,
+            "scene_id": stack[-1].get("scene_id") if stack else None,
+            "depth": len(stack),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "bytes_written": attrs.pop("bytes_written", 0),
+            "attrs": attrs,
+            "start": time.perf_counter() - trace.origin - wall,
+            "wall": wall,
+            "cpu": cpu
+        })
+
+
+def file_size(path) -> int:
+    """파일 크기 반환 (없으면 0) - span의 bytes_written 기록용"""
+    try:
+        return Path(path).stat().st_size
+    except (OSError, TypeError):
+        return 0
+
+
+# 전역 트레이서 인스턴스
+render_tracer = RenderTracer()
@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 from typing import List, Optional
+from service.project_catalog import project_catalog
 from service.scene import Scene
 
 
@@ -74,6 +75,8 @@ class SceneManager:
             with open(self.video_json_path, 'w', encoding='utf-8') as f:
                 json.dump(video_data, f, ensure_ascii=False, indent=2)
             
+            # 프로젝트 카탈로그 통계(씬 수 등)는 다음 조회 때 다시 계산
+            project_catalog.invalidate(self.video_json_path.parent)
             return True
         except Exception as e:
             print(f"video.json 저장 오류: {e}")
@@ -0,0 +1,48 @@
+"""
+씬 렌더러 모듈
+각 씬 타입의 비디오 생성(MoviePy) 로직을 Streamlit UI와 분리하여 포함합니다.
+헤드리스 렌더링(CLI, 백그라운드 워커)은 이 패키지만 import 합니다.
+
+렌더러 클래스는 처음 사용될 때 import 됩니다 (지연 로딩).
+외부 패키지는 "supermovie.scene_renderers" entry point 그룹으로 새 렌더러를 등록할 수 있습니다.
+"""
+
+from utils.lazy_registry import LazyClassRegistry
+
+__all__ = ['get_renderer_class', 'register_renderer', 'renderer_classes']
+
+# 씬 타입별 렌더러 클래스 (키는 ui.scene_types.scene_classes와 동일) - 접근 시 import
+renderer_classes = LazyClassRegistry(entry_point_group="supermovie.scene_renderers")
+renderer_classes.register("type1", "service.scene_renderers.basic_types:Type1Renderer", "Type 1")
+renderer_classes.register("type2", "service.scene_renderers.basic_types:Type2Renderer", "Type 2")
+renderer_classes.register("type3", "service.scene_renderers.basic_types:Type3Renderer", "Type 3")
+renderer_classes.register("balance_christmas_main", "service.scene_renderers.balance_christmas_main:BalanceChristmasMainRenderer", "Balance Christmas Main")
+renderer_classes.register("balance_christmas_enter", "service.scene_renderers.balance_christmas_enter:BalanceChristmasEnterRenderer", "Balance Christmas Enter")
+renderer_classes.register("balance_christmas_exit", "service.scene_renderers.balance_christmas_exit:BalanceChristmasExitRenderer", "Balance Christmas Exit")
+renderer_classes.register("dimango_type", "service.scene_renderers.dimango_type:DimangoTypeRenderer", "Dimango Type")
+renderer_classes.register("dimango_end_type", "service.scene_renderers.dimango_end_type:DimangoEndTypeRenderer", "Dimango End Type")
+
+
+def register_renderer(scene_type: str, target, display_name: str = None):
+    """
+    렌더러 등록 (플러그인/코드에서 직접 등록할 때 사용)
+    
+    Args:
+        scene_type (str): 씬 타입 키
+        target (str or type): "패키지.모듈:클래스" 문자열 또는 클래스
+        display_name (str, optional): 표시 이름
+    """
+    renderer_classes.register(scene_type, target, display_name)
+
+
+def get_renderer_class(scene_type: str):
+    """
+    씬 타입에 맞는 렌더러 클래스 반환
+    
+    Args:
+        scene_type (str): 씬 타입 ("type1", "balance_christmas_main" 등)
+        
+    Returns:
+        BaseSceneRenderer: 해당 타입의 렌더러 클래스 또는 None
+    """
+    return renderer_classes.get_class(scene_type)
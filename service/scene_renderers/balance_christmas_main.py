@@ -0,0 +1,52 @@
+from typing import Dict, Any
+from service.scene_renderers.base_scene_renderer import BaseSceneRenderer
+from utils import FontUtils
+
+y_variabtion = 300
+
+class BalanceChristmasMainRenderer(BaseSceneRenderer):
+    """BalanceChristmasMain 씬의 비디오 생성 클래스"""
+    def __init__(self, scene: Dict[str, Any], project_path=None):
+        super().__init__(scene, project_path)
+
+    def build_timeline(self) -> float:
+        title_audio_clip = self.gen_audio_clip("title_audio", 0)
+        a_audio_clip = self.gen_audio_clip("a_audio", title_audio_clip.end)
+        b_audio_clip = self.gen_audio_clip("b_audio", a_audio_clip.end)
+
+        
+        max_duration = round(b_audio_clip.end + 0.3, 1)
+        print("max_duration : {max_duration}")
+    
+       
+        base_clip = self.gen_color_clip(color=(0, 0, 0), duration=max_duration)
+
+        
+        bg_clip = self.gen_image_clip(path="assets/balance/balance_bg.png",
+                                       duration=max_duration, resized_width=1080, resized_height=1080, 
+                                       position=("center", y_variabtion))
+       
+        self.gen_text_clip(text="크리스마스 밸런스",
+                           font=FontUtils.MAPLESTORY_BOLD,
+                           font_size=80,
+                           start=0,
+                           duration=max_duration,
+                           position=("center", 200-960)
+        )
+
+       
+        
+        title_text_clip = self.gen_text_clip(field="title", color='black',font=FontUtils.MAPLESTORY_BOLD,start=0,duration=max_duration, size=(880, 1920),position=("center", 220-960+y_variabtion))
+        a_text_clip = self.gen_text_clip(field="choice_a", font=FontUtils.MAPLESTORY_LIGHT,font_size=70,start=a_audio_clip.start,duration=max_duration,
+                                         size=(480, 1920), position=(0, 800-960+y_variabtion), margin=(30,0))
+        b_text_clip = self.gen_text_clip(field="choice_b", font=FontUtils.MAPLESTORY_LIGHT,font_size=70,start=b_audio_clip.start,duration=max_duration,
+                                         size=(480, 1920), position=(540, 800-960+y_variabtion), margin=(30,0))
+        
+                    
+        
+        self.gen_image_clip(field="a_image", start=a_audio_clip.start, duration=max_duration, resized_width=300, position=(270-150, 400+y_variabtion))
+        self.gen_image_clip(field="b_image", start=b_audio_clip.start, duration=max_duration,resized_width=300, position=(810-150, 400+y_variabtion))
+
+        
+        # 씬 길이 반환
+        return max_duration
@@ -0,0 +1,425 @@
+from abc import ABC
+from typing import Dict, Any, Optional
+from pathlib import Path
+from project_manager import project_manager
+from utils import FontUtils
+from service.audio_cache_service import audio_cache_service
+from service.audio_mixer import AudioPlacement
+from service.audio_preview import AudioPreview, audio_preview_service
+from service.chunked_encoder import chunked_encoder
+from service.compositors import get_compositor, get_compositor_name
+from service.frame_preview import frame_preview_service
+from service.render_tracer import render_tracer
+from service.timeline import Layer, LayerKind, Timeline
+
+# gen_* 메서드는 MoviePy 클립 대신 타임라인 레이어를 만들고, 프레임 합성은 컴포지터 백엔드가 담당합니다.
+
+
+class BaseSceneRenderer(ABC):
+    """
+    씬 렌더링(비디오 생성)의 기본 클래스 - 모든 씬 렌더러가 상속받아야 함
+    Streamlit UI에 의존하지 않으므로 헤드리스 렌더링(CLI, 워커)에서 그대로 사용할 수 있음
+    """
+    
+    def __init__(self, scene: Dict[str, Any], project_path=None):
+        """
+        씬 렌더러 초기화
+        
+        Args:
+            scene (dict): 씬 정보 딕셔너리 (id, text, type 포함)
+            project_path (str or Path, optional): 프로젝트 경로 (없으면 현재 로드된 프로젝트 사용)
+                                                  백그라운드 렌더링처럼 UI의 현재 프로젝트와 무관하게 렌더링할 때 사용
+        """
+        self.scene = scene
+        self.project_path = Path(project_path) if project_path else project_manager.get_project_path()
+        self.scene_id = scene.get('id')
+        self.scene_type = scene.get('type', 'type1')
+        self.fps = project_manager.get_fps()
+        self.screen_size = project_manager.get_screen_size()
+
+        # 타임라인 레이어 (추가된 순서가 z 순서)
+        self.layers = []
+        # 프로젝트 단위 사운드트랙 조립용 오디오 배치 정보와 씬 길이
+        self.audio_placements = []
+        self.duration = None
+        # write_videofile에 넘길 proglog 로거 (VideoGenerator가 RenderProgressTracker의 로거로 교체)
+        self.progress_logger = "bar"
+        # 같은 프레임으로 함께 인코딩할 출력 대상 (OutputTarget 리스트)과 대상 이름별 씬 비디오 상대 경로
+        self.output_targets = []
+        self.target_paths = {}
+        # 인코딩 전에 미리 준비한 합성 자원 (prepare()에서 채우고 generate_video에서 사용 후 비움)
+        self.prepared = None
+    
+    def build_timeline(self) -> Optional[float]:
+        """
+        gen_* 메서드로 씬의 레이어를 추가하고 씬 길이를 반환 (각 씬 렌더러가 구현)
+        generate_video_structure를 직접 구현한 기존 렌더러는 그대로 동작합니다.
+
+        Returns:
+            float: 씬 길이(초) 또는 None (생성할 수 없을 때)
+        """
+        pass
+
+    def get_timeline(self) -> Optional[Timeline]:
+        """
+        씬 타임라인 생성 (프레임 계산 없이 레이어 구조만 만듦)
+
+        Returns:
+            Timeline: 씬 타임라인 또는 None (실패 시)
+        """
+        if self.duration is None:
+            self.layers = []
+            self.audio_placements = []
+            try:
+                with render_tracer.span("build_timeline", phase="timeline"):
+                    self.duration = self.build_timeline()
+            except Exception as e:
+                print(f"타임라인 생성 중 오류 발생: {e}")
+                return None
+        if not self.duration:
+            return None
+        return Timeline(
+            scene_id=self.scene_id,
+            scene_type=self.scene_type,
+            duration=self.duration,
+            fps=self.fps,
+            screen_size=tuple(self.screen_size),
+            layers=list(self.layers)
+        )
+
+    def generate_video_structure(self) -> Optional[str]:
+        """
+        씬 비디오 파일 생성 (타임라인 생성 → 컴포지터로 인코딩)
+
+        Returns:
+            str: 생성된 비디오의 상대 경로 또는 None (실패 시)
+        """
+        if self.get_timeline() is None:
+            return None
+        return self.generate_video(max_duration=self.duration)
+    
+    def get_field(self, field: str, default=None):
+        """
+        씬의 필드 값 가져오기 (편의 메서드)
+        
+        Args:
+            field (str): 필드명
+            default: 기본값
+            
+        Returns:
+            필드 값 또는 default
+        """
+        return self.scene.get(field, default)
+
+
+    def get_asset_path(self, relative_path: str) -> Optional[Path]:
+        """
+        프로젝트 기준 상대 경로를 전체 경로로 변환
+        
+        Args:
+            relative_path (str): 상대 경로 (예: "audio/filename.mp3")
+            
+        Returns:
+            Path: 전체 경로 또는 None (프로젝트 경로가 없을 때)
+        """
+        if not self.project_path:
+            return None
+        return self.project_path / relative_path
+
+    def get_frame_count(self) -> int:
+        """
+        인코딩된 씬 비디오의 프레임 수 반환 (MoviePy의 iter_frames와 동일한 계산)
+
+        Returns:
+            int: 프레임 수 (씬 길이가 정해지지 않았으면 0)
+        """
+        if not self.duration:
+            return 0
+        return int(self.duration * self.fps)
+
+    def get_preview_duration(self) -> Optional[float]:
+        """
+        미리보기 스크러버 범위로 사용할 씬 길이(초)
+
+        Returns:
+            float: 씬 길이 또는 None (타임라인을 만들 수 없을 때)
+        """
+        return frame_preview_service.get_duration(self.scene, project_path=self.project_path)
+
+    def get_preview_frame(self, t: float, width: Optional[int] = frame_preview_service.DEFAULT_WIDTH) -> Optional[bytes]:
+        """
+        t초의 프레임 하나만 합성한 미리보기 이미지 (인코딩 없이, 최근 프레임은 캐시 사용)
+
+        Args:
+            t (float): 시각(초)
+            width (int, optional): 미리보기 너비 (None이면 원본 크기)
+
+        Returns:
+            bytes: JPEG 이미지 바이트 또는 None (실패 시)
+        """
+        return frame_preview_service.get_frame_image(self.scene, t, project_path=self.project_path, width=width)
+
+    def get_preview_audio(self, audio_format: str = "wav") -> Optional[AudioPreview]:
+        """
+        비디오 렌더링 없이 씬의 오디오 배치만 믹싱한 미리듣기 (같은 오디오 지문은 캐시 사용)
+
+        Args:
+            audio_format (str): 형식 ("wav" 또는 "opus")
+
+        Returns:
+            AudioPreview: 미리듣기 결과 또는 None (오디오가 없거나 실패 시)
+        """
+        return audio_preview_service.get_preview(self.scene, project_path=self.project_path, audio_format=audio_format)
+
+    def get_target_paths(self) -> Dict[str, str]:
+        """출력 대상 이름별 씬 비디오 상대 경로"""
+        return {target.name: target.get_scene_relative_path(self.scene_id) for target in self.output_targets}
+
+    def prepare(self) -> bool:
+        """
+        인코딩 전에 할 수 있는 작업(타임라인 생성, 오디오 디코딩, 이미지 로드/리사이즈, 텍스트 렌더링)을 미리 수행
+        앞 씬이 인코딩되는 동안 별도 스레드에서 호출할 수 있습니다. (결과는 generate_video에서 사용)
+
+        Returns:
+            bool: 준비된 자원이 있는지 여부 (False여도 generate_video는 그대로 동작)
+        """
+        try:
+            _, output_path, _ = project_manager.get_output_path(self.scene_id, self.project_path)
+            timeline = self.get_timeline() if output_path else None
+            compositor = get_compositor()
+            if timeline is None or compositor is None or chunked_encoder.should_chunk(timeline, compositor):
+                return False
+            work_dir = self.project_path / "temp" if self.project_path else None
+            target_paths = self.get_target_paths()
+            targets = [(target, self.project_path / target_paths[target.name]) for target in self.output_targets]
+            self.prepared = compositor.prepare(timeline, output_path, work_dir=work_dir, targets=targets or None)
+        except Exception as e:
+            print(f"씬 준비 중 오류 발생: {e}")
+            self.prepared = None
+        return self.prepared is not None
+
+    def release_prepared(self):
+        """사용하지 않은 준비 자원 해제"""
+        prepared, self.prepared = self.prepared, None
+        if prepared is not None:
+            prepared.close()
+
+    @render_tracer.traced(phase="encode")
+    def generate_video(self, max_duration) -> str:
+        self.duration = max_duration
+        # 미리 준비한 자원은 한 번만 사용 (실패해도 아래 finally에서 해제)
+        prepared, self.prepared = self.prepared, None
+        try:
+            # project_manager를 통해 output 경로 가져오기
+            output_folder, output_path, relative_path = project_manager.get_output_path(self.scene_id, self.project_path)
+            if not output_path:
+                return None
+
+            timeline = self.get_timeline()
+            if timeline is None:
+                return None
+            # 씬 비디오 옆에 타임라인 저장 (확인/비교/다른 백엔드에서 다시 렌더링용)
+            timeline.save(Path(output_path).with_suffix(".timeline.json"))
+
+            # 타임라인을 컴포지터 백엔드로 합성/인코딩 (중간 파일은 프로젝트 temp 폴더)
+            compositor = get_compositor()
+            if compositor is None:
+                print(f"알 수 없는 컴포지터: {get_compositor_name()}")
+                return None
+            work_dir = self.project_path / "temp" if self.project_path else None
+
+            # 출력 대상별 씬 비디오 경로 (프레임은 한 번만 합성하고 대상별 인코더로 나눠 보냄)
+            target_paths = self.get_target_paths()
+            targets = [(target, self.project_path / target_paths[target.name]) for target in self.output_targets]
+            if chunked_encoder.should_chunk(timeline, compositor):
+                # 긴 씬은 시간 청크로 나눠 워커 프로세스에서 병렬 인코딩 후 스트림 복사로 이어붙임
+                rendered = chunked_encoder.render(timeline, output_path, compositor, logger=self.progress_logger,
+                                                  targets=targets or None)
+            else:
+                # 준비된 자원은 컴포지터가 렌더링 후 해제
+                handed_over, prepared = prepared, None
+                rendered = compositor.render(timeline, output_path, work_dir=work_dir, logger=self.progress_logger,
+                                             targets=targets or None, prepared=handed_over)
+            if not rendered:
+                return None
+            self.target_paths = target_paths
+
+            # 상대 경로 반환
+            return relative_path
+
+        except Exception as e:
+            print(f"비디오 생성 중 오류 발생: {e}")
+            return None
+        finally:
+            if prepared is not None:
+                prepared.close()
+
+    def _add_layer(self, layer: Layer) -> Layer:
+        """레이어 추가 (z는 추가된 순서)"""
+        layer.z = len(self.layers)
+        self.layers.append(layer)
+        return layer
+
+    @staticmethod
+    def _get_end(start, end, duration):
+        """end가 -1이면 start + duration"""
+        return end if end != -1 else start + duration
+
+    def gen_color_clip(self, color=(0, 0, 0), start=0, end=-1, duration=1, size=None):
+        """
+        단색 배경 레이어 생성
+
+        Args:
+            color (tuple): RGB 색상
+            start (float): 시작 시간
+            end (float): 종료 시간 (-1이면 duration 사용)
+            duration (float): 지속 시간
+            size (tuple, optional): 크기 (없으면 화면 크기)
+
+        Returns:
+            Layer: 생성된 레이어
+        """
+        return self._add_layer(Layer(
+            kind=LayerKind.COLOR,
+            start=start,
+            end=self._get_end(start, end, duration),
+            source={"color": list(color)},
+            position=("center", "center"),
+            size=tuple(size or self.screen_size)
+        ))
+
+    @render_tracer.traced(phase="audio_clip")
+    def gen_audio_clip(self, field, start=0):
+        audio_path = self.scene.get(field, None)
+        if not audio_path:
+            return None
+
+        full_audio_path = self.get_asset_path(audio_path)
+        if full_audio_path and full_audio_path.exists():
+            # 디코딩된 PCM 캐시(.npy, mmap)로 길이 계산 - 반복 렌더링 시 ffmpeg 디코딩 없음
+            pcm = audio_cache_service.load(full_audio_path)
+            if pcm is None:
+                return None
+            duration = pcm.shape[0] / audio_cache_service.DEFAULT_FPS
+            self.audio_placements.append(AudioPlacement(path=str(full_audio_path), start=start))
+            return self._add_layer(Layer(
+                kind=LayerKind.AUDIO,
+                start=start,
+                end=start + duration,
+                source={"path": str(full_audio_path)}
+            ))
+
+        return None
+
+    @render_tracer.traced(phase="image_clip")
+    def gen_image_clip(self, field=None, path=None, start=0, end= -1, duration= 1, resized_width = -1, resized_height=-1, position=("center", "center")):
+        if not path:
+            image_path = self.scene.get(field, None)
+            if not image_path:
+                return None
+            else:
+                full_path = self.get_asset_path(image_path)
+        else:
+            full_path = path
+
+
+        if full_path:
+            return self._add_layer(Layer(
+                kind=LayerKind.IMAGE,
+                start=start,
+                end=self._get_end(start, end, duration),
+                source={"path": str(full_path)},
+                position=position,
+                size=(resized_width if resized_width != -1 else None,
+                      resized_height if resized_height != -1 else None)
+            ))
+
+        return None
+
+    @render_tracer.traced(phase="text_clip")
+    def gen_text_clip(self, text=None, field=None, font=FontUtils.MAPLESTORY_LIGHT,font_size=80,color='white',method='caption',margin=(0,0),size=(1080,1920),start=0, end= -1, duration= 1, position=("center", "center")):
+        if not text:
+            text = self.scene.get(field, None)
+        if not text:
+            return None
+
+        return self._add_layer(Layer(
+            kind=LayerKind.TEXT,
+            start=start,
+            end=self._get_end(start, end, duration),
+            source={
+                "text": text,
+                "font": font,
+                "font_size": font_size,
+                "color": color,
+                "method": method,
+                "margin": list(margin)
+            },
+            position=position,
+            size=tuple(size)
+        ))
+
+    @render_tracer.traced(phase="rich_text_clip")
+    def gen_rich_text_clip(
+        self,
+        text=None,
+        field=None,
+        font=FontUtils.MAPLESTORY_LIGHT,
+        font_size=80,
+        color='white',
+        screen_size=(1080, 1920),
+        text_width=1080,
+        margin=(0, 0),
+        text_align="center",
+        start=0,
+        end=-1,
+        duration=1,
+        position=(540, 960)
+    ):
+        """
+        텍스트를 이미지로 그려서 배치하는 레이어 생성 (이미지는 컴포지터가 렌더링할 때 그림)
+
+        Args:
+            text (str, optional): 텍스트 (없으면 field에서 가져옴)
+            field (str, optional): 씬 필드명
+            font (str): 폰트 경로
+            font_size (int): 폰트 크기
+            color (str): 텍스트 색상
+            screen_size (tuple): 캔버스 크기 (width, height) - 전체 이미지 크기
+            text_width (int): 텍스트 한 줄 너비
+            margin (tuple): 여백 (x, y) - 현재 미사용
+            text_align (str): 텍스트 정렬 ("center", "left", "right")
+            start (float): 시작 시간
+            end (float): 종료 시간 (-1이면 duration 사용)
+            duration (float): 지속 시간
+            position (tuple): 캔버스 내에서 텍스트를 그릴 중점 위치 (x, y)
+                             텍스트는 position - (text_width/2, text_height/2)부터 그려짐
+                             이미지는 center로 배치됨
+
+        Returns:
+            Layer: 생성된 레이어 또는 None
+        """
+        # 텍스트 가져오기
+        if not text:
+            text = self.scene.get(field, None) if field else None
+
+        if not text:
+            return None
+
+        # position은 텍스트를 그릴 때 적용하므로 레이어는 center로 배치
+        return self._add_layer(Layer(
+            kind=LayerKind.RICH_TEXT,
+            start=start,
+            end=self._get_end(start, end, duration),
+            source={
+                "text": text,
+                "font": font,
+                "font_size": font_size,
+                "color": color,
+                "text_width": text_width,
+                "text_align": text_align,
+                "text_position": list(position)
+            },
+            position="center",
+            size=tuple(screen_size)
+        ))
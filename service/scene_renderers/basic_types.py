@@ -0,0 +1,46 @@
+from service.scene_renderers.base_scene_renderer import BaseSceneRenderer
+
+
+class Type1Renderer(BaseSceneRenderer):
+    """Type 1 씬의 비디오 생성 클래스"""
+    
+    def generate_video_structure(self) -> str:
+        """
+        Type 1 씬의 비디오 파일 생성
+        기본 구현을 사용 (1080x1920, 가운데 텍스트)
+        
+        Returns:
+            str: 생성된 비디오 파일 경로 또는 None
+        """
+        # 기본 구현 사용 (부모 클래스의 메서드 호출)
+        return super().generate_video_structure()
+
+
+class Type2Renderer(BaseSceneRenderer):
+    """Type 2 씬의 비디오 생성 클래스"""
+    
+    def generate_video_structure(self) -> str:
+        """
+        Type 2 씬의 비디오 파일 생성
+        기본 구현을 사용 (1080x1920, 가운데 텍스트)
+        
+        Returns:
+            str: 생성된 비디오 파일 경로 또는 None
+        """
+        # 기본 구현 사용 (부모 클래스의 메서드 호출)
+        return super().generate_video_structure()
+
+
+class Type3Renderer(BaseSceneRenderer):
+    """Type 3 씬의 비디오 생성 클래스"""
+    
+    def generate_video_structure(self) -> str:
+        """
+        Type 3 씬의 비디오 파일 생성
+        기본 구현을 사용 (1080x1920, 가운데 텍스트)
+        
+        Returns:
+            str: 생성된 비디오 파일 경로 또는 None
+        """
+        # 기본 구현 사용 (부모 클래스의 메서드 호출)
+        return super().generate_video_structure()
@@ -0,0 +1,32 @@
+from typing import Dict, Any
+from service.scene_renderers.base_scene_renderer import BaseSceneRenderer
+from utils import FontUtils
+
+y_variabtion = 300
+
+class DimangoTypeRenderer(BaseSceneRenderer):
+    """DimangoType 씬의 비디오 생성 클래스"""
+    def __init__(self, scene: Dict[str, Any], project_path=None):
+        super().__init__(scene, project_path)
+
+    def build_timeline(self) -> float:
+        title_audio_clip = self.gen_audio_clip("title_audio", 0)        
+        max_duration = round(title_audio_clip.end)
+        print("max_duration : {max_duration}")
+       
+        base_clip = self.gen_color_clip(color=(255, 255, 255), duration=max_duration)
+
+        
+        # bg_clip = self.gen_image_clip(path="assets/balance/christmas_bal_title_bg.png",
+        #                                duration=max_duration, resized_width=1080, resized_height=1080, 
+        #                                position=("center", y_variabtion))
+       
+    
+        title_text_clip = self.gen_rich_text_clip(field="title", font=FontUtils.MAPLESTORY_BOLD,color='black',text_align="center",start=0,duration=max_duration, position=(540, 400))
+                    
+        
+        self.gen_image_clip(field="center_image", start=0.5, duration=max_duration, resized_width=300, position=("center", 400+y_variabtion))
+        
+        
+        # 씬 길이 반환
+        return max_duration
@@ -0,0 +1,374 @@
+"""
+저장소 정리(GC) 서비스
+렌더링/TTS가 만드는 중간 파일이 끝없이 쌓이지 않도록 폴더별 용량 한도(byte budget)를 넘으면
+오래 쓰지 않은 파일부터(LRU) 지웁니다. 씬이 아직 참조하는 파일은 절대 지우지 않습니다.
+
+정리 대상과 참조 판단:
+- 프로젝트 temp/ (rich_text 이미지): 현재 씬들의 타임라인(output/<씬 ID>_output.timeline.json)이 쓰는 이미지는 참조 중
+- 프로젝트 output/ (씬 비디오): 렌더링 매니페스트에 있지만 video.json에서 삭제된 씬의 파일만 정리 대상
+  (최종 비디오, 매니페스트, 알 수 없는 파일은 항상 보존)
+- tts_outputs/ (TTS 캐시): 에셋 저장소 파일이 프로젝트에서 참조 중이면(또는 알 수 없는 하드링크가 있으면) 보존
+  (저장소 파일과만 링크된 파일은 지운 뒤 저장소 파일도 함께 정리)
+
+- 최근 MIN_AGE_SECONDS 안에 쓰거나 읽은 파일과 렌더링 중인 프로젝트는 건드리지 않습니다.
+- 한도는 설정 "storage_gc_budgets"({"temp", "output", "tts_outputs"}: 바이트)로 바꿀 수 있습니다.
+- 설정 "storage_gc"가 켜져 있으면 앱이 백그라운드에서 "storage_gc_interval"초(기본값 3600)마다 실행합니다.
+
+보고만 하기(dry-run): python -m service.storage_gc --dry-run
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from settings import Settings
+
+# 폴더별 기본 용량 한도 (바이트) - temp/output은 프로젝트마다, tts_outputs는 전체
+DEFAULT_BUDGETS = {
+    "temp": 200 * 1024 * 1024,
+    "output": 2 * 1024 * 1024 * 1024,
+    "tts_outputs": 1024 * 1024 * 1024
+}
+
+# 이보다 최근에 쓰거나 읽은 파일은 사용 중일 수 있으므로 지우지 않음
+MIN_AGE_SECONDS = 10 * 60
+
+TTS_OUTPUT_DIR = Path("tts_outputs")
+
+
+@dataclass
+class GCFile:
+    """정리 후보 파일 정보 (경로, 크기, 마지막 사용 시각, 참조 여부)"""
+    path: Path
+    size: int
+    last_used: float
+    referenced: bool = False
+
+
+@dataclass
+class GCReport:
+    """
+    폴더 하나의 정리 결과 구조체
+    용량 한도, 전체/참조 중 크기, 삭제한(dry-run이면 삭제할) 파일 목록을 포함
+    """
+    directory: str
+    budget: int
+    total_bytes: int = 0
+    referenced_bytes: int = 0
+    deleted: List[Tuple[str, int]] = field(default_factory=list)
+    dry_run: bool = False
+
+    @property
+    def freed_bytes(self) -> int:
+        return sum(size for _, size in self.deleted)
+
+    def format_message(self) -> str:
+        """보고 메시지 (예: "projects/a/temp: 250.0/200.0 MB, 참조 12.0 MB → 3개 삭제 (52.1 MB)")"""
+        action = "삭제 예정" if self.dry_run else "삭제"
+        return (f"{self.directory}: {_mb(self.total_bytes)}/{_mb(self.budget)} MB, 참조 {_mb(self.referenced_bytes)} MB"
+                f" → {len(self.deleted)}개 {action} ({_mb(self.freed_bytes)} MB)")
+
+
+def _mb(size: int) -> str:
+    return f"{size / 1024 / 1024:.1f}"
+
+
+def _scan(folder: Path) -> List[GCFile]:
+    """폴더 아래 파일 목록 (마지막 사용 시각 = 수정/접근 시각 중 늦은 값)"""
+    files = []
+    if not folder.exists():
+        return files
+    for path in folder.rglob("*"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if path.is_file():
+            files.append(GCFile(path=path, size=stat.st_size, last_used=max(stat.st_mtime, stat.st_atime)))
+    return files
+
+
+class StorageGC:
+    """폴더별 용량 한도와 LRU로 중간 파일을 정리하는 클래스"""
+
+    def __init__(self):
+        """StorageGC 초기화"""
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._run_lock = threading.Lock()
+        self.last_reports: List[GCReport] = []
+        self.last_run_at: Optional[float] = None
+
+    @staticmethod
+    def get_budget(name: str) -> int:
+        """폴더 종류별 용량 한도 (설정 "storage_gc_budgets"가 기본값보다 우선)"""
+        budgets = Settings.get("storage_gc_budgets", {}) or {}
+        return int(budgets.get(name, DEFAULT_BUDGETS[name]))
+
+    @staticmethod
+    def evict(files: List[GCFile], budget: int, dry_run: bool = False, now: Optional[float] = None) -> List[GCFile]:
+        """
+        전체 크기가 한도 이하가 될 때까지 참조되지 않은 파일을 오래된 순서로 삭제
+
+        Args:
+            files (list): 폴더의 파일 목록
+            budget (int): 용량 한도 (바이트)
+            dry_run (bool): True면 지우지 않고 대상만 반환
+            now (float, optional): 기준 시각 (최근 사용 파일 보호용)
+
+        Returns:
+            list: 삭제한(dry-run이면 삭제할) 파일 목록
+        """
+        total = sum(item.size for item in files)
+        if total <= budget:
+            return []
+        cutoff = (now or time.time()) - MIN_AGE_SECONDS
+        candidates = sorted((item for item in files if not item.referenced and item.last_used < cutoff),
+                            key=lambda item: item.last_used)
+        deleted = []
+        for item in candidates:
+            if total <= budget:
+                break
+            if not dry_run:
+                try:
+                    item.path.unlink()
+                except OSError as e:
+                    print(f"[STORAGE_GC] 삭제 오류: {item.path} ({e})")
+                    continue
+            total -= item.size
+            deleted.append(item)
+        return deleted
+
+    def _report(self, directory, budget: int, files: List[GCFile], dry_run: bool) -> Tuple[GCReport, List[GCFile]]:
+        deleted = self.evict(files, budget, dry_run=dry_run)
+        report = GCReport(
+            directory=str(directory),
+            budget=budget,
+            total_bytes=sum(item.size for item in files),
+            referenced_bytes=sum(item.size for item in files if item.referenced),
+            deleted=[(str(item.path), item.size) for item in deleted],
+            dry_run=dry_run
+        )
+        return report, deleted
+
+    @staticmethod
+    def get_live_scene_ids(project_path: Path) -> Optional[Set[str]]:
+        """video.json의 씬 ID 목록 (읽을 수 없으면 None - 이때는 아무것도 지우지 않음)"""
+        from service.scene_manager import SceneManager
+        video_json_path = project_path / "video.json"
+        if not video_json_path.exists():
+            return None
+        scenes = SceneManager(video_json_path).get_video_data().get("scenes", [])
+        return {scene.get("id") for scene in scenes}
+
+    @staticmethod
+    def get_referenced_temp_files(project_path: Path, scene_ids: Set[str]) -> Set[str]:
+        """현재 씬들의 타임라인이 참조하는 temp/ 파일 이름"""
+        from service.compositors.base_compositor import BaseCompositor
+        from service.timeline import LayerKind, Timeline
+        referenced = set()
+        for scene_id in scene_ids:
+            timeline_path = project_path / "output" / f"{scene_id}_output.timeline.json"
+            timeline = Timeline.load(timeline_path) if timeline_path.exists() else None
+            if timeline is None:
+                continue
+            for layer in timeline.layers:
+                if layer.kind == LayerKind.RICH_TEXT:
+                    referenced.add(BaseCompositor.get_rich_text_filename(layer, scene_id))
+        return referenced
+
+    def collect_project(self, project_path, dry_run: bool = False) -> List[GCReport]:
+        """
+        프로젝트 하나의 temp/, output/ 정리
+
+        Args:
+            project_path (str or Path): 프로젝트 경로
+            dry_run (bool): True면 보고만 함
+
+        Returns:
+            List[GCReport]: 폴더별 정리 결과 (씬 목록을 읽을 수 없으면 빈 리스트)
+        """
+        from service.render_manifest import RenderManifest
+
+        project_path = Path(project_path)
+        scene_ids = self.get_live_scene_ids(project_path)
+        if scene_ids is None:
+            return []
+        reports = []
+
+        # temp/: 현재 타임라인이 쓰는 rich_text 이미지는 참조 중
+        temp_files = _scan(project_path / "temp")
+        if temp_files:
+            referenced = self.get_referenced_temp_files(project_path, scene_ids)
+            for item in temp_files:
+                item.referenced = item.path.name in referenced
+            reports.append(self._report(project_path / "temp", self.get_budget("temp"), temp_files, dry_run)[0])
+
+        # output/: 매니페스트에 남아 있지만 삭제된 씬의 파일만 정리 대상
+        output_files = _scan(project_path / "output")
+        if output_files:
+            manifest = RenderManifest(project_path)
+            stale_scene_ids = set(manifest.get_entries()) - scene_ids
+            for item in output_files:
+                scene_id = item.path.name.split("_output", 1)[0] if "_output" in item.path.name else None
+                item.referenced = scene_id not in stale_scene_ids
+            report, deleted = self._report(project_path / "output", self.get_budget("output"), output_files, dry_run)
+            reports.append(report)
+            if not dry_run:
+                # 씬 비디오가 지워진 씬은 매니페스트에서도 삭제
+                for scene_id in {item.path.name.split("_output", 1)[0] for item in deleted}:
+                    if not (project_path / "output" / f"{scene_id}_output.mp4").exists():
+                        manifest.forget(scene_id)
+        return reports
+
+    def collect_tts_outputs(self, dry_run: bool = False) -> Optional[GCReport]:
+        """
+        전역 tts_outputs/ 정리
+        에셋 저장소와 하드링크로 공유 중인 파일은 저장소 참조(refs)로 판단합니다.
+        프로젝트가 참조하는 저장소 파일이면 지워도 공간이 생기지 않으므로 보존하고,
+        참조가 없는 저장소 파일과만 링크된 파일은 지운 뒤 저장소 파일도 함께 삭제합니다.
+
+        Args:
+            dry_run (bool): True면 보고만 함
+
+        Returns:
+            GCReport: 정리 결과 또는 None (폴더가 없을 때)
+        """
+        from service.blob_store import blob_store
+
+        files = _scan(TTS_OUTPUT_DIR)
+        if not files:
+            return None
+        inode_digests = None
+        orphan_digests = {}     # 참조 없는 저장소 파일과만 링크된 TTS 파일 → 해시
+        for item in files:
+            try:
+                stat = item.path.stat()
+            except OSError:
+                item.referenced = True
+                continue
+            if stat.st_nlink <= 1:
+                continue
+            if inode_digests is None:
+                inode_digests = blob_store.get_inode_digests()
+            digest = inode_digests.get((stat.st_dev, stat.st_ino))
+            if digest is None or stat.st_nlink > 2 or blob_store.get_refcount(digest):
+                # 프로젝트가 참조하는 저장소 파일이거나 알 수 없는 하드링크
+                item.referenced = True
+            else:
+                orphan_digests[item.path] = digest
+        report, deleted = self._report(TTS_OUTPUT_DIR, self.get_budget("tts_outputs"), files, dry_run)
+        if not dry_run:
+            digests = [orphan_digests[item.path] for item in deleted if item.path in orphan_digests]
+            if digests:
+                blob_store.collect(digests)
+        return report
+
+    @staticmethod
+    def _get_busy_projects() -> Set[str]:
+        """대기/실행 중인 렌더링 작업의 프로젝트 (절대 경로)"""
+        from service.render_job_queue import RenderJobStatus, render_job_queue
+        jobs = render_job_queue.list_jobs(statuses=RenderJobStatus.ACTIVE, limit=1000)
+        return {os.path.abspath(job.project_path) for job in jobs}
+
+    def run(self, dry_run: bool = False, project_paths: Optional[List] = None) -> List[GCReport]:
+        """
+        전체 정리 실행 (프로젝트 목록은 프로젝트 카탈로그 사용, 렌더링 중인 프로젝트는 건너뜀)
+
+        Args:
+            dry_run (bool): True면 지우지 않고 보고만 함
+            project_paths (list, optional): 정리할 프로젝트 경로 (없으면 모든 프로젝트)
+
+        Returns:
+            List[GCReport]: 폴더별 정리 결과
+        """
+        from service.project_catalog import project_catalog
+
+        with self._run_lock:
+            if project_paths is None:
+                entries, _ = project_catalog.query(limit=None, refresh_stats=False)
+                project_paths = [entry.path for entry in entries]
+            busy = self._get_busy_projects()
+
+            reports = []
+            for project_path in project_paths:
+                if os.path.abspath(project_path) in busy:
+                    continue
+                try:
+                    project_reports = self.collect_project(project_path, dry_run=dry_run)
+                except Exception as e:
+                    print(f"[STORAGE_GC] 프로젝트 정리 오류: {project_path} ({e})")
+                    continue
+                reports.extend(project_reports)
+                if not dry_run and any(report.deleted for report in project_reports):
+                    project_catalog.invalidate(project_path)
+
+            tts_report = self.collect_tts_outputs(dry_run=dry_run)
+            if tts_report:
+                reports.append(tts_report)
+
+            self.last_reports = reports
+            self.last_run_at = time.time()
+            freed = sum(report.freed_bytes for report in reports)
+            if freed:
+                action = "정리 가능" if dry_run else "정리"
+                print(f"[STORAGE_GC] {sum(len(report.deleted) for report in reports)}개 파일 {action} ({_mb(freed)} MB)")
+            return reports
+
+    def start(self, interval: float = 3600.0) -> bool:
+        """
+        백그라운드 정리 시작 (이미 실행 중이면 아무것도 하지 않음)
+
+        Args:
+            interval (float): 실행 간격(초)
+
+        Returns:
+            bool: 새로 시작했는지 여부
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, args=(interval,), name="storage-gc", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """백그라운드 정리 중지"""
+        self._stop.set()
+
+    def _loop(self, interval: float):
+        while not self._stop.wait(timeout=interval):
+            try:
+                self.run()
+            except Exception as e:
+                print(f"[STORAGE_GC] 정리 오류: {e}")
+
+
+# 싱글톤 인스턴스 생성 (편의를 위해)
+storage_gc = StorageGC()
+
+
+def main(argv=None) -> int:
+    """저장소 정리 CLI"""
+    parser = argparse.ArgumentParser(description="중간 파일(temp, tts_outputs, 삭제된 씬 비디오)을 정리합니다.")
+    parser.add_argument("--dry-run", action="store_true", help="지우지 않고 정리 대상만 보고")
+    parser.add_argument("--project", action="append", dest="project_paths", metavar="PATH",
+                        help="정리할 프로젝트 경로 (여러 번 지정 가능, 없으면 모든 프로젝트)")
+    args = parser.parse_args(argv)
+
+    reports = storage_gc.run(dry_run=args.dry_run, project_paths=args.project_paths)
+    for report in reports:
+        print(report.format_message())
+        if args.dry_run:
+            for path, size in report.deleted:
+                print(f"   - {path} ({_mb(size)} MB)")
+    print(f"합계: {sum(len(report.deleted) for report in reports)}개, {_mb(sum(report.freed_bytes for report in reports))} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""
+렌더링 텔레메트리 저장소
+성능 대시보드(페이지 2)에서 사용할 측정값을 SQLite(telemetry.db)에 모읍니다.
+
+- 캐시 적중/실패 (render: 렌더링 매니페스트, text: 텍스트 이미지, audio: 디코딩된 PCM, tts: TTS 결과,
+  frame: 단일 프레임 미리보기, audio_preview: 오디오 미리듣기)
+  조회마다 DB에 쓰지 않도록 메모리에서 합산한 뒤 FLUSH_INTERVAL마다(그리고 렌더링이 끝날 때, 종료 시) 기록합니다.
+- 측정값 샘플 (TTS 지연 시간, 렌더링 단계별 시간, 씬별 렌더링 시간, 인코딩 fps)
+  렌더링 단계/씬/fps는 렌더링 트레이스가 끝날 때 트레이스의 span에서 계산해 기록합니다.
+- RETENTION_DAYS보다 오래된 기록은 기록할 때 함께 지웁니다.
+"""
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.sqlite_utils import SQLiteStore
+
+# 메모리에 모은 값을 DB에 기록하는 간격(초)
+FLUSH_INTERVAL = 30.0
+# 기록 보관 기간(일)
+RETENTION_DAYS = 30
+# 씬 인코딩 전체 시간을 재는 가장 바깥 span (안쪽의 chunked_encode/encode_chunk도 phase가 "encode"이므로 이것만 사용)
+ENCODE_SPAN_NAME = "generate_video"
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """
+    백분위수 (선형 보간)
+
+    Args:
+        values (list): 값 리스트
+        q (float): 백분위 (0 ~ 100)
+
+    Returns:
+        float: 백분위수 또는 None (값이 없을 때)
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class Telemetry(SQLiteStore):
+    """캐시 적중 카운터와 측정값 샘플을 모아 SQLite에 저장하고 조회하는 클래스"""
+
+    DB_LABEL = "[TELEMETRY] 텔레메트리 DB"
+
+    def __init__(self, db_path: str = "telemetry.db"):
+        """
+        Telemetry 초기화
+
+        Args:
+            db_path (str): 텔레메트리 DB 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._samples: List[Tuple[str, float, Optional[str], float]] = []
+        self._last_flush = time.time()
+        self._init_db()
+        atexit.register(self.flush)
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        """카운터/샘플 테이블 생성"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_counts (
+                cache TEXT NOT NULL,
+                hits INTEGER NOT NULL,
+                misses INTEGER NOT NULL,
+                recorded_at REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS samples (
+                name TEXT NOT NULL,
+                value REAL NOT NULL,
+                attrs TEXT,
+                recorded_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_counts_time ON cache_counts (recorded_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_samples_name_time ON samples (name, recorded_at)")
+
+    def count_cache(self, cache: str, hit: bool):
+        """
+        캐시 조회 결과 기록 (메모리에서 합산)
+
+        Args:
+            cache (str): 캐시 이름 ("render", "text", "audio", "tts", "frame", "audio_preview")
+            hit (bool): 적중 여부
+        """
+        with self._lock:
+            self._counts[(cache, bool(hit))] += 1
+        self._maybe_flush()
+
+    def observe(self, name: str, value: float, **attrs):
+        """
+        측정값 샘플 기록 (메모리에 모았다가 기록)
+
+        Args:
+            name (str): 측정값 이름 (예: "tts_latency", "scene_seconds")
+            value (float): 값
+            **attrs: 추가 속성 (씬 타입, 백엔드 등)
+        """
+        with self._lock:
+            self._samples.append((name, float(value), json.dumps(attrs, ensure_ascii=False) if attrs else None,
+                                  time.time()))
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if time.time() - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """메모리에 모은 카운터/샘플을 DB에 기록하고 오래된 기록 삭제"""
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            samples, self._samples = self._samples, []
+            self._last_flush = time.time()
+        if not counts and not samples:
+            return
+        now = time.time()
+        caches = sorted({cache for cache, _ in counts})
+        try:
+            with self._db() as conn:
+                conn.executemany(
+                    "INSERT INTO cache_counts (cache, hits, misses, recorded_at) VALUES (?, ?, ?, ?)",
+                    [(cache, counts[(cache, True)], counts[(cache, False)], now) for cache in caches]
+                )
+                conn.executemany("INSERT INTO samples (name, value, attrs, recorded_at) VALUES (?, ?, ?, ?)", samples)
+                cutoff = now - RETENTION_DAYS * 86400
+                conn.execute("DELETE FROM cache_counts WHERE recorded_at < ?", (cutoff,))
+                conn.execute("DELETE FROM samples WHERE recorded_at < ?", (cutoff,))
+        except Exception as e:
+            print(f"[TELEMETRY] 텔레메트리 저장 오류: {e}")
+
+    def record_trace(self, trace):
+        """
+        끝난 렌더링 트레이스에서 단계별 시간, 씬별 렌더링 시간, 씬별 인코딩 fps를 계산해 기록
+
+        Args:
+            trace (RenderTrace): 렌더링 트레이스
+        """
+        data = trace.to_dict()
+        project = Path(str(data["meta"].get("project") or "")).name
+        render_id = data["render_id"]
+        for phase, item in trace.summarize().items():
+            self.observe("phase_seconds", item["wall"], phase=phase, project=project, render_id=render_id)
+
+        frames: Dict[str, int] = {}
+        encode_wall: Dict[str, float] = {}
+        for span in data["spans"]:
+            scene_id = span.get("scene_id")
+            if span["name"] == "scene":
+                self.observe("scene_seconds", span["wall"], scene_id=scene_id,
+                             scene_type=span["attrs"].get("scene_type"), project=project, render_id=render_id)
+            elif span["name"] == ENCODE_SPAN_NAME and scene_id:
+                encode_wall[scene_id] = encode_wall.get(scene_id, 0.0) + span["wall"]
+            if scene_id and span["name"] in ("composite_frames", "chunked_encode") and span["attrs"].get("frames"):
+                frames[scene_id] = max(frames.get(scene_id, 0), int(span["attrs"]["frames"]))
+        for scene_id, frame_count in frames.items():
+            if encode_wall.get(scene_id):
+                self.observe("encode_fps", frame_count / encode_wall[scene_id], scene_id=scene_id,
+                             project=project, render_id=render_id)
+        self.flush()
+
+    def get_cache_stats(self, since: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+        """
+        캐시별 적중 통계 (메모리에 모은 값을 먼저 기록)
+
+        Args:
+            since (float, optional): 이 시각 이후 기록만 (없으면 전체)
+
+        Returns:
+            dict: {캐시 이름: {"hits", "misses", "hit_rate"}}
+        """
+        self.flush()
+        stats: Dict[str, Dict[str, float]] = {}
+        try:
+            with self._db() as conn:
+                rows = conn.execute(
+                    "SELECT cache, SUM(hits) AS hits, SUM(misses) AS misses FROM cache_counts "
+                    "WHERE recorded_at >= ? GROUP BY cache",
+                    (since or 0,)
+                ).fetchall()
+            for row in rows:
+                stats[row["cache"]] = {"hits": row["hits"], "misses": row["misses"]}
+        except Exception as e:
+            print(f"[TELEMETRY] 캐시 통계 조회 오류: {e}")
+        for item in stats.values():
+            total = item["hits"] + item["misses"]
+            item["hit_rate"] = item["hits"] / total if total else 0.0
+        return stats
+
+    def get_samples(self, name: str, since: Optional[float] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        측정값 샘플 조회 (오래된 순, 메모리에 모은 값을 먼저 기록)
+
+        Args:
+            name (str): 측정값 이름
+            since (float, optional): 이 시각 이후 기록만 (없으면 전체)
+            limit (int, optional): 최근 기록 최대 개수
+
+        Returns:
+            list: {"value", "recorded_at", 속성...} 딕셔너리 리스트
+        """
+        self.flush()
+        query = "SELECT value, attrs, recorded_at FROM samples WHERE name = ? AND recorded_at >= ? ORDER BY recorded_at DESC"
+        params: List[Any] = [name, since or 0]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        try:
+            with self._db() as conn:
+                rows = conn.execute(query, params).fetchall()
+        except Exception as e:
+            print(f"[TELEMETRY] 샘플 조회 오류: {e}")
+            return []
+        samples = []
+        for row in reversed(rows):
+            item = json.loads(row["attrs"]) if row["attrs"] else {}
+            item.update(value=row["value"], recorded_at=row["recorded_at"])
+            samples.append(item)
+        return samples
+
+
+# 전역 텔레메트리 인스턴스
+telemetry = Telemetry()
@@ -12,12 +12,14 @@ from pathlib import Path
 from typing import Optional, List, Tuple
 import re
 from utils import FontUtils
+from service.render_tracer import render_tracer
 
 
 class TextImageService:
     """텍스트를 이미지로 변환하는 서비스 클래스"""
     
     @classmethod
+    @render_tracer.traced(phase="text_rasterize")
     def create_text_image(
         cls,
         text: str,
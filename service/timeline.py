@@ -0,0 +1,197 @@
+"""
+씬 타임라인 (중간 표현)
+씬 렌더러의 gen_* 메서드는 MoviePy 클립 대신 직렬화 가능한 레이어(Layer)를 만들고,
+레이어들을 모은 타임라인(Timeline)을 컴포지터 백엔드(service.compositors)가 프레임으로 변환합니다.
+
+타임라인은 프레임을 계산하기 전에 확인/해시/비교/저장/전송할 수 있으므로
+캐시, 비용 추정, 분산 렌더링, 다른 컴포지터에서 같은 씬 설명을 사용할 수 있습니다.
+"""
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+TIMELINE_VERSION = 1
+
+
+class LayerKind:
+    """레이어 종류 상수"""
+    COLOR = "color"          # 단색 배경
+    IMAGE = "image"          # 이미지 파일
+    TEXT = "text"            # MoviePy TextClip 텍스트
+    RICH_TEXT = "rich_text"  # TextImageService로 그린 텍스트 이미지
+    AUDIO = "audio"          # 오디오 파일
+
+    VISUAL = (COLOR, IMAGE, TEXT, RICH_TEXT)
+
+
+@dataclass
+class Layer:
+    """
+    타임라인 레이어 구조체
+    소스 참조(source), 시간(start/end), 위치(position), 크기(size), 쌓는 순서(z)를 포함
+
+    - source: 종류별 소스 정보 (color: {"color"}, image: {"path"}, text/rich_text: {"text", "font", ...},
+      audio: {"path"})
+    - position: MoviePy with_position과 같은 형식 ("center" 또는 픽셀 좌표)
+    - size: image는 리사이즈 크기 (지정하지 않은 축은 None), text는 텍스트 상자 크기, color는 캔버스 크기
+    """
+    kind: str
+    start: float
+    end: float
+    source: Dict[str, Any] = field(default_factory=dict)
+    position: Any = ("center", "center")
+    size: Optional[Tuple[Optional[int], Optional[int]]] = None
+    z: int = 0
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def is_visual(self) -> bool:
+        """영상 레이어인지 여부 (오디오 제외)"""
+        return self.kind in LayerKind.VISUAL
+
+    def is_active(self, t: float) -> bool:
+        """t초에 보이는(재생되는) 레이어인지 여부"""
+        return self.start <= t < self.end
+
+    def to_dict(self) -> Dict[str, Any]:
+        return _jsonable(asdict(self))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Layer':
+        size = data.get("size")
+        position = data.get("position", ("center", "center"))
+        return cls(
+            kind=data["kind"],
+            start=data["start"],
+            end=data["end"],
+            source=dict(data.get("source", {})),
+            position=tuple(position) if isinstance(position, list) else position,
+            size=tuple(size) if size is not None else None,
+            z=data.get("z", 0)
+        )
+
+
+@dataclass
+class Timeline:
+    """
+    씬 하나의 타임라인 구조체
+    씬 정보, 길이, fps, 화면 크기, 레이어 리스트를 포함
+    """
+    scene_id: Optional[str]
+    scene_type: str
+    duration: float
+    fps: int
+    screen_size: Tuple[int, int]
+    layers: List[Layer] = field(default_factory=list)
+    version: int = TIMELINE_VERSION
+
+    @property
+    def frame_count(self) -> int:
+        """인코딩될 프레임 수 (MoviePy의 iter_frames와 동일한 계산)"""
+        return int(self.duration * self.fps)
+
+    @property
+    def visual_layers(self) -> List[Layer]:
+        """영상 레이어 (z 순서, 아래에서 위로)"""
+        return sorted((layer for layer in self.layers if layer.is_visual()), key=lambda layer: layer.z)
+
+    @property
+    def audio_layers(self) -> List[Layer]:
+        """오디오 레이어"""
+        return [layer for layer in self.layers if layer.kind == LayerKind.AUDIO]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "scene_id": self.scene_id,
+            "scene_type": self.scene_type,
+            "duration": self.duration,
+            "fps": self.fps,
+            "screen_size": list(self.screen_size),
+            "layers": [layer.to_dict() for layer in self.layers]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Timeline':
+        return cls(
+            scene_id=data.get("scene_id"),
+            scene_type=data.get("scene_type", "type1"),
+            duration=data["duration"],
+            fps=data["fps"],
+            screen_size=tuple(data["screen_size"]),
+            layers=[Layer.from_dict(item) for item in data.get("layers", [])],
+            version=data.get("version", TIMELINE_VERSION)
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, sort_keys=True)
+
+    def fingerprint(self) -> str:
+        """
+        타임라인 해시 (레이어가 참조하는 파일의 크기/수정 시각 포함)
+
+        Returns:
+            str: SHA-256 해시
+        """
+        files = {}
+        for layer in self.layers:
+            path = layer.source.get("path")
+            if path:
+                try:
+                    stat = Path(path).stat()
+                    files[path] = [stat.st_size, stat.st_mtime_ns]
+                except OSError:
+                    files[path] = None
+        payload = json.dumps({"timeline": self.to_dict(), "files": files}, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def save(self, path) -> bool:
+        """
+        타임라인을 JSON 파일로 저장
+
+        Args:
+            path (str or Path): 저장 경로
+
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            return True
+        except Exception as e:
+            print(f"[TIMELINE] 타임라인 저장 오류: {e}")
+            return False
+
+    @classmethod
+    def load(cls, path) -> Optional['Timeline']:
+        """
+        JSON 파일에서 타임라인 로드
+
+        Args:
+            path (str or Path): 파일 경로
+
+        Returns:
+            Timeline: 타임라인 또는 None (실패 시)
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except Exception as e:
+            print(f"[TIMELINE] 타임라인 로드 오류: {e}")
+            return None
+
+
+def _jsonable(value):
+    """튜플을 리스트로 바꿔 JSON과 같은 형태로 정규화 (해시/비교가 직렬화 전후로 같도록)"""
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    return value
@@ -0,0 +1,60 @@
+"""
+TTS 백엔드 모듈
+TTSService가 사용할 음성 합성 제공자(ElevenLabs, 오프라인 로컬 엔진 등)를 포함합니다.
+
+백엔드 클래스는 처음 사용될 때 import 됩니다 (지연 로딩).
+외부 패키지는 "supermovie.tts_backends" entry point 그룹으로 새 백엔드를 등록할 수 있습니다.
+"""
+import threading
+
+from utils.lazy_registry import LazyClassRegistry
+
+__all__ = ['get_tts_backend', 'register_tts_backend', 'tts_backend_classes', 'DEFAULT_TTS_BACKEND']
+
+DEFAULT_TTS_BACKEND = "elevenlabs"
+
+# 백엔드 이름별 클래스 - 접근 시 import
+tts_backend_classes = LazyClassRegistry(entry_point_group="supermovie.tts_backends")
+tts_backend_classes.register("elevenlabs", "service.tts_backends.elevenlabs_backend:ElevenLabsBackend", "ElevenLabs")
+tts_backend_classes.register("local", "service.tts_backends.local_backend:LocalTTSBackend", "Local (offline)")
+
+# 백엔드 인스턴스 캐시 (HTTP 세션 재사용)
+_backend_instances = {}
+_backend_lock = threading.Lock()
+
+
+def register_tts_backend(name: str, target, display_name: str = None):
+    """
+    TTS 백엔드 등록 (플러그인/코드에서 직접 등록할 때 사용)
+
+    Args:
+        name (str): 백엔드 이름
+        target (str or type): "패키지.모듈:클래스" 문자열, 클래스 또는 백엔드 인스턴스
+        display_name (str, optional): 표시 이름
+    """
+    with _backend_lock:
+        if isinstance(target, (str, type)):
+            _backend_instances.pop(name, None)
+            tts_backend_classes.register(name, target, display_name)
+        else:
+            tts_backend_classes.register(name, type(target), display_name)
+            _backend_instances[name] = target
+
+
+def get_tts_backend(name: str):
+    """
+    이름에 맞는 TTS 백엔드 인스턴스 반환 (한 번 만든 인스턴스는 재사용)
+
+    Args:
+        name (str): 백엔드 이름 ("elevenlabs", "local" 등)
+
+    Returns:
+        BaseTTSBackend: 백엔드 인스턴스 또는 None (없거나 로드 실패 시)
+    """
+    with _backend_lock:
+        if name not in _backend_instances:
+            backend_class = tts_backend_classes.get_class(name)
+            if backend_class is None:
+                return None
+            _backend_instances[name] = backend_class()
+        return _backend_instances[name]
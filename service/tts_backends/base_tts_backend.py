@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class TTSAudio:
+    """
+    TTS 합성 결과 구조체
+    오디오 바이트와 파일 확장자(".mp3", ".wav" 등)를 포함
+    """
+    data: bytes
+    extension: str = ".mp3"
+
+
+class BaseTTSBackend(ABC):
+    """
+    TTS 백엔드의 기본 클래스 - 모든 TTS 제공자가 상속받아야 함
+    TTSService가 요청마다 백엔드를 골라 synthesize를 호출합니다.
+    """
+
+    # 레지스트리 키와 동일한 백엔드 이름
+    name = "base"
+
+    # 사용량(글자 수)이 과금/할당량에 포함되는지 여부 (미리 합성 예산 계산에 사용)
+    billable = True
+
+    @abstractmethod
+    def synthesize(self, text: str, voice_id: str, model_id: str, speed: float = 1.0) -> Optional[TTSAudio]:
+        """
+        텍스트를 음성으로 합성
+
+        Args:
+            text (str): 색상 태그가 제거된 순수 텍스트
+            voice_id (str): 음성 ID
+            model_id (str): 모델 ID
+            speed (float): 음성 속도
+
+        Returns:
+            TTSAudio: 합성된 오디오 또는 None (실패 시)
+        """
+        pass
@@ -0,0 +1,101 @@
+import os
+import threading
+from typing import Optional
+
+import requests
+
+from settings import Settings
+from service.tts_backends.base_tts_backend import BaseTTSBackend, TTSAudio
+
+
+class ElevenLabsBackend(BaseTTSBackend):
+    """
+    ElevenLabs HTTP API 백엔드
+    base_url을 바꾸면 로컬 대역 서버(fake_elevenlabs_server)로도 요청할 수 있습니다.
+
+    설정 우선순위:
+    - API 키: 생성자 인자 → ELEVENLABS_API_KEY 환경 변수 → Settings "elevenlabs_api_key" (없으면 합성 실패)
+    - 엔드포인트: 생성자 인자 → ELEVENLABS_BASE_URL 환경 변수 → Settings "elevenlabs_base_url" → 공식 API
+    """
+
+    name = "elevenlabs"
+
+    DEFAULT_BASE_URL = "https://api.elevenlabs.io/v1/text-to-speech"
+
+    # Content-Type → 확장자
+    EXTENSIONS = {
+        "audio/mpeg": ".mp3",
+        "audio/mp3": ".mp3",
+        "audio/wav": ".wav",
+        "audio/x-wav": ".wav",
+    }
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None, timeout: float = 30):
+        """
+        ElevenLabsBackend 초기화
+
+        Args:
+            base_url (str, optional): text-to-speech 엔드포인트 (끝에 /{voice_id}가 붙음)
+            api_key (str, optional): API 키
+            timeout (float): 요청 타임아웃(초)
+        """
+        self.base_url = (base_url or os.environ.get("ELEVENLABS_BASE_URL")
+                         or Settings.get("elevenlabs_base_url") or self.DEFAULT_BASE_URL).rstrip("/")
+        self._api_key = api_key
+        self.timeout = timeout
+        # 스레드마다 세션을 따로 두어 연결(keep-alive)을 재사용
+        self._local = threading.local()
+
+    @property
+    def api_key(self) -> Optional[str]:
+        """API 키 (요청마다 확인하므로 실행 중에 설정해도 바로 적용)"""
+        return self._api_key or os.environ.get("ELEVENLABS_API_KEY") or Settings.get("elevenlabs_api_key") or None
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def synthesize(self, text: str, voice_id: str, model_id: str, speed: float = 1.0) -> Optional[TTSAudio]:
+        """ElevenLabs text-to-speech API 호출"""
+        api_key = self.api_key
+        if not api_key:
+            print("❌ 오류: ElevenLabs API 키가 없습니다. ELEVENLABS_API_KEY 환경 변수나 설정 \"elevenlabs_api_key\"를 지정하거나, "
+                  "설정 \"tts_backend\"를 \"local\"(오프라인 엔진)로 바꾸세요.")
+            return None
+        url = f"{self.base_url}/{voice_id}"
+
+        headers = {
+            "Accept": "audio/mpeg",
+            "Content-Type": "application/json",
+            "xi-api-key": api_key
+        }
+
+        data = {
+            "text": text,
+            "model_id": model_id,
+            "voice_settings": {
+                "stability": 0.5,
+                "similarity_boost": 0.75,
+                "style": 0.0,
+                "use_speaker_boost": True,
+                "speed": speed
+            }
+        }
+
+        try:
+            response = self._session().post(url, json=data, headers=headers, timeout=self.timeout)
+        except requests.exceptions.Timeout:
+            print("❌ 오류: TTS API 요청 시간 초과")
+            return None
+        except requests.exceptions.RequestException as e:
+            print(f"❌ 오류: TTS API 요청 중 문제 발생: {str(e)}")
+            return None
+
+        if response.status_code != 200:
+            print(f"❌ TTS API 요청 실패 (상태 코드: {response.status_code})")
+            print(f"   오류 메시지: {response.text}")
+            return None
+
+        content_type = response.headers.get("Content-Type", "audio/mpeg").split(";")[0].strip()
+        return TTSAudio(data=response.content, extension=self.EXTENSIONS.get(content_type, ".mp3"))
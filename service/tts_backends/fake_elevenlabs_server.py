@@ -0,0 +1,181 @@
+"""
+ElevenLabs 대역(stand-in) 서버
+POST /v1/text-to-speech/{voice_id} 엔드포인트를 흉내 내는 로컬 HTTP 서버입니다.
+실제 API와 비슷한 지연 시간(기본 지연 + 글자 수 비례 + 로그정규 분포 흔들림)과
+동시 요청 제한(초과 시 429)을 재현하며, 오디오는 LocalTTSBackend로 합성한 WAV를 반환합니다.
+
+테스트/처리량 벤치마크에서 네트워크와 API 사용량 없이 ElevenLabsBackend 경로 전체를 검증할 때 사용합니다.
+
+사용 예:
+    python -m service.tts_backends.fake_elevenlabs_server --port 8765
+    # 다른 터미널에서
+    ELEVENLABS_BASE_URL=http://127.0.0.1:8765/v1/text-to-speech streamlit run app.py
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+from service.tts_backends.local_backend import LocalTTSBackend
+
+ENDPOINT_PREFIX = "/v1/text-to-speech/"
+
+
+class FakeElevenLabsServer(ThreadingHTTPServer):
+    """지연 시간/동시성 설정을 가진 ElevenLabs 대역 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, address, base_latency: float = 0.35, per_char_latency: float = 0.012,
+                 jitter: float = 0.25, max_concurrency: int = 5, error_rate: float = 0.0):
+        """
+        FakeElevenLabsServer 초기화
+
+        Args:
+            address (tuple): (host, port)
+            base_latency (float): 요청당 기본 지연(초, 첫 바이트까지)
+            per_char_latency (float): 글자당 추가 지연(초)
+            jitter (float): 로그정규 흔들림의 시그마 (0이면 고정 지연)
+            max_concurrency (int): 동시에 처리할 최대 요청 수 (초과 시 429)
+            error_rate (float): 임의로 500을 반환할 확률 (0.0 ~ 1.0)
+        """
+        super().__init__(address, FakeElevenLabsHandler)
+        self.base_latency = base_latency
+        self.per_char_latency = per_char_latency
+        self.jitter = jitter
+        self.max_concurrency = max_concurrency
+        self.error_rate = error_rate
+        self.active_requests = 0
+        self.total_requests = 0
+        self.total_characters = 0
+        self._lock = threading.Lock()
+
+    def get_latency(self, text: str) -> float:
+        """텍스트 길이에 따른 지연 시간(초) 계산"""
+        latency = self.base_latency + self.per_char_latency * len(text)
+        if self.jitter > 0:
+            latency *= random.lognormvariate(0.0, self.jitter)
+        return latency
+
+
+class FakeElevenLabsHandler(BaseHTTPRequestHandler):
+    """text-to-speech 요청 처리기"""
+
+    server: FakeElevenLabsServer
+
+    def log_message(self, format, *args):
+        # 요청마다 출력하지 않음 (벤치마크 출력 방해 방지)
+        pass
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if not self.path.split("?")[0].startswith(ENDPOINT_PREFIX):
+            self._send_json(404, {"detail": {"status": "not_found", "message": self.path}})
+            return
+        voice_id = self.path.split("?")[0][len(ENDPOINT_PREFIX):].strip("/")
+
+        if not self.headers.get("xi-api-key"):
+            self._send_json(401, {"detail": {"status": "invalid_api_key", "message": "xi-api-key 헤더가 없습니다."}})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except (ValueError, json.JSONDecodeError):
+            self._send_json(400, {"detail": {"status": "invalid_json", "message": "요청 본문을 읽을 수 없습니다."}})
+            return
+
+        text = payload.get("text", "")
+        if not text:
+            self._send_json(422, {"detail": {"status": "invalid_text", "message": "text가 비어 있습니다."}})
+            return
+
+        server = self.server
+        with server._lock:
+            if server.active_requests >= server.max_concurrency:
+                busy = True
+            else:
+                busy = False
+                server.active_requests += 1
+                server.total_requests += 1
+                server.total_characters += len(text)
+        if busy:
+            self._send_json(429, {"detail": {"status": "too_many_concurrent_requests",
+                                             "message": "동시 요청 수 제한을 초과했습니다."}})
+            return
+
+        try:
+            time.sleep(server.get_latency(text))
+            if server.error_rate and random.random() < server.error_rate:
+                self._send_json(500, {"detail": {"status": "internal_error", "message": "임의 오류"}})
+                return
+
+            speed = (payload.get("voice_settings") or {}).get("speed", 1.0)
+            body = LocalTTSBackend.synthesize_wav_bytes(text, voice_id, speed)
+            self.send_response(200)
+            self.send_header("Content-Type", "audio/wav")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("character-cost", str(len(text)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server._lock:
+                server.active_requests -= 1
+
+
+def start_fake_server(host: str = "127.0.0.1", port: int = 0, **options) -> Tuple[FakeElevenLabsServer, str]:
+    """
+    대역 서버를 백그라운드 스레드에서 시작 (테스트/벤치마크용)
+
+    Args:
+        host (str): 바인딩할 호스트
+        port (int): 포트 (0이면 빈 포트 자동 선택)
+        **options: FakeElevenLabsServer 옵션 (base_latency, max_concurrency 등)
+
+    Returns:
+        tuple: (서버 객체, ElevenLabsBackend에 넘길 base_url)
+    """
+    server = FakeElevenLabsServer((host, port), **options)
+    thread = threading.Thread(target=server.serve_forever, name="fake-elevenlabs", daemon=True)
+    thread.start()
+    base_url = f"http://{host}:{server.server_address[1]}{ENDPOINT_PREFIX.rstrip('/')}"
+    return server, base_url
+
+
+def main(argv=None):
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description="ElevenLabs text-to-speech 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.35, help="요청당 기본 지연(초)")
+    parser.add_argument("--per-char", type=float, default=0.012, help="글자당 추가 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.25, help="지연 흔들림 (로그정규 시그마)")
+    parser.add_argument("--max-concurrency", type=int, default=5, help="최대 동시 요청 수 (초과 시 429)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="임의 500 오류 확률")
+    args = parser.parse_args(argv)
+
+    server = FakeElevenLabsServer((args.host, args.port), base_latency=args.latency,
+                                  per_char_latency=args.per_char, jitter=args.jitter,
+                                  max_concurrency=args.max_concurrency, error_rate=args.error_rate)
+    print(f"ElevenLabs 대역 서버 실행 중: http://{args.host}:{args.port}{ENDPOINT_PREFIX}<voice_id>")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"처리한 요청: {server.total_requests}건, {server.total_characters}자")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import hashlib
+import io
+import wave
+from typing import Optional
+
+import numpy as np
+
+from service.tts_backends.base_tts_backend import BaseTTSBackend, TTSAudio
+
+
+class LocalTTSBackend(BaseTTSBackend):
+    """
+    오프라인 로컬 TTS 백엔드
+    네트워크 없이 글자 수에 비례하는 길이의 음성 유사 신호(음절마다 배음이 있는 톤)를 WAV로 합성합니다.
+    실제 발음은 아니지만 길이/리듬이 실제 TTS와 비슷하여 렌더링 테스트와 벤치마크에 사용할 수 있습니다.
+    같은 텍스트/음성/속도에는 항상 같은 오디오를 반환합니다.
+    """
+
+    name = "local"
+    billable = False
+
+    SAMPLE_RATE = 44100
+    SYLLABLE_SECONDS = 0.17  # 한 글자(음절) 길이 (속도 1.0 기준)
+    SPACE_SECONDS = 0.08
+    PAUSE_SECONDS = 0.28  # 문장 부호 뒤 쉼
+    PAUSE_CHARS = ".,!?…~"
+
+    def synthesize(self, text: str, voice_id: str, model_id: str, speed: float = 1.0) -> Optional[TTSAudio]:
+        """텍스트를 음성 유사 WAV로 합성"""
+        if not text or not text.strip():
+            return None
+        try:
+            return TTSAudio(data=self.synthesize_wav_bytes(text, voice_id, speed), extension=".wav")
+        except Exception as e:
+            print(f"❌ 오류: 로컬 TTS 합성 중 문제 발생: {e}")
+            return None
+
+    @classmethod
+    def synthesize_wav_bytes(cls, text: str, voice_id: str = "", speed: float = 1.0) -> bytes:
+        """
+        텍스트를 WAV 바이트로 합성 (로컬 대역 서버에서도 사용)
+
+        Args:
+            text (str): 텍스트
+            voice_id (str): 음성 ID (기본 음높이 결정에 사용)
+            speed (float): 음성 속도
+
+        Returns:
+            bytes: 모노 16bit WAV 바이트
+        """
+        speed = speed if speed and speed > 0 else 1.0
+        voice_seed = int(hashlib.md5(voice_id.encode()).hexdigest()[:8], 16)
+        base_pitch = 110.0 + (voice_seed % 110)  # 음성마다 110~220Hz
+
+        segments = [np.zeros(int(0.1 * cls.SAMPLE_RATE), dtype=np.float32)]
+        for idx, char in enumerate(text.strip()):
+            if char.isspace():
+                seconds, voiced = cls.SPACE_SECONDS, False
+            elif char in cls.PAUSE_CHARS:
+                seconds, voiced = cls.PAUSE_SECONDS, False
+            else:
+                seconds, voiced = cls.SYLLABLE_SECONDS, True
+
+            length = int(seconds / speed * cls.SAMPLE_RATE)
+            if not voiced:
+                segments.append(np.zeros(length, dtype=np.float32))
+                continue
+
+            t = np.arange(length, dtype=np.float32) / cls.SAMPLE_RATE
+            # 글자마다 음높이를 조금씩 바꾸고, 음절 안에서는 살짝 내려가는 억양
+            pitch = base_pitch * (1.0 + 0.08 * ((ord(char) + idx) % 5 - 2) / 2)
+            phase = 2 * np.pi * pitch * t * (1.0 - 0.15 * t / max(t[-1], 1e-3))
+            tone = (np.sin(phase) + 0.5 * np.sin(2 * phase) + 0.25 * np.sin(3 * phase)) / 1.75
+            envelope = np.minimum(1.0, t / 0.02) * np.exp(-3.0 * t / (seconds / speed))
+            segments.append((0.4 * tone * envelope).astype(np.float32))
+        segments.append(np.zeros(int(0.1 * cls.SAMPLE_RATE), dtype=np.float32))
+
+        samples = (np.concatenate(segments) * 32767).astype('<i2')
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(cls.SAMPLE_RATE)
+            wav_file.writeframes(samples.tobytes())
+        return buffer.getvalue()
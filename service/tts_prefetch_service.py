@@ -0,0 +1,222 @@
+"""
+TTS 미리 합성(prefetch) 서비스
+씬 텍스트 입력이 멈추면(디바운스) 해당 TTSRequest를 백그라운드에서 미리 합성해 TTS 캐시에 넣어 둡니다.
+이후 "auto" 버튼을 누르면 캐시에서 바로 가져오므로 기다리지 않습니다.
+
+- 설정 "tts_prefetch"가 켜져 있을 때만 동작합니다 (기본값: 꺼짐).
+- 같은 입력 칸(slot)에 새 텍스트가 들어오면 대기 중인 이전 요청은 취소됩니다.
+  (이미 전송된 요청은 중단할 수 없으므로, 디바운스 동안에만 취소해 할당량 낭비를 막습니다.)
+- 과금되는 백엔드는 프로젝트별 하루 글자 수 예산(tts_prefetch_budget_chars) 안에서만 미리 합성합니다.
+  사용량은 프로젝트의 config/tts_prefetch_usage.json에 기록됩니다.
+"""
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Dict, Optional
+
+from settings import Settings
+from service.tts_backends import get_tts_backend
+from service.tts_service import TTSRequest, TTSService
+
+
+@dataclass
+class PrefetchItem:
+    """
+    미리 합성 대기 항목 구조체
+    입력 칸 키(slot), 요청, 프로젝트 경로, 실행 예정 시각을 포함
+    """
+    slot: str
+    request: TTSRequest
+    project_path: Optional[Path]
+    due_at: float
+    scheduled_at: float = field(default_factory=time.time)
+
+
+class TTSPrefetchService:
+    """디바운스된 TTS 미리 합성을 백그라운드 스레드에서 처리하는 클래스"""
+
+    DEFAULT_DEBOUNCE = 1.5  # 초
+    DEFAULT_BUDGET_CHARS = 3000  # 프로젝트별 하루 미리 합성 글자 수
+    USAGE_FILE = "config/tts_prefetch_usage.json"
+
+    def __init__(self):
+        """TTSPrefetchService 초기화"""
+        self._pending: Dict[str, PrefetchItem] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._usage_lock = threading.Lock()
+        self.stats = {"scheduled": 0, "cancelled": 0, "synthesized": 0, "cache_hits": 0,
+                      "budget_skipped": 0, "failed": 0}
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """미리 합성 사용 여부 (설정 "tts_prefetch")"""
+        return bool(Settings.get("tts_prefetch", False))
+
+    def schedule(self, slot: str, request: Optional[TTSRequest], project_path=None) -> bool:
+        """
+        입력 칸의 요청을 디바운스 후 미리 합성하도록 예약 (같은 칸의 대기 요청은 교체)
+
+        Args:
+            slot (str): 입력 칸 키 (예: "{scene_id}:{field}")
+            request (TTSRequest, optional): 미리 합성할 요청 (None이면 대기 요청만 취소)
+            project_path (str or Path, optional): 프로젝트 경로
+
+        Returns:
+            bool: 예약 여부
+        """
+        if request is None or not request.text or not self.is_enabled():
+            self.cancel(slot)
+            return False
+
+        debounce = float(Settings.get("tts_prefetch_debounce", self.DEFAULT_DEBOUNCE))
+        item = PrefetchItem(slot=slot, request=request,
+                            project_path=Path(project_path) if project_path else None,
+                            due_at=time.monotonic() + debounce)
+
+        with self._condition:
+            if slot in self._pending:
+                self.stats["cancelled"] += 1
+            self._pending[slot] = item
+            self.stats["scheduled"] += 1
+            self._ensure_worker()
+            self._condition.notify()
+        return True
+
+    def cancel(self, slot: str) -> bool:
+        """
+        대기 중인 요청 취소
+
+        Args:
+            slot (str): 입력 칸 키
+
+        Returns:
+            bool: 취소한 요청이 있었는지 여부
+        """
+        with self._condition:
+            if self._pending.pop(slot, None) is None:
+                return False
+            self.stats["cancelled"] += 1
+            return True
+
+    def cancel_project(self, project_path) -> int:
+        """
+        프로젝트의 대기 요청 모두 취소 (프로젝트 전환/삭제 시)
+
+        Returns:
+            int: 취소한 요청 수
+        """
+        project_path = Path(project_path)
+        with self._condition:
+            slots = [slot for slot, item in self._pending.items() if item.project_path == project_path]
+            for slot in slots:
+                del self._pending[slot]
+            self.stats["cancelled"] += len(slots)
+            return len(slots)
+
+    def get_pending_count(self) -> int:
+        """대기 중인 요청 수"""
+        with self._condition:
+            return len(self._pending)
+
+    def _ensure_worker(self):
+        """워커 스레드가 없으면 시작 (_condition 잠금 안에서 호출)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._worker_loop, name="tts-prefetch", daemon=True)
+            self._thread.start()
+
+    def _worker_loop(self):
+        while True:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    due = [item for item in self._pending.values() if item.due_at <= now]
+                    if due:
+                        item = min(due, key=lambda pending: pending.due_at)
+                        del self._pending[item.slot]
+                        break
+                    timeout = min((pending.due_at for pending in self._pending.values()), default=now + 60) - now
+                    self._condition.wait(timeout=max(timeout, 0.05))
+            self._run(item)
+
+    def _run(self, item: PrefetchItem):
+        """대기 시간이 지난 요청 하나를 합성"""
+        if not self.is_enabled():
+            return
+        try:
+            if TTSService.get_cached_path(item.request, item.project_path):
+                self.stats["cache_hits"] += 1
+                return
+
+            backend = get_tts_backend(TTSService.get_backend_name(item.request, item.project_path))
+            characters = len(TTSService._remove_color_tags(item.request.text))
+            if backend is not None and backend.billable and not self._reserve_budget(item.project_path, characters):
+                self.stats["budget_skipped"] += 1
+                print(f"[TTS_PREFETCH] 예산 초과로 미리 합성 건너뜀: {item.slot}")
+                return
+
+            if TTSService.generate(item.request, project_path=item.project_path):
+                self.stats["synthesized"] += 1
+            else:
+                self.stats["failed"] += 1
+        except Exception as e:
+            self.stats["failed"] += 1
+            print(f"[TTS_PREFETCH] 미리 합성 오류: {e}")
+
+    def get_budget(self) -> int:
+        """프로젝트별 하루 미리 합성 글자 수 예산"""
+        return int(Settings.get("tts_prefetch_budget_chars", self.DEFAULT_BUDGET_CHARS))
+
+    def get_usage(self, project_path) -> int:
+        """
+        프로젝트의 오늘 미리 합성 사용량(글자 수)
+
+        Args:
+            project_path (str or Path): 프로젝트 경로
+
+        Returns:
+            int: 사용한 글자 수
+        """
+        if not project_path:
+            return 0
+        usage_path = Path(project_path) / self.USAGE_FILE
+        try:
+            with open(usage_path, 'r', encoding='utf-8') as f:
+                usage = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        return int(usage.get("characters", 0)) if usage.get("date") == date.today().isoformat() else 0
+
+    def _reserve_budget(self, project_path, characters: int) -> bool:
+        """
+        예산 안이면 사용량을 기록하고 True 반환
+
+        Args:
+            project_path (Path): 프로젝트 경로 (없으면 예산을 확인할 수 없으므로 거부)
+            characters (int): 사용할 글자 수
+
+        Returns:
+            bool: 예산 확보 여부
+        """
+        if not project_path:
+            return False
+        with self._usage_lock:
+            used = self.get_usage(project_path)
+            if used + characters > self.get_budget():
+                return False
+            usage_path = Path(project_path) / self.USAGE_FILE
+            try:
+                usage_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(usage_path, 'w', encoding='utf-8') as f:
+                    json.dump({"date": date.today().isoformat(), "characters": used + characters}, f)
+            except Exception as e:
+                print(f"[TTS_PREFETCH] 사용량 저장 오류: {e}")
+                return False
+            return True
+
+
+# 싱글톤 인스턴스 생성 (편의를 위해)
+tts_prefetch_service = TTSPrefetchService()
@@ -1,13 +1,24 @@
 """
-ElevenLabs TTS 서비스
+TTS 서비스
 텍스트를 음성으로 변환하고 파일로 저장하는 서비스
+실제 합성은 service.tts_backends의 백엔드(ElevenLabs, 오프라인 로컬 엔진 등)가 담당합니다.
 """
-import requests
+import hashlib
+import json
+import os
 import re
+import shutil
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from settings import Settings
+from service.render_tracer import render_tracer
+from service.telemetry import telemetry
+from service.tts_backends import DEFAULT_TTS_BACKEND, get_tts_backend
+
 
 @dataclass
 class TTSRequest:
@@ -21,15 +32,18 @@ class TTSRequest:
     model_id: str
     output_path: Optional[str] = None  # None이면 자동으로 tts_outputs에 저장
     speed: float = 1.1  # 음성 속도 (기본값: 1.1)
+    preset: Optional[str] = None  # 프리셋 이름 (프리셋별 백엔드 선택에 사용)
+    backend: Optional[str] = None  # None이면 프로젝트/전역 설정에 따라 선택
     
     @classmethod
-    def rachel(cls, text: str, output_path: Optional[str] = None) -> 'TTSRequest':
+    def rachel(cls, text: str, output_path: Optional[str] = None, backend: Optional[str] = None) -> 'TTSRequest':
         """
         레이첼 음성 프리셋으로 TTSRequest 생성
         
         Args:
             text (str): 음성으로 변환할 텍스트
             output_path (str, optional): 저장할 오디오 파일 경로 (None이면 자동 생성)
+            backend (str, optional): 사용할 TTS 백엔드 (None이면 설정에 따라 선택)
         
         Returns:
             TTSRequest: 레이첼 음성 설정이 포함된 요청 객체
@@ -38,17 +52,20 @@ class TTSRequest:
             text=text,
             output_path=output_path,
             voice_id="21m00Tcm4TlvDq8ikWAM",  # 레이첼 (영어)
-            model_id="eleven_multilingual_v2"
+            model_id="eleven_multilingual_v2",
+            preset="rachel",
+            backend=backend
         )
     
     @classmethod
-    def default(cls, text: str, output_path: Optional[str] = None) -> 'TTSRequest':
+    def default(cls, text: str, output_path: Optional[str] = None, backend: Optional[str] = None) -> 'TTSRequest':
         """
         기본 음성 프리셋으로 TTSRequest 생성
         
         Args:
             text (str): 음성으로 변환할 텍스트
             output_path (str, optional): 저장할 오디오 파일 경로 (None이면 자동 생성)
+            backend (str, optional): 사용할 TTS 백엔드 (None이면 설정에 따라 선택)
         
         Returns:
             TTSRequest: 기본 음성 설정이 포함된 요청 객체
@@ -57,17 +74,20 @@ class TTSRequest:
             text=text,
             output_path=output_path,
             voice_id="8jHHF8rMqMlg8if2mOUe",  # 기본 음성
-            model_id="eleven_multilingual_v2"
+            model_id="eleven_multilingual_v2",
+            preset="default",
+            backend=backend
         )
     
     @classmethod
-    def han(cls, text: str, output_path: Optional[str] = None) -> 'TTSRequest':
+    def han(cls, text: str, output_path: Optional[str] = None, backend: Optional[str] = None) -> 'TTSRequest':
         """
         한(han) 음성 프리셋으로 TTSRequest 생성
         
         Args:
             text (str): 음성으로 변환할 텍스트
             output_path (str, optional): 저장할 오디오 파일 경로 (None이면 자동 생성)
+            backend (str, optional): 사용할 TTS 백엔드 (None이면 설정에 따라 선택)
         
         Returns:
             TTSRequest: 한(han) 음성 설정이 포함된 요청 객체
@@ -76,15 +96,25 @@ class TTSRequest:
             text=text,
             output_path=output_path,
             voice_id="8jHHF8rMqMlg8if2mOUe",  # 한(han) 음성
-            model_id="eleven_multilingual_v2"
+            model_id="eleven_multilingual_v2",
+            preset="han",
+            backend=backend
         )
 
 
 class TTSService:
-    """ElevenLabs TTS 서비스 클래스"""
+    """
+    TTS 서비스 클래스
+    요청마다 TTS 백엔드(ElevenLabs, 오프라인 로컬 엔진 등)를 골라 음성을 합성하고 파일로 저장합니다.
+
+    백엔드 선택 우선순위:
+    1. TTSRequest.backend
+    2. 프로젝트 설정 (config/tts.json의 "presets"[프리셋] → "backend")
+    3. 전역 설정 (Settings "tts_preset_backends"[프리셋] → "tts_backend")
+    4. 기본값 "elevenlabs"
     
-    # API 키 하드코딩 (인자로 받지 않음)
-    API_KEY = "sk_92c9abfb8d79f63d8ad337bc05d711c20fdfe8c140beaec7"
+    합성 결과는 요청 내용 기준으로 캐싱되며, 같은 요청이 동시에 들어오면 한 번만 합성합니다.
+    """
     
     # 기본 설정 하드코딩
     DEFAULT_VOICE_ID = "8jHHF8rMqMlg8if2mOUe"
@@ -94,8 +124,16 @@ class TTSService:
     VOICE_RACHEL = "21m00Tcm4TlvDq8ikWAM"  # 레이첼 (영어)
     VOICE_DEFAULT = "8jHHF8rMqMlg8if2mOUe"  # 기본 음성
     
-    # API 엔드포인트
-    BASE_URL = "https://api.elevenlabs.io/v1/text-to-speech"
+    # 프로젝트별 TTS 설정 파일 (프로젝트 폴더 기준)
+    PROJECT_CONFIG_FILE = "config/tts.json"
+    
+    # 합성 결과 캐시 (파일명: 요청 내용의 SHA-256 + 확장자)
+    CACHE_DIR = Path("tts_outputs/cache")
+    
+    # 같은 요청이 합성 중일 때 기다리는 최대 시간(초)
+    INFLIGHT_TIMEOUT = 60
+    _inflight = {}
+    _inflight_lock = threading.Lock()
     
     @staticmethod
     def _remove_color_tags(text: str) -> str:
@@ -113,80 +151,197 @@ class TTSService:
         return re.sub(pattern, r'\1', text)
     
     @classmethod
-    def generate(cls, request: TTSRequest) -> Optional[Path]:
+    def load_project_config(cls, project_path=None) -> dict:
         """
-        TTSRequest 구조체를 받아서 텍스트를 음성으로 변환하고 파일로 저장
+        프로젝트의 TTS 설정(config/tts.json) 로드
         
         Args:
-            request (TTSRequest): TTS 요청 구조체 (text, output_path, voice_id, model_id 포함)
+            project_path (str or Path, optional): 프로젝트 경로
         
         Returns:
-            Path: 저장된 파일 경로 (실패 시 None)
+            dict: {"backend": 백엔드 이름, "presets": {프리셋: 백엔드 이름}} (없으면 빈 딕셔너리)
         """
+        if not project_path:
+            return {}
+        config_path = Path(project_path) / cls.PROJECT_CONFIG_FILE
+        if not config_path.exists():
+            return {}
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[TTS] 프로젝트 TTS 설정 읽기 오류: {e}")
+            return {}
+    
+    @classmethod
+    def save_project_config(cls, project_path, config: dict) -> bool:
+        """
+        프로젝트의 TTS 설정(config/tts.json) 저장
+        
+        Args:
+            project_path (str or Path): 프로젝트 경로
+            config (dict): {"backend": 백엔드 이름, "presets": {프리셋: 백엔드 이름}}
+        
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            config_path = Path(project_path) / cls.PROJECT_CONFIG_FILE
+            config_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(config_path, 'w', encoding='utf-8') as f:
+                json.dump(config, f, ensure_ascii=False, indent=2)
+            return True
+        except Exception as e:
+            print(f"[TTS] 프로젝트 TTS 설정 저장 오류: {e}")
+            return False
+    
+    @classmethod
+    def get_backend_name(cls, request: TTSRequest, project_path=None) -> str:
+        """
+        요청에 사용할 백엔드 이름 결정
+        
+        Args:
+            request (TTSRequest): TTS 요청
+            project_path (str or Path, optional): 프로젝트 경로 (프로젝트별 설정 확인용)
+        
+        Returns:
+            str: 백엔드 이름
+        """
+        if request.backend:
+            return request.backend
+        
+        project_config = cls.load_project_config(project_path)
+        preset_backends = project_config.get("presets") or {}
+        if request.preset in preset_backends:
+            return preset_backends[request.preset]
+        if project_config.get("backend"):
+            return project_config["backend"]
+        
+        preset_backends = Settings.get("tts_preset_backends") or {}
+        if request.preset in preset_backends:
+            return preset_backends[request.preset]
+        return Settings.get("tts_backend") or DEFAULT_TTS_BACKEND
+    
+    @classmethod
+    def get_cache_key(cls, request: TTSRequest, backend_name: str) -> str:
+        """
+        요청 내용(백엔드, 음성, 모델, 속도, 태그 제거된 텍스트)의 SHA-256 캐시 키 반환
+        
+        Args:
+            request (TTSRequest): TTS 요청
+            backend_name (str): 사용할 백엔드 이름
+        
+        Returns:
+            str: 캐시 키 (16진수 문자열)
+        """
+        payload = json.dumps([backend_name, request.voice_id, request.model_id, request.speed,
+                              cls._remove_color_tags(request.text)], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    @classmethod
+    def _find_cached(cls, cache_key: str) -> Optional[Path]:
+        """캐시 키에 해당하는 오디오 파일 반환 (없으면 None)"""
+        for path in cls.CACHE_DIR.glob(f"{cache_key}.*"):
+            if not path.name.endswith(".tmp"):
+                return path
+        return None
+    
+    @classmethod
+    def get_cached_path(cls, request: TTSRequest, project_path=None) -> Optional[Path]:
+        """
+        요청에 대한 캐시된 오디오 파일 경로 반환 (합성하지 않음)
+        
+        Args:
+            request (TTSRequest): TTS 요청
+            project_path (str or Path, optional): 프로젝트 경로 (백엔드 선택용)
+        
+        Returns:
+            Path: 캐시 파일 경로 또는 None (캐시에 없을 때)
+        """
+        return cls._find_cached(cls.get_cache_key(request, cls.get_backend_name(request, project_path)))
+    
+    @classmethod
+    def _synthesize_to_cache(cls, request: TTSRequest, backend, cache_key: str) -> Optional[Path]:
+        """
+        백엔드로 합성하여 캐시에 저장 (같은 키의 요청이 동시에 들어오면 한 번만 합성)
+        
+        Returns:
+            Path: 캐시 파일 경로 또는 None (실패 시)
+        """
+        with cls._inflight_lock:
+            event = cls._inflight.get(cache_key)
+            owner = event is None
+            if owner:
+                event = threading.Event()
+                cls._inflight[cache_key] = event
+        
+        if not owner:
+            # 다른 스레드(예: 미리 합성)가 같은 요청을 처리 중이면 결과를 기다림
+            event.wait(timeout=cls.INFLIGHT_TIMEOUT)
+            return cls._find_cached(cache_key)
+        
         try:
             # 텍스트에서 색상 태그 제거 (TTS는 순수 텍스트만 필요)
             clean_text = cls._remove_color_tags(request.text)
+            started = time.perf_counter()
+            audio = backend.synthesize(clean_text, request.voice_id, request.model_id, request.speed)
+            telemetry.observe("tts_latency", time.perf_counter() - started, backend=backend.name,
+                              ok=audio is not None, chars=len(clean_text))
+            if audio is None:
+                return None
             
-            # output_path가 없으면 자동으로 tts_outputs 폴더에 저장
-            if request.output_path is None:
-                import hashlib
-                import time
-                # 텍스트 기반으로 고유한 파일명 생성 (원본 텍스트 사용)
-                text_hash = hashlib.md5(request.text.encode()).hexdigest()[:8]
-                timestamp = int(time.time())
-                output_path = f"tts_outputs/tts_{timestamp}_{text_hash}.mp3"
-            else:
-                output_path = request.output_path
-            
-            # API 엔드포인트 URL
-            url = f"{cls.BASE_URL}/{request.voice_id}"
-            
-            # 요청 헤더 설정
-            headers = {
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json",
-                "xi-api-key": cls.API_KEY
-            }
+            cls.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path = cls.CACHE_DIR / f"{cache_key}{audio.extension}"
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(audio.data)
+            os.replace(tmp_path, cache_path)
+            render_tracer.record_bytes(len(audio.data))
+            return cache_path
+        finally:
+            with cls._inflight_lock:
+                cls._inflight.pop(cache_key, None)
+            event.set()
+    
+    @classmethod
+    @render_tracer.traced(phase="tts")
+    def generate(cls, request: TTSRequest, project_path=None) -> Optional[Path]:
+        """
+        TTSRequest 구조체를 받아서 텍스트를 음성으로 변환하고 파일로 저장
+        같은 내용의 요청은 캐시(tts_outputs/cache)에서 바로 반환합니다.
+        
+        Args:
+            request (TTSRequest): TTS 요청 구조체 (text, output_path, voice_id, model_id 포함)
+            project_path (str or Path, optional): 프로젝트 경로 (프로젝트별 백엔드 설정 확인용)
+        
+        Returns:
+            Path: 저장된 파일 경로 (실패 시 None)
+                  output_path가 없으면 캐시 파일 경로를 반환
+        """
+        try:
+            backend_name = cls.get_backend_name(request, project_path)
+            backend = get_tts_backend(backend_name)
+            if backend is None:
+                print(f"❌ 오류: 알 수 없는 TTS 백엔드: {backend_name}")
+                return None
             
-            # 요청 데이터 설정 (태그가 제거된 순수 텍스트 사용)
-            data = {
-                "text": clean_text,
-                "model_id": request.model_id,
-                "voice_settings": {
-                    "stability": 0.5,
-                    "similarity_boost": 0.75,
-                    "style": 0.0,
-                    "use_speaker_boost": True,
-                    "speed": request.speed
-                }
-            }
+            cache_key = cls.get_cache_key(request, backend_name)
+            cache_path = cls._find_cached(cache_key)
+            telemetry.count_cache("tts", hit=cache_path is not None)
+            if cache_path is None:
+                cache_path = cls._synthesize_to_cache(request, backend, cache_key)
+                if cache_path is None:
+                    return None
             
-            # API 요청 보내기
-            response = requests.post(url, json=data, headers=headers, timeout=30)
+            if request.output_path is None:
+                return cache_path
             
-            # 응답 확인
-            if response.status_code == 200:
-                # 오디오 데이터를 파일로 저장
-                output_file = Path(output_path)
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(output_file, "wb") as f:
-                    f.write(response.content)
+            # 지정된 경로로 복사
+            output_file = Path(request.output_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cache_path, output_file)
+            return output_file
                 
-                return output_file
-            else:
-                # 에러 응답 처리
-                error_msg = response.text
-                print(f"❌ TTS API 요청 실패 (상태 코드: {response.status_code})")
-                print(f"   오류 메시지: {error_msg}")
-                return None
-                
-        except requests.exceptions.Timeout:
-            print("❌ 오류: TTS API 요청 시간 초과")
-            return None
-        except requests.exceptions.RequestException as e:
-            print(f"❌ 오류: TTS API 요청 중 문제 발생: {str(e)}")
-            return None
         except Exception as e:
             print(f"❌ 오류: TTS 생성 중 예상치 못한 문제 발생: {str(e)}")
             return None
@@ -194,4 +349,3 @@ class TTSService:
 
 # 싱글톤 인스턴스 생성 (편의를 위해)
 tts_service = TTSService()
-
@@ -3,26 +3,279 @@
 씬들의 비디오를 생성하고 합성하는 기능을 제공합니다.
 """
 
-from typing import List, Dict, Any, Optional, Callable
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Tuple
 from pathlib import Path
-from moviepy import VideoFileClip, concatenate_videoclips
 from project_manager import project_manager
-from ui.scene_types import get_scene_class
+from settings import Settings
+from service.audio_mixer import AudioPlacement, audio_mixer
+from service.output_targets import resolve_output_targets
+from service.render_estimator import render_estimator
+from service.render_manifest import RenderManifest
+from service.render_progress import RenderProgressTracker
+from service.render_tracer import render_tracer, file_size
+from service.telemetry import telemetry
+from service.scene_renderers import get_renderer_class
+from utils.ffmpeg_utils import run_ffmpeg, write_concat_list
+
+
+# 인코딩 중에 미리 준비할 다음 씬 수 (설정 "prepare_lookahead", 0이면 준비를 인코딩 직전에 수행)
+DEFAULT_PREPARE_LOOKAHEAD = 2
+
+
+def prepare_ahead(
+    items: Iterable,
+    prepare: Callable[[Any], Any],
+    lookahead: int = DEFAULT_PREPARE_LOOKAHEAD,
+    release: Optional[Callable[[Any], None]] = None
+) -> Iterator[Tuple[Any, Any, float]]:
+    """
+    항목을 순서대로 돌려주면서 다음 lookahead개 항목의 준비를 스레드 풀에서 미리 수행하는 제너레이터
+    호출 측이 현재 항목을 처리(인코딩)하는 동안 다음 항목들이 준비되며, 미리 준비하는 항목 수가 제한되므로
+    메모리 사용량도 (lookahead + 1)개 항목으로 제한됩니다.
+
+    Args:
+        items (Iterable): 처리할 항목
+        prepare (Callable): 항목을 받아 준비된 결과를 반환하는 함수 (다른 스레드에서 호출됨)
+        lookahead (int): 미리 준비할 항목 수 (0 이하면 돌려주기 직전에 준비)
+        release (Callable, optional): 중간에 멈췄을 때 사용하지 않은 준비 결과를 해제하는 함수
+
+    Yields:
+        tuple: (항목, 준비된 결과, 준비를 기다린 시간(초))
+    """
+    if lookahead <= 0:
+        for item in items:
+            started = time.perf_counter()
+            result = prepare(item)
+            yield item, result, time.perf_counter() - started
+        return
+
+    iterator = iter(items)
+    queue = deque()
+    executor = ThreadPoolExecutor(max_workers=lookahead, thread_name_prefix="scene-prepare")
+
+    def submit_next():
+        for item in iterator:
+            queue.append((item, executor.submit(prepare, item)))
+            return
+
+    try:
+        for _ in range(lookahead):
+            submit_next()
+        while queue:
+            item, future = queue.popleft()
+            started = time.perf_counter()
+            result = future.result()
+            waited = time.perf_counter() - started
+            # 현재 항목을 처리하는 동안 준비할 다음 항목 추가
+            submit_next()
+            yield item, result, waited
+    finally:
+        for _, future in queue:
+            future.cancel()
+        executor.shutdown(wait=True)
+        if release:
+            for _, future in queue:
+                if not future.cancelled() and future.exception() is None:
+                    release(future.result())
+
+
+@dataclass
+class SceneRenderResult:
+    """
+    씬 렌더링 결과 구조체
+    생성된 비디오 경로, 씬 길이/fps, 오디오 배치 정보, 출력 대상별 씬 비디오 경로를 포함
+    """
+    scene_id: str
+    video_path: str
+    duration: float
+    fps: int
+    audio_placements: List[AudioPlacement] = field(default_factory=list)
+    target_paths: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def video_duration(self) -> float:
+        """인코딩된 비디오의 실제 길이 (프레임 단위로 잘린 길이)"""
+        return int(self.duration * self.fps) / self.fps
 
 
 class VideoGenerator:
     """비디오 생성 및 합성을 담당하는 클래스"""
     
+    # assemble_final_outputs 결과에서 기본 최종 비디오의 키
+    MASTER_OUTPUT = "master"
+    
     def __init__(self):
         """VideoGenerator 초기화"""
         pass
     
+    @staticmethod
+    def _get_trace_dir(project_path: Optional[Path] = None) -> Optional[Path]:
+        """렌더링 트레이스를 저장할 폴더 (프로젝트의 logs 폴더) 반환"""
+        project_path = Path(project_path) if project_path else project_manager.get_project_path()
+        return project_path / "logs" if project_path else None
+    
+    def render_scenes(
+        self,
+        scenes: List[Dict[str, Any]],
+        progress_callback: Optional[Callable[[float], None]] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+        warning_callback: Optional[Callable[[str], None]] = None,
+        project_path: Optional[Path] = None,
+        use_cache: bool = True,
+        output_targets: Optional[list] = None,
+        tracker: Optional[RenderProgressTracker] = None
+    ) -> List[SceneRenderResult]:
+        """
+        모든 씬의 비디오를 생성하고 씬별 렌더링 결과를 반환합니다.
+        입력이 바뀌지 않은 씬(렌더링 매니페스트의 지문 일치)은 이전 결과를 그대로 사용합니다.
+        출력 대상이 있으면 씬마다 프레임을 한 번만 합성하여 대상별 씬 비디오를 함께 인코딩합니다.
+        
+        Args:
+            scenes (List[Dict[str, Any]]): 씬 정보 리스트
+            progress_callback (Optional[Callable[[float], None]]): 프레임 단위 전체 진행률 콜백 (0.0 ~ 1.0, 스로틀됨)
+            status_callback (Optional[Callable[[str], None]]): 상태 메시지 콜백 (단계, 프레임, fps, 남은 시간)
+            warning_callback (Optional[Callable[[str], None]]): 경고 메시지 콜백
+            project_path (Optional[Path]): 프로젝트 경로 (없으면 현재 로드된 프로젝트 사용)
+            use_cache (bool): False면 깨끗한 씬도 다시 렌더링
+            output_targets (list, optional): 출력 대상 (프리셋 이름/딕셔너리/OutputTarget 리스트)
+            tracker (RenderProgressTracker, optional): 진행률 트래커 (합치기 단계까지 이어서 보고할 때 전달,
+                                                       없으면 progress_callback/status_callback으로 새로 만듦)
+            
+        Returns:
+            List[SceneRenderResult]: 생성에 성공한 씬들의 렌더링 결과 리스트
+        """
+        results = []
+        targets = resolve_output_targets(output_targets)
+        project_path = Path(project_path) if project_path else project_manager.get_project_path()
+        manifest = RenderManifest(project_path) if project_path else None
+        
+        # 프레임 단위 진행률/ETA (이전 렌더링 길이로 씬별 작업량 추정)
+        tracker = tracker or RenderProgressTracker(len(scenes), progress_callback, status_callback)
+        previous_entries = manifest.get_entries() if manifest else {}
+        for idx, scene in enumerate(scenes):
+            entry = previous_entries.get(scene.get('id'))
+            if entry:
+                tracker.set_estimate(idx, int(entry.get("duration", 0) * entry.get("fps", 0)))
+        
+        # 씬별 렌더러 클래스, 지문, 재사용할 이전 결과 (입력이 바뀌지 않은 씬은 이전 렌더링 결과 재사용)
+        plans = []
+        for scene in scenes:
+            SceneClass = get_renderer_class(scene.get('type', 'type1'))
+            fingerprint = manifest.fingerprint(scene) if manifest and SceneClass else None
+            entry = manifest.get_clean_entry(scene, fingerprint, targets) if SceneClass and manifest and use_cache else None
+            plans.append((SceneClass, fingerprint, entry))
+        
+        def prepare_scene(idx):
+            # 렌더러 생성 + 타임라인/클립/씬 오디오 준비 (앞 씬이 인코딩되는 동안 별도 스레드에서 실행)
+            scene_instance = plans[idx][0](scenes[idx], project_path=project_path)
+            scene_instance.output_targets = targets
+            scene_instance.prepare()
+            return scene_instance
+        
+        dirty_indices = [idx for idx, (SceneClass, _, entry) in enumerate(plans) if SceneClass and not entry]
+        lookahead = int(Settings.get("prepare_lookahead", DEFAULT_PREPARE_LOOKAHEAD))
+        with closing(prepare_ahead(dirty_indices, prepare_scene, lookahead,
+                                   release=lambda instance: instance.release_prepared())) as prepared_scenes:
+            for idx, scene in enumerate(scenes):
+                scene_type = scene.get('type', 'type1')
+                SceneClass, fingerprint, entry = plans[idx]
+                
+                if SceneClass:
+                    telemetry.count_cache("render", hit=bool(entry))
+                    if entry:
+                        with render_tracer.span("scene_cached", phase="scene_cache", scene_id=scene.get('id')):
+                            results.append(SceneRenderResult(
+                                scene_id=scene.get('id'),
+                                video_path=str(project_path / entry["video_path"]),
+                                duration=entry["duration"],
+                                fps=entry["fps"],
+                                audio_placements=[AudioPlacement.from_dict(item) for item in entry["audio_placements"]],
+                                target_paths={target.name: str(project_path / entry["targets"][target.name]["path"])
+                                              for target in targets}
+                            ))
+                        tracker.finish_scene(idx, cached=True)
+                        continue
+                
+                    # 상태 메시지 업데이트
+                    tracker.start_scene(idx, scene.get('id'))
+                
+                    # 미리 준비된 씬 인스턴스로 비디오 생성 (인코딩 진행은 proglog 로거로 트래커에 전달)
+                    scene_started = time.perf_counter()
+                    with render_tracer.span("scene", phase="scene", scene_id=scene.get('id'), scene_type=scene_type):
+                        _, scene_instance, waited = next(prepared_scenes)
+                        # 준비는 다른 스레드에서 했으므로 측정값을 span으로 추가 (기다린 시간 = 가려지지 않은 준비 시간)
+                        if scene_instance.prepared is not None:
+                            render_tracer.add_span("prepare_scene", scene_instance.prepared.wall, phase="prepare")
+                        render_tracer.add_span("prepare_wait", waited, phase="prepare_wait")
+                        scene_instance.progress_logger = tracker.create_logger()
+                        video_path = scene_instance.generate_video_structure()
+                        # generate_video를 거치지 않은 렌더러의 준비 자원 해제
+                        scene_instance.release_prepared()
+                    # 인코딩 중 콜백에서 발생한 예외(작업 취소 등)는 렌더러가 삼키므로 여기서 다시 발생
+                    tracker.raise_if_aborted()
+                
+                    if video_path:
+                        # 상대 경로를 전체 경로로 변환
+                        if project_path:
+                            full_path = project_path / video_path
+                            if full_path.exists():
+                                results.append(SceneRenderResult(
+                                    scene_id=scene_instance.scene_id,
+                                    video_path=str(full_path),
+                                    duration=scene_instance.duration,
+                                    fps=scene_instance.fps,
+                                    audio_placements=list(scene_instance.audio_placements),
+                                    target_paths={name: str(project_path / path)
+                                                  for name, path in scene_instance.target_paths.items()}
+                                ))
+                                manifest.record(
+                                    scene_id=scene_instance.scene_id,
+                                    fingerprint=fingerprint,
+                                    video_path=str(video_path),
+                                    duration=scene_instance.duration,
+                                    fps=scene_instance.fps,
+                                    audio_placements=[placement.to_dict() for placement in scene_instance.audio_placements],
+                                    targets={target.name: {"path": scene_instance.target_paths[target.name],
+                                                           "signature": target.signature()}
+                                             for target in targets if target.name in scene_instance.target_paths}
+                                )
+                                # 씬 타입별 렌더링 시간/출력 크기 기록 (다음 렌더링의 비용 추정에 사용)
+                                render_estimator.record(
+                                    scene_instance.get_timeline(),
+                                    wall=time.perf_counter() - scene_started,
+                                    bytes_written=file_size(full_path) + sum(
+                                        file_size(project_path / path) for path in scene_instance.target_paths.values()),
+                                    targets=targets
+                                )
+                    else:
+                        if manifest:
+                            manifest.forget(scene.get('id'))
+                        # 비디오 생성 실패 경고
+                        if warning_callback:
+                            warning_callback(f"씬 {idx + 1}의 비디오 생성에 실패했습니다.")
+                else:
+                    # 알 수 없는 씬 타입 경고
+                    if warning_callback:
+                        warning_callback(f"알 수 없는 씬 타입: {scene_type}")
+                
+                # 진행률 업데이트
+                tracker.finish_scene(idx, frames=tracker.total_frames)
+        
+        return results
+    
     def generate_all_scene_videos(
         self,
         scenes: List[Dict[str, Any]],
         progress_callback: Optional[Callable[[float], None]] = None,
         status_callback: Optional[Callable[[str], None]] = None,
-        warning_callback: Optional[Callable[[str], None]] = None
+        warning_callback: Optional[Callable[[str], None]] = None,
+        project_path: Optional[Path] = None,
+        use_cache: bool = True
     ) -> List[str]:
         """
         모든 씬의 비디오를 생성합니다.
@@ -32,47 +285,197 @@ class VideoGenerator:
             progress_callback (Optional[Callable[[float], None]]): 진행률 업데이트 콜백 (0.0 ~ 1.0)
             status_callback (Optional[Callable[[str], None]]): 상태 메시지 업데이트 콜백
             warning_callback (Optional[Callable[[str], None]]): 경고 메시지 콜백
+            project_path (Optional[Path]): 프로젝트 경로 (없으면 현재 로드된 프로젝트 사용)
+            use_cache (bool): False면 깨끗한 씬도 다시 렌더링
             
         Returns:
             List[str]: 생성된 비디오 파일의 전체 경로 리스트
         """
-        video_paths = []
+        with render_tracer.trace(self._get_trace_dir(project_path), project=str(project_path or ""),
+                                 scenes=len(scenes)):
+            results = self.render_scenes(
+                scenes=scenes,
+                progress_callback=progress_callback,
+                status_callback=status_callback,
+                warning_callback=warning_callback,
+                project_path=project_path,
+                use_cache=use_cache
+            )
+        return [result.video_path for result in results]
+    
+    def assemble_final_video(
+        self,
+        results: List[SceneRenderResult],
+        output_filename: str = "final_output.mp4",
+        status_callback: Optional[Callable[[str], None]] = None,
+        error_callback: Optional[Callable[[str], None]] = None,
+        project_path: Optional[Path] = None
+    ) -> Optional[str]:
+        """
+        씬 비디오들의 영상 스트림을 재인코딩 없이 이어붙이고,
+        전체 사운드트랙을 원본 오디오에서 한 번에 믹싱/인코딩하여 한 번만 mux합니다.
         
-        for idx, scene in enumerate(scenes):
-            scene_type = scene.get('type', 'type1')
-            SceneClass = get_scene_class(scene_type)
+        씬 mp4에 들어있는 AAC 오디오는 사용하지 않으므로 세대 손실과 씬 경계의 어긋남이 없습니다.
+        
+        Args:
+            results (List[SceneRenderResult]): 씬 렌더링 결과 리스트 (순서대로)
+            output_filename (str): 출력 파일명 (기본값: "final_output.mp4")
+            status_callback (Optional[Callable[[str], None]]): 상태 메시지 업데이트 콜백
+            error_callback (Optional[Callable[[str], None]]): 에러 메시지 콜백
+            project_path (Optional[Path]): 프로젝트 경로 (없으면 현재 로드된 프로젝트 사용)
             
-            if SceneClass:
-                # 상태 메시지 업데이트
-                if status_callback:
-                    status_callback(f"씬 {idx + 1}/{len(scenes)} 생성 중...")
-                
-                # 씬 인스턴스 생성 및 비디오 생성
-                scene_instance = SceneClass(scene)
-                video_path = scene_instance.generate_video_structure()
-                
-                if video_path:
-                    # 상대 경로를 전체 경로로 변환
-                    project_path = project_manager.get_project_path()
-                    if project_path:
-                        full_path = project_path / video_path
-                        if full_path.exists():
-                            video_paths.append(str(full_path))
-                else:
-                    # 비디오 생성 실패 경고
-                    if warning_callback:
-                        warning_callback(f"씬 {idx + 1}의 비디오 생성에 실패했습니다.")
-            else:
-                # 알 수 없는 씬 타입 경고
-                if warning_callback:
-                    warning_callback(f"알 수 없는 씬 타입: {scene_type}")
+        Returns:
+            Optional[str]: 생성된 비디오 파일의 전체 경로 또는 None (실패 시)
+        """
+        outputs = self.assemble_final_outputs(
+            results=results,
+            output_filename=output_filename,
+            status_callback=status_callback,
+            error_callback=error_callback,
+            project_path=project_path
+        )
+        return outputs.get(self.MASTER_OUTPUT) if outputs else None
+    
+    def assemble_final_outputs(
+        self,
+        results: List[SceneRenderResult],
+        output_filename: str = "final_output.mp4",
+        output_targets: Optional[list] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+        error_callback: Optional[Callable[[str], None]] = None,
+        project_path: Optional[Path] = None,
+        tracker: Optional[RenderProgressTracker] = None
+    ) -> Optional[Dict[str, str]]:
+        """
+        기본 최종 비디오와 출력 대상별 최종 비디오를 만듭니다.
+        사운드트랙은 한 번만 믹싱하고, 기본/대상별 영상 이어붙이기(stream copy) + mux는 병렬로 실행합니다.
+        
+        Args:
+            results (List[SceneRenderResult]): 씬 렌더링 결과 리스트 (순서대로)
+            output_filename (str): 기본 출력 파일명 (대상별 파일명은 <파일명>_<대상 이름>.<컨테이너>)
+            output_targets (list, optional): 출력 대상 (프리셋 이름/딕셔너리/OutputTarget 리스트)
+            status_callback (Optional[Callable[[str], None]]): 상태 메시지 업데이트 콜백
+            error_callback (Optional[Callable[[str], None]]): 에러 메시지 콜백
+            project_path (Optional[Path]): 프로젝트 경로 (없으면 현재 로드된 프로젝트 사용)
+            tracker (RenderProgressTracker, optional): 씬 렌더링에 사용한 진행률 트래커
+                                                       (있으면 상태 메시지 대신 합치기 단계/남은 시간으로 보고)
             
-            # 진행률 업데이트
-            if progress_callback:
-                progress_callback((idx + 1) / len(scenes))
+        Returns:
+            Optional[Dict[str, str]]: 출력 이름("master" 또는 대상 이름) → 최종 비디오 전체 경로
+                                      또는 None (기본 최종 비디오 실패 시)
+        """
+        if not results:
+            if error_callback:
+                error_callback("합성할 비디오가 없습니다.")
+            return None
+        
+        project_path = Path(project_path) if project_path else project_manager.get_project_path()
+        if not project_path:
+            if error_callback:
+                error_callback("프로젝트 경로를 찾을 수 없습니다.")
+            return None
+        
+        output_folder = project_path / "output"
+        output_folder.mkdir(parents=True, exist_ok=True)
+        stem = Path(output_filename).stem
+        soundtrack_path = output_folder / f"{stem}_soundtrack.wav"
+        
+        # 출력 이름 → (씬 비디오 경로 리스트, 최종 비디오 경로, 오디오/컨테이너 인자)
+        jobs = {
+            self.MASTER_OUTPUT: ([result.video_path for result in results], output_folder / output_filename,
+                                 ["-c:a", "aac", "-b:a", "192k", "-movflags", "+faststart"])
+        }
+        for target in resolve_output_targets(output_targets):
+            if not all(target.name in result.target_paths for result in results):
+                if error_callback:
+                    error_callback(f"출력 대상 '{target.name}'의 씬 비디오가 없어 건너뜁니다.")
+                continue
+            jobs[target.name] = ([result.target_paths[target.name] for result in results],
+                                 output_folder / target.get_output_filename(output_filename),
+                                 target.get_mux_args())
+        concat_list_paths = [output_folder / f"{stem}_{name}_concat.txt" for name in jobs]
         
-        return video_paths
+        def report(step):
+            if tracker:
+                tracker.set_assemble_step(step)
+            elif status_callback:
+                status_callback(f"{step} 중...")
+        
+        try:
+            report("사운드트랙 믹싱")
+            
+            # 씬 시작 시간(실제 인코딩된 프레임 길이 기준)만큼 오디오 배치를 이동
+            placements = []
+            offset = 0.0
+            for result in results:
+                scene_end = offset + result.video_duration
+                for placement in result.audio_placements:
+                    placements.append(placement.shifted(offset, end=scene_end))
+                offset = scene_end
+            
+            with render_tracer.span("mix_soundtrack", phase="soundtrack_mix", placements=len(placements)) as span:
+                mixed = audio_mixer.mix_to_wav(placements, offset, soundtrack_path)
+                span["bytes_written"] = file_size(soundtrack_path)
+            if not mixed:
+                if error_callback:
+                    error_callback("사운드트랙 생성에 실패했습니다.")
+                return None
+            
+            report("비디오 합치기" if len(jobs) == 1 else f"비디오 {len(jobs)}개 합치기")
+            
+            # 씬 비디오에는 자체 오디오 트랙(패딩 포함)이 있어 컨테이너 길이가 영상보다 길 수 있으므로,
+            # 씬 경계를 사운드트랙 배치와 같은 영상 길이로 고정 (씬마다 어긋남이 누적되지 않도록)
+            scene_durations = [result.video_duration for result in results]
+            
+            def mux(video_paths, output_path, mux_args, concat_list_path):
+                # 영상은 stream copy, 오디오는 출력마다 한 번만 인코딩
+                started = time.perf_counter()
+                if not write_concat_list(video_paths, concat_list_path, durations=scene_durations):
+                    return False, 0.0
+                success = run_ffmpeg([
+                    "-f", "concat", "-safe", "0", "-i", str(concat_list_path),
+                    "-i", str(soundtrack_path),
+                    "-map", "0:v:0", "-map", "1:a:0",
+                    "-c:v", "copy",
+                    *mux_args,
+                    str(output_path)
+                ], error_prefix="VIDEO_MUX")
+                return success, time.perf_counter() - started
+            
+            with ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="final-mux") as executor:
+                futures = {
+                    name: executor.submit(mux, *job, concat_list_path)
+                    for (name, job), concat_list_path in zip(jobs.items(), concat_list_paths)
+                }
+            
+            outputs = {}
+            for name, future in futures.items():
+                success, elapsed = future.result()
+                output_path = jobs[name][1]
+                # 트레이스는 스레드별이므로 mux 시간은 여기서 기록
+                render_tracer.add_span("mux", elapsed, phase="mux", scenes=len(results), target=name,
+                                       bytes_written=file_size(output_path))
+                if success:
+                    outputs[name] = str(output_path)
+                elif error_callback:
+                    error_callback("비디오 합치기에 실패했습니다." if name == self.MASTER_OUTPUT
+                                   else f"출력 대상 '{name}' 비디오 합치기에 실패했습니다.")
+            
+            return outputs if self.MASTER_OUTPUT in outputs else None
+            
+        except Exception as e:
+            if error_callback:
+                error_callback(f"비디오 합치기 중 오류 발생: {e}")
+            return None
+        finally:
+            # 임시 파일 정리
+            for temp_path in (soundtrack_path, *concat_list_paths):
+                try:
+                    temp_path.unlink()
+                except OSError:
+                    pass
     
+
     def concatenate_videos(
         self,
         video_paths: List[str],
@@ -102,6 +505,8 @@ class VideoGenerator:
             if status_callback:
                 status_callback("비디오 합치는 중...")
             
+            from moviepy import VideoFileClip, concatenate_videoclips
+            
             # 비디오 클립 로드
             clips = [VideoFileClip(path) for path in video_paths]
             
@@ -138,10 +543,14 @@ class VideoGenerator:
         status_callback: Optional[Callable[[str], None]] = None,
         warning_callback: Optional[Callable[[str], None]] = None,
         error_callback: Optional[Callable[[str], None]] = None,
-        success_callback: Optional[Callable[[str], None]] = None
+        success_callback: Optional[Callable[[str], None]] = None,
+        project_path: Optional[Path] = None,
+        use_cache: bool = True,
+        output_targets: Optional[list] = None
     ) -> Optional[str]:
         """
         모든 씬의 비디오를 생성하고 합성하여 최종 비디오를 만듭니다.
+        출력 대상을 넘기면 대상별 최종 비디오도 함께 만듭니다 (경로 목록은 generate_final_outputs 사용).
         
         Args:
             scenes (List[Dict[str, Any]]): 씬 정보 리스트
@@ -151,35 +560,97 @@ class VideoGenerator:
             warning_callback (Optional[Callable[[str], None]]): 경고 메시지 콜백
             error_callback (Optional[Callable[[str], None]]): 에러 메시지 콜백
             success_callback (Optional[Callable[[str], None]]): 성공 메시지 콜백
+            project_path (Optional[Path]): 프로젝트 경로 (없으면 현재 로드된 프로젝트 사용)
+            use_cache (bool): False면 깨끗한 씬도 다시 렌더링
+            output_targets (list, optional): 출력 대상 (프리셋 이름/딕셔너리/OutputTarget 리스트)
             
         Returns:
             Optional[str]: 생성된 최종 비디오 파일의 전체 경로 또는 None (실패 시)
         """
-        # 모든 씬의 비디오 생성
-        video_paths = self.generate_all_scene_videos(
+        outputs = self.generate_final_outputs(
             scenes=scenes,
+            output_filename=output_filename,
             progress_callback=progress_callback,
             status_callback=status_callback,
-            warning_callback=warning_callback
+            warning_callback=warning_callback,
+            error_callback=error_callback,
+            success_callback=success_callback,
+            project_path=project_path,
+            use_cache=use_cache,
+            output_targets=output_targets
         )
+        return outputs.get(self.MASTER_OUTPUT) if outputs else None
+    
+    def generate_final_outputs(
+        self,
+        scenes: List[Dict[str, Any]],
+        output_filename: str = "final_output.mp4",
+        progress_callback: Optional[Callable[[float], None]] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+        warning_callback: Optional[Callable[[str], None]] = None,
+        error_callback: Optional[Callable[[str], None]] = None,
+        success_callback: Optional[Callable[[str], None]] = None,
+        project_path: Optional[Path] = None,
+        use_cache: bool = True,
+        output_targets: Optional[list] = None
+    ) -> Optional[Dict[str, str]]:
+        """
+        한 번의 렌더링(씬마다 프레임 합성 한 번)으로 기본 최종 비디오와 출력 대상별 최종 비디오를 만듭니다.
         
-        if not video_paths:
-            if error_callback:
-                error_callback("생성된 비디오가 없습니다.")
-            return None
-        
-        # 비디오 합성
-        final_path = self.concatenate_videos(
-            video_paths=video_paths,
-            output_filename=output_filename,
-            status_callback=status_callback,
-            error_callback=error_callback
-        )
+        Args:
+            scenes (List[Dict[str, Any]]): 씬 정보 리스트
+            output_filename (str): 기본 출력 파일명 (기본값: "final_output.mp4")
+            progress_callback (Optional[Callable[[float], None]]): 진행률 업데이트 콜백 (0.0 ~ 1.0)
+            status_callback (Optional[Callable[[str], None]]): 상태 메시지 업데이트 콜백
+            warning_callback (Optional[Callable[[str], None]]): 경고 메시지 콜백
+            error_callback (Optional[Callable[[str], None]]): 에러 메시지 콜백
+            success_callback (Optional[Callable[[str], None]]): 성공 메시지 콜백
+            project_path (Optional[Path]): 프로젝트 경로 (없으면 현재 로드된 프로젝트 사용)
+            use_cache (bool): False면 깨끗한 씬도 다시 렌더링
+            output_targets (list, optional): 출력 대상 (프리셋 이름/딕셔너리/OutputTarget 리스트)
+            
+        Returns:
+            Optional[Dict[str, str]]: 출력 이름("master" 또는 대상 이름) → 최종 비디오 전체 경로 또는 None (실패 시)
+        """
+        with render_tracer.trace(self._get_trace_dir(project_path), project=str(project_path or ""),
+                                 scenes=len(scenes), output=output_filename):
+            # 씬 렌더링과 합치기 단계를 하나의 진행률/남은 시간으로 보고
+            tracker = RenderProgressTracker(len(scenes), progress_callback, status_callback,
+                                            assemble_seconds=render_estimator.estimate_assemble_seconds())
+            
+            # 모든 씬의 비디오 생성 (출력 대상별 씬 비디오 포함)
+            results = self.render_scenes(
+                scenes=scenes,
+                progress_callback=progress_callback,
+                status_callback=status_callback,
+                warning_callback=warning_callback,
+                project_path=project_path,
+                use_cache=use_cache,
+                output_targets=output_targets,
+                tracker=tracker
+            )
+            
+            if not results:
+                if error_callback:
+                    error_callback("생성된 비디오가 없습니다.")
+                return None
+            
+            # 영상 이어붙이기 + 사운드트랙 한 번에 mux (출력별로 병렬)
+            outputs = self.assemble_final_outputs(
+                results=results,
+                output_filename=output_filename,
+                output_targets=output_targets,
+                status_callback=status_callback,
+                error_callback=error_callback,
+                project_path=project_path,
+                tracker=tracker
+            )
         
-        if final_path and success_callback:
-            success_callback(f"전체 비디오 생성 완료: {final_path}")
+        if outputs and success_callback:
+            extra = f" (출력 대상 {len(outputs) - 1}개 포함)" if len(outputs) > 1 else ""
+            success_callback(f"전체 비디오 생성 완료: {outputs[self.MASTER_OUTPUT]}{extra}")
         
-        return final_path
+        return outputs
 
 
 # 전역 VideoGenerator 인스턴스
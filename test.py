@@ -8,7 +8,7 @@ from typing import Optional, List
 def generate_tts_with_elevenlabs(
     text: str,
     output_path: str = "output.mp3",
-    api_key: Optional[str] = "sk_92c9abfb8d79f63d8ad337bc05d711c20fdfe8c140beaec7",
+    api_key: Optional[str] = None,
     voice_id: str = "21m00Tcm4TlvDq8ikWAM",  # 기본 음성 ID (Rachel - 영어)
     model_id: str = "eleven_multilingual_v2"  # 다국어 모델 사용
 ) -> bool:
@@ -215,8 +215,8 @@ if __name__ == "__main__":
         "팥붕",
     ]
     
-    # API 키 설정 (기본값 사용)
-    api_key = "sk_92c9abfb8d79f63d8ad337bc05d711c20fdfe8c140beaec7"
+    # API 키 설정 (환경 변수 사용)
+    api_key = os.getenv("ELEVENLABS_API_KEY")
     
     # 여러 문장을 순차적으로 TTS로 변환
     result = generate_multiple_tts(
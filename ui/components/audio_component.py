@@ -1,8 +1,8 @@
 import streamlit as st
-import shutil
 from typing import Dict, Any, Optional
 from service.video_manager import video_manager
 from project_manager import project_manager
+from service.blob_store import blob_store
 from pathlib import Path
 from service.tts_service import TTSRequest, tts_service
 
@@ -50,14 +50,16 @@ def _save_audio_to_project(
         audio_filename = f"{scene_id}_{field}{file_extension}"
         target_path = audio_folder / audio_filename
         
-        # 파일 저장/복사
+        # 파일 저장 (내용 주소 저장소에 한 번만 보관하고 하드링크 - 같은 TTS 문장/파일은 복사 없음)
         if isinstance(source_file, Path):
-            # Path 객체인 경우 (TTS 생성 파일)
-            shutil.copy2(source_file, target_path)
+            # Path 객체인 경우 (TTS 생성 파일 - 캐시 파일은 바뀌지 않으므로 저장소에 링크로 넣음)
+            saved = blob_store.save_file(source_file, target_path, link_source=True)
         else:
             # UploadedFile인 경우
-            with open(target_path, "wb") as f:
-                f.write(source_file.getbuffer())
+            saved = blob_store.save_bytes(source_file.getbuffer(), target_path)
+        if not saved:
+            st.error("오디오 파일 저장에 실패했습니다.")
+            return False
         
         # 상대 경로 생성
         relative_path = f"{subfolder}/{audio_filename}"
@@ -100,7 +102,7 @@ def render_audio_input(scene: Dict[str, Any], field: str = "audio", tts_request:
             if st.button("auto", key=auto_key, help="자동 생성 (TTS)"):
                 try:
                     # TTS 서비스 호출하여 음성 파일 생성
-                    generated_file = tts_service.generate(tts_request)
+                    generated_file = tts_service.generate(tts_request, project_path=project_manager.get_project_path())
                     
                     if generated_file and generated_file.exists():
                         # 공통 함수를 사용하여 프로젝트에 저장
@@ -1,6 +1,9 @@
 import streamlit as st
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional
 from service.video_manager import video_manager
+from project_manager import project_manager
+from service.tts_service import TTSRequest
+from service.tts_prefetch_service import tts_prefetch_service
 
 
 def render_text_input(
@@ -9,6 +12,7 @@ def render_text_input(
     height: int = 50,
     label: str = None,
     multiline: bool = True,   # ✅ 추가: True면 text_area, False면 text_input(한줄)
+    tts_request_factory: Optional[Callable[[str], TTSRequest]] = None,
 ):
     """
     텍스트 입력 컴포넌트 - 여러 타입에서 공용으로 사용 가능
@@ -19,6 +23,8 @@ def render_text_input(
         height (int): text_area 높이 (multiline=True일 때만 사용)
         label (str, optional): 라벨 텍스트 (None이면 field 사용)
         multiline (bool): True=여러줄(text_area), False=한줄(text_input)
+        tts_request_factory (Callable, optional): 텍스트로 TTSRequest를 만드는 함수 (예: TTSRequest.han)
+                                                  지정하면 저장 후 TTS를 미리 합성함 (설정 "tts_prefetch"가 켜져 있을 때)
     """
     scene_id = scene.get("id")
     current_value = scene.get(field, "")
@@ -33,6 +39,13 @@ def render_text_input(
             new_text = st.session_state[key]
             if video_manager.update_scene_field(scene_id, field, new_text) is False:
                 st.error("저장에 실패했습니다.")
+            elif tts_request_factory:
+                # 입력이 멈춘 뒤(디바운스) 백그라운드에서 미리 합성, 빈 텍스트면 대기 요청 취소
+                tts_prefetch_service.schedule(
+                    f"{scene_id}:{field}",
+                    tts_request_factory(new_text) if new_text else None,
+                    project_path=project_manager.get_project_path()
+                )
 
     if multiline:
         st.text_area(
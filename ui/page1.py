@@ -1,13 +1,102 @@
+import json
 import streamlit as st
 from pathlib import Path
 from service.video_manager import video_manager
 from ui.popup.scene_type_dialog import scene_type_dialog
 from ui.popup.video_player_popup import video_player_dialog
 from project_manager import project_manager
+from settings import Settings
 from utils.folder_utils import open_folder_in_explorer
+from service.render_estimator import render_estimator
+from service.render_manifest import MANIFEST_FILENAME
+from service.render_job_queue import render_job_queue, RenderJobStatus
+
+
+@st.fragment(run_every=1.0)
+def render_jobs_panel(project_path):
+    """
+    현재 프로젝트의 렌더링 작업 상태를 주기적으로 조회하여 표시하는 패널
+    작업이 끝나면 한 번 전체 페이지를 새로고침하여 재생 버튼 등을 갱신합니다.
+    
+    Args:
+        project_path (Path): 프로젝트 경로
+    """
+    jobs = render_job_queue.list_jobs(project_path, limit=5)
+    if not jobs:
+        return
+    
+    seen_key = "render_jobs_seen_finished"
+    seen_finished = st.session_state.setdefault(seen_key, set())
+    newly_finished = False
+    
+    for job in jobs:
+        scope = "전체 비디오" if job.is_final_render else f"씬 {len(job.scene_ids)}개"
+        
+        if job.is_active:
+            col_progress, col_cancel = st.columns([6, 1], vertical_alignment="center")
+            with col_progress:
+                st.progress(job.progress, text=f"🎬 {scope} - {job.message}")
+            with col_cancel:
+                if st.button("⏹", key=f"cancel_job_{job.job_id}", help="렌더링 취소"):
+                    render_job_queue.cancel(job.job_id)
+            continue
+        
+        # 이미 확인한 완료 작업은 가장 최근 것만 결과 표시
+        if job.job_id not in seen_finished:
+            seen_finished.add(job.job_id)
+            newly_finished = True
+        
+        if job is jobs[0]:
+            if job.status == RenderJobStatus.DONE:
+                if job.is_final_render and job.output_paths:
+                    st.success(f"전체 비디오 생성 완료: {job.output_paths[0]}")
+                else:
+                    st.success(f"{scope} 비디오 생성 완료")
+            elif job.status == RenderJobStatus.FAILED:
+                st.error(f"{scope} 생성 실패: {job.message}")
+            elif job.status == RenderJobStatus.CANCELLED:
+                st.info(f"{scope} 렌더링이 취소되었습니다.")
+            if job.error and job.status != RenderJobStatus.CANCELLED:
+                st.caption(job.error)
+    
+    # 첫 조회에서 이미 끝나 있던 작업은 새로고침하지 않음
+    if newly_finished and st.session_state.get("render_jobs_panel_initialized"):
+        st.rerun(scope="app")
+    st.session_state["render_jobs_panel_initialized"] = True
+
+def get_cached_estimate(project_path):
+    """
+    렌더링 전 예상 시간/출력 크기 (변경 없는 씬은 이전 결과를 재사용하므로 제외)
+    재실행마다 타임라인을 다시 만들지 않도록 video.json과 렌더링 매니페스트가 바뀔 때만 다시 계산합니다.
+
+    Args:
+        project_path (Path): 프로젝트 경로
+
+    Returns:
+        ProjectEstimate: 프로젝트 예상 결과 또는 None (프로젝트가 없을 때)
+    """
+    if not project_path:
+        return None
+    output_targets = Settings.get("output_targets", [])
+    mtimes = []
+    for path in (project_path / "video.json", project_path / "output" / MANIFEST_FILENAME):
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    cache_key = (str(project_path), tuple(mtimes), json.dumps(output_targets, sort_keys=True, default=str))
+    cached = st.session_state.get("render_estimate")
+    if cached and cached[0] == cache_key:
+        return cached[1]
+    estimate = render_estimator.estimate_project(project_path, output_targets=output_targets)
+    st.session_state["render_estimate"] = (cache_key, estimate)
+    return estimate
 
 def show():
     
+    project_path = project_manager.get_project_path()
+    estimate = get_cached_estimate(project_path)
+    
     # + 버튼과 비디오 생성 버튼, output 폴더 열기 버튼
     col1, col2, col3, col4 = st.columns([1, 1, 1, 2])
     with col1:
@@ -17,56 +106,19 @@ def show():
     
     with col2:
         if st.button("🎬", width="stretch", help="비디오 생성"):
-            # 비디오 생성 처리
+            # 비디오 생성 처리 (백그라운드 렌더링 작업으로 등록)
             video_data = video_manager.get_video_data()
             scenes = video_data.get("scenes", [])
+            project_path = project_manager.get_project_path()
             
             if not scenes:
                 st.warning("생성할 씬이 없습니다.")
+            elif not project_path:
+                st.warning("프로젝트가 로드되지 않았습니다.")
             else:
-                # VideoGenerator를 사용하여 비디오 생성
-                from service.video_generator import video_generator
-                
-                # UI 요소 생성
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                # 콜백 함수 정의
-                def update_progress(progress: float):
-                    """진행률 업데이트 콜백"""
-                    progress_bar.progress(progress)
-                
-                def update_status(status: str):
-                    """상태 메시지 업데이트 콜백"""
-                    status_text.text(status)
-                
-                def show_warning(message: str):
-                    """경고 메시지 콜백"""
-                    st.warning(message)
-                
-                def show_error(message: str):
-                    """에러 메시지 콜백"""
-                    st.error(message)
-                
-                def show_success(message: str):
-                    """성공 메시지 콜백"""
-                    # st.success(message)
-                    status_text.text("완료!")
-                
-                # 최종 비디오 생성
-                final_path = video_generator.generate_final_video(
-                    scenes=scenes,
-                    progress_callback=update_progress,
-                    status_callback=update_status,
-                    warning_callback=show_warning,
-                    error_callback=show_error,
-                    success_callback=show_success
-                )
-                
-                # UI 요소 정리
-                progress_bar.empty()
-                if not final_path:
-                    status_text.empty()
+                # 설정한 출력 대상(Shorts/Reels 등)도 같은 렌더링에서 함께 인코딩
+                if not render_job_queue.submit(project_path, output_targets=Settings.get("output_targets", [])):
+                    st.error("렌더링 작업 등록에 실패했습니다.")
     
     with col3:
         # output 폴더 열기 버튼
@@ -84,6 +136,15 @@ def show():
             else:
                 st.warning("프로젝트가 로드되지 않았습니다.")
     
+    with col4:
+        if estimate and estimate.scenes:
+            st.caption(f"⏱️ {estimate.format_message()}")
+    
+    # 렌더링 작업 진행 상황 (완료 시 자동 새로고침)
+    project_path = project_manager.get_project_path()
+    if project_path:
+        render_jobs_panel(project_path)
+    
     # 현재 씬 목록 표시
     video_data = video_manager.get_video_data()
     scenes = video_data.get("scenes", [])
@@ -106,21 +167,17 @@ def show():
             with col_header:
                 # 씬 헤더 표시
                 st.markdown(f"### 씬 {idx} (Type: {scene_type})")
+                scene_estimate = estimate.get_scene(scene_id) if estimate else None
+                if scene_estimate:
+                    st.caption(f"⏱️ {scene_estimate.format_message()}")
             
             with col_video:
                 # 비디오 생성 버튼 (이 씬만)
                 if st.button("🎬", key=f"video_{scene_id}", help="이 씬만 비디오 생성"):
-                    # 해당 씬의 비디오 생성
-                    SceneClass = get_scene_class(scene_type)
-                    if SceneClass:
-                        scene_instance = SceneClass(scene)
-                        video_path = scene_instance.generate_video_structure()
-                        
-                        if not video_path:
-                            st.error("비디오 생성에 실패했습니다.")
-                        else:
-                            # 비디오 생성 후 페이지 새로고침하여 재생 버튼 표시
-                            st.rerun()
+                    # 해당 씬의 비디오 생성 (단일 씬 작업은 전체 렌더링보다 우선 처리)
+                    if get_scene_class(scene_type):
+                        if not render_job_queue.submit(project_manager.get_project_path(), scene_ids=[scene_id], priority=1):
+                            st.error("렌더링 작업 등록에 실패했습니다.")
                     else:
                         st.warning(f"알 수 없는 씬 타입: {scene_type}")
             
@@ -146,6 +203,7 @@ def show():
             if SceneClass:
                 scene_instance = SceneClass(scene)
                 scene_instance.render()
+                scene_instance.render_preview()
             else:
                 # 알 수 없는 타입인 경우 기본 UI 표시
                 st.warning(f"알 수 없는 씬 타입: {scene_type}")
@@ -1,29 +1,193 @@
+import statistics
+import time
+from collections import defaultdict
+from datetime import datetime
+
 import streamlit as st
+from service.project_catalog import project_catalog
+from service.render_progress import format_duration
+from service.telemetry import percentile, telemetry
+
+# 기간 선택 → 초
+PERIODS = {"최근 24시간": 86400, "최근 7일": 7 * 86400, "최근 30일": 30 * 86400}
+# 캐시 이름 → 표시 이름
+CACHE_LABELS = {"render": "🎬 씬 렌더링", "text": "🔤 텍스트 이미지", "audio": "🔊 오디오 PCM", "tts": "🗣️ TTS",
+                "frame": "🖼️ 미리보기 프레임", "audio_preview": "🎧 오디오 미리듣기"}
+# 회귀 확인에 사용할 최근 샘플 수 (이전 샘플 중앙값과 비교)
+RECENT_SAMPLES = 5
+
+
+def _format_time(timestamp):
+    return datetime.fromtimestamp(timestamp).strftime("%m-%d %H:%M")
+
+
+def _summarize(values):
+    """값 리스트의 횟수/중앙값/p90/최대"""
+    return {
+        "횟수": len(values),
+        "중앙값(초)": round(statistics.median(values), 2),
+        "p90(초)": round(percentile(values, 90), 2),
+        "최대(초)": round(max(values), 2)
+    }
+
+
+def _get_change(values):
+    """최근 RECENT_SAMPLES개 중앙값의 이전 대비 변화율 (%) - 비교할 이전 값이 없으면 None"""
+    if len(values) <= RECENT_SAMPLES:
+        return None
+    before = statistics.median(values[:-RECENT_SAMPLES])
+    recent = statistics.median(values[-RECENT_SAMPLES:])
+    return round((recent - before) / before * 100, 1) if before else None
+
+
+def show_cache_stats(since):
+    """캐시별 적중률"""
+    st.subheader("💾 캐시 적중률")
+    stats = telemetry.get_cache_stats(since)
+    columns = st.columns(len(CACHE_LABELS))
+    for column, (cache, label) in zip(columns, CACHE_LABELS.items()):
+        item = stats.get(cache)
+        with column:
+            if item:
+                st.metric(label, f"{item['hit_rate'] * 100:.0f}%",
+                          help=f"적중 {item['hits']}회 / 실패 {item['misses']}회")
+            else:
+                st.metric(label, "-", help="기록 없음")
+
+
+def show_scene_history(since):
+    """씬별 렌더링 시간 추이와 느린 씬 타입"""
+    samples = telemetry.get_samples("scene_seconds", since)
+    st.subheader("🎞️ 씬 렌더링 시간")
+    if not samples:
+        st.info("기간 내 씬 렌더링 기록이 없습니다.")
+        return
+
+    # 씬 타입별 렌더링 시간 추이 (렌더링 시각 순)
+    by_type = defaultdict(list)
+    for sample in samples:
+        by_type[sample.get("scene_type") or "unknown"].append(sample["value"])
+    st.line_chart({
+        scene_type: [sample["value"] if (sample.get("scene_type") or "unknown") == scene_type else None
+                     for sample in samples]
+        for scene_type in by_type
+    })
+
+    # 느린 씬 타입 (중앙값 순) + 최근 렌더링의 변화율로 회귀 확인
+    st.markdown("**🐢 느린 씬 타입**")
+    rows = []
+    for scene_type, values in by_type.items():
+        change = _get_change(values)
+        rows.append({"씬 타입": scene_type, **_summarize(values),
+                     "최근 변화": f"{change:+.1f}%" if change is not None else "-"})
+    rows.sort(key=lambda row: row["중앙값(초)"], reverse=True)
+    st.dataframe(rows, hide_index=True, width="stretch")
+
+    with st.expander("최근 씬 렌더링"):
+        st.dataframe([
+            {"시각": _format_time(sample["recorded_at"]), "프로젝트": sample.get("project", ""),
+             "씬 ID": sample.get("scene_id", ""), "씬 타입": sample.get("scene_type", ""),
+             "시간(초)": round(sample["value"], 2)}
+            for sample in reversed(samples[-50:])
+        ], hide_index=True, width="stretch")
+
+
+def show_phase_history(since):
+    """렌더링 단계별 시간"""
+    samples = telemetry.get_samples("phase_seconds", since)
+    st.subheader("⏱️ 단계별 시간")
+    if not samples:
+        st.info("기간 내 렌더링 트레이스 기록이 없습니다.")
+        return
+
+    by_phase = defaultdict(list)
+    for sample in samples:
+        by_phase[sample.get("phase") or "unknown"].append(sample["value"])
+    rows = []
+    for phase, values in by_phase.items():
+        change = _get_change(values)
+        rows.append({"단계": phase, **_summarize(values), "합계(초)": round(sum(values), 1),
+                     "최근 변화": f"{change:+.1f}%" if change is not None else "-"})
+    rows.sort(key=lambda row: row["합계(초)"], reverse=True)
+    st.dataframe(rows, hide_index=True, width="stretch")
+
+    phase = st.selectbox("단계별 추이", [row["단계"] for row in rows], key="dashboard_phase")
+    st.line_chart({phase: by_phase[phase]})
+
+
+def show_encoder_fps(since):
+    """씬별 인코딩 fps"""
+    samples = telemetry.get_samples("encode_fps", since)
+    st.subheader("🚀 인코딩 fps")
+    if not samples:
+        st.info("기간 내 인코딩 기록이 없습니다.")
+        return
+    values = [sample["value"] for sample in samples]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("중앙값", f"{statistics.median(values):.1f} fps")
+    col2.metric("하위 10%", f"{percentile(values, 10):.1f} fps")
+    change = _get_change(values)
+    col3.metric("최근", f"{statistics.median(values[-RECENT_SAMPLES:]):.1f} fps",
+                f"{change:+.1f}%" if change is not None else None)
+    st.line_chart({"fps": values})
+
+
+def show_tts_latency(since):
+    """TTS 백엔드별 지연 시간 백분위수"""
+    samples = telemetry.get_samples("tts_latency", since)
+    st.subheader("🗣️ TTS 지연 시간")
+    if not samples:
+        st.info("기간 내 TTS 합성 기록이 없습니다.")
+        return
+    by_backend = defaultdict(list)
+    failures = defaultdict(int)
+    for sample in samples:
+        by_backend[sample.get("backend") or "unknown"].append(sample["value"])
+        if sample.get("ok") is False:
+            failures[sample.get("backend") or "unknown"] += 1
+    st.dataframe([
+        {"백엔드": backend, "횟수": len(values), "실패": failures[backend],
+         "p50(초)": round(percentile(values, 50), 2), "p90(초)": round(percentile(values, 90), 2),
+         "p99(초)": round(percentile(values, 99), 2)}
+        for backend, values in by_backend.items()
+    ], hide_index=True, width="stretch")
+
+
+def show_disk_usage():
+    """프로젝트별 디스크 사용량 (프로젝트 카탈로그 통계)"""
+    st.subheader("🗂️ 프로젝트별 디스크 사용량")
+    entries, total, total_bytes = project_catalog.get_disk_usage(limit=20)
+    if not entries:
+        st.info("프로젝트가 없습니다.")
+        return
+    st.caption(f"프로젝트 {total}개 · 전체 {total_bytes / 1024 / 1024:.1f} MB")
+    st.bar_chart({"MB": {entry.project_name or entry.folder_name: round(entry.size_bytes / 1024 / 1024, 1)
+                         for entry in entries}}, horizontal=True)
+
 
 def show():
-    st.title("페이지 2")
-    st.markdown("이것은 두 번째 페이지입니다.")
-    
-    st.write("여기에 페이지 2의 내용이 표시됩니다.")
-    
-    # 간단한 예제 콘텐츠
-    st.subheader("📊 페이지 2 데이터")
-    st.write("- 기능: 데이터 분석")
-    st.write("- 처리 중인 항목: 5개")
-    st.write("- 완료된 항목: 12개")
-    
-    # 간단한 메트릭
+    st.title("📊 렌더링 성능 대시보드")
+    st.caption("렌더링 트레이스, 캐시, TTS 기록(telemetry.db)으로 회귀와 병목을 확인합니다.")
+
+    period = st.selectbox("기간", list(PERIODS), index=1, key="dashboard_period")
+    since = time.time() - PERIODS[period]
+
+    # 요약
+    scene_samples = telemetry.get_samples("scene_seconds", since)
+    renders = {sample.get("render_id") for sample in scene_samples}
     col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("사용자", "1,234", "12%")
-    with col2:
-        st.metric("방문", "5,678", "8%")
-    with col3:
-        st.metric("전환", "89", "-2%")
-    
-    # 간단한 선택 상자
-    option = st.selectbox(
-        "데이터 유형 선택",
-        ["실시간", "일간", "주간", "월간"]
-    )
-    st.write(f"선택된 데이터 유형: {option}")
+    col1.metric("렌더링", f"{len(renders)}회")
+    col2.metric("렌더링한 씬", f"{len(scene_samples)}개")
+    col3.metric("씬 렌더링 시간 합계", format_duration(sum(sample["value"] for sample in scene_samples)))
+
+    show_cache_stats(since)
+    st.divider()
+    show_scene_history(since)
+    st.divider()
+    show_phase_history(since)
+    st.divider()
+    show_encoder_fps(since)
+    st.divider()
+    show_tts_latency(since)
+    st.divider()
+    show_disk_usage()
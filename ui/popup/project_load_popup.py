@@ -1,52 +1,102 @@
+import datetime
 import streamlit as st
 from project_manager import project_manager
 
+# 한 페이지에 표시할 프로젝트 수
+PAGE_SIZE = 20
+
+
+def _format_size(size_bytes):
+    """바이트 수를 읽기 쉬운 단위로 변환"""
+    size = float(size_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def _format_stats(entry):
+    """프로젝트 통계 한 줄 (씬 수 · 크기 · 마지막 렌더링)"""
+    parts = [f"씬 {entry.scene_count}개", _format_size(entry.size_bytes)]
+    if entry.last_render_at:
+        rendered = datetime.datetime.fromtimestamp(entry.last_render_at).strftime("%Y-%m-%d %H:%M")
+        parts.append(f"렌더링 {entry.rendered_scenes}씬 · {rendered}")
+    else:
+        parts.append("렌더링 없음")
+    return " · ".join(parts)
+
+
 @st.dialog("프로젝트 로드")
 def load_dialog():
     st.write("로드할 프로젝트를 선택하세요")
-    
-    # 프로젝트 목록 가져오기
-    projects = project_manager.get_projects_list()
-    
-    if not projects:
-        st.warning("생성된 프로젝트가 없습니다.")
+
+    # 검색 조건 (이름, 생성일 범위)
+    search = st.text_input("🔍 프로젝트 이름", key="project_load_search")
+    use_date_range = st.checkbox("생성일로 찾기", key="project_load_use_dates")
+    date_from = date_to = None
+    if use_date_range:
+        today = datetime.date.today()
+        date_range = st.date_input("생성일 범위", value=(today - datetime.timedelta(days=30), today),
+                                   key="project_load_dates")
+        if isinstance(date_range, (tuple, list)) and len(date_range) == 2:
+            date_from, date_to = date_range
+
+    # 검색 조건이 바뀌면 첫 페이지로
+    query_key = (search, date_from, date_to)
+    if st.session_state.get("project_load_query") != query_key:
+        st.session_state["project_load_query"] = query_key
+        st.session_state["project_load_page"] = 0
+    page = st.session_state.get("project_load_page", 0)
+
+    # 프로젝트 카탈로그에서 현재 페이지만 가져오기
+    entries, total = project_manager.search_projects(search=search.strip() or None, date_from=date_from,
+                                                     date_to=date_to, page=page, page_size=PAGE_SIZE)
+
+    if not total:
+        st.warning("조건에 맞는 프로젝트가 없습니다." if search or use_date_range else "생성된 프로젝트가 없습니다.")
         if st.button("닫기", width="stretch"):
             st.rerun()
         return
-    
+
     # 현재 선택된 프로젝트 표시
     current_project = project_manager.get_current_project()
-    
+
     # 각 프로젝트를 클릭 가능한 버튼으로 표시
-    for project in projects:
-        # Project 객체는 딕셔너리처럼 접근 가능 (__getitem__ 구현)
-        # 폴더 이름에서 타임스탬프와 프로젝트 이름 분리
-        if "_" in project['folder_name']:
-            timestamp, name = project['folder_name'].split("_", 1)
-            # 타임스탬프를 읽기 쉬운 형식으로 변환
-            try:
-                dt = timestamp[:4] + "-" + timestamp[4:6] + "-" + timestamp[6:8] + " " + timestamp[9:11] + ":" + timestamp[11:13] + ":" + timestamp[13:15]
-                display_name = f"{name} ({dt})"
-            except:
-                display_name = project['folder_name']
-        else:
-            display_name = project['folder_name']
-        
+    for entry in entries:
+        created_at = entry.created_at
+        display_name = f"{entry.project_name} ({created_at:%Y-%m-%d %H:%M:%S})" if created_at else entry.folder_name
+
         # 현재 선택된 프로젝트는 강조 표시
-        if current_project and current_project['folder_name'] == project['folder_name']:
+        if current_project and current_project['folder_name'] == entry.folder_name:
             button_type = "primary"
             emoji = "✅ "
         else:
             button_type = "secondary"
             emoji = "📁 "
-        
+
         # 프로젝트 선택 버튼
-        if st.button(f"{emoji}{display_name}", key=f"select_{project['folder_name']}", width="stretch", type=button_type):
+        if st.button(f"{emoji}{display_name}", key=f"select_{entry.folder_name}", width="stretch", type=button_type):
             # 현재 프로젝트 업데이트 (Project 객체 전달)
-            project_manager.load_project(project)
-            st.success(f"✅ '{project['project_name']}' 프로젝트를 로드했습니다.")
+            project_manager.load_project(project_manager.entry_to_project(entry))
+            st.success(f"✅ '{entry.project_name}' 프로젝트를 로드했습니다.")
             st.rerun()
-    
+        st.caption(_format_stats(entry))
+
+    # 페이지 이동
+    page_count = (total + PAGE_SIZE - 1) // PAGE_SIZE
+    if page_count > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("◀", width="stretch", disabled=page == 0, key="project_load_prev"):
+                st.session_state["project_load_page"] = page - 1
+                st.rerun(scope="fragment")
+        with col2:
+            st.caption(f"{page + 1} / {page_count} 페이지 (전체 {total}개)")
+        with col3:
+            if st.button("▶", width="stretch", disabled=page + 1 >= page_count, key="project_load_next"):
+                st.session_state["project_load_page"] = page + 1
+                st.rerun(scope="fragment")
+
     # 닫기 버튼
     st.divider()
     if st.button("닫기", width="stretch"):
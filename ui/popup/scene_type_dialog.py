@@ -1,6 +1,6 @@
 import streamlit as st
 from service.video_manager import video_manager
-from ui.scene_types import scene_classes, get_scene_display_name
+from ui.scene_types import scene_classes
 
 
 def get_available_scene_types():
@@ -10,13 +10,8 @@ def get_available_scene_types():
     Returns:
         list: (scene_type_key, class_name, display_name) 튜플의 리스트
     """
-    scene_types = []
-    
-    for scene_type_key, (scene_class, display_name) in scene_classes.items():
-        class_name = scene_class.__name__
-        scene_types.append((scene_type_key, class_name, display_name))
-    
-    return scene_types
+    # 클래스를 import 하지 않고 등록 정보만 사용 (지연 로딩 유지)
+    return scene_classes.list_types()
 
 
 @st.dialog("씬 타입 선택")
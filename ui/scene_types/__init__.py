@@ -1,30 +1,39 @@
 """
 씬 타입별 UI 모듈
 각 타입에 맞는 UI를 제공하는 모듈들을 포함합니다.
+
+씬 타입 클래스는 처음 사용될 때 import 됩니다 (지연 로딩).
+외부 패키지는 "supermovie.scene_types" entry point 그룹으로 새 씬 타입을 등록할 수 있습니다.
+    예) [project.entry-points."supermovie.scene_types"]
+        my_type = "my_package.my_module:MySceneType"
 """
 
-from ui.scene_types.dimango_end_type import DimangoEndType
-from ui.scene_types.dimango_type import DimangoType
-from ui.scene_types.type1 import Type1Scene
-from ui.scene_types.type2 import Type2Scene
-from ui.scene_types.type3 import Type3Scene
-from ui.scene_types.balance_christmas_main import BalanceChristmasMain
-from ui.scene_types.balance_christmas_enter import BalanceChristmasEnter
-from ui.scene_types.balance_christmas_exit import BalanceChristmasExit
-
-__all__ = ['Type1Scene', 'Type2Scene', 'Type3Scene', 'BalanceChristmasMain', 'BalanceChristmasEnter', 'BalanceChristmasExit', 'get_scene_class', 'scene_classes']
-
-# 씬 타입 정보: (클래스, 표시 이름)
-scene_classes = {
-    "type1": (Type1Scene, "Type 1"),
-    "type2": (Type2Scene, "Type 2"),
-    "type3": (Type3Scene, "Type 3"),
-    "balance_christmas_main": (BalanceChristmasMain, "Balance Christmas Main"),
-    "balance_christmas_enter": (BalanceChristmasEnter, "Balance Christmas Enter"),
-    "balance_christmas_exit": (BalanceChristmasExit, "Balance Christmas Exit"),
-    "dimango_type": (DimangoType, "Dimango Type"),
-    "dimango_end_type": (DimangoEndType, "Dimango End Type")
-}
+from utils.lazy_registry import LazyClassRegistry
+
+__all__ = ['get_scene_class', 'get_scene_display_name', 'register_scene_type', 'scene_classes']
+
+# 씬 타입 정보: 타입 키 → (클래스, 표시 이름) - 클래스는 접근 시 import
+scene_classes = LazyClassRegistry(entry_point_group="supermovie.scene_types")
+scene_classes.register("type1", "ui.scene_types.type1:Type1Scene", "Type 1")
+scene_classes.register("type2", "ui.scene_types.type2:Type2Scene", "Type 2")
+scene_classes.register("type3", "ui.scene_types.type3:Type3Scene", "Type 3")
+scene_classes.register("balance_christmas_main", "ui.scene_types.balance_christmas_main:BalanceChristmasMain", "Balance Christmas Main")
+scene_classes.register("balance_christmas_enter", "ui.scene_types.balance_christmas_enter:BalanceChristmasEnter", "Balance Christmas Enter")
+scene_classes.register("balance_christmas_exit", "ui.scene_types.balance_christmas_exit:BalanceChristmasExit", "Balance Christmas Exit")
+scene_classes.register("dimango_type", "ui.scene_types.dimango_type:DimangoType", "Dimango Type")
+scene_classes.register("dimango_end_type", "ui.scene_types.dimango_end_type:DimangoEndType", "Dimango End Type")
+
+
+def register_scene_type(scene_type: str, target, display_name: str = None):
+    """
+    씬 타입 등록 (플러그인/코드에서 직접 등록할 때 사용)
+    
+    Args:
+        scene_type (str): 씬 타입 키
+        target (str or type): "패키지.모듈:클래스" 문자열 또는 클래스
+        display_name (str, optional): 표시 이름
+    """
+    scene_classes.register(scene_type, target, display_name)
 
 
 def get_scene_class(scene_type: str):
@@ -37,8 +46,7 @@ def get_scene_class(scene_type: str):
     Returns:
         BaseSceneType: 해당 타입의 씬 클래스 또는 None
     """
-    scene_info = scene_classes.get(scene_type)
-    return scene_info[0] if scene_info else None
+    return scene_classes.get_class(scene_type)
 
 
 def get_scene_display_name(scene_type: str):
@@ -51,5 +59,4 @@ def get_scene_display_name(scene_type: str):
     Returns:
         str: 표시 이름 또는 None
     """
-    scene_info = scene_classes.get(scene_type)
-    return scene_info[1] if scene_info else None
+    return scene_classes.get_display_name(scene_type)
@@ -1,31 +1,55 @@
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from pathlib import Path
-from moviepy import AudioFileClip, CompositeAudioClip, CompositeVideoClip, ImageClip, TextClip
-from project_manager import project_manager
-from utils import FontUtils
-from service.text_image_service import text_image_service
-import tempfile
+from abc import abstractmethod
 
+import streamlit as st
+from service.scene_renderers.base_scene_renderer import BaseSceneRenderer
+
+
+@st.fragment
+def preview_scrubber(scene_instance):
+    """
+    씬 프레임 미리보기 스크러버 (슬라이더를 움직이면 이 부분만 다시 실행)
+
+    Args:
+        scene_instance (BaseSceneType): 씬 타입 인스턴스
+    """
+    duration = scene_instance.get_preview_duration()
+    if not duration:
+        st.caption("미리보기를 만들 수 없습니다. (오디오/이미지 등 필요한 입력을 확인하세요)")
+        return
+
+    t = st.slider("⏱️ 시각(초)", min_value=0.0, max_value=float(duration), value=0.0,
+                  step=1.0 / scene_instance.fps, format="%.2f", key=f"preview_t_{scene_instance.scene_id}")
+    image = scene_instance.get_preview_frame(t)
+    if image:
+        st.image(image, width=270)
+    else:
+        st.caption("프레임을 합성하지 못했습니다.")
 
-class BaseSceneType(ABC):
-    """씬 타입의 기본 클래스 - 모든 씬 타입이 상속받아야 함"""
-    
-    def __init__(self, scene: Dict[str, Any]):
-        """
-        씬 타입 초기화
-        
-        Args:
-            scene (dict): 씬 정보 딕셔너리 (id, text, type 포함)
-        """
-        self.scene = scene
-        self.scene_id = scene.get('id')
-        self.scene_type = scene.get('type', 'type1')
-        self.fps = project_manager.get_fps()
-        self.screen_size = project_manager.get_screen_size()
 
-        self.clips = []
-        self.audio_clips = []
+def audio_preview(scene_instance):
+    """
+    씬 오디오 미리듣기 (오디오 배치만 믹싱한 결과와 순서/간격 표)
+
+    Args:
+        scene_instance (BaseSceneType): 씬 타입 인스턴스
+    """
+    preview = scene_instance.get_preview_audio()
+    if not preview:
+        st.caption("미리듣기를 만들 수 없습니다. (오디오가 있는지 확인하세요)")
+        return
+    st.audio(preview.data, format=preview.mime_type)
+    st.dataframe([
+        {"순서": idx, "파일": item["name"], "시작(초)": item["start"], "끝(초)": item["end"],
+         "앞 오디오와 간격(초)": item["gap"]}
+        for idx, item in enumerate(preview.placements, 1)
+    ], hide_index=True, width="stretch")
+
+
+class BaseSceneType(BaseSceneRenderer):
+    """
+    씬 타입의 기본 클래스 - 모든 씬 타입이 상속받아야 함
+    비디오 생성 로직은 service.scene_renderers의 렌더러에 있고, 여기서는 UI(render)만 추가
+    """
     
     @abstractmethod
     def render(self):
@@ -34,217 +58,19 @@ class BaseSceneType(ABC):
         각 타입별로 구현해야 함
         """
         pass
-    
-    @abstractmethod
-    def generate_video_structure(self) -> Optional[str]:
-        pass
-    
-    def get_field(self, field: str, default=None):
-        """
-        씬의 필드 값 가져오기 (편의 메서드)
-        
-        Args:
-            field (str): 필드명
-            default: 기본값
-            
-        Returns:
-            필드 값 또는 default
-        """
-        return self.scene.get(field, default)
-
-
-    def generate_video(self, max_duration) -> str:
-        try:
-            # project_manager를 통해 output 경로 가져오기
-            output_folder, output_path, relative_path = project_manager.get_output_path(self.scene_id)
-            if not output_path:
-                return None            
-            # 모든 클립을 연결하여 최종 비디오 생성
-            if self.clips:
-                final_audio = CompositeAudioClip(self.audio_clips)
-                final_clip = CompositeVideoClip(self.clips).with_audio(final_audio)
-            
-            final_clip = final_clip.with_duration(max_duration)
-            # 비디오 저장
-            final_clip.write_videofile(str(output_path), fps=self.fps)
-            
-            # 리소스 정리
-            final_clip.close()
-            for clip in self.clips:
-                clip.close()
-            
-            # 상대 경로 반환
-            return relative_path
-            
-        except Exception as e:
-            print(f"비디오 생성 중 오류 발생: {e}")
-            return None
-
-    def gen_audio_clip(self, field, start=0):
-        audio_path = self.scene.get(field, None)
-        if not audio_path:
-            return None
-        
-        full_audio_path = project_manager.get_relative_path(audio_path)
-        if full_audio_path and full_audio_path.exists():
-            audio_clip = AudioFileClip(full_audio_path).with_start(start)
-            self.audio_clips.append(audio_clip)
-            return audio_clip
-
-        return None
-    
-    def gen_image_clip(self, field=None, path=None, start=0, end= -1, duration= 1, resized_width = -1, resized_height=-1, position=("center", "center")):
-        if not path:
-            image_path = self.scene.get(field, None)
-            if not image_path:
-                return None
-            else:
-                full_path = project_manager.get_relative_path(image_path)
-        else:
-            full_path = path
-        
-        
-        if full_path:
-            
-            if end != -1:
-                clip = ImageClip(str(full_path)).with_start(start).with_position(position).with_end(end)
-            else:
-                clip = ImageClip(str(full_path), duration=duration).with_start(start).with_position(position)
-            
-            if resized_width != -1 and resized_height != -1:
-                clip = clip.resized(width=resized_width, height=resized_height)
-            elif resized_width != -1:
-                clip = clip.resized(width=resized_width)
-            elif resized_height != -1:
-                clip = clip.resized(height=resized_height)
 
-            self.clips.append(clip)
-                
-            return clip
-
-        return None
-    
-    def gen_text_clip(self, text=None, field=None, font=FontUtils.MAPLESTORY_LIGHT,font_size=80,color='white',method='caption',margin=(0,0),size=(1080,1920),start=0, end= -1, duration= 1, position=("center", "center")):
-        if not text:
-            text = self.scene.get(field, None)
-        if not text:
-            return None
-        
-        clip = TextClip(
-                font=font,
-                text=text,
-                font_size=font_size,
-                color=color,
-                method=method,
-                margin=margin,
-                size=size,
-                text_align="center"
-            )
-        if end != -1:
-            clip = clip.with_start(start).with_end(end).with_position(position)
-        else:
-            clip = clip.with_start(start).with_duration(duration).with_position(position)
-
-        self.clips.append(clip)
-        return clip
-    
-    def gen_rich_text_clip(
-        self,
-        text=None,
-        field=None,
-        font=FontUtils.MAPLESTORY_LIGHT,
-        font_size=80,
-        color='white',
-        screen_size=(1080, 1920),
-        text_width=1080,
-        margin=(0, 0),
-        text_align="center",
-        start=0,
-        end=-1,
-        duration=1,
-        position=(540, 960)
-    ):
+    def render_preview(self):
         """
-        텍스트를 이미지로 변환하여 ImageClip으로 생성하는 메서드
-        
-        Args:
-            text (str, optional): 텍스트 (없으면 field에서 가져옴)
-            field (str, optional): 씬 필드명
-            font (str): 폰트 경로
-            font_size (int): 폰트 크기
-            color (str): 텍스트 색상
-            screen_size (tuple): 캔버스 크기 (width, height) - 전체 이미지 크기
-            text_width (int): 텍스트 한 줄 너비
-            margin (tuple): 여백 (x, y) - 현재 미사용
-            text_align (str): 텍스트 정렬 ("center", "left", "right")
-            start (float): 시작 시간
-            end (float): 종료 시간 (-1이면 duration 사용)
-            duration (float): 지속 시간
-            position (tuple): 캔버스 내에서 텍스트를 그릴 중점 위치 (x, y)
-                             텍스트는 position - (text_width/2, text_height/2)부터 그려짐
-                             ImageClip은 center로 배치됨
-        
-        Returns:
-            ImageClip: 생성된 이미지 클립 또는 None
+        인코딩 없이 원하는 시각의 프레임과 씬 오디오를 바로 확인하는 미리보기 UI (켜져 있을 때만 합성)
         """
-        # 텍스트 가져오기
-        if not text:
-            text = self.scene.get(field, None) if field else None
-        
-        if not text:
-            return None
-        
-        try:
-            # TextImage 서비스를 사용하여 텍스트를 이미지로 변환
-            # screen_size는 캔버스 크기, position은 텍스트를 그릴 중점 위치
-            text_image = text_image_service.create_text_image(
-                text=text,
-                font_path=font,
-                font_size=font_size,
-                color=color,
-                screen_size=screen_size,
-                text_width=text_width,
-                position=position,
-                text_align=text_align
-            )
-            
-            if not text_image:
-                return None
-            
-            # 프로젝트 폴더의 temp 폴더에 저장 (상태 확인용)
-            project_path = project_manager.get_project_path()
-            if project_path:
-                # temp 폴더 생성
-                temp_folder = project_path / "temp"
-                temp_folder.mkdir(parents=True, exist_ok=True)
-                
-                # 파일명 생성 (scene_id와 텍스트 해시 사용)
-                import hashlib
-                text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-                filename = f"{self.scene_id}_text_{text_hash}.png"
-                tmp_path = temp_folder / filename
-            else:
-                # 프로젝트가 없으면 시스템 임시 디렉토리 사용
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-                    tmp_path = Path(tmp_file.name)
-            
-            # 이미지 저장
-            text_image.save(tmp_path, 'PNG')
-            print(f"[TEXT_IMAGE] 텍스트 이미지 저장: {tmp_path}")
-            
-            # ImageClip 생성 (position은 이미 텍스트 그릴 때 적용했으므로 center로 설정)
-            if end != -1:
-                clip = ImageClip(str(tmp_path)).with_start(start).with_position("center").with_end(end)
-            else:
-                clip = ImageClip(str(tmp_path), duration=duration).with_start(start).with_position("center")
-            
-            # clips에 추가
-            self.clips.append(clip)
-            
-            return clip
-            
-        except Exception as e:
-            print(f"rich text clip 생성 중 오류 발생: {e}")
-            return None
-    
-    
+        col_frame, col_audio = st.columns(2)
+        with col_frame:
+            show_frame = st.toggle("🖼️ 프레임 미리보기", key=f"preview_on_{self.scene_id}",
+                                   help="인코딩 없이 해당 시각의 화면만 합성합니다.")
+        with col_audio:
+            show_audio = st.toggle("🔊 오디오 미리듣기", key=f"audio_preview_on_{self.scene_id}",
+                                   help="비디오 렌더링 없이 씬의 오디오 배치만 믹싱해서 들려줍니다.")
+        if show_audio:
+            audio_preview(self)
+        if show_frame:
+            preview_scrubber(self)
@@ -3,9 +3,10 @@ from typing import Dict, Any
 from ui.components.text_component import render_text_input
 from ui.components.image_component import render_image_input
 from ui.scene_types.base_scene_type import BaseSceneType
+from service.scene_renderers.basic_types import Type1Renderer
 
 
-class Type1Scene(BaseSceneType):
+class Type1Scene(BaseSceneType, Type1Renderer):
     """Type 1 씬 타입 클래스"""
     
     def render(self):
@@ -16,15 +17,3 @@ class Type1Scene(BaseSceneType):
         
         # 이미지 입력 컴포넌트 사용
         render_image_input(self.scene, "image")
-    
-    def generate_video_structure(self) -> str:
-        """
-        Type 1 씬의 비디오 파일 생성
-        기본 구현을 사용 (1080x1920, 가운데 텍스트)
-        
-        Returns:
-            str: 생성된 비디오 파일 경로 또는 None
-        """
-        # 기본 구현 사용 (부모 클래스의 메서드 호출)
-        return super().generate_video_structure()
-
@@ -1,9 +1,10 @@
 import streamlit as st
 from typing import Dict, Any
 from ui.scene_types.base_scene_type import BaseSceneType
+from service.scene_renderers.basic_types import Type3Renderer
 
 
-class Type3Scene(BaseSceneType):
+class Type3Scene(BaseSceneType, Type3Renderer):
     """Type 3 씬 타입 클래스"""
     
     def render(self):
@@ -58,15 +59,3 @@ class Type3Scene(BaseSceneType):
         )
         
         st.divider()
-    
-    def generate_video_structure(self) -> str:
-        """
-        Type 3 씬의 비디오 파일 생성
-        기본 구현을 사용 (1080x1920, 가운데 텍스트)
-        
-        Returns:
-            str: 생성된 비디오 파일 경로 또는 None
-        """
-        # 기본 구현 사용 (부모 클래스의 메서드 호출)
-        return super().generate_video_structure()
-
@@ -0,0 +1,82 @@
+"""
+ffmpeg 관련 유틸리티 함수
+MoviePy와 동일한 ffmpeg 바이너리를 찾아 직접 실행하는 기능 제공
+"""
+import subprocess
+from pathlib import Path
+from typing import List, Optional
+
+
+def get_ffmpeg_binary() -> str:
+    """
+    사용할 ffmpeg 실행 파일 경로 반환 (MoviePy 설정 → imageio-ffmpeg → PATH 순)
+
+    Returns:
+        str: ffmpeg 실행 파일 경로
+    """
+    try:
+        from moviepy.config import FFMPEG_BINARY
+        if FFMPEG_BINARY:
+            return FFMPEG_BINARY
+    except Exception:
+        pass
+
+    try:
+        from imageio_ffmpeg import get_ffmpeg_exe
+        return get_ffmpeg_exe()
+    except Exception:
+        return "ffmpeg"
+
+
+def run_ffmpeg(args: List[str], error_prefix: str = "ffmpeg") -> bool:
+    """
+    ffmpeg를 실행하고 성공 여부를 반환
+
+    Args:
+        args (List[str]): ffmpeg 실행 파일을 제외한 인자 리스트
+        error_prefix (str): 오류 로그 접두어
+
+    Returns:
+        bool: 성공 여부
+    """
+    command = [get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error", "-y"] + args
+    try:
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except Exception as e:
+        print(f"[{error_prefix}] ffmpeg 실행 실패: {e}")
+        return False
+
+    if result.returncode != 0:
+        print(f"[{error_prefix}] ffmpeg 오류 (코드: {result.returncode})")
+        print(f"   {result.stderr.decode(errors='ignore').strip()}")
+        return False
+    return True
+
+
+def write_concat_list(video_paths: List[str], list_path: Path,
+                      durations: Optional[List[float]] = None) -> Optional[Path]:
+    """
+    ffmpeg concat demuxer용 파일 목록을 작성
+
+    Args:
+        video_paths (List[str]): 이어붙일 비디오 파일 경로 리스트
+        list_path (Path): 작성할 목록 파일 경로
+        durations (List[float], optional): 파일별 길이(초)
+            지정하면 다음 파일의 시작 시각을 컨테이너 길이(영상/오디오 중 긴 쪽) 대신 이 길이로 맞춥니다.
+
+    Returns:
+        Path: 작성된 목록 파일 경로 또는 None (실패 시)
+    """
+    try:
+        lines = []
+        for idx, path in enumerate(video_paths):
+            # concat 목록에서는 작은따옴표를 '\'' 형태로 이스케이프해야 함
+            escaped = str(Path(path).resolve()).replace("'", "'\\''")
+            lines.append(f"file '{escaped}'")
+            if durations is not None:
+                lines.append(f"duration {durations[idx]:.6f}")
+        list_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        return list_path
+    except Exception as e:
+        print(f"concat 목록 작성 오류: {e}")
+        return None
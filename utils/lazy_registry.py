@@ -0,0 +1,129 @@
+"""
+지연 로딩 클래스 레지스트리
+타입 키 → "모듈:클래스" 문자열만 보관하고, 실제 클래스는 처음 필요할 때 import 합니다.
+패키지 entry point(플러그인)로 새 타입을 등록할 수 있습니다.
+"""
+import importlib
+from collections.abc import Mapping
+from importlib.metadata import entry_points
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class LazyClassRegistry(Mapping):
+    """
+    타입 키별 클래스를 지연 로딩하는 레지스트리
+    기존 코드 호환을 위해 registry[key]는 (클래스, 표시 이름) 튜플을 반환합니다.
+    """
+
+    def __init__(self, entry_point_group: Optional[str] = None):
+        """
+        LazyClassRegistry 초기화
+
+        Args:
+            entry_point_group (str, optional): 플러그인 타입을 찾을 entry point 그룹명
+        """
+        self.entry_point_group = entry_point_group
+        self._targets: Dict[str, str] = {}
+        self._display_names: Dict[str, str] = {}
+        self._classes: Dict[str, type] = {}
+        self._entry_points_loaded = False
+
+    def register(self, type_key: str, target, display_name: Optional[str] = None):
+        """
+        타입 등록
+
+        Args:
+            type_key (str): 타입 키 (예: "balance_christmas_main")
+            target (str or type): "패키지.모듈:클래스" 문자열 또는 클래스 객체
+            display_name (str, optional): 표시 이름 (없으면 type_key 사용)
+        """
+        if isinstance(target, str):
+            self._targets[type_key] = target
+            self._classes.pop(type_key, None)
+        else:
+            self._targets[type_key] = f"{target.__module__}:{target.__name__}"
+            self._classes[type_key] = target
+        self._display_names[type_key] = display_name or type_key
+
+    def _load_entry_points(self):
+        """entry point 그룹에 등록된 플러그인 타입을 (import 없이) 레지스트리에 추가"""
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        if not self.entry_point_group:
+            return
+
+        try:
+            for entry_point in entry_points(group=self.entry_point_group):
+                if entry_point.name not in self._targets:
+                    self.register(entry_point.name, entry_point.value,
+                                  entry_point.name.replace("_", " ").title())
+        except Exception as e:
+            print(f"플러그인 타입 로드 오류 ({self.entry_point_group}): {e}")
+
+    def get_class(self, type_key: str):
+        """
+        타입 키에 해당하는 클래스 반환 (처음 호출 시 import)
+
+        Args:
+            type_key (str): 타입 키
+
+        Returns:
+            type: 클래스 또는 None (없거나 import 실패 시)
+        """
+        if type_key in self._classes:
+            return self._classes[type_key]
+
+        self._load_entry_points()
+        target = self._targets.get(type_key)
+        if not target:
+            return None
+
+        try:
+            module_name, _, class_name = target.partition(":")
+            cls = getattr(importlib.import_module(module_name), class_name)
+        except Exception as e:
+            print(f"타입 클래스 로드 오류 ({type_key} → {target}): {e}")
+            return None
+
+        self._classes[type_key] = cls
+        return cls
+
+    def get_display_name(self, type_key: str) -> Optional[str]:
+        """타입의 표시 이름 반환 (import 없음)"""
+        self._load_entry_points()
+        return self._display_names.get(type_key)
+
+    def get_class_name(self, type_key: str) -> Optional[str]:
+        """타입의 클래스 이름 반환 (import 없음)"""
+        self._load_entry_points()
+        target = self._targets.get(type_key)
+        return target.partition(":")[2] if target else None
+
+    def list_types(self) -> List[Tuple[str, str, str]]:
+        """
+        등록된 타입 목록 반환 (import 없음)
+
+        Returns:
+            list: (타입 키, 클래스 이름, 표시 이름) 튜플의 리스트
+        """
+        self._load_entry_points()
+        return [(key, self.get_class_name(key), self._display_names[key]) for key in self._targets]
+
+    def __getitem__(self, type_key: str):
+        cls = self.get_class(type_key)
+        if cls is None:
+            raise KeyError(type_key)
+        return cls, self._display_names[type_key]
+
+    def __iter__(self) -> Iterator[str]:
+        self._load_entry_points()
+        return iter(list(self._targets))
+
+    def __len__(self) -> int:
+        self._load_entry_points()
+        return len(self._targets)
+
+    def __contains__(self, type_key) -> bool:
+        self._load_entry_points()
+        return type_key in self._targets
@@ -0,0 +1,51 @@
+"""
+SQLite 관련 유틸리티
+카탈로그, 작업 큐, 에셋 저장소, 렌더링 기록, 렌더 팜, 텔레메트리가 같은 방식으로 DB를 열고 트랜잭션을 처리하도록
+연결/트랜잭션/초기화 메서드를 제공하는 믹스인 클래스
+"""
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class SQLiteStore:
+    """
+    SQLite DB 파일 하나를 쓰는 클래스의 믹스인
+    하위 클래스는 self.db_path를 설정한 뒤 _init_db()를 호출하고, _create_tables()에서 테이블을 만듭니다.
+    연결은 스레드마다 따로 열고(_connect), 트랜잭션이 끝나면 커밋 후 닫습니다(_db).
+    """
+
+    db_path: Path
+    DB_LABEL = "DB"     # 오류 메시지에 쓰는 DB 이름 (예: "[FARM] 작업 DB")
+    WAL = True          # WAL 모드 사용 여부 (네트워크 공유 폴더의 DB는 False)
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결 생성 (스레드마다 별도 연결 사용)"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _db(self):
+        """트랜잭션 단위로 DB 연결을 열고 커밋 후 닫음"""
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        """DB 폴더를 만들고 테이블 생성 (실패하면 오류만 출력)"""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._db() as conn:
+                if self.WAL:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                self._create_tables(conn)
+        except Exception as e:
+            print(f"{self.DB_LABEL} 초기화 오류: {e}")
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        """테이블 생성 (하위 클래스에서 구현)"""
+        raise NotImplementedError